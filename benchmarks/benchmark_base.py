@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_base
+Timing of comparing and deduplicating pmutt objects. Classes follow the
+airspeed velocity (asv) conventions but the file can also be run directly.
+"""
+import timeit
+
+from pmutt.reaction.bep import BEP
+
+
+class TimeDeduplicateBEPs:
+    params = [100, 1000, 5000]
+    param_names = ['n_beps']
+
+    def setup(self, n_beps):
+        # Every BEP appears twice as separate (but equal) objects, similar to
+        # reactions sharing a BEP relationship after being read from a file
+        self.beps = [
+            BEP(slope=0.1 * (i % (n_beps // 2)),
+                intercept=1.,
+                descriptor='delta_H',
+                notes={'source': 'benchmark'}) for i in range(n_beps)
+        ]
+
+    def time_deduplicate(self, n_beps):
+        unique_beps = set()
+        beps = []
+        for bep in self.beps:
+            if bep not in unique_beps:
+                unique_beps.add(bep)
+                beps.append(bep)
+
+    def time_eq(self, n_beps):
+        for bep1, bep2 in zip(self.beps, self.beps[1:]):
+            bep1 == bep2
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeDeduplicateBEPs, ):
+        benchmark = benchmark_class()
+        for n_beps in benchmark_class.params:
+            benchmark.setup(n_beps)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(timeit.repeat(lambda: method(n_beps), number=1,
+                                      repeat=3))
+                print('{}.{:<16} {:>6} BEPs {:10.6f} s'.format(
+                    benchmark_class.__name__, method_name, n_beps, t))
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_empirical
+Timing of empirical models over temperature grids. Classes follow the airspeed
+velocity (asv) conventions but the file can also be run directly.
+"""
+import timeit
+
+import numpy as np
+
+from pmutt.empirical.nasa import Nasa, Nasa9, SingleNasa9
+from pmutt.statmech import StatMech, elec, rot, trans, vib
+
+
+class TimeNasa:
+    params = [1, 100, 10000]
+    param_names = ['n_T']
+
+    def setup(self, n_T):
+        # Coefficients of CO2 from the GRI-Mech 3.0 thermodynamic data
+        self.nasa = Nasa(name='CO2',
+                         elements={'C': 1, 'O': 2},
+                         phase='g',
+                         T_low=200.,
+                         T_mid=1000.,
+                         T_high=3500.,
+                         a_low=np.array([
+                             2.35677352E+00, 8.98459677E-03, -7.12356269E-06,
+                             2.45919022E-09, -1.43699548E-13, -4.83719697E+04,
+                             9.90105222E+00]),
+                         a_high=np.array([
+                             3.85746029E+00, 4.41437026E-03, -2.21481404E-06,
+                             5.23490188E-10, -4.72084164E-14, -4.87591660E+04,
+                             2.27163806E+00]))
+        self.T = np.linspace(300., 3000., n_T)
+
+    def time_get_CpoR(self, n_T):
+        self.nasa.get_CpoR(T=self.T)
+
+    def time_get_GoRT(self, n_T):
+        self.nasa.get_GoRT(T=self.T)
+
+
+class TimeNasa9:
+    params = [1, 100, 10000]
+    param_names = ['n_T']
+
+    def setup(self, n_T):
+        # Coefficients of CO2 from the NASA Glenn thermodynamic database
+        a = np.array([
+            [4.943650540E+04, -6.264116010E+02, 5.301725240E+00,
+             2.503813816E-03, -2.127308728E-07, -7.689988780E-10,
+             2.849677801E-13, -4.528198460E+04, -7.048279440E+00],
+            [1.176962419E+05, -1.788791477E+03, 8.291523190E+00,
+             -9.223156780E-05, 4.863676880E-09, -1.891053312E-12,
+             6.330036590E-16, -3.908350590E+04, -2.652669281E+01],
+            [-1.544423287E+09, 1.016847056E+06, -2.561405230E+02,
+             3.369401080E-02, -2.181184337E-06, 6.991420840E-11,
+             -8.842351500E-16, -8.043214510E+06, 2.254177493E+03]])
+        T_bounds = [200., 1000., 6000., 20000.]
+        nasas = [
+            SingleNasa9(T_low=T_low, T_high=T_high, a=a_row)
+            for a_row, T_low, T_high in zip(a, T_bounds, T_bounds[1:])
+        ]
+        self.nasa9 = Nasa9(name='CO2',
+                           elements={'C': 1, 'O': 2},
+                           phase='g',
+                           nasas=nasas)
+        self.T = np.linspace(300., 15000., n_T)
+
+    def time_get_CpoR(self, n_T):
+        self.nasa9.get_CpoR(T=self.T)
+
+    def time_get_GoRT(self, n_T):
+        self.nasa9.get_GoRT(T=self.T)
+
+
+class TimeFromModel:
+    params = [50, 500]
+    param_names = ['n_T']
+
+    def setup(self, n_T):
+        # Ideal gas CO2
+        self.model = StatMech(
+            name='CO2',
+            elements={'C': 1, 'O': 2},
+            trans_model=trans.FreeTrans(n_degrees=3, molecular_weight=44.01),
+            rot_model=rot.RigidRotor(symmetrynumber=2,
+                                     rot_temperatures=[0.561],
+                                     geometry='linear'),
+            vib_model=vib.HarmonicVib(
+                vib_wavenumbers=[2349., 1333., 667., 667.]),
+            elec_model=elec.GroundStateElec(potentialenergy=-22.96,
+                                            spin=0.))
+
+    def time_nasa_from_model(self, n_T):
+        Nasa.from_model(model=self.model, T_low=300., T_high=1500.,
+                        n_T=n_T)
+
+    def time_nasa9_from_model(self, n_T):
+        Nasa9.from_model(name='CO2', model=self.model, T_low=300.,
+                         T_high=1500., n_T=n_T)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeNasa, TimeNasa9, TimeFromModel):
+        benchmark = benchmark_class()
+        for n_T in benchmark_class.params:
+            benchmark.setup(n_T)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(timeit.repeat(lambda: method(n_T), number=1, repeat=3))
+                print('{}.{:<21} {:>6} T {:10.6f} s'.format(
+                    benchmark_class.__name__, method_name, n_T, t))
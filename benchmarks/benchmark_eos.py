@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_eos
+Timing of equations of state over temperature and pressure grids. Classes
+follow the airspeed velocity (asv) conventions but the file can also be run
+directly.
+"""
+import timeit
+
+import numpy as np
+
+from pmutt.eos import PengRobinsonEOS, vanDerWaalsEOS
+
+
+class TimevanDerWaalsEOS:
+    params = [1, 100, 10000]
+    param_names = ['n_conditions']
+
+    def setup(self, n_conditions):
+        # Water
+        self.eos = vanDerWaalsEOS.from_critical(Tc=647.1, Pc=220.64)
+        self.T = np.linspace(300., 900., n_conditions)
+        self.P = np.linspace(1., 300., n_conditions)
+
+    def time_get_Vm(self, n_conditions):
+        self.eos.get_Vm(T=self.T, P=self.P)
+
+    def time_get_n(self, n_conditions):
+        self.eos.get_n(V=1.e-3, T=self.T, P=self.P)
+
+
+class TimePengRobinsonEOS:
+    params = [1, 100, 10000]
+    param_names = ['n_conditions']
+
+    def setup(self, n_conditions):
+        # CO2, CH4, N2, H2O
+        self.eos = PengRobinsonEOS(Tc=[304.13, 190.56, 126.2, 647.1],
+                                   Pc=[73.77, 45.99, 33.98, 220.64],
+                                   omega=[0.225, 0.011, 0.037, 0.344])
+        self.T = np.linspace(400., 900., n_conditions)
+        self.P = np.linspace(1., 300., n_conditions)
+        self.y = np.array([0.1, 0.6, 0.2, 0.1])
+
+    def time_get_Z(self, n_conditions):
+        self.eos.get_Z(T=self.T, P=self.P, y=self.y)
+
+    def time_get_phi(self, n_conditions):
+        self.eos.get_phi(T=self.T, P=self.P, y=self.y)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimevanDerWaalsEOS, TimePengRobinsonEOS):
+        benchmark = benchmark_class()
+        for n_conditions in benchmark_class.params:
+            benchmark.setup(n_conditions)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(
+                    timeit.repeat(lambda: method(n_conditions),
+                                  number=1,
+                                  repeat=3))
+                print('{}.{:<12} {:>6} conditions {:10.6f} s'.format(
+                    benchmark_class.__name__, method_name, n_conditions, t))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_import
+Timing of importing pmutt modules in a fresh interpreter. Classes follow the
+airspeed velocity (asv) conventions but the file can also be run directly.
+"""
+import os
+import subprocess
+import sys
+import timeit
+
+# Run the interpreters from the repository root so the working tree is used
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_module(module):
+    """Imports a module in a new Python process
+
+    Parameters
+    ----------
+        module : str
+            Name of the module to import. e.g. 'pmutt.statmech'
+    """
+    subprocess.run([sys.executable, '-c', 'import {}'.format(module)],
+                   cwd=root_path,
+                   check=True)
+
+
+class TimeImport:
+    params = ['pmutt', 'pmutt.statmech', 'pmutt.empirical.nasa',
+              'pmutt.reaction.network', 'pmutt.io.omkm']
+    param_names = ['module']
+    # Each sample starts a new interpreter so there is no warm-up to discard
+    number = 1
+    repeat = 5
+
+    def setup(self, module):
+        # Populate the bytecode cache so compilation is not timed
+        import_module(module)
+
+    def time_import(self, module):
+        import_module(module)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeImport, ):
+        benchmark = benchmark_class()
+        for module in benchmark_class.params:
+            benchmark.setup(module)
+            t = min(timeit.repeat(lambda: benchmark.time_import(module),
+                                  number=1, repeat=5))
+            print('{}.time_import {:<24} {:10.6f} s'.format(
+                benchmark_class.__name__, module, t))
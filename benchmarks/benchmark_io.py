@@ -0,0 +1,546 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_io
+Timing of mechanism readers on generated input files. Classes follow the
+airspeed velocity (asv) conventions but the file can also be run directly.
+"""
+import itertools
+import os
+import random
+import shutil
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from pmutt.chemkin import CatSite
+from pmutt.empirical.nasa import Nasa
+from pmutt.io import (chemkin, ctml_writer, excel, omkm, ring, tabular,
+                      thermdat, vasp)
+from pmutt.omkm.phase import IdealGas, InteractingInterface
+from pmutt.omkm.reaction import SurfaceReaction
+from pmutt.reaction import ChemkinReaction, Reactions
+from pmutt.statmech import ConstantMode, StatMech
+
+
+def write_ring_file(filename, n_reactions, n_species=500, seed=0):
+    """Writes a RING output file with randomly generated reactions between
+    SMILES-like species.
+
+    Parameters
+    ----------
+        filename : str
+            Output filename
+        n_reactions : int
+            Number of reactions to write
+        n_species : int, optional
+            Number of unique species. Default is 500
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        species : dict of :class:`~pmutt.statmech.StatMech` objects
+            Species in the file using the names as keys
+    """
+    rng = random.Random(seed)
+    names = ['C' * (i % 12 + 1) + '[{}]'.format(i) for i in range(n_species)]
+    species = {
+        name: StatMech(name=name, elec_model=ConstantMode(G=0.))
+        for name in names
+    }
+    with open(filename, 'w') as f_ptr:
+        f_ptr.write('Reactions generated by RING\n')
+        for _ in range(n_reactions):
+            f_ptr.write('{}.{}>>{}\n'.format(*rng.sample(names, 3)))
+    return species
+
+
+def write_chemkin_file(filename, n_reactions, n_species=500, seed=0):
+    """Writes a Chemkin gas.inp-style file with randomly generated reversible
+    reactions and Arrhenius parameters, similar in layout to full hydrocarbon
+    combustion mechanisms.
+
+    Parameters
+    ----------
+        filename : str
+            Output filename
+        n_reactions : int
+            Number of reactions to write
+        n_species : int, optional
+            Number of unique species. Default is 500
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    """
+    rng = random.Random(seed)
+    names = ['C{}H{}O'.format(i % 9 + 1, i) for i in range(n_species)]
+    with open(filename, 'w') as f_ptr:
+        f_ptr.write('ELEMENTS\nC H O\nEND\nREACTIONS\n')
+        for i in range(n_reactions):
+            reaction_str = '{}+{}<=>{}+2{}'.format(*rng.sample(names, 4))
+            f_ptr.write('{:<48}{:10.3E} {:6.2f} {:10.1f}  !R{}\n'.format(
+                reaction_str, rng.uniform(1e10, 1e14), rng.uniform(-1., 2.),
+                rng.uniform(0., 3e4), i))
+        f_ptr.write('END\n')
+
+
+def write_outcar_file(filename, n_ionic_steps, n_atoms=20):
+    """Writes an OUTCAR-like file where many ionic steps of force output
+    precede the frequency block, as in large MD or relaxation runs.
+
+    Parameters
+    ----------
+        filename : str
+            Output filename
+        n_ionic_steps : int
+            Number of ionic steps to write before the frequency block
+        n_atoms : int, optional
+            Number of atoms. Default is 20
+    """
+    force_line = '      1.00000      2.00000      3.00000' \
+                 '         0.010000     -0.020000      0.030000\n'
+    step_lines = ' POSITION                                       ' \
+                 'TOTAL-FORCE (eV/Angst)\n' + force_line * n_atoms
+    freq_line = '{:4d} f  = {:11.6f} THz {:11.6f} 2PiTHz {:12.6f} cm-1 ' \
+                '{:11.6f} meV\n'
+    with open(filename, 'w') as f_ptr:
+        for _ in range(n_ionic_steps):
+            f_ptr.write(step_lines)
+        f_ptr.write(' Eigenvectors and eigenvalues of the dynamical matrix\n')
+        for i in range(3 * n_atoms):
+            wavenumber = 50. + 60. * i
+            f_ptr.write(freq_line.format(i + 1, wavenumber / 33.356,
+                                         wavenumber / 5.309, wavenumber,
+                                         wavenumber / 8.0655))
+            f_ptr.write(force_line * n_atoms)
+
+
+def get_nasa_species(n_species, seed=0):
+    """Generates NASA polynomials with random coefficients
+
+    Parameters
+    ----------
+        n_species : int
+            Number of species
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        nasa_species : list of :class:`~pmutt.empirical.nasa.Nasa` objects
+            Species with up to three elements
+    """
+    rng = np.random.default_rng(seed)
+    nasa_species = []
+    for i in range(n_species):
+        elements = {'C': int(rng.integers(0, 4)),
+                    'H': int(rng.integers(1, 9)),
+                    'O': int(rng.integers(0, 3))}
+        nasa_species.append(
+            Nasa(name='CHO{}'.format(i), phase='G', elements=elements,
+                 T_low=300., T_mid=1000., T_high=1500.,
+                 a_low=rng.uniform(-1., 1., 7) * 10.**-np.arange(7),
+                 a_high=rng.uniform(-1., 1., 7) * 10.**-np.arange(7),
+                 notes='bench'))
+    return nasa_species
+
+
+def get_species_table(n_species, n_vib=20, seed=0):
+    """Creates a table of ideal gas species using the column conventions of
+    :func:`~pmutt.io.excel.read_excel`
+
+    Parameters
+    ----------
+        n_species : int
+            Number of rows
+        n_vib : int, optional
+            Number of vibrational wavenumber columns. Default is 20
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        species_table : pandas.DataFrame
+            Species table
+    """
+    rng = np.random.default_rng(seed)
+    molecules = ['H2O', 'CO2', 'CH4', 'NH3', 'C2H6']
+    table = {
+        'name': ['species{}'.format(i) for i in range(n_species)],
+        'phase': ['G'] * n_species,
+        'statmech_model': ['IdealGas'] * n_species,
+        'atoms': [molecules[i % len(molecules)] for i in range(n_species)],
+        'element.C': rng.integers(0, 3, n_species),
+        'element.H': rng.integers(0, 7, n_species),
+        'element.O': rng.integers(0, 3, n_species),
+        'symmetrynumber': rng.integers(1, 4, n_species),
+        'potentialenergy': rng.uniform(-50., -5., n_species),
+        'spin': np.zeros(n_species),
+    }
+    for i in range(n_vib):
+        vib_wavenumbers = rng.uniform(50., 3800., n_species)
+        # Species have different numbers of modes
+        vib_wavenumbers[rng.random(n_species) < 0.2] = np.nan
+        table['vib_wavenumber.{}'.format(i)] = vib_wavenumbers
+    return pd.DataFrame(table)
+
+
+def get_omkm_mechanism(n_reactions, n_species=200, seed=0):
+    """Generates a random surface mechanism for OpenMKM
+
+    Parameters
+    ----------
+        n_reactions : int
+            Number of reactions to generate
+        n_species : int, optional
+            Number of surface species. Default is 200
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        mechanism : dict
+            Phases, species and reactions that can be passed to
+            :func:`~pmutt.io.omkm.write_cti` or
+            :func:`~pmutt.io.omkm.write_thermo_yaml`
+    """
+    rng = np.random.default_rng(seed)
+    gas_species = [
+        Nasa(name='H2', elements={'H': 2}, phase='gas', T_low=300.,
+             T_mid=1000., T_high=2000., a_low=rng.random(7),
+             a_high=rng.random(7))
+    ]
+    surf_species = [
+        Nasa(name='Pt(S)', elements={'Pt': 1}, phase='terrace', T_low=300.,
+             T_mid=1000., T_high=2000., a_low=np.zeros(7),
+             a_high=np.zeros(7))
+    ]
+    for i in range(n_species):
+        surf_species.append(
+            Nasa(name='X{}(S)'.format(i), elements={'H': 1, 'Pt': 1},
+                 phase='terrace', T_low=300., T_mid=1000., T_high=2000.,
+                 a_low=rng.random(7), a_high=rng.random(7)))
+    species_dict = {ind_species.name: ind_species
+                    for ind_species in gas_species + surf_species}
+    reactions = []
+    for i in range(n_reactions):
+        j, k = rng.choice(n_species, size=2, replace=False)
+        if i % 10 == 0:
+            reaction_str = 'H2+2Pt(S)=X{}(S)+X{}(S)'.format(j, k)
+            reactions.append(SurfaceReaction.from_string(
+                reaction_str, species=species_dict, is_adsorption=True,
+                sticking_coeff=0.5))
+        else:
+            reaction_str = 'X{}(S)+Pt(S)=X{}(S)+Pt(S)'.format(j, k)
+            reactions.append(SurfaceReaction.from_string(
+                reaction_str, species=species_dict, A=1.e13, beta=0.))
+    gas = IdealGas(name='gas', species=gas_species)
+    terrace = InteractingInterface(name='terrace', species=surf_species,
+                                   site_density=2.49e-9, phases=[gas],
+                                   reactions=reactions)
+    return {'phases': [gas, terrace],
+            'species': gas_species + surf_species,
+            'reactions': reactions}
+
+
+def get_chemkin_mechanism(n_reactions, n_species=200, seed=0):
+    """Generates a random surface mechanism for Chemkin
+
+    Parameters
+    ----------
+        n_reactions : int
+            Number of reactions to generate. Every tenth reaction is an
+            adsorption reaction and the others have transition states
+        n_species : int, optional
+            Number of surface species. Default is 200
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        reactions : :class:`~pmutt.reaction.Reactions` object
+            Reactions using :class:`~pmutt.empirical.nasa.Nasa` species
+    """
+    rng = np.random.default_rng(seed)
+    cat_site = CatSite(name='RU', site_density=2.17e-9, density=12.4,
+                       bulk_specie='RU(B)')
+
+    def get_nasa(name, phase, scale=1.):
+        a_low = np.array([3., 1.e-3, -1.e-6, 1.e-10, -1.e-14, -1.e3, 1.])
+        a_high = a_low * (1. + 0.01 * rng.random(7))
+        nasa = Nasa(name=name, phase=phase, elements={'H': 1, 'Ru': 1},
+                    T_low=300., T_mid=1000., T_high=2000.,
+                    a_low=scale * a_low, a_high=scale * a_high)
+        if phase == 'S':
+            nasa.cat_site = cat_site
+            nasa.n_sites = 1
+        return nasa
+
+    species = {'H2': get_nasa('H2', 'G'), 'RU(S)': get_nasa('RU(S)', 'S', 0.)}
+    for i in range(n_species):
+        name = 'X{}(S)'.format(i)
+        species[name] = get_nasa(name, 'S', 1. + rng.random())
+    reactions = []
+    for i in range(n_reactions):
+        j, k = rng.choice(n_species, size=2, replace=False)
+        if i % 10 == 0:
+            reaction_str = 'H2+2RU(S)=X{}(S)+X{}(S)'.format(j, k)
+            reactions.append(ChemkinReaction.from_string(
+                reaction_str, species=species, is_adsorption=True))
+        else:
+            ts_name = 'TS{}(S)'.format(i)
+            species[ts_name] = get_nasa(ts_name, 'S', 2. + rng.random())
+            reaction_str = 'X{0}(S)+RU(S)={2}=X{1}(S)+RU(S)'.format(j, k,
+                                                                   ts_name)
+            reactions.append(ChemkinReaction.from_string(reaction_str,
+                                                         species=species))
+    return Reactions(reactions=reactions)
+
+
+class TimeChemkinWrite:
+    params = [(100, 1000), (1, 50, 500)]
+    param_names = ['n_reactions', 'n_conditions']
+
+    def setup(self, n_reactions, n_conditions):
+        self.reactions = get_chemkin_mechanism(n_reactions=n_reactions)
+        self.conditions = [{'T': T, 'P': 1.}
+                           for T in np.linspace(400., 900., n_conditions)]
+
+    def time_write_EA(self, n_reactions, n_conditions):
+        chemkin.write_EA(reactions=self.reactions,
+                         conditions=self.conditions)
+
+    def time_write_surf(self, n_reactions, n_conditions):
+        chemkin.write_surf(reactions=self.reactions,
+                           T=self.conditions[0]['T'])
+
+
+class TimeWriteCti:
+    params = [100, 2000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'thermo.cti')
+        self.mechanism = get_omkm_mechanism(n_reactions=n_reactions)
+
+    def teardown(self, n_reactions):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_write_cti(self, n_reactions):
+        omkm.write_cti(filename=self.filename, T=500., write_xml=False,
+                       **self.mechanism)
+
+    def time_write_cti_xml(self, n_reactions):
+        omkm.write_cti(filename=self.filename, T=500., **self.mechanism)
+
+    def peakmem_write_cti_xml(self, n_reactions):
+        omkm.write_cti(filename=self.filename, T=500., **self.mechanism)
+
+
+class TimeWriteThermoYaml:
+    params = [100, 2000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'thermo.yaml')
+        self.manifest = os.path.join(self.tmp_dir, 'manifest.json')
+        self.mechanism = get_omkm_mechanism(n_reactions=n_reactions)
+        omkm.write_thermo_yaml(filename=self.filename, T=500.,
+                               manifest=self.manifest, **self.mechanism)
+
+    def teardown(self, n_reactions):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_write_thermo_yaml(self, n_reactions):
+        omkm.write_thermo_yaml(filename=self.filename, T=500.,
+                               **self.mechanism)
+
+    def time_write_thermo_yaml_unchanged(self, n_reactions):
+        omkm.write_thermo_yaml(filename=self.filename, T=500.,
+                               manifest=self.manifest, **self.mechanism)
+
+    def peakmem_write_thermo_yaml(self, n_reactions):
+        omkm.write_thermo_yaml(filename=self.filename, T=500.,
+                               **self.mechanism)
+
+
+class TimeOrganizePhases:
+    params = [100, 2000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        mechanism = get_omkm_mechanism(n_reactions=n_reactions)
+        self.species = mechanism['species']
+        self.reactions = mechanism['reactions']
+        self.phases_data = [
+            {'name': 'gas', 'phase_type': 'IdealGas'},
+            {'name': 'terrace', 'phase_type': 'InteractingInterface',
+             'site_density': 2.49e-9, 'phases': ['gas']},
+        ]
+
+    def time_organize_phases(self, n_reactions):
+        # Phases reassign the phase of their species so reset them
+        for ind_species in self.species:
+            ind_species.phase = 'gas' if ind_species.name == 'H2' \
+                else 'terrace'
+        omkm.organize_phases(
+            phases_data=[phase_data.copy() for phase_data in self.phases_data],
+            species=self.species,
+            reactions=self.reactions)
+
+
+class TimeThermdat:
+    params = [100, 5000]
+    param_names = ['n_species']
+
+    def setup(self, n_species):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'thermdat')
+        self.nasa_species = get_nasa_species(n_species=n_species)
+        thermdat.write_thermdat(nasa_species=self.nasa_species,
+                                filename=self.filename, write_date=False)
+
+    def teardown(self, n_species):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_read_thermdat(self, n_species):
+        thermdat.read_thermdat(filename=self.filename)
+
+    def time_write_thermdat(self, n_species):
+        thermdat.write_thermdat(nasa_species=self.nasa_species,
+                                filename=self.filename, write_date=False)
+
+
+class TimeConvertCti:
+    params = [100, 2000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'thermo.cti')
+        self.out_name = os.path.join(self.tmp_dir, 'thermo.xml')
+        omkm.write_cti(filename=self.filename, T=500., write_xml=False,
+                       **get_omkm_mechanism(n_reactions=n_reactions))
+
+    def teardown(self, n_reactions):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_convert(self, n_reactions):
+        ctml_writer.convert(filename=self.filename, outName=self.out_name)
+
+
+class TimeReadExcel:
+    params = [100, 2000]
+    param_names = ['n_species']
+
+    def setup(self, n_species):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'species.xlsx')
+        species_table = get_species_table(n_species=n_species)
+        # read_excel skips the second row by default for comments
+        comments = pd.DataFrame([[''] * len(species_table.columns)],
+                                columns=species_table.columns)
+        pd.concat([comments, species_table]).to_excel(self.filename,
+                                                      index=False)
+        self.species_table = species_table
+
+    def teardown(self, n_species):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_read_excel(self, n_species):
+        excel.read_excel(io=self.filename)
+
+    def time_process_table(self, n_species):
+        excel._read_tabular_data(input_data=self.species_table,
+                                 source=self.filename)
+
+
+class TimeReadCsv:
+    params = [1000, 10000]
+    param_names = ['n_species']
+
+    def setup(self, n_species):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'species.csv')
+        get_species_table(n_species=n_species).to_csv(self.filename,
+                                                      index=False)
+
+    def teardown(self, n_species):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_read_csv(self, n_species):
+        for _ in tabular.read_csv(filename=self.filename, chunksize=1000):
+            pass
+
+
+class TimeRingReadReactions:
+    params = [1000, 10000, 50000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'ring_reactions.txt')
+        self.species = write_ring_file(filename=self.filename,
+                                       n_reactions=n_reactions)
+
+    def teardown(self, n_reactions):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_read_reactions(self, n_reactions):
+        ring.read_reactions(filename=self.filename, species=self.species)
+
+
+class TimeChemkinReadReactions:
+    params = [1000, 10000, 50000]
+    param_names = ['n_reactions']
+
+    def setup(self, n_reactions):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'gas.inp')
+        write_chemkin_file(filename=self.filename, n_reactions=n_reactions)
+
+    def teardown(self, n_reactions):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_read_reactions(self, n_reactions):
+        chemkin.read_reactions(filename=self.filename)
+
+
+class TimeOutcarFrequencies:
+    params = [100, 10000]
+    param_names = ['n_ionic_steps']
+
+    def setup(self, n_ionic_steps):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'OUTCAR')
+        write_outcar_file(filename=self.filename, n_ionic_steps=n_ionic_steps)
+
+    def teardown(self, n_ionic_steps):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_set_vib_wavenumbers_from_outcar(self, n_ionic_steps):
+        vasp.set_vib_wavenumbers_from_outcar(in_file=self.filename,
+                                             output_structure={})
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeRingReadReactions, TimeChemkinReadReactions,
+                            TimeOutcarFrequencies, TimeReadExcel,
+                            TimeReadCsv, TimeWriteCti, TimeWriteThermoYaml,
+                            TimeOrganizePhases, TimeConvertCti,
+                            TimeChemkinWrite, TimeThermdat):
+        benchmark = benchmark_class()
+        if len(benchmark_class.param_names) == 1:
+            all_params = [(param, ) for param in benchmark_class.params]
+        else:
+            all_params = list(itertools.product(*benchmark_class.params))
+        for params in all_params:
+            benchmark.setup(*params)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(timeit.repeat(lambda: method(*params), number=1,
+                                      repeat=3))
+                print('{}.{:<24} {:<12} {:10.4f} s'.format(
+                    benchmark_class.__name__, method_name, str(params), t))
+            if hasattr(benchmark, 'teardown'):
+                benchmark.teardown(*params)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_network
+Timing of energy span analysis on branched reaction networks. Classes follow
+the airspeed velocity (asv) conventions but the file can also be run directly.
+"""
+import random
+import timeit
+
+import numpy as np
+
+from pmutt.reaction import Reaction
+from pmutt.reaction.network import Network
+from pmutt.statmech import ConstantMode, StatMech
+
+
+def get_lattice_network(n_rows, n_cols, seed=0):
+    """Generates a branched network where intermediate (i, j) reacts to form
+    (i+1, j) and (i, j+1). Energies drift downhill towards (n_rows-1,
+    n_cols-1) with random noise.
+
+    Parameters
+    ----------
+        n_rows : int
+            Number of rows of intermediates
+        n_cols : int
+            Number of columns of intermediates
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        network : :class:`~pmutt.reaction.network.Network` object
+            Reaction network with n_rows*n_cols intermediates
+    """
+    rng = random.Random(seed)
+    intermediates = {}
+    for i in range(n_rows):
+        for j in range(n_cols):
+            G = -0.1 * (i + j) + rng.uniform(-0.5, 0.5)
+            intermediates[(i, j)] = StatMech(name='I{}_{}'.format(i, j),
+                                             elec_model=ConstantMode(G=G))
+    reactions = []
+    for (i, j), reactant in intermediates.items():
+        for indices in ((i + 1, j), (i, j + 1)):
+            try:
+                product = intermediates[indices]
+            except KeyError:
+                continue
+            G_TS = max(reactant.elec_model.G, product.elec_model.G) \
+                + rng.uniform(0.2, 1.2)
+            transition_state = StatMech(
+                name='TS_{}_{}'.format(reactant.name, product.name),
+                elec_model=ConstantMode(G=G_TS))
+            reactions.append(
+                Reaction(reactants=[reactant],
+                         reactants_stoich=[1.],
+                         products=[product],
+                         products_stoich=[1.],
+                         transition_state=[transition_state],
+                         transition_state_stoich=[1.]))
+    return Network(reactions=reactions)
+
+
+class TimeMinEnergySpan:
+    params = [10, 20, 30]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.network = get_lattice_network(n_rows=n_rows, n_cols=n_rows)
+        self.target = 'I{0}_{0}'.format(n_rows - 1)
+
+    def time_get_min_E_span(self, n_rows):
+        self.network.get_min_E_span(source='I0_0',
+                                    target=self.target,
+                                    units='eV',
+                                    T=500.)
+
+    def time_get_G_nodes(self, n_rows):
+        self.network.update_network()
+        self.network.get_G_nodes(units='eV', T=500.)
+
+
+class TimeEnergySpanSweep:
+    params = [10, 20]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.network = get_lattice_network(n_rows=n_rows, n_cols=n_rows)
+        self.target = 'I{0}_{0}'.format(n_rows - 1)
+        self.T = np.linspace(300., 900., 50)
+
+    def time_get_E_span_sweep(self, n_rows):
+        self.network.get_E_span_sweep(source='I0_0',
+                                      target=self.target,
+                                      T=self.T)
+
+
+class TimeNetworkUpdate:
+    params = [10, 20, 30]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.network = get_lattice_network(n_rows=n_rows, n_cols=n_rows)
+        self.reaction = self.network.reactions[len(self.network) // 2]
+
+    def time_update_network(self, n_rows):
+        self.network.update_network()
+
+    def time_add_remove_reaction(self, n_rows):
+        self.network.remove_reaction(self.reaction)
+        self.network.add_reaction(self.reaction)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeMinEnergySpan, TimeEnergySpanSweep,
+                            TimeNetworkUpdate):
+        benchmark = benchmark_class()
+        for n_rows in benchmark_class.params:
+            benchmark.setup(n_rows)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(
+                    timeit.repeat(lambda: method(n_rows), number=1, repeat=3))
+                print('{:<26} {:>5} intermediates {:10.4f} s'.format(
+                    method_name, n_rows**2, t))
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_reaction
+Timing of reaction rate parameters, phase diagrams and equilibrium
+compositions. Classes follow the airspeed velocity (asv) conventions but the
+file can also be run directly.
+"""
+import itertools
+import os
+import timeit
+
+import numpy as np
+
+from pmutt.equilibrium import Equilibrium
+from pmutt.reaction import Reaction
+from pmutt.reaction.phasediagram import PhaseDiagram
+from pmutt.statmech import StatMech, elec, rot, trans, vib
+
+
+def get_adsorbate(name, n_vib, rng):
+    """Creates an adsorbate with harmonic vibrations
+
+    Parameters
+    ----------
+        name : str
+            Name of the adsorbate
+        n_vib : int
+            Number of vibrational modes
+        rng : numpy.random.Generator
+            Random number generator
+    Returns
+    -------
+        adsorbate : :class:`~pmutt.statmech.StatMech` object
+            Adsorbate with vibrational and electronic modes
+    """
+    return StatMech(
+        name=name,
+        vib_model=vib.HarmonicVib(
+            vib_wavenumbers=rng.uniform(100., 3500., n_vib)),
+        elec_model=elec.GroundStateElec(
+            potentialenergy=rng.uniform(-50., -5.)))
+
+
+def get_surface_reactions(n_reactions, n_vib=15, seed=0):
+    """Generates bimolecular surface reactions, A* + B* -> TS* -> AB* + *,
+    between randomly generated adsorbates
+
+    Parameters
+    ----------
+        n_reactions : int
+            Number of reactions
+        n_vib : int, optional
+            Number of vibrational modes of each adsorbate. Default is 15
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        reactions : list of :class:`~pmutt.reaction.Reaction` objects
+            Surface reactions
+    """
+    rng = np.random.default_rng(seed)
+    site = StatMech(name='*',
+                    elec_model=elec.GroundStateElec(potentialenergy=0.))
+    reactions = []
+    for i in range(n_reactions):
+        reactant1 = get_adsorbate('A{}*'.format(i), n_vib, rng)
+        reactant2 = get_adsorbate('B{}*'.format(i), n_vib, rng)
+        product = get_adsorbate('AB{}*'.format(i), 2 * n_vib, rng)
+        transition_state = get_adsorbate('TS{}*'.format(i), 2 * n_vib - 1,
+                                         rng)
+        reactions.append(
+            Reaction(reactants=[reactant1, reactant2],
+                     reactants_stoich=[1., 1.],
+                     products=[product, site],
+                     products_stoich=[1., 1.],
+                     transition_state=[transition_state],
+                     transition_state_stoich=[1.]))
+    return reactions
+
+
+def get_oxide_phase_diagram(n_phases, seed=0):
+    """Generates a phase diagram of surface oxides, M + x/2 O2 -> MOx
+
+    Parameters
+    ----------
+        n_phases : int
+            Number of oxide phases
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        phase_diagram : :class:`~pmutt.reaction.phasediagram.PhaseDiagram`
+            Phase diagram with one formation reaction per oxide
+    """
+    rng = np.random.default_rng(seed)
+    O2 = StatMech(
+        name='O2',
+        trans_model=trans.FreeTrans(n_degrees=3, molecular_weight=32.),
+        rot_model=rot.RigidRotor(symmetrynumber=2, rot_temperatures=[2.08],
+                                 geometry='linear'),
+        vib_model=vib.HarmonicVib(vib_wavenumbers=[1580.]),
+        elec_model=elec.GroundStateElec(potentialenergy=-9.86, spin=1.))
+    metal = get_adsorbate('M', 6, rng)
+    reactions = []
+    for i in range(n_phases):
+        n_O = i + 1
+        oxide = get_adsorbate('MO{}'.format(n_O), 6 + 3 * n_O, rng)
+        oxide.elec_model.potentialenergy = metal.elec_model.potentialenergy \
+            - 4.93 * n_O - rng.uniform(0.5, 2.) * n_O
+        reactions.append(
+            Reaction(reactants=[metal, O2],
+                     reactants_stoich=[1., n_O / 2.],
+                     products=[oxide],
+                     products_stoich=[1.]))
+    return PhaseDiagram(reactions=reactions)
+
+
+class TimeReactionGetA:
+    params = ([10, 100], [15, 60])
+    param_names = ['n_reactions', 'n_vib']
+
+    def setup(self, n_reactions, n_vib):
+        self.reactions = get_surface_reactions(n_reactions=n_reactions,
+                                               n_vib=n_vib)
+
+    def time_get_A(self, n_reactions, n_vib):
+        for reaction in self.reactions:
+            reaction.get_A(T=500.)
+
+    def time_get_A_entropy(self, n_reactions, n_vib):
+        for reaction in self.reactions:
+            reaction.get_A(T=500., use_q=False)
+
+
+class TimePhaseDiagram:
+    params = ([5], [10, 40])
+    param_names = ['n_phases', 'n_points']
+
+    def setup(self, n_phases, n_points):
+        self.phase_diagram = get_oxide_phase_diagram(n_phases=n_phases)
+        self.T = np.linspace(300., 1200., n_points)
+        self.P = np.logspace(-10., 1., n_points)
+
+    def time_get_GoRT_2D(self, n_phases, n_points):
+        self.phase_diagram.get_GoRT_2D(x1_name='T', x1_values=self.T,
+                                       x2_name='P', x2_values=self.P)
+
+
+class TimeEquilibrium:
+    params = [500., 900.]
+    param_names = ['T']
+
+    def setup(self, T):
+        # Propane dehydrogenation network used by the unit tests
+        thermdat_path = os.path.join(os.path.dirname(__file__), os.pardir,
+                                     'pmutt', 'tests', 'equilibrium',
+                                     'thermdat_equilibrium_unittest.txt')
+        network = {'CH3CH2CH3': 1, 'H2O': 0.7, 'H2': 0, 'CH2CHCH3': 0,
+                   'CH4': 0, 'CHCH': 0, 'CH2CH2': 0, 'CH3CH3': 0,
+                   'CO2': 0, 'CO': 0}
+        self.equilibrium = Equilibrium.from_thermdat(thermdat_path, network)
+
+    def time_get_net_comp(self, T):
+        self.equilibrium.get_net_comp(T=T, P=1.)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeReactionGetA, TimePhaseDiagram,
+                            TimeEquilibrium):
+        benchmark = benchmark_class()
+        if len(benchmark_class.param_names) == 1:
+            all_params = [(param, ) for param in benchmark_class.params]
+        else:
+            all_params = list(itertools.product(*benchmark_class.params))
+        for params in all_params:
+            benchmark.setup(*params)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(timeit.repeat(lambda: method(*params), number=1,
+                                      repeat=3))
+                print('{}.{:<20} {:<12} {:10.4f} s'.format(
+                    benchmark_class.__name__, method_name, str(params), t))
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmark_statmech
+Timing of statistical mechanical models over temperature grids. Classes
+follow the airspeed velocity (asv) conventions but the file can also be run
+directly.
+"""
+import itertools
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from pmutt.statmech import EmptyMode, StatMech, elec, rot, trans, vib
+
+
+def get_ideal_gas(n_atoms, name='species', seed=0):
+    """Creates a nonlinear ideal gas species with random properties
+
+    Parameters
+    ----------
+        n_atoms : int
+            Number of atoms. The species has 3*n_atoms-6 vibrational modes
+        name : str, optional
+            Name of the species. Default is 'species'
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        species : :class:`~pmutt.statmech.StatMech` object
+            Species with translational, rotational, vibrational and
+            electronic modes
+    """
+    rng = np.random.default_rng(seed)
+    return StatMech(
+        name=name,
+        elements={'C': n_atoms // 3, 'H': n_atoms - n_atoms // 3},
+        trans_model=trans.FreeTrans(n_degrees=3,
+                                    molecular_weight=10. * n_atoms),
+        rot_model=rot.RigidRotor(symmetrynumber=int(rng.integers(1, 4)),
+                                 rot_temperatures=rng.uniform(0.1, 5., 3),
+                                 geometry='nonlinear'),
+        vib_model=vib.HarmonicVib(
+            vib_wavenumbers=rng.uniform(100., 3500., 3 * n_atoms - 6)),
+        elec_model=elec.GroundStateElec(
+            potentialenergy=rng.uniform(-50., -5.), spin=0.))
+
+
+class TimeHarmonicVib:
+    params = ([3, 300], [1, 1000])
+    param_names = ['n_modes', 'n_T']
+    vib_class = vib.HarmonicVib
+
+    def setup(self, n_modes, n_T):
+        vib_wavenumbers = np.linspace(50., 3500., n_modes)
+        # Include an imaginary frequency as is typical of adsorbates
+        vib_wavenumbers[0] *= -1.
+        self.vib_model = self.vib_class(vib_wavenumbers=vib_wavenumbers,
+                                        imaginary_substitute=12.)
+        self.T = np.linspace(100., 1500., n_T)
+
+    def time_get_CvoR(self, n_modes, n_T):
+        self.vib_model.get_CvoR(T=self.T)
+
+    def time_get_SoR(self, n_modes, n_T):
+        self.vib_model.get_SoR(T=self.T)
+
+    def time_get_GoRT(self, n_modes, n_T):
+        self.vib_model.get_GoRT(T=self.T)
+
+
+class TimeQRRHOVib(TimeHarmonicVib):
+    vib_class = vib.QRRHOVib
+
+
+class TimeDebyeVib:
+    params = [1, 100, 10000]
+    param_names = ['n_T']
+
+    def setup(self, n_T):
+        self.vib_model = vib.DebyeVib(debye_temperature=215.,
+                                      interaction_energy=0.5)
+        self.T = np.linspace(100., 1500., n_T)
+
+    def time_get_CvoR(self, n_T):
+        self.vib_model.get_CvoR(T=self.T)
+
+    def time_get_SoR(self, n_T):
+        self.vib_model.get_SoR(T=self.T)
+
+    def time_get_GoRT(self, n_T):
+        self.vib_model.get_GoRT(T=self.T)
+
+
+class TimeStatMech:
+    params = ([3, 30], [1, 100, 1000])
+    param_names = ['n_atoms', 'n_T']
+
+    def setup(self, n_atoms, n_T):
+        self.species = get_ideal_gas(n_atoms=n_atoms)
+        self.T = np.linspace(100., 1500., n_T)
+
+    # StatMech combines the modes for one temperature at a time so the grid
+    # is evaluated the same way as when fitting empirical models
+    def time_get_CpoR(self, n_atoms, n_T):
+        [self.species.get_CpoR(T=T) for T in self.T]
+
+    def time_get_GoRT(self, n_atoms, n_T):
+        [self.species.get_GoRT(T=T, P=1.) for T in self.T]
+
+
+def get_adsorbate(n_vib, name='species', seed=0):
+    """Creates an adsorbate the way the spreadsheet reader does, with the
+    wavenumbers as a list and the unused modes passed as classes
+
+    Parameters
+    ----------
+        n_vib : int
+            Number of vibrational modes
+        name : str, optional
+            Name of the species. Default is 'species'
+        seed : int, optional
+            Seed for the random number generator. Default is 0
+    Returns
+    -------
+        species : :class:`~pmutt.statmech.StatMech` object
+            Species with vibrational and electronic modes
+    """
+    rng = np.random.default_rng(seed)
+    return StatMech(
+        name=name,
+        vib_model=vib.HarmonicVib(
+            vib_wavenumbers=rng.uniform(100., 3500., n_vib).tolist()),
+        elec_model=elec.GroundStateElec(
+            potentialenergy=rng.uniform(-50., -5.)),
+        trans_model=EmptyMode,
+        rot_model=EmptyMode,
+        nucl_model=EmptyMode)
+
+
+class TrackStatMechMemory:
+    params = ['ideal_gas', 'adsorbate']
+    param_names = ['species_type']
+    n_species = 2000
+
+    def _get_species(self, species_type):
+        if species_type == 'ideal_gas':
+            return [get_ideal_gas(n_atoms=6, name='species{}'.format(i),
+                                  seed=i)
+                    for i in range(self.n_species)]
+        return [get_adsorbate(n_vib=15, name='species{}'.format(i), seed=i)
+                for i in range(self.n_species)]
+
+    def track_bytes_per_species(self, species_type):
+        tracemalloc.start()
+        try:
+            mem_start = tracemalloc.get_traced_memory()[0]
+            species = self._get_species(species_type)
+            mem_end = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return (mem_end - mem_start) / len(species)
+    track_bytes_per_species.unit = 'bytes'
+
+    def peakmem_create_species(self, species_type):
+        self._get_species(species_type)
+
+
+if __name__ == '__main__':
+    for benchmark_class in (TimeHarmonicVib, TimeQRRHOVib, TimeDebyeVib,
+                            TimeStatMech):
+        benchmark = benchmark_class()
+        if len(benchmark_class.param_names) == 1:
+            all_params = [(param, ) for param in benchmark_class.params]
+        else:
+            all_params = list(itertools.product(*benchmark_class.params))
+        for params in all_params:
+            benchmark.setup(*params)
+            for method_name in dir(benchmark):
+                if not method_name.startswith('time_'):
+                    continue
+                method = getattr(benchmark, method_name)
+                t = min(timeit.repeat(lambda: method(*params), number=1,
+                                      repeat=3))
+                print('{}.{:<20} {:<12} {:10.6f} s'.format(
+                    benchmark_class.__name__, method_name, str(params), t))
+    for species_type in TrackStatMechMemory.params:
+        n_bytes = TrackStatMechMemory().track_bytes_per_species(species_type)
+        print('TrackStatMechMemory.track_bytes_per_species {:<12} {:10.1f} '
+              'bytes'.format(species_type, n_bytes))
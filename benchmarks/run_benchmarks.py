@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.run_benchmarks
+Runs the benchmarks without airspeed velocity and compares the timings (and
+values of ``track_`` methods, e.g. memory) to the baselines stored in
+baselines.json. Exits with a non-zero status if a result is larger than its
+baseline by more than the tolerance.
+
+Baselines depend on the machine so they should be regenerated using
+``--save`` before comparing on a new machine, e.g.
+
+    python benchmarks/run_benchmarks.py --quick --save
+    python benchmarks/run_benchmarks.py --quick
+"""
+import argparse
+import glob
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import sys
+import timeit
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+root_path = os.path.dirname(benchmarks_path)
+default_baselines_path = os.path.join(benchmarks_path, 'baselines.json')
+
+
+def get_benchmark_classes(pattern=None):
+    """Imports the benchmark modules and finds the benchmark classes
+
+    Parameters
+    ----------
+        pattern : str, optional
+            Regular expression. Only classes whose name (module.class)
+            matches are returned. Default is None
+    Returns
+    -------
+        benchmark_classes : list of (str, class)
+            Name (module.class) and benchmark class
+    """
+    for path in (root_path, benchmarks_path):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    benchmark_classes = []
+    for filename in sorted(glob.glob(os.path.join(benchmarks_path,
+                                                  'benchmark_*.py'))):
+        module_name = os.path.splitext(os.path.basename(filename))[0]
+        module = importlib.import_module(module_name)
+        for class_name, benchmark_class in inspect.getmembers(
+                module, inspect.isclass):
+            if not class_name.startswith(('Time', 'Track')) \
+                    or benchmark_class.__module__ != module_name:
+                continue
+            name = '{}.{}'.format(module_name, class_name)
+            if pattern is not None and re.search(pattern, name) is None:
+                continue
+            benchmark_classes.append((name, benchmark_class))
+    return benchmark_classes
+
+
+def _get_all_params(benchmark_class, quick=False):
+    """Returns the combinations of parameters of a benchmark class
+
+    Parameters
+    ----------
+        benchmark_class : class
+            Benchmark class following the asv conventions
+        quick : bool, optional
+            If True, only the first value of each parameter is used. Default
+            is False
+    Returns
+    -------
+        all_params : list of tuple
+            Parameters to pass to the setup and time methods
+    """
+    if len(benchmark_class.param_names) == 1:
+        params = [benchmark_class.params]
+    else:
+        params = benchmark_class.params
+    if quick:
+        params = [param_values[:1] for param_values in params]
+    return list(itertools.product(*params))
+
+
+def run_benchmarks(benchmark_classes, quick=False, repeat=3, verbose=True):
+    """Runs the time and track methods of the benchmark classes
+
+    Parameters
+    ----------
+        benchmark_classes : list of (str, class)
+            Benchmarks returned by :func:`get_benchmark_classes`
+        quick : bool, optional
+            If True, only the first value of each parameter is used. Default
+            is False
+        repeat : int, optional
+            Number of times each ``time_`` method is timed after an untimed
+            warm-up call. The best time is reported. Benchmark classes with a
+            ``repeat`` attribute override this value. Default is 3
+        verbose : bool, optional
+            If True, prints the results as they are measured. Default is True
+    Returns
+    -------
+        results : dict
+            Best time in s of ``time_`` methods and value returned by
+            ``track_`` methods using '<module>.<class>.<method>(<params>)' as
+            the keys
+    """
+    results = {}
+    for name, benchmark_class in benchmark_classes:
+        benchmark = benchmark_class()
+        method_names = [method_name for method_name in dir(benchmark)
+                        if method_name.startswith(('time_', 'track_'))]
+        class_repeat = getattr(benchmark_class, 'repeat', repeat)
+        for params in _get_all_params(benchmark_class, quick=quick):
+            if hasattr(benchmark, 'setup'):
+                benchmark.setup(*params)
+            try:
+                for method_name in method_names:
+                    method = getattr(benchmark, method_name)
+                    key = '{}.{}{}'.format(name, method_name,
+                                           _get_params_str(params))
+                    if method_name.startswith('track_'):
+                        result = method(*params)
+                        units = getattr(method, 'unit', '')
+                    else:
+                        # Untimed call so one-off costs (e.g. lazy imports)
+                        # are not included in the first timing
+                        method(*params)
+                        result = min(timeit.repeat(lambda: method(*params),
+                                                   number=1,
+                                                   repeat=class_repeat))
+                        units = 's'
+                    results[key] = result
+                    if verbose:
+                        print('{:<72} {:10.4f} {}'.format(key, result, units))
+            finally:
+                if hasattr(benchmark, 'teardown'):
+                    benchmark.teardown(*params)
+    return results
+
+
+def _get_params_str(params):
+    return '({})'.format(', '.join(str(param) for param in params))
+
+
+def compare_results(results, baselines, tolerance=1.5, track_tolerance=1.1,
+                    min_time=1.e-3):
+    """Compares results to the baselines
+
+    Parameters
+    ----------
+        results : dict
+            Results returned by :func:`run_benchmarks`
+        baselines : dict
+            Stored results using the same keys
+        tolerance : float, optional
+            Maximum ratio of the timing to the baseline. Default is 1.5
+        track_tolerance : float, optional
+            Maximum ratio of the values of ``track_`` methods to the
+            baseline. These values (e.g. memory) are less noisy than timings.
+            Default is 1.1
+        min_time : float, optional
+            Timings and baselines below this value in s are dominated by
+            noise and are not compared. Default is 1 ms
+    Returns
+    -------
+        regressions : list of (str, float, float)
+            Key, result and baseline of the benchmarks exceeding the tolerance
+    """
+    regressions = []
+    for key, result in results.items():
+        try:
+            baseline = baselines[key]
+        except KeyError:
+            continue
+        if '.track_' in key:
+            max_ratio = track_tolerance
+        elif max(result, baseline) < min_time:
+            continue
+        else:
+            max_ratio = tolerance
+        if result > max_ratio * baseline:
+            regressions.append((key, result, baseline))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Runs the pmutt benchmarks and compares them to the '
+                    'stored baselines.')
+    parser.add_argument('pattern', nargs='?', default=None,
+                        help='Regular expression to select the benchmark '
+                             'classes (module.class)')
+    parser.add_argument('--quick', action='store_true',
+                        help='Only use the first value of each parameter')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of runs of each benchmark')
+    parser.add_argument('--save', action='store_true',
+                        help='Store the results as the new baselines')
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help='Maximum ratio of the timing to the baseline')
+    parser.add_argument('--track-tolerance', type=float, default=1.1,
+                        help='Maximum ratio of tracked values (e.g. memory) '
+                             'to the baseline')
+    parser.add_argument('--baselines', default=default_baselines_path,
+                        help='Path to the baselines file')
+    args = parser.parse_args(args)
+
+    benchmark_classes = get_benchmark_classes(pattern=args.pattern)
+    results = run_benchmarks(benchmark_classes, quick=args.quick,
+                             repeat=args.repeat)
+
+    try:
+        with open(args.baselines) as f_ptr:
+            baselines = json.load(f_ptr)
+    except FileNotFoundError:
+        baselines = {'machine': {}, 'results': {}}
+
+    if args.save:
+        baselines['machine'] = {'platform': platform.platform(),
+                                'processor': platform.processor(),
+                                'python': platform.python_version()}
+        baselines['results'].update(results)
+        baselines['results'] = dict(sorted(baselines['results'].items()))
+        with open(args.baselines, 'w') as f_ptr:
+            json.dump(baselines, f_ptr, indent=1)
+            f_ptr.write('\n')
+        print('Saved {} results to {}'.format(len(results), args.baselines))
+        return 0
+
+    regressions = compare_results(results, baselines['results'],
+                                  tolerance=args.tolerance,
+                                  track_tolerance=args.track_tolerance)
+    n_compared = len(set(results) & set(baselines['results']))
+    print('Compared {} of {} results to the baselines'.format(
+        n_compared, len(results)))
+    for key, result, baseline in regressions:
+        print('Regression: {} is {:.4f} (baseline {:.4f}, {:.2f}x)'
+              ''.format(key, result, baseline, result / baseline))
+    return int(len(regressions) > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,17 +12,48 @@ pmutt
 name = 'pmutt'
 __version__ = '1.4.5'
 
+import importlib
 import os
 import inspect
 import itertools
 import re
+import weakref
 from warnings import warn
 
 import numpy as np
-import pygal
-from matplotlib import pyplot as plt
+
+
+class _LazyModule:
+    """Stands in for a module that is only imported when one of its
+    attributes is first accessed. Used for plotting, optimization and other
+    backends that are slow to import but not needed by most calculations.
+
+    Attributes
+    ----------
+        name : str
+            Full name of the module. e.g. 'matplotlib.pyplot'
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        # Only called for attributes not found normally. name is missing if
+        # __init__ was skipped (e.g. copying, unpickling) and special methods
+        # are looked up by copy and pickle so neither imports the module
+        if attr == 'name' or (attr.startswith('__') and attr.endswith('__')):
+            raise AttributeError(attr)
+        module = importlib.import_module(self.name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return '<lazy module {}>'.format(self.name)
+
+
+plt = _LazyModule('matplotlib.pyplot')
+pygal = _LazyModule('pygal')
 
 from pmutt import constants as c
+from pmutt import profiling
 from pmutt.io.json import remove_class
 
 
@@ -30,12 +61,46 @@ class _pmuttBase:
     """Generic parent class to all pmutt objects. Functionality:
 
     - ``__eq__`` method that compares ``to_dict`` outputs
+    - ``__hash__`` method based on the ``to_dict`` output so objects can be
+      used in sets and as dictionary keys
     - ``to_dict`` method that converts object to dictionary format
-    - ``from_dict`` method that creates the object from a dictionary"""
+    - ``from_dict`` method that creates the object from a dictionary
+
+    The ``to_dict`` output is cached as a fingerprint used by ``__eq__`` and
+    ``__hash__``. Assigning an attribute clears the fingerprint of the object
+    and of the pmutt objects containing it. Call
+    :meth:`~pmutt._pmuttBase.clear_fingerprint` after modifying a mutable
+    attribute in place (e.g. ``species.elements['C'] = 2``).
+
+    Subclasses without ``__slots__`` store their attributes in ``__dict__``.
+    Subclasses that define ``__slots__`` (e.g. statistical mechanical modes)
+    should also define ``to_dict`` if they have attributes.
+    """
+    # Cached fingerprint and weak references to the objects containing this
+    # one. Stored in slots so they are not part of to_dict
+    __slots__ = ('_fingerprint', '_parents', '__weakref__')
+
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        # Set here so assignments in __init__ do not look up an empty slot
+        object.__setattr__(obj, '_fingerprint', None)
+        return obj
+
     def __init__(self):
         pass
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._fingerprint is not None:
+            self.clear_fingerprint()
+
     def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, _pmuttBase):
+            # Frozensets with different cached hashes are unequal without
+            # comparing their items
+            return self._get_fingerprint() == other._get_fingerprint()
         try:
             other_dict = other.to_dict()
         except AttributeError:
@@ -43,6 +108,99 @@ class _pmuttBase:
             return False
         return self.to_dict() == other_dict
 
+    def __hash__(self):
+        return hash(self._get_fingerprint())
+
+    def __getstate__(self):
+        # Cached fingerprints and parents are not copied or pickled
+        state = dict(getattr(self, '__dict__', {}))
+        for name in _get_slot_names(type(self)):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def clear_fingerprint(self):
+        """Clears the cached fingerprint of the object and of the pmutt
+        objects containing it. Assigning an attribute does this
+        automatically but modifying a mutable attribute in place does not."""
+        if getattr(self, '_fingerprint', None) is None:
+            # Containing objects were cleared when this fingerprint was
+            return
+        object.__setattr__(self, '_fingerprint', None)
+        for parent_ref in list(getattr(self, '_parents', {}).values()):
+            parent = parent_ref()
+            if parent is not None:
+                parent.clear_fingerprint()
+
+    def _get_fingerprint(self):
+        """Hashable representation of the ``to_dict`` output. Equal objects
+        have equal fingerprints.
+
+        Returns
+        -------
+            fingerprint : frozenset
+        """
+        fingerprint = getattr(self, '_fingerprint', None)
+        if fingerprint is not None:
+            return fingerprint
+        # Contained objects clear this fingerprint when they are modified
+        for value in self._get_attribute_values():
+            for child in _get_pmutt_objects(value):
+                child._add_parent(self)
+                child._get_fingerprint()
+        fingerprint = _get_hashable(self.to_dict())
+        object.__setattr__(self, '_fingerprint', fingerprint)
+        return fingerprint
+
+    def _add_parent(self, parent):
+        """Registers an object whose ``clear_fingerprint`` method is called
+        when this object's fingerprint is cleared.
+
+        Parameters
+        ----------
+            parent : pmutt object
+                Object containing this object
+        """
+        if getattr(self, '__dict__', None) is None \
+           and not _get_slot_names(type(self)):
+            # Objects without attributes (e.g. EmptyMode) cannot change
+            return
+        try:
+            parents = self._parents
+        except AttributeError:
+            parents = {}
+            object.__setattr__(self, '_parents', parents)
+        parent_ref = parents.get(id(parent))
+        if parent_ref is not None and parent_ref() is parent:
+            return
+        if len(parents) % 64 == 63:
+            # Remove the references to objects that no longer exist
+            for parent_id, parent_ref in list(parents.items()):
+                if parent_ref() is None:
+                    del parents[parent_id]
+        parents[id(parent)] = weakref.ref(parent)
+
+    def _get_attribute_values(self):
+        """Values of the attributes in ``__dict__`` and ``__slots__``
+
+        Returns
+        -------
+            values : list
+        """
+        values = list(getattr(self, '__dict__', {}).values())
+        for name in _get_slot_names(type(self)):
+            try:
+                values.append(object.__getattribute__(self, name))
+            except AttributeError:
+                pass
+        return values
+
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
 
@@ -50,7 +208,7 @@ class _pmuttBase:
         -------
             obj_dict : dict
         """
-        obj_dict = dict(self.__dict__)
+        obj_dict = dict(getattr(self, '__dict__', {}))
         obj_dict['class'] = str(self.__class__)
         return obj_dict
 
@@ -79,6 +237,9 @@ class _ModelBase(_pmuttBase):
       ``get_F``, ``get_GoRT``, ``get_G``)
       
     Inherits from :class:`~pmutt._pmuttBase`"""
+    # Allows subclasses to be defined using __slots__
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -552,6 +713,9 @@ def _get_expected_arguments(fn):
         fn = fn.__init__
 
     fn_code = fn.__code__
+    # Methods instrumented by pmutt.profiling expect the original arguments
+    if fn_code is profiling._method_wrapper_code:
+        fn_code = fn.__wrapped__.__code__
     arg_count = fn_code.co_argcount
     args = fn_code.co_varnames[:arg_count]
     return args
@@ -587,6 +751,11 @@ def _pass_expected_arguments(fn, **kwargs):
     return fn(**expected_arg_val)
 
 
+# Results of _kwargs_allowed. Inspecting signatures is slow relative to the
+# functions being called
+_kwargs_allowed_cache = weakref.WeakKeyDictionary()
+
+
 def _kwargs_allowed(fn):
     """Checks to see if kwargs is allowed
 
@@ -599,12 +768,27 @@ def _kwargs_allowed(fn):
         kwargs_allowed : bool
             True if kwargs are allowed. False otherwise.
     """
+    # Bound methods share the result of the underlying function
+    key = getattr(fn, '__func__', fn)
+    try:
+        return _kwargs_allowed_cache[key]
+    except (KeyError, TypeError):
+        pass
+
     sig = inspect.signature(fn)
     for param in sig.parameters.values():
         if param.kind == param.VAR_KEYWORD:
-            return True
+            kwargs_allowed = True
+            break
     else:
-        return False
+        kwargs_allowed = False
+
+    try:
+        _kwargs_allowed_cache[key] = kwargs_allowed
+    except TypeError:
+        # Objects that cannot be weakly referenced are not cached
+        pass
+    return kwargs_allowed
 
 
 def _force_pass_arguments(fn, **kwargs):
@@ -656,6 +840,248 @@ def _is_iterable(val):
             return True
 
 
+# Types returned by _get_hashable without conversion
+_scalar_types = frozenset((float, int, str, bool))
+
+
+def _get_hashable(val):
+    """
+    Converts a value (typically a ``to_dict`` output) to a hashable
+    representation. Values that compare equal have equal representations.
+
+    Parameters
+    ----------
+        val : object
+            Value to convert
+    Returns
+    -------
+        hashable_val : hashable object
+            Dictionaries and sets are converted to frozensets, lists, tuples
+            and arrays to tuples and pmutt objects to their fingerprints.
+            Unhashable values of other types are wrapped in
+            :class:`~pmutt._UnhashableValue`.
+    """
+    if val is None or type(val) in _scalar_types:
+        return val
+    elif isinstance(val, _pmuttBase):
+        return val._get_fingerprint()
+    elif isinstance(val, dict):
+        return frozenset([(key, _get_hashable(sub_val))
+                          for key, sub_val in val.items()])
+    elif isinstance(val, (list, tuple)):
+        return tuple([_get_hashable(sub_val) for sub_val in val])
+    elif isinstance(val, np.ndarray):
+        return _get_hashable(val.tolist())
+    elif isinstance(val, (set, frozenset)):
+        return frozenset(_get_hashable(sub_val) for sub_val in val)
+    try:
+        hash(val)
+    except TypeError:
+        return _UnhashableValue(val)
+    return val
+
+
+class _UnhashableValue:
+    """Wraps a value that does not have a hashable representation. Values of
+    the same type have the same hash and are compared using ``==``.
+
+    Attributes
+    ----------
+        val : object
+            Wrapped value
+    """
+    __slots__ = ('val', )
+
+    def __init__(self, val):
+        self.val = val
+
+    def __eq__(self, other):
+        if not isinstance(other, _UnhashableValue):
+            return False
+        try:
+            return bool(self.val == other.val)
+        except (TypeError, ValueError):
+            # Comparison does not result in a single boolean
+            return self.val is other.val
+
+    def __hash__(self):
+        return hash(type(self.val).__name__)
+
+
+# Attribute names in __slots__ of each class. Populated by _get_slot_names
+_slot_names = {}
+
+
+def _get_slot_names(cls):
+    """Names of the attributes stored in ``__slots__`` by a pmutt class,
+    excluding the cached fingerprint and parents.
+
+    Parameters
+    ----------
+        cls : class
+            pmutt class
+    Returns
+    -------
+        slot_names : tuple of str
+    """
+    try:
+        return _slot_names[cls]
+    except KeyError:
+        pass
+    slot_names = []
+    for mro_cls in cls.__mro__:
+        cls_slots = mro_cls.__dict__.get('__slots__', ())
+        if isinstance(cls_slots, str):
+            cls_slots = (cls_slots, )
+        for name in cls_slots:
+            if name not in ('_fingerprint', '_parents', '__weakref__',
+                            '__dict__'):
+                slot_names.append(name)
+    _slot_names[cls] = tuple(slot_names)
+    return _slot_names[cls]
+
+
+def _get_pmutt_objects(val):
+    """Finds the pmutt objects in a value, searching through dictionaries,
+    lists, tuples and sets.
+
+    Parameters
+    ----------
+        val : object
+            Value to search
+    Returns
+    -------
+        pmutt_objs : list of pmutt objects
+    """
+    if isinstance(val, _pmuttBase):
+        return [val]
+    elif isinstance(val, dict):
+        val = val.values()
+    elif not isinstance(val, (list, tuple, set, frozenset)):
+        return []
+    pmutt_objs = []
+    for sub_val in val:
+        if isinstance(sub_val, (float, int, str)):
+            continue
+        pmutt_objs.extend(_get_pmutt_objects(sub_val))
+    return pmutt_objs
+
+
+class _UniqueObjects:
+    """Collection of pmutt objects without duplicates. Objects are filed by
+    fingerprint so checking for a duplicate does not compare every object.
+    Objects modified after being added are filed again under their new
+    fingerprint.
+    """
+    def __init__(self):
+        # Fingerprint -> objects filed under it
+        self._groups = {}
+        # id(obj) -> (obj, fingerprint it is filed under, watcher)
+        self._entries = {}
+        # Objects whose fingerprint was cleared since they were filed
+        self._changed = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        self._refile()
+        return obj._get_fingerprint() in self._groups
+
+    def add(self, obj):
+        """Adds the object if an equal object was not added before
+
+        Parameters
+        ----------
+            obj : pmutt object
+                Object to add
+        Returns
+        -------
+            added : bool
+                True if the object was added. False if it is a duplicate
+        """
+        self._refile()
+        fingerprint = obj._get_fingerprint()
+        if fingerprint in self._groups:
+            return False
+        watcher = _FingerprintWatcher(self._changed, obj)
+        obj._add_parent(watcher)
+        self._entries[id(obj)] = (obj, fingerprint, watcher)
+        self._groups[fingerprint] = [obj]
+        return True
+
+    def remove(self, obj):
+        """Removes the object, or an object equal to it
+
+        Parameters
+        ----------
+            obj : pmutt object
+                Object to remove
+        Returns
+        -------
+            removed_obj : pmutt object
+                Object that was removed. ``obj`` itself if it was added
+        Raises
+        ------
+            KeyError
+                If no object equal to ``obj`` was added
+        """
+        self._refile()
+        entry = self._entries.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            try:
+                obj = self._groups[obj._get_fingerprint()][0]
+            except KeyError:
+                raise KeyError(obj) from None
+        self._unfile(obj)
+        del self._entries[id(obj)]
+        return obj
+
+    def _unfile(self, obj):
+        fingerprint = self._entries[id(obj)][1]
+        group = [other for other in self._groups[fingerprint]
+                 if other is not obj]
+        if group:
+            self._groups[fingerprint] = group
+        else:
+            del self._groups[fingerprint]
+
+    def _refile(self):
+        """Files the modified objects under their current fingerprint"""
+        while self._changed:
+            obj = self._changed.pop()
+            entry = self._entries.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                # Removed after it was modified
+                continue
+            self._unfile(obj)
+            fingerprint = obj._get_fingerprint()
+            self._entries[id(obj)] = (obj, fingerprint, entry[2])
+            # Objects modified to be equal are kept together
+            self._groups.setdefault(fingerprint, []).append(obj)
+
+
+class _FingerprintWatcher:
+    """Registered as a parent of an object in :class:`~pmutt._UniqueObjects`
+    so the collection knows when the object is modified.
+
+    Attributes
+    ----------
+        changed : list
+            Modified objects of the collection
+        obj : pmutt object
+            Watched object
+    """
+    __slots__ = ('changed', 'obj', '__weakref__')
+
+    def __init__(self, changed, obj):
+        self.changed = changed
+        self.obj = obj
+
+    def clear_fingerprint(self):
+        self.changed.append(self.obj)
+
+
 def _get_mode_quantity(mode,
                        method_name,
                        raise_error=True,
@@ -964,7 +1390,10 @@ def _check_iterable_attr(obj):
             If ``obj`` is None, returns None. Otherwise, returns ``obj``
             as a list
     """
-    if not _is_iterable(obj) and obj is not None:
+    # None and lists are the most common inputs so skip the general check
+    if obj is None or isinstance(obj, list):
+        return obj
+    elif not _is_iterable(obj):
         return [obj]
     else:
         return obj
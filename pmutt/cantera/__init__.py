@@ -1,3 +1,5 @@
+import ast
+
 import more_itertools as mit
 
 
@@ -109,3 +111,28 @@ def _get_omkm_range(objs, parent_obj=None, delimiter='_', format='str'):
             CTI_out = CTI_out.replace('[', '').replace(']', '')
             CTI_out = CTI_out.split(', ')
     return CTI_out
+
+
+def _get_ctml_range(objs, parent_obj=None, delimiter='_'):
+    """Returns the objs IDs in the range format read by ctml_writer
+
+    Parameters
+    ----------
+        objs : list or str
+            Objects to be grouped. See
+            :func:`~pmutt.cantera._get_omkm_range` for more details.
+        parent_obj : obj, optional
+            Primarily used for more helpful error messages. Default is None.
+        delimiter : str, optional
+            Delimiter to separate header and footer of obj strings. Default is
+            '_'
+    Returns
+    -------
+        ctml_range : list of str or str
+            Ranges as they would be read from the CTI file
+    """
+    cti_range = _get_omkm_range(objs=objs,
+                                parent_obj=parent_obj,
+                                delimiter=delimiter)
+    # The range is a CTI literal (e.g. '["r_0001 to r_0003"]')
+    return ast.literal_eval(cti_range)
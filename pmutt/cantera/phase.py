@@ -1,8 +1,8 @@
 import more_itertools as mit
 
 from pmutt import constants as c
-from pmutt.cantera import _get_omkm_range
-from pmutt.io.cantera import obj_to_cti
+from pmutt.cantera import _get_ctml_range, _get_omkm_range
+from pmutt.io.cantera import _get_cti_number, obj_to_cti, obj_to_ctml
 
 
 class Phase:
@@ -71,28 +71,56 @@ class Phase:
             for i in range(len(val)):
                 val[i].phase = self
         self._species = val
+        self._species_index = None
 
     def append_species(self, val):
         self._species.append(val)
         self._species[-1].phase = self
+        if self._species_index is not None:
+            self._species_index.setdefault(val.name, len(self._species) - 1)
 
     def extend_species(self, val):
         for i in range(len(val)):
             val[i].phase = self
         self._species.extend(val)
+        self._species_index = None
 
     def remove_species(self, name):
         i = self.index_species(name)
         self.pop_species(i)
 
     def index_species(self, name):
-        return self.species_names.index(name)
+        # Position of the first species with each name. The list can be
+        # modified directly so the position is checked before returning it
+        try:
+            i = self._species_index[name]
+            if self._species[i].name == name:
+                return i
+        except (KeyError, IndexError, TypeError):
+            pass
+        self._species_index = {}
+        for i, ind_species in enumerate(self._species):
+            self._species_index.setdefault(ind_species.name, i)
+        try:
+            return self._species_index[name]
+        except KeyError:
+            raise ValueError('{} is not in list'.format(repr(name)))
 
     def pop_species(self, i):
-        self._species.pop(i)
+        ind_species = self._species.pop(i)
+        if self._species_index is not None:
+            # Only the species after the removed one change position
+            if i < 0:
+                i += len(self._species) + 1
+            if i == len(self._species):
+                if self._species_index.get(ind_species.name) == i:
+                    del self._species_index[ind_species.name]
+            else:
+                self._species_index = None
 
     def clear_species(self):
         self._species.clear()
+        self._species_index = None
 
     def copy_species(self):
         return self._species.copy()
@@ -209,6 +237,52 @@ class IdealGas(Phase):
         cti_str = '{})\n'.format(cti_str[:-2])
         return cti_str
 
+    def to_ctml(self, ctml, max_line_len=80, delimiter='_'):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.cantera.phase.IdealGas.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the phase
+            max_line_len : int, optional
+                Maximum number of characters in the line of the equivalent
+                CTI file. Default is 80.
+            delimiter : str, optional
+                Delimiter to use when specifying ranges for reactions. Default
+                is '_'.
+        Returns
+        -------
+            ctml_phase : ctml_writer.ideal_gas object
+                Phase entry
+        """
+        species_names = [species.name for species in self.species]
+        kwargs = {
+            'name': obj_to_ctml(self.name,
+                                line_len=max_line_len - 15,
+                                max_line_len=max_line_len - 16),
+            'elements': obj_to_ctml(self.elements,
+                                    line_len=max_line_len - 19,
+                                    max_line_len=max_line_len),
+            'species': obj_to_ctml(species_names,
+                                   line_len=max_line_len - 18,
+                                   max_line_len=max_line_len),
+        }
+        if self.reactions is not None:
+            kwargs['reactions'] = _get_ctml_range(objs=self.reactions,
+                                                  parent_obj=self,
+                                                  delimiter=delimiter)
+        for field in ('kinetics', 'transport', 'options', 'note'):
+            val = getattr(self, field)
+            # Skip empty fields
+            if val is None:
+                continue
+            kwargs[field] = obj_to_ctml(
+                val,
+                line_len=max_line_len - len(field) - 11,
+                max_line_len=max_line_len)
+        return ctml.ideal_gas(**kwargs)
+
     def to_omkm_yaml(self):
         """Writes the object in Cantera's CTI format.
 
@@ -351,6 +425,65 @@ class StoichSolid(Phase):
         # Terminate the string
         cti_str = '{})\n'.format(cti_str[:-2])
         return cti_str
+
+    def to_ctml(self,
+                ctml,
+                max_line_len=80,
+                mass_unit='g',
+                length_unit='cm',
+                units=None):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.cantera.phase.StoichSolid.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the phase
+            max_line_len : int, optional
+                Maximum number of characters in the line of the equivalent
+                CTI file. Default is 80.
+            mass_unit : str, optional
+                Mass unit for `density`. Default is 'g'
+            length_unit : str, optional
+                Length unit for `density`. Default is 'cm'
+            units : :class:`~pmutt.cantera.units.Units` object, optional
+                If specified, `mass_unit` and `length_unit` are overwritten.
+                Default is None.
+        Returns
+        -------
+            ctml_phase : ctml_writer.stoichiometric_solid object
+                Phase entry
+        """
+        if units is not None:
+            length_unit = units.length
+            mass_unit = units.mass
+
+        species_names = [species.name for species in self.species]
+        volume_unit = '{}3'.format(length_unit)
+        density = self.density*c.convert_unit(initial='g', final=mass_unit)\
+                  /c.convert_unit(initial='cm3', final=volume_unit)
+        kwargs = {
+            'name': obj_to_ctml(self.name,
+                                line_len=max_line_len - 26,
+                                max_line_len=max_line_len - 27),
+            'elements': obj_to_ctml(self.elements,
+                                    line_len=max_line_len - 30,
+                                    max_line_len=max_line_len),
+            'species': obj_to_ctml(species_names,
+                                   line_len=max_line_len - 29,
+                                   max_line_len=max_line_len),
+            'density': _get_cti_number(density),
+        }
+        for field in ('transport', 'options', 'note', 'initial_state'):
+            val = getattr(self, field)
+            # Skip empty fields
+            if val is None:
+                continue
+            kwargs[field] = obj_to_ctml(
+                val,
+                line_len=max_line_len - len(field) - 22,
+                max_line_len=max_line_len)
+        return ctml.stoichiometric_solid(**kwargs)
     
 def _filter_reactions(reactions, phase_name):
     """Helper method to remove reactions that occur in multiple phases. Required
@@ -53,6 +53,19 @@ class Units:
                 self.act_energy, self.pressure, self.mass)
         return cti_str
 
+    def to_ctml(self, ctml):
+        """Sets the units of a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.cantera.units.Units.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to modify
+        """
+        ctml.units(length=self.length, time=self.time, quantity=self.quantity,
+                   energy=self.energy, act_energy=self.act_energy,
+                   pressure=self.pressure, mass=self.mass)
+
     def to_cti_dict(self):
         """Returns a useful dictionary for CTI IO functions.
         
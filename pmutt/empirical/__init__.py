@@ -8,13 +8,13 @@ Empirical models.
 import inspect
 
 import numpy as np
-from matplotlib import pyplot as plt
 
-from pmutt import plot_1D
+from pmutt import plot_1D, plt
 from pmutt import constants as c
 from pmutt.io.json import json_to_pmutt, remove_class
 from pmutt import (_is_iterable, _ModelBase, _pmuttBase, _check_obj,
                    _check_iterable_attr)
+from pmutt.mixture import _get_mix_quantity
 
 
 class EmpiricalBase(_ModelBase):
@@ -97,6 +97,62 @@ class EmpiricalBase(_ModelBase):
                         misc_models.append(GasPressureAdj())
         self.misc_models = misc_models
 
+    def _get_misc_quantity(self, method_name, T, raise_error=True,
+                           raise_warning=True, **kwargs):
+        """Calculates the contribution of the misc models
+
+        Parameters
+        ----------
+            method_name : str
+                Name of method to calculate
+            T : float or (N,) `numpy.ndarray`_
+                Temperature(s) in K
+            raise_error : bool, optional
+                If True, raises an error if any of the modes do not have the
+                quantity of interest. Default is True
+            raise_warning : bool, optional
+                Only relevant if raise_error is False. Raises a warning if any
+                of the modes do not have the quantity of interest. Default is
+                True
+            kwargs : key-word arguments
+                Arguments to calculate mixture model properties, if any
+        Returns
+        -------
+            quantity : float or (N,) `numpy.ndarray`_
+                Contribution of misc models. 0 if there are no misc models
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        if self.misc_models is None:
+            return 0.
+        if _is_iterable(T):
+            # Misc models that do not depend on T (e.g.
+            # :class:`~pmutt.empirical.GasPressureAdj`) return a single value
+            # for all temperatures. Otherwise they are evaluated one
+            # temperature at a time
+            try:
+                return np.sum(_get_mix_quantity(misc_models=self.misc_models,
+                                                method_name=method_name,
+                                                raise_error=raise_error,
+                                                raise_warning=raise_warning,
+                                                default_value=0.,
+                                                T=T, **kwargs))
+            except (TypeError, ValueError):
+                pass
+            return np.array([
+                self._get_misc_quantity(method_name=method_name,
+                                        T=T_i,
+                                        raise_error=raise_error,
+                                        raise_warning=raise_warning,
+                                        **kwargs) for T_i in T
+            ])
+        return np.sum(_get_mix_quantity(misc_models=self.misc_models,
+                                        method_name=method_name,
+                                        raise_error=raise_error,
+                                        raise_warning=raise_warning,
+                                        default_value=0.,
+                                        T=T, **kwargs))
+
     def plot_empirical(self,
                        T_low=None,
                        T_high=None,
@@ -10,15 +10,16 @@ from copy import copy
 from warnings import warn
 
 import numpy as np
-from scipy.optimize import minimize
 
-from pmutt import (_get_R_adj, _is_iterable,
+from pmutt import (_get_R_adj, _is_iterable, _LazyModule,
                    _pass_expected_arguments)
 from pmutt import constants as c
 from pmutt.empirical import EmpiricalBase
-from pmutt.io.cantera import obj_to_cti
+from pmutt.io.cantera import (_get_cti_coeffs, _get_cti_number, obj_to_cti,
+                              obj_to_ctml)
 from pmutt.io.json import json_to_pmutt, remove_class
-from pmutt.mixture import _get_mix_quantity
+
+optimize = _LazyModule('scipy.optimize')
 
 
 class Nasa(EmpiricalBase):
@@ -117,6 +118,38 @@ class Nasa(EmpiricalBase):
                 warn(warn_msg, RuntimeWarning)
             return self.a_high
 
+    def _get_nasa_quantity(self, fn, T):
+        """Evaluates the NASA polynomials at the temperatures requested. Each
+        polynomial is evaluated once for all of its temperatures.
+
+        Parameters
+        ----------
+            fn : function
+                NASA polynomial function (e.g.
+                :func:`~pmutt.empirical.nasa.get_nasa_CpoR`)
+            T : float or (N,) `numpy.ndarray`_
+                Temperature(s) in K
+        Returns
+        -------
+            quantity : float or (N,) `numpy.ndarray`_
+                Quantity calculated by fn
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        if not _is_iterable(T):
+            return fn(a=self.get_a(T=T), T=T)
+        T_arr = np.asarray(T, dtype=np.double)
+        # get_a warns about temperatures outside of the range
+        for T_i in T_arr[(T_arr < self.T_low) | (T_arr > self.T_high)]:
+            self.get_a(T=T_i)
+        if type(self.T_mid) is list:
+            self.T_mid = self.T_mid[0]
+        is_low = T_arr < self.T_mid
+        quantity = np.zeros_like(T_arr)
+        quantity[is_low] = fn(a=self.a_low, T=T_arr[is_low])
+        quantity[~is_low] = fn(a=self.a_high, T=T_arr[~is_low])
+        return quantity
+
     def get_CpoR(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless heat capacity
 
@@ -140,27 +173,12 @@ class Nasa(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            CpoR = np.zeros(len(T))
-            for i, T_i in enumerate(T):
-                a = self.get_a(T_i)
-                CpoR[i] = get_nasa_CpoR(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(self.misc_models,
-                                               method_name='get_CpoR',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
-        else:
-            a = self.get_a(T=T)
-            CpoR = get_nasa_CpoR(a=a, T=T) \
-                + np.sum(_get_mix_quantity(self.misc_models,
-                                           method_name='get_CpoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        return CpoR
+        return self._get_nasa_quantity(fn=get_nasa_CpoR, T=T) \
+            + self._get_misc_quantity(method_name='get_CpoR',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
 
     def get_Cp(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the heat capacity
@@ -214,27 +232,12 @@ class Nasa(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            HoRT = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                a = self.get_a(T=T_i)
-                HoRT[i] = get_nasa_HoRT(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                               method_name='get_HoRT',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
-        else:
-            a = self.get_a(T=T)
-            HoRT = get_nasa_HoRT(a=a, T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_HoRT',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        return HoRT
+        return self._get_nasa_quantity(fn=get_nasa_HoRT, T=T) \
+            + self._get_misc_quantity(method_name='get_HoRT',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
 
     def get_H(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the enthalpy
@@ -314,26 +317,12 @@ class Nasa(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            SoR = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                a = self.get_a(T=T_i)
-                SoR[i] = get_nasa_SoR(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                               method_name='get_SoR',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
-        else:
-            a = self.get_a(T=T)
-            SoR = get_nasa_SoR(a=a, T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_SoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
+        SoR = self._get_nasa_quantity(fn=get_nasa_SoR, T=T) \
+            + self._get_misc_quantity(method_name='get_SoR',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
         if not S_elements:
             S_ele = 0
         else:
@@ -716,6 +705,34 @@ class Nasa(EmpiricalBase):
                        self.a_high[4], self.a_high[5], self.a_high[6])
         return cti_str
 
+    def to_ctml(self, ctml):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.empirical.nasa.Nasa.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the species
+        Returns
+        -------
+            ctml_species : ctml_writer.species object
+                Species entry
+        """
+        elements = {key: int(val) for key, val in self.elements.items()}
+        kwargs = {}
+        if self.n_sites is not None:
+            kwargs['size'] = _get_cti_number(self.n_sites)
+        thermo = (ctml.NASA([_get_cti_number(self.T_low),
+                             _get_cti_number(self.T_mid)],
+                            _get_cti_coeffs(self.a_low)),
+                  ctml.NASA([_get_cti_number(self.T_mid),
+                             _get_cti_number(self.T_high)],
+                            _get_cti_coeffs(self.a_high)))
+        return ctml.species(name=self.name,
+                            atoms=obj_to_ctml(elements),
+                            thermo=thermo,
+                            **kwargs)
+
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
 
@@ -828,6 +845,14 @@ class Nasa9(EmpiricalBase):
     @nasas.setter
     def nasas(self, val):
         self._nasas = copy(val)
+        # Stack the temperature intervals and coefficients so temperature
+        # arrays can be assigned to intervals using np.searchsorted
+        nasas_sorted = sorted(self._nasas, key=lambda nasa: nasa.T_high)
+        self._T_lows = np.array([nasa.T_low for nasa in nasas_sorted],
+                                dtype=np.double)
+        self._T_highs = np.array([nasa.T_high for nasa in nasas_sorted],
+                                 dtype=np.double)
+        self._a = np.array([nasa.a for nasa in nasas_sorted], dtype=np.double)
 
     @property
     def T_low(self):
@@ -868,6 +893,68 @@ class Nasa9(EmpiricalBase):
                        ''.format(T, self.name, self.T_low, self.T_high))
             raise ValueError(err_msg)
 
+    def _get_nasa_indices(self, T):
+        """Gets the indices of the relevant NASA9 intervals given temperatures
+
+        Parameters
+        ----------
+            T : (N,) `numpy.ndarray`_
+                Temperatures in K
+        Returns
+        -------
+            i_nasas : (N,) `numpy.ndarray`_ of int
+                Indices of the stacked intervals (``self._a``) for each T
+        Raises
+        ------
+            ValueError:
+                Raised if no valid :class:`~pmutt.empirical.nasa.SingleNasa9`
+                exists for any T
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        n_nasas = len(self._T_highs)
+        # If T lies on a shared bound, the lower interval is used
+        i_nasas = np.searchsorted(self._T_highs, T, side='left')
+        i_clipped = np.minimum(i_nasas, n_nasas - 1)
+        invalid = (i_nasas == n_nasas) | (T < self._T_lows[i_clipped])
+        if np.any(invalid):
+            err_msg = ('Requested T ({} K) has no valid SingleNasa9 object '
+                       'for species, {}. The global T_low is {} K and global '
+                       'T_high is {} K.'
+                       ''.format(T[invalid][0], self.name, self.T_low,
+                                 self.T_high))
+            raise ValueError(err_msg)
+        return i_nasas
+
+    def _get_nasa_quantity(self, fn, T):
+        """Evaluates the NASA9 polynomials at the temperatures requested.
+        Temperatures are grouped by interval so each interval's polynomial is
+        evaluated once.
+
+        Parameters
+        ----------
+            fn : function
+                NASA9 polynomial function (e.g.
+                :func:`~pmutt.empirical.nasa.get_nasa9_CpoR`)
+            T : float or (N,) `numpy.ndarray`_
+                Temperature(s) in K
+        Returns
+        -------
+            quantity : float or (N,) `numpy.ndarray`_
+                Quantity calculated by fn
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        T_arr = np.atleast_1d(np.asarray(T, dtype=np.double))
+        i_nasas = self._get_nasa_indices(T=T_arr)
+        quantity = np.zeros_like(T_arr)
+        for i in np.unique(i_nasas):
+            in_interval = (i_nasas == i)
+            quantity[in_interval] = fn(a=self._a[i], T=T_arr[in_interval])
+        if not _is_iterable(T):
+            quantity = quantity.item(0)
+        return quantity
+
     def get_CpoR(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless heat capacity
 
@@ -891,29 +978,12 @@ class Nasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            CpoR = np.zeros(len(T))
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T_i)
-                CpoR[i] = nasa.get_CpoR(T=T_i) \
-                    + np.sum(_get_mix_quantity(self.misc_models,
-                                               method_name='get_CpoR',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
-        else:
-            nasa = self._get_nasa(T=T)
-            CpoR = nasa.get_CpoR(T=T) \
-                + np.sum(_get_mix_quantity(self.misc_models,
-                                           method_name='get_CpoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        if len(CpoR) == 1:
-            CpoR = CpoR.item(0)
-        return CpoR
+        return self._get_nasa_quantity(fn=get_nasa9_CpoR, T=T) \
+            + self._get_misc_quantity(method_name='get_CpoR',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
 
     def get_Cp(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the heat capacity
@@ -967,32 +1037,12 @@ class Nasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            HoRT = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T=T_i)
-                HoRT[i] = nasa.get_HoRT(T=T_i) \
-                    + np.sum(_get_mix_quantity(
-                                        misc_models=self.misc_models,
-                                        method_name='get_HoRT',
-                                        raise_error=raise_error,
-                                        raise_warning=raise_warning,
-                                        default_value=0.,
-                                        T=T_i, **kwargs))
-        else:
-            nasa = self._get_nasa(T=T)
-            HoRT = nasa.get_HoRT(T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_HoRT',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-            HoRT = HoRT.item(0)
-#        if not _is_iterable(T):
-#        if len(HoRT) == 1:
-#            HoRT = HoRT.item(0)
-        return HoRT
+        return self._get_nasa_quantity(fn=get_nasa9_HoRT, T=T) \
+            + self._get_misc_quantity(method_name='get_HoRT',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
 
     def get_H(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the enthalpy
@@ -1072,37 +1122,18 @@ class Nasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if _is_iterable(T):
-            SoR = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T=T_i)
-                SoR[i] = nasa.get_SoR(T=T_i) \
-                    + np.sum(_get_mix_quantity(
-                                        misc_models=self.misc_models,
-                                        method_name='get_SoR',
-                                        raise_error=raise_error,
-                                        raise_warning=raise_warning,
-                                        default_value=0.,
-                                        T=T_i, **kwargs))
-        else:
-            nasa = self._get_nasa(T=T)
-            SoR = nasa.get_SoR(T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_SoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
+        SoR = self._get_nasa_quantity(fn=get_nasa9_SoR, T=T) \
+            + self._get_misc_quantity(method_name='get_SoR',
+                                      T=T,
+                                      raise_error=raise_error,
+                                      raise_warning=raise_warning,
+                                      **kwargs)
         if not S_elements:
             S_ele = 0
         else:
             S_ele = self.get_Selements()
         return SoR - S_ele
 
-        if len(SoR) == 1:
-            SoR = SoR.item(0)
-        return SoR - S_ele
-
     def get_S(self, T, units, raise_error=True, raise_warning=True,
               S_elements=None, **kwargs):
         """Calculate the entropy
@@ -1337,10 +1368,10 @@ class Nasa9(EmpiricalBase):
                 T_mid0 = np.linspace(T_low, T_high, n_interval + 1)[1:-1]
             else:
                 T_mid0 = T_mid
-            res = minimize(method='Nelder-Mead',
-                           x0=T_mid0,
-                           fun=_calc_T_mid_mse_nasa9,
-                           args=(T_low, T_high, model, n_T))
+            res = optimize.minimize(method='Nelder-Mead',
+                                    x0=T_mid0,
+                                    fun=_calc_T_mid_mse_nasa9,
+                                    args=(T_low, T_high, model, n_T))
             T_mid = res.x
 
         # Generate heat capacity data for from_data
@@ -1463,6 +1494,32 @@ class Nasa9(EmpiricalBase):
         cti_str = '{})\n'.format(cti_str[:-2])
         return cti_str
 
+    def to_ctml(self, ctml):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.empirical.nasa.Nasa9.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the species
+        Returns
+        -------
+            ctml_species : ctml_writer.species object
+                Species entry
+        """
+        elements = {key: int(val) for key, val in self.elements.items()}
+        kwargs = {}
+        if self.n_sites is not None:
+            kwargs['size'] = _get_cti_number(self.n_sites)
+        thermo = tuple(nasa.to_ctml(ctml) for nasa in self.nasas)
+        # A single polynomial is not written as a tuple in the CTI file
+        if len(thermo) == 1:
+            thermo = thermo[0]
+        return ctml.species(name=self.name,
+                            atoms=obj_to_ctml(elements),
+                            thermo=thermo,
+                            **kwargs)
+
 
 class SingleNasa9(EmpiricalBase):
     """Stores the NASA9 polynomial for a defined interval.
@@ -1611,6 +1668,23 @@ class SingleNasa9(EmpiricalBase):
                              self.a[5], self.a[6], self.a[7], self.a[8]))
         return cti_str
 
+    def to_ctml(self, ctml):
+        """Creates the polynomial for a CTML converter. Equivalent to reading
+        the output of :meth:`~pmutt.empirical.nasa.SingleNasa9.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to use
+        Returns
+        -------
+            ctml_nasa : ctml_writer.NASA object
+                Polynomial entry
+        """
+        return ctml.NASA([_get_cti_number(self.T_low),
+                          _get_cti_number(self.T_high)],
+                         _get_cti_coeffs(self.a))
+
 
 def _fit_CpoR(T, CpoR, T_mid=None):
     """Fit a[0]-a[4] coefficients in a_low and a_high attributes given the
@@ -1839,11 +1913,11 @@ def _calc_T_mid_mse_nasa9(T_mid, T_low, T_high, model, n_T=50):
         CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
 
         # Optimize NASA9 coefficients
-        res = minimize(method='BFGS',
-                       args=(T, CpoR),
-                       fun=_get_nasa9_mse,
-                       jac=_get_nasa9_mse_jacob,
-                       x0=np.zeros(9))
+        res = optimize.minimize(method='BFGS',
+                                args=(T, CpoR),
+                                fun=_get_nasa9_mse,
+                                jac=_get_nasa9_mse_jacob,
+                                x0=np.zeros(9))
         mse += res.fun
     return mse
 
@@ -1886,11 +1960,11 @@ def _calc_T_mid_mse_nasa(T_mid, T_low, T_high, model, n_T=50):
             CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
 
         # Optimize NASA9 coefficients
-        res = minimize(method='BFGS',
-                       args=(T, CpoR),
-                       fun=_get_nasa_mse,
-                       jac=_get_nasa_mse_jacob,
-                       x0=np.zeros(7))
+        res = optimize.minimize(method='BFGS',
+                                args=(T, CpoR),
+                                fun=_get_nasa_mse,
+                                jac=_get_nasa_mse_jacob,
+                                x0=np.zeros(7))
         mse += res.fun
     return mse
 
@@ -2036,11 +2110,11 @@ def _fit_CpoR9(T, CpoR, T_low, T_high, T_mid):
         T_cond = np.extract(condition=condition, arr=T)
         CpoR_cond = np.extract(condition=condition, arr=CpoR)
 
-        res = minimize(method='BFGS',
-                       args=(T_cond, CpoR_cond),
-                       fun=_get_nasa9_mse,
-                       jac=_get_nasa9_mse_jacob,
-                       x0=np.zeros(9))
+        res = optimize.minimize(method='BFGS',
+                                args=(T_cond, CpoR_cond),
+                                fun=_get_nasa9_mse,
+                                jac=_get_nasa9_mse_jacob,
+                                x0=np.zeros(9))
         a.append(res.x)
     return a
 
@@ -2131,7 +2205,7 @@ def get_nasa_CpoR(a, T):
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([1., T, T**2, T**3, T**4, np.zeros_like(T),
+    T_arr = np.array([np.ones_like(T), T, T**2, T**3, T**4, np.zeros_like(T),
                       np.zeros_like(T)])
     return np.dot(a, T_arr)
 
@@ -2175,7 +2249,8 @@ def get_nasa_SoR(a, T):
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
     T_arr = np.array(
-        [np.log(T), T, (T**2) / 2., (T**3) / 3., (T**4) / 4., 0., 1.])
+        [np.log(T), T, (T**2) / 2., (T**3) / 3., (T**4) / 4., np.zeros_like(T),
+         np.ones_like(T)])
     return np.dot(a, T_arr)
 
 
@@ -2186,15 +2261,16 @@ def get_nasa9_CpoR(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        CpoR: float
+        CpoR: float or (N,) `numpy.ndarray`_
             Dimensionless heat capacity
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
+    T = np.asarray(T, dtype=np.double)
     T_arr = np.array([T**-2, T**-1, np.ones_like(T), T, T**2, T**3, T**4,
                       np.zeros_like(T), np.zeros_like(T)])
     return np.dot(a, T_arr)
@@ -2207,16 +2283,16 @@ def get_nasa9_HoRT(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        HoRT : float
+        HoRT : float or (N,) `numpy.ndarray`_
             Dimensionless enthalpy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T = float(T)
+    T = np.asarray(T, dtype=np.double)
     T_arr = np.array([
         -(T**-2),
         np.log(T) / T, np.ones_like(T), T / 2., (T**2) / 3., (T**3) / 4.,
@@ -2232,16 +2308,16 @@ def get_nasa9_SoR(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        SoR : float
+        SoR : float or (N,) `numpy.ndarray`_
             Dimensionless entropy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T = float(T)
+    T = np.asarray(T, dtype=np.double)
     T_arr = np.array([
         -(T**-2) / 2., -(T**-1),
         np.log(T), T, (T**2) / 2., (T**3) / 3., (T**4) / 4., np.zeros_like(T),
@@ -9,15 +9,17 @@ import inspect
 from warnings import warn
 
 import numpy as np
-from scipy.optimize import curve_fit
 
-from pmutt import _get_R_adj, _is_iterable
+from pmutt import _get_R_adj, _is_iterable, _LazyModule
 from pmutt import constants as c
 from pmutt.empirical import EmpiricalBase
-from pmutt.io.cantera import obj_to_cti
+from pmutt.io.cantera import (_get_cti_coeffs, _get_cti_number, obj_to_cti,
+                              obj_to_ctml)
 from pmutt.io.json import json_to_pmutt, remove_class
 from pmutt.mixture import _get_mix_quantity
 
+optimize = _LazyModule('scipy.optimize')
+
 
 class Shomate(EmpiricalBase):
     """Stores the information for an individual Shomate specie
@@ -703,6 +705,30 @@ class Shomate(EmpiricalBase):
                        self.a[2], self.a[3], self.a[4], self.a[5], self.a[6])
         return cti_str
 
+    def to_ctml(self, ctml):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.empirical.shomate.Shomate.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the species
+        Returns
+        -------
+            ctml_species : ctml_writer.species object
+                Species entry
+        """
+        kwargs = {}
+        if self.n_sites is not None:
+            kwargs['size'] = _get_cti_number(self.n_sites)
+        thermo = ctml.Shomate([_get_cti_number(self.T_low),
+                               _get_cti_number(self.T_high)],
+                              _get_cti_coeffs(self.a[:7]))
+        return ctml.species(name=self.name,
+                            atoms=obj_to_ctml(self.elements),
+                            thermo=thermo,
+                            **kwargs)
+
     def _check_T(self, T):
         for T_i in T:
             if T_i < self.T_low:
@@ -745,7 +771,7 @@ def _fit_CpoR(T, CpoR, units):
         # Pass the unit set
         adj_shomate_CpoR = lambda T, A, B, C, D, E: _shomate_CpoR(
             T=T, A=A, B=B, C=C, D=D, E=E, units=units)
-        [a, _] = curve_fit(adj_shomate_CpoR, T, np.array(CpoR))
+        [a, _] = optimize.curve_fit(adj_shomate_CpoR, T, np.array(CpoR))
         a = np.append(a, [0., 0., 0.])
         return a
 
@@ -7,9 +7,9 @@ Created on Tues Jul 10 12:40:00 2018
 
 import numpy as np
 
-from pmutt import _pmuttBase
+from pmutt import _ModelBase, _pmuttBase
 from pmutt import constants as c
-from pmutt.io.json import remove_class
+from pmutt.io.json import json_to_pmutt, remove_class
 
 
 class IdealGasEOS(_pmuttBase):
@@ -114,11 +114,16 @@ class vanDerWaalsEOS(_pmuttBase):
     def get_Vm(self, T=c.T0('K'), P=c.P0('bar'), gas_phase=True):
         """Calculates the molar volume of a van der Waals gas
 
+        The compressibility factor, :math:`Z=\\frac{PV_m}{RT}`, is found
+        analytically from
+        :math:`Z^3 - (1+B)Z^2 + AZ - AB = 0`
+        where :math:`A=\\frac{aP}{(RT)^2}` and :math:`B=\\frac{bP}{RT}`
+
         Parameters
         ----------
-            T : float, optional
+            T : float or (N,) `numpy.ndarray`_, optional
                 Temperature in K. Default is standard temperature
-            P : float, optional
+            P : float or (N,) `numpy.ndarray`_, optional
                 Pressure in bar. Default is standard pressure
             gas_phase : bool, optional
                 Relevant if system is in vapor-liquid equilibrium. If True,
@@ -126,19 +131,22 @@ class vanDerWaalsEOS(_pmuttBase):
                 smaller volume (liquid phase).
         Returns
         -------
-            Vm : float
+            Vm : float or (N,) `numpy.ndarray`_
                 Volume in m3
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        P_SI = P * c.convert_unit(initial='bar', final='Pa')
-        Vm = np.roots([
-            P_SI, -(P_SI * self.b + c.R('J/mol/K') * T), self.a,
-            -self.a * self.b
-        ])
-        real_Vm = np.real([Vm_i for Vm_i in Vm if np.isreal(Vm_i)])
+        P_SI = np.asarray(P, dtype=float) \
+            * c.convert_unit(initial='bar', final='Pa')
+        RT = c.R('J/mol/K') * np.asarray(T, dtype=float)
+        A = self.a * P_SI / RT**2
+        B = self.b * P_SI / RT
+        Z_min, Z_max = _get_cubic_real_roots(a2=-(1. + B), a1=A, a0=-A * B)
         if gas_phase:
-            return np.max(real_Vm)
+            Z = Z_max
         else:
-            return np.min(real_Vm)
+            Z = Z_min
+        return (Z * RT / P_SI)[()]
 
     def get_V(self, T=c.T0('K'), P=c.P0('bar'), n=1., gas_phase=True):
         """Calculates the volume of a van der Waals gas
@@ -278,3 +286,721 @@ class vanDerWaalsEOS(_pmuttBase):
         a = 27. / 64. * (c.R('J/mol/K') * Tc)**2 / Pc_SI
         b = c.R('J/mol/K') * Tc / 8. / Pc_SI
         return cls(a=a, b=b)
+
+
+class _CubicEOS(_pmuttBase):
+    """Generic two-parameter cubic equation of state for pure species and
+    mixtures
+
+    :math:`P=\\frac{RT}{V_m-b}-\\frac{a(T)}{(V_m+\\epsilon b)(V_m+\\sigma b)}`
+
+    :math:`a_i(T)=\\Omega_a\\frac{(RT_{c,i})^2}{P_{c,i}}\\bigg(1+\\kappa_i
+    \\bigg(1-\\sqrt{\\frac{T}{T_{c,i}}}\\bigg)\\bigg)^2`,
+    :math:`b_i=\\Omega_b\\frac{RT_{c,i}}{P_{c,i}}`
+
+    Mixtures use the van der Waals mixing rules,
+    :math:`a=\\sum_i\\sum_j y_i y_j \\sqrt{a_i a_j}(1-k_{ij})` and
+    :math:`b=\\sum_i y_i b_i`. Temperature, pressure and mole fractions are
+    broadcast against each other so many conditions are evaluated at once.
+
+    Attributes
+    ----------
+        Tc : float or (M,) `numpy.ndarray`_
+            Critical temperature(s) in K
+        Pc : float or (M,) `numpy.ndarray`_
+            Critical pressure(s) in bar
+        omega : float or (M,) `numpy.ndarray`_
+            Acentric factor(s)
+        kij : (M, M) `numpy.ndarray`_, optional
+            Binary interaction parameters. Default is None (all 0)
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    sigma = None
+    epsilon = None
+    Omega_a = None
+    Omega_b = None
+
+    def __init__(self, Tc, Pc, omega, kij=None):
+        self.Tc = Tc
+        self.Pc = Pc
+        self.omega = omega
+        self.kij = kij
+
+    def _get_kappa(self, omega):
+        """Calculates the parameter relating the acentric factor to the
+        temperature dependence of :math:`a`
+
+        Parameters
+        ----------
+            omega : (M,) `numpy.ndarray`_
+                Acentric factors
+        Returns
+        -------
+            kappa : (M,) `numpy.ndarray`_
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        raise NotImplementedError()
+
+    def _get_mix_params(self, T, P, y):
+        """Calculates the species and mixture parameters at the conditions
+        requested
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_
+                Pressure in bar
+            y : (M,) or (M, ...) `numpy.ndarray`_
+                Mole fractions. Can be None for pure species
+        Returns
+        -------
+            params : dict
+                Dictionary with the keys:
+
+                - T, P_SI : Conditions broadcast against each other
+                - b_i, b : Species and mixture co-volumes in m3/mol
+                - aiy : :math:`\\sum_j y_j a_{ij}` for each species
+                - a : Mixture attraction parameter in Pa m6/mol2
+                - A, B : Dimensionless :math:`\\frac{aP}{(RT)^2}` and
+                  :math:`\\frac{bP}{RT}`
+        Raises
+        ------
+            ValueError
+                Raised if y is not specified for a mixture or does not match
+                the number of species
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        Tc = np.atleast_1d(np.asarray(self.Tc, dtype=float))
+        Pc_SI = np.atleast_1d(np.asarray(self.Pc, dtype=float)) \
+            * c.convert_unit(initial='bar', final='Pa')
+        omega = np.atleast_1d(np.asarray(self.omega, dtype=float))
+        n_species = len(Tc)
+        if y is None:
+            if n_species != 1:
+                err_msg = ('Mole fractions, y, must be specified for mixtures '
+                           'of {} species.'.format(n_species))
+                raise ValueError(err_msg)
+            y = np.ones(1)
+        y = np.asarray(y, dtype=float)
+        if y.shape[0] != n_species:
+            err_msg = ('Mole fractions, y, have {} entries but {} species '
+                       'are described.'.format(y.shape[0], n_species))
+            raise ValueError(err_msg)
+
+        # Broadcast conditions and give species parameters a leading axis
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float),
+                                   np.asarray(P, dtype=float))
+        shape = np.broadcast_shapes(T.shape, y.shape[1:])
+        T = np.broadcast_to(T, shape)
+        P_SI = np.broadcast_to(P, shape) \
+            * c.convert_unit(initial='bar', final='Pa')
+        y = np.broadcast_to(y.reshape(y.shape + (1, ) * (len(shape) + 1 -
+                                                         y.ndim)),
+                            (n_species, ) + shape)
+        species_shape = (n_species, ) + (1, ) * len(shape)
+        Tc = Tc.reshape(species_shape)
+        Pc_SI = Pc_SI.reshape(species_shape)
+        kappa = self._get_kappa(omega).reshape(species_shape)
+        if self.kij is None:
+            kij = np.zeros((n_species, n_species))
+        else:
+            kij = np.asarray(self.kij, dtype=float)
+
+        R = c.R('J/mol/K')
+        a_c = self.Omega_a * (R * Tc)**2 / Pc_SI
+        b_i = self.Omega_b * R * Tc / Pc_SI
+        # sqrt(a_i*a_j) = sqrt(a_c,i*a_c,j)*m_i*m_j where alpha_i = m_i^2
+        m = 1. + kappa * (1. - np.sqrt(T / Tc))
+        Q = np.sqrt(a_c[:, np.newaxis] * a_c[np.newaxis, :]) \
+            * (1. - kij).reshape((n_species, n_species) + (1, ) * len(shape))
+        aiy = m * np.einsum('ij...,j...->i...', Q, y * m)
+        a = np.sum(y * aiy, axis=0)
+        b = np.sum(y * b_i, axis=0)
+        return {
+            'T': T,
+            'P_SI': P_SI,
+            'b_i': b_i,
+            'b': b,
+            'aiy': aiy,
+            'a': a,
+            'A': a * P_SI / (R * T)**2,
+            'B': b * P_SI / (R * T),
+        }
+
+    def _get_Z(self, A, B, gas_phase=True):
+        """Solves the cubic equation of state for the compressibility factor
+
+        :math:`Z^3+((\\epsilon+\\sigma-1)B-1)Z^2+(A+\\epsilon\\sigma B^2-
+        (\\epsilon+\\sigma)B(1+B))Z-(AB+\\epsilon\\sigma B^2(1+B))=0`
+
+        Parameters
+        ----------
+            A : `numpy.ndarray`_
+                Dimensionless attraction parameter
+            B : `numpy.ndarray`_
+                Dimensionless co-volume
+            gas_phase : bool, optional
+                If True, returns the largest root (gas phase). If False,
+                returns the smallest root (liquid phase). Default is True
+        Returns
+        -------
+            Z : `numpy.ndarray`_
+                Compressibility factor
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        eps_sig_sum = self.epsilon + self.sigma
+        eps_sig_prod = self.epsilon * self.sigma
+        Z_min, Z_max = _get_cubic_real_roots(
+            a2=(eps_sig_sum - 1.) * B - 1.,
+            a1=A + eps_sig_prod * B**2 - eps_sig_sum * B * (1. + B),
+            a0=-(A * B + eps_sig_prod * B**2 * (1. + B)))
+        if gas_phase:
+            return Z_max
+        else:
+            return Z_min
+
+    def get_Z(self, T=c.T0('K'), P=c.P0('bar'), y=None, gas_phase=True):
+        """Calculates the compressibility factor, :math:`Z=\\frac{PV_m}{RT}`
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures. Trailing
+                dimensions are broadcast against T and P
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                return the larger root (gas phase). If False, returns the
+                smaller root (liquid phase).
+        Returns
+        -------
+            Z : float or `numpy.ndarray`_
+                Compressibility factor
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        params = self._get_mix_params(T=T, P=P, y=y)
+        return self._get_Z(A=params['A'], B=params['B'],
+                           gas_phase=gas_phase)[()]
+
+    def get_Vm(self, T=c.T0('K'), P=c.P0('bar'), y=None, gas_phase=True):
+        """Calculates the molar volume
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                return the larger volume (gas phase). If False, returns the
+                smaller volume (liquid phase).
+        Returns
+        -------
+            Vm : float or `numpy.ndarray`_
+                Molar volume in m3/mol
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        params = self._get_mix_params(T=T, P=P, y=y)
+        Z = self._get_Z(A=params['A'], B=params['B'], gas_phase=gas_phase)
+        return (Z * c.R('J/mol/K') * params['T'] / params['P_SI'])[()]
+
+    def get_V(self, T=c.T0('K'), P=c.P0('bar'), n=1., y=None, gas_phase=True):
+        """Calculates the volume
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            n : float or `numpy.ndarray`_, optional
+                Number of moles (in mol). Default is 1 mol
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                return the larger volume (gas phase). If False, returns the
+                smaller volume (liquid phase).
+        Returns
+        -------
+            V : float or `numpy.ndarray`_
+                Volume in m3
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return self.get_Vm(T=T, P=P, y=y, gas_phase=gas_phase) * n
+
+    def get_P(self, T=c.T0('K'), V=c.V0('m3'), n=1., y=None):
+        """Calculates the pressure
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            V : float or `numpy.ndarray`_, optional
+                Volume in m3. Default is standard volume
+            n : float or `numpy.ndarray`_, optional
+                Number of moles (in mol). Default is 1 mol
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            P : float or `numpy.ndarray`_
+                Pressure in bar
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        Vm = np.asarray(V, dtype=float) / n
+        params = self._get_mix_params(T=T, P=c.P0('bar'), y=y)
+        a = params['a']
+        b = params['b']
+        P_SI = c.R('J/mol/K') * params['T'] / (Vm - b) \
+            - a / (Vm + self.epsilon * b) / (Vm + self.sigma * b)
+        return (P_SI * c.convert_unit(initial='Pa', final='bar'))[()]
+
+    def get_n(self, V=c.V0('m3'), P=c.P0('bar'), T=c.T0('K'), y=None,
+              gas_phase=True):
+        """Calculates the moles
+
+        Parameters
+        ----------
+            V : float or `numpy.ndarray`_, optional
+                Volume in m3. Default is standard volume
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                return the smaller moles (gas phase). If False, returns the
+                larger moles (liquid phase).
+        Returns
+        -------
+            n : float or `numpy.ndarray`_
+                Number of moles in mol
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return V / self.get_Vm(T=T, P=P, y=y, gas_phase=gas_phase)
+
+    def get_ln_phi(self, T=c.T0('K'), P=c.P0('bar'), y=None, gas_phase=True):
+        """Calculates the natural log of the fugacity coefficient(s)
+
+        :math:`\\ln\\phi_i=\\frac{b_i}{b}(Z-1)-\\ln(Z-B)-\\frac{A}{B}
+        \\bigg(\\frac{2\\sum_j y_j a_{ij}}{a}-\\frac{b_i}{b}\\bigg)I`
+
+        :math:`I=\\frac{1}{\\sigma-\\epsilon}\\ln\\bigg(\\frac{Z+\\sigma B}
+        {Z+\\epsilon B}\\bigg)`
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                uses the gas phase root. If False, uses the liquid phase root.
+        Returns
+        -------
+            ln_phi : float or `numpy.ndarray`_
+                Log of fugacity coefficient. If y is specified, the first
+                axis corresponds to each species
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        params = self._get_mix_params(T=T, P=P, y=y)
+        A = params['A']
+        B = params['B']
+        Z = self._get_Z(A=A, B=B, gas_phase=gas_phase)
+        I = np.log((Z + self.sigma * B) / (Z + self.epsilon * B)) \
+            / (self.sigma - self.epsilon)
+        b_ratio = params['b_i'] / params['b']
+        ln_phi = b_ratio * (Z - 1.) - np.log(Z - B) \
+            - A / B * (2. * params['aiy'] / params['a'] - b_ratio) * I
+        if y is None:
+            ln_phi = ln_phi[0]
+        return ln_phi[()]
+
+    def get_phi(self, T=c.T0('K'), P=c.P0('bar'), y=None, gas_phase=True):
+        """Calculates the fugacity coefficient(s). See
+        :meth:`~pmutt.eos._CubicEOS.get_ln_phi`
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_, optional
+                Temperature in K. Default is standard temperature
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+            gas_phase : bool, optional
+                Relevant if system is in vapor-liquid equilibrium. If True,
+                uses the gas phase root. If False, uses the liquid phase root.
+        Returns
+        -------
+            phi : float or `numpy.ndarray`_
+                Fugacity coefficient. If y is specified, the first axis
+                corresponds to each species
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return np.exp(self.get_ln_phi(T=T, P=P, y=y, gas_phase=gas_phase))
+
+    def to_dict(self):
+        """Represents object as dictionary with JSON-accepted datatypes
+
+        Returns
+        -------
+            obj_dict : dict
+        """
+        obj_dict = {'class': str(self.__class__)}
+        for attr in ('Tc', 'Pc', 'omega', 'kij'):
+            val = getattr(self, attr)
+            if isinstance(val, np.ndarray):
+                val = val.tolist()
+            obj_dict[attr] = val
+        return obj_dict
+
+
+class PengRobinsonEOS(_CubicEOS):
+    """Peng-Robinson equation of state. Inherits from
+    :class:`~pmutt.eos._CubicEOS` with :math:`\\sigma=1+\\sqrt{2}`,
+    :math:`\\epsilon=1-\\sqrt{2}`, :math:`\\Omega_a=0.45724`,
+    :math:`\\Omega_b=0.07780` and
+
+    :math:`\\kappa=0.37464+1.54226\\omega-0.26992\\omega^2`
+
+    * Peng, D.-Y.; Robinson, D. B. Ind. Eng. Chem. Fundam. 1976, 15 (1),
+      59–64.
+
+    Attributes
+    ----------
+        Tc : float or (M,) `numpy.ndarray`_
+            Critical temperature(s) in K
+        Pc : float or (M,) `numpy.ndarray`_
+            Critical pressure(s) in bar
+        omega : float or (M,) `numpy.ndarray`_
+            Acentric factor(s)
+        kij : (M, M) `numpy.ndarray`_, optional
+            Binary interaction parameters. Default is None (all 0)
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    sigma = 1. + np.sqrt(2.)
+    epsilon = 1. - np.sqrt(2.)
+    Omega_a = 0.45724
+    Omega_b = 0.07780
+
+    def _get_kappa(self, omega):
+        return 0.37464 + 1.54226 * omega - 0.26992 * omega**2
+
+
+class SoaveRedlichKwongEOS(_CubicEOS):
+    """Soave-Redlich-Kwong equation of state. Inherits from
+    :class:`~pmutt.eos._CubicEOS` with :math:`\\sigma=1`,
+    :math:`\\epsilon=0`, :math:`\\Omega_a=0.42748`,
+    :math:`\\Omega_b=0.08664` and
+
+    :math:`\\kappa=0.480+1.574\\omega-0.176\\omega^2`
+
+    * Soave, G. Chem. Eng. Sci. 1972, 27 (6), 1197–1203.
+
+    Attributes
+    ----------
+        Tc : float or (M,) `numpy.ndarray`_
+            Critical temperature(s) in K
+        Pc : float or (M,) `numpy.ndarray`_
+            Critical pressure(s) in bar
+        omega : float or (M,) `numpy.ndarray`_
+            Acentric factor(s)
+        kij : (M, M) `numpy.ndarray`_, optional
+            Binary interaction parameters. Default is None (all 0)
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    sigma = 1.
+    epsilon = 0.
+    Omega_a = 0.42748
+    Omega_b = 0.08664
+
+    def _get_kappa(self, omega):
+        return 0.480 + 1.574 * omega - 0.176 * omega**2
+
+
+class RealGasAdj(_ModelBase):
+    """Includes the departure from ideal gas behavior using a cubic equation
+    of state. The adjustment is the (partial molar) residual property of the
+    species so it is meant to be added to an ideal gas model (e.g.
+    :class:`~pmutt.statmech.trans.FreeTrans` or an empirical model with
+    :class:`~pmutt.empirical.GasPressureAdj`) through ``misc_models``.
+
+    :math:`\\frac{G^R}{RT}=\\ln\\phi_i`,
+    :math:`\\frac{H^R}{RT}=-T\\bigg(\\frac{\\partial\\ln\\phi_i}{\\partial T}
+    \\bigg)_{P,y}`,
+    :math:`\\frac{U^R}{RT}=\\frac{H^R}{RT}-P\\bigg(\\frac{\\partial\\ln
+    \\phi_i}{\\partial P}\\bigg)_{T,y}`
+
+    Derivatives are evaluated with central differences.
+
+    Attributes
+    ----------
+        eos : :class:`~pmutt.eos.PengRobinsonEOS` or :class:`~pmutt.eos.SoaveRedlichKwongEOS` object
+            Equation of state
+        species_index : int, optional
+            Index of the species if ``eos`` describes a mixture. In this case,
+            mole fractions, y, must be passed when calculating properties.
+            Default is None (pure species)
+        gas_phase : bool, optional
+            If True, uses the gas phase root. If False, uses the liquid phase
+            root. Default is True
+    """
+    def __init__(self, eos, species_index=None, gas_phase=True):
+        self.eos = eos
+        self.species_index = species_index
+        self.gas_phase = gas_phase
+
+    def _get_ln_phi(self, T, P, y):
+        ln_phi = self.eos.get_ln_phi(T=T, P=P, y=y, gas_phase=self.gas_phase)
+        if self.species_index is not None:
+            ln_phi = ln_phi[self.species_index]
+        return ln_phi
+
+    def get_CpoR(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless heat capacity
+
+        :math:`\\frac{C_P^R}{R}=\\frac{\\partial}{\\partial T}\\bigg(T
+        \\frac{H^R}{RT}\\bigg)_{P,y}`
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            CpoR : float or `numpy.ndarray`_
+                Residual dimensionless heat capacity
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        dT = 1.e-4 * np.asarray(T, dtype=float)
+        HoR_high = self.get_HoRT(T=T + dT, P=P, y=y) * (T + dT)
+        HoR_low = self.get_HoRT(T=T - dT, P=P, y=y) * (T - dT)
+        return (HoR_high - HoR_low) / (2. * dT)
+
+    def get_UoRT(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless internal energy
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            UoRT : float or `numpy.ndarray`_
+                Residual dimensionless internal energy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        dP = 1.e-6 * np.asarray(P, dtype=float)
+        d_ln_phi = self._get_ln_phi(T=T, P=P + dP, y=y) \
+            - self._get_ln_phi(T=T, P=P - dP, y=y)
+        return self.get_HoRT(T=T, P=P, y=y) - P * d_ln_phi / (2. * dP)
+
+    def get_HoRT(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless enthalpy
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            HoRT : float or `numpy.ndarray`_
+                Residual dimensionless enthalpy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        dT = 1.e-6 * np.asarray(T, dtype=float)
+        d_ln_phi = self._get_ln_phi(T=T + dT, P=P, y=y) \
+            - self._get_ln_phi(T=T - dT, P=P, y=y)
+        return -T * d_ln_phi / (2. * dT)
+
+    def get_SoR(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless entropy
+
+        :math:`\\frac{S^R}{R}=\\frac{H^R}{RT}-\\frac{G^R}{RT}`
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            SoR : float or `numpy.ndarray`_
+                Residual dimensionless entropy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return self.get_HoRT(T=T, P=P, y=y) - self.get_GoRT(T=T, P=P, y=y)
+
+    def get_FoRT(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless Helmholtz energy
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            FoRT : float or `numpy.ndarray`_
+                Residual dimensionless Helmholtz energy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return self.get_UoRT(T=T, P=P, y=y) - self.get_SoR(T=T, P=P, y=y)
+
+    def get_GoRT(self, T, P=c.P0('bar'), y=None):
+        """Calculates the residual dimensionless Gibbs energy
+
+        Parameters
+        ----------
+            T : float or `numpy.ndarray`_
+                Temperature in K
+            P : float or `numpy.ndarray`_, optional
+                Pressure in bar. Default is standard pressure
+            y : (M,) or (M, ...) `numpy.ndarray`_, optional
+                Mole fractions. Only required for mixtures
+        Returns
+        -------
+            GoRT : float or `numpy.ndarray`_
+                Residual dimensionless Gibbs energy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        return self._get_ln_phi(T=T, P=P, y=y)
+
+    def to_dict(self):
+        """Represents object as dictionary with JSON-accepted datatypes
+
+        Returns
+        -------
+            obj_dict : dict
+        """
+        return {
+            'class': str(self.__class__),
+            'eos': self.eos.to_dict(),
+            'species_index': self.species_index,
+            'gas_phase': self.gas_phase
+        }
+
+    @classmethod
+    def from_dict(cls, json_obj):
+        """Recreate an object from the JSON representation.
+
+        Parameters
+        ----------
+            json_obj : dict
+                JSON representation
+        Returns
+        -------
+            RealGasAdj : RealGasAdj object
+        """
+        json_obj = remove_class(json_obj)
+        json_obj['eos'] = json_to_pmutt(json_obj['eos'])
+        return cls(**json_obj)
+
+
+def _get_cubic_real_roots(a2, a1, a0):
+    """Calculates the smallest and largest real roots of the cubic
+    :math:`x^3 + a_2 x^2 + a_1 x + a_0 = 0` analytically. Coefficients are
+    broadcast against each other so many cubics can be solved at once.
+
+    Cardano's formula is used when there is one real root. The trigonometric
+    form is used when there are three real roots.
+
+    Parameters
+    ----------
+        a2 : float or (N,) `numpy.ndarray`_
+            Coefficient of the quadratic term
+        a1 : float or (N,) `numpy.ndarray`_
+            Coefficient of the linear term
+        a0 : float or (N,) `numpy.ndarray`_
+            Constant term
+    Returns
+    -------
+        x_min : `numpy.ndarray`_
+            Smallest real root
+        x_max : `numpy.ndarray`_
+            Largest real root. Equal to x_min if there is one real root
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    a2, a1, a0 = np.broadcast_arrays(np.asarray(a2, dtype=float),
+                                     np.asarray(a1, dtype=float),
+                                     np.asarray(a0, dtype=float))
+    # Depressed cubic, t^3 + p*t + q = 0, where x = t - a2/3
+    shift = a2 / 3.
+    p = a1 - a2 * shift
+    q = 2. * shift**3 - shift * a1 + a0
+    discriminant = (q / 2.)**2 + (p / 3.)**3
+    three_roots = discriminant < 0.
+
+    x_min = np.empty_like(p)
+    x_max = np.empty_like(p)
+
+    # One real root. Sign chosen to avoid cancellation
+    one_root = ~three_roots
+    q_1 = q[one_root]
+    p_1 = p[one_root]
+    u = np.cbrt(-q_1 / 2. - np.copysign(np.sqrt(discriminant[one_root]), q_1))
+    u_nonzero = np.where(u == 0., 1., u)
+    t = np.where(u == 0., 0., u - p_1 / 3. / u_nonzero)
+    x_min[one_root] = x_max[one_root] = t - shift[one_root]
+
+    # Three real roots
+    p_3 = p[three_roots]
+    q_3 = q[three_roots]
+    r = 2. * np.sqrt(-p_3 / 3.)
+    theta = np.arccos(np.clip(3. * q_3 / p_3 / r, -1., 1.)) / 3.
+    x_max[three_roots] = r * np.cos(theta) - shift[three_roots]
+    x_min[three_roots] = r * np.cos(theta - 4. * np.pi / 3.) \
+        - shift[three_roots]
+    return x_min, x_max
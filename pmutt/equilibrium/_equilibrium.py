@@ -1,12 +1,14 @@
-from scipy.optimize import minimize
 import numpy as np
 import sys
 from itertools import repeat
 from pmutt.io.thermdat import read_thermdat
 from pmutt import pmutt_list_to_dict
 from pmutt import constants as c
+from pmutt import _LazyModule
 from collections import namedtuple
 
+optimize = _LazyModule('scipy.optimize')
+
 
 class Equilibrium():
     """Reaction thermodynamic equilibrium.
@@ -160,13 +162,14 @@ class Equilibrium():
             self.gibbs.append(self.model[x].get_GoRT(T=T))
 
         # Run solver once and collect data
-        sol = minimize(self._objective, self.guess,
-                       args=(self.gibbs, self.P*1.01325),
-                       jac=self._objective_jac,
-                       method='SLSQP',
-                       options={'ftol': 1e-14, 'maxiter': self.maxiter},
-                       bounds=self.bounds,
-                       constraints=self.con)
+        sol = optimize.minimize(self._objective, self.guess,
+                                args=(self.gibbs, self.P*1.01325),
+                                jac=self._objective_jac,
+                                method='SLSQP',
+                                options={'ftol': 1e-14,
+                                         'maxiter': self.maxiter},
+                                bounds=self.bounds,
+                                constraints=self.con)
 
         res = namedtuple("res", ["species", "moles", "mole_frac", "P", "T"])
 
@@ -1,3 +1,5 @@
+import numbers
+
 from pmutt import constants as c
 
 
@@ -66,3 +68,66 @@ def obj_to_cti(obj, line_len=80, max_line_len=80, **kwargs):
                     cti_lines.append('{}{}'.format(header_spaces, cti_val))
             cti_str = '\n'.join(cti_lines)
     return cti_str
+
+
+def obj_to_ctml(obj, line_len=80, max_line_len=80):
+    """Converts elementary data types to the string ctml_writer would receive
+    after reading the output of :func:`~pmutt.io.cantera.obj_to_cti`
+
+    Parameters
+    ----------
+        obj
+            Object to convert
+        line_len : int, optional
+            Number of characters available in line. Used to determine
+            indentation. Default is 80
+        max_line_len : int, optional
+            Maximum number of characters available in line. Used to determine
+            indentation. Default is 80
+    Returns
+    -------
+        ctml_str : str
+            Object expressed as a string without the CTI quotes
+    """
+    cti_str = obj_to_cti(obj, line_len=line_len, max_line_len=max_line_len)
+    if cti_str.startswith('"""'):
+        return cti_str[3:-3]
+    elif cti_str.startswith('"'):
+        return cti_str[1:-1]
+    return cti_str
+
+
+def _get_cti_number(val):
+    """Returns the number as it would be read from a CTI file if it was
+    written using ``'{}'.format(val)``
+
+    Parameters
+    ----------
+        val : int or float
+            Number to convert
+    Returns
+    -------
+        cti_val : int or float
+            Python int or float
+    """
+    if isinstance(val, numbers.Integral):
+        return int(val)
+    return float(val)
+
+
+def _get_cti_coeffs(coeffs, fmt='{: 2.8E}'):
+    """Returns coefficients as they would be read from a CTI file. The
+    values are rounded to the precision of the format used to write them.
+
+    Parameters
+    ----------
+        coeffs : iterable of float
+            Coefficients to convert
+        fmt : str, optional
+            Format used to write each coefficient. Default is '{: 2.8E}'
+    Returns
+    -------
+        cti_coeffs : list of float
+            Rounded coefficients
+    """
+    return [float(fmt.format(coeff)) for coeff in coeffs]
@@ -5,7 +5,9 @@ pmutt.io.chemkin
 Reads reactions lists from Chemkin gas.inp and surf.inp files
 """
 import datetime
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from warnings import warn
 
 import numpy as np
@@ -14,9 +16,22 @@ from pmutt import _force_pass_arguments
 from pmutt import constants as c
 from pmutt import pmutt_list_to_dict
 from pmutt.io import _get_file_timestamp
+from pmutt.reaction import ChemkinReaction, Reactions, _SpeciesCache
 
 
-def read_reactions(filename, species=None):
+# Floating point number, optionally in scientific notation
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+# Reaction line of the form ``A + 2B <=> C  A  beta  Ea  !comment`` where
+# the Arrhenius parameters and comment are optional
+_REACTION_LINE_PATTERN = re.compile(
+    r'(?P<reactants>[^!]+?)\s*<?=>?\s*(?P<products>[^!]+?)'
+    r'(?:\s+(?P<A>{0})\s+(?P<beta>{0})\s+(?P<Ea>{0}))?\s*(?:!.*)?'
+    ''.format(_NUMBER))
+# Species in one side of the reaction with an optional integer coefficient
+_SPECIE_PATTERN = re.compile(r'(\d*)([^\s+]+)')
+
+
+def read_reactions(filename, species=None, return_reactions=False):
     """Directly read reactions from Chemkin gas.inp or surf.inp files
 
     Parameters
@@ -27,6 +42,10 @@ def read_reactions(filename, species=None):
             List of NASA objects containing thermodynamic properties for
             all Reactants and Products in Reactions
             default = None. Will not return React_obj and Prod_obj
+        return_reactions : bool, optional
+            If True, returns a :class:`~pmutt.reaction.Reactions` object
+            containing :class:`~pmutt.reaction.ChemkinReaction` objects
+            instead of lists. ``species`` must be specified. Default is False
     Returns
     -------
         Reactions   : list of reactions
@@ -38,6 +57,13 @@ def read_reactions(filename, species=None):
         Prod_obj    : list of NASA polynomials for each Product
                       If species object list is supplied
         Prod_stoic  : list of reaction stoichiometries for Products
+        reactions : :class:`~pmutt.reaction.Reactions` object
+            Only returned instead of the lists above if ``return_reactions``
+            is True. The beta value of each reaction is read from the file.
+            Reactions followed by the STICK keyword are adsorption reactions
+            using the preexponential factor as the sticking coefficient.
+            Otherwise, the preexponential factor and activation energy are
+            stored in ``notes``
     Raises
     ------
         FileNotFoundError
@@ -46,71 +72,79 @@ def read_reactions(filename, species=None):
             If the species file does not exist
         AttributeError
             If the species list is incorrect format
+        ValueError
+            If ``return_reactions`` is True but ``species`` is not specified
     """
     if species is not None:
         species_dict = pmutt_list_to_dict(species)
+    elif return_reactions:
+        err_msg = ('species must be specified to return reactions from '
+                   'pmutt.io.chemkin.read_reactions.')
+        raise ValueError(err_msg)
 
-    rxns = []
-    with open(filename, 'r') as lines:
-        for line in lines:
-            if re.findall(r'(^[^\!].+)( *<*(?<![0-9][eE])[=\-]>* *)', line):
-                rxns.append(line.strip())
-    RHS = []
-    LHS = []
-    for rxn in rxns:
-        LHS.append(re.split(r' *<*(?<![0-9][eE])[=\-]>* *', rxn)[0])
-        RHS.append(re.split(r' *<*(?<![0-9][eE])[=\-]>* *', rxn)[1])
+    reaction_strs = []
     Reactants = []
-    Products = []
-    React_obj = []
-    Prod_obj = []
     React_stoic = []
+    Products = []
     Prod_stoic = []
-    for Reacs, Prods in zip(LHS, RHS):
-        Reactants.append(re.split(r' *\+ *| +', Reacs))
-        Products.append(re.split(r' *\+ *| +', Prods))
-        R = []
-        RS = []
-        Rx = []
-        for RR in Reactants[-1]:
-            stoic = re.findall(r'^[0-9]*', RR)[0]
-            if stoic == '':
-                stoic = 1
-            else:
-                RR = RR.replace(stoic, "", 1)
-                stoic = int(stoic)
-            Rx.append(RR)
-            RS.append(stoic)
-            if species is not None:
-                R.append(species_dict[RR])
-        Reactants[-1] = Rx
-        React_stoic.append(RS)
-        P = []
-        PS = []
-        Px = []
-        for PP in Products[-1]:
-            stoic = re.findall(r'^[0-9]*', PP)[0]
-            if stoic == '':
-                stoic = 1
-            else:
-                PP = PP.replace(stoic, "", 1)
-                stoic = int(stoic)
-            Px.append(PP)
-            PS.append(stoic)
-            if species is not None:
-                P.append(species_dict[PP])
-        Products[-1] = Px
-        Prod_stoic.append(PS)
-        React_obj.append(R)
-        Prod_obj.append(P)
-    Reactions = []
-    for rxn, Prods in zip(rxns, Products):
-        Reactions.append(rxn[0:rxn.rindex(Prods[-1]) + len(Prods[-1])])
-    if species is not None:
-        return (Reactions, Reactants, React_obj, React_stoic, Products,
+    # Arrhenius parameters and whether the STICK keyword follows the reaction
+    Arrhenius = []
+    is_sticks = []
+    with open(filename, 'r') as f_ptr:
+        for line in f_ptr:
+            line = line.strip()
+            # Skip blank lines and comments
+            if not line or line[0] == '!':
+                continue
+            match = _REACTION_LINE_PATTERN.fullmatch(line)
+            if match is None:
+                if line.upper() == 'STICK' and len(is_sticks) > 0:
+                    is_sticks[-1] = True
+                continue
+            reaction_strs.append(line[:match.end('products')])
+            for side, names, stoics in (('reactants', Reactants, React_stoic),
+                                        ('products', Products, Prod_stoic)):
+                side_names = []
+                side_stoics = []
+                for stoic, name in _SPECIE_PATTERN.findall(match.group(side)):
+                    side_names.append(name)
+                    side_stoics.append(1 if stoic == '' else int(stoic))
+                names.append(side_names)
+                stoics.append(side_stoics)
+            Arrhenius.append(match.group('A', 'beta', 'Ea'))
+            is_sticks.append(False)
+
+    if species is None:
+        return (reaction_strs, Reactants, React_stoic, Products,
+                Prod_stoic)
+
+    # Resolve the species objects once all the names are known
+    React_obj = [[species_dict[name] for name in names]
+                 for names in Reactants]
+    Prod_obj = [[species_dict[name] for name in names] for names in Products]
+    if not return_reactions:
+        return (reaction_strs, Reactants, React_obj, React_stoic, Products,
                 Prod_obj, Prod_stoic)
-    else:
-        return (Reactions, Reactants, React_stoic, Products, Prod_stoic)
+
+    rxns = []
+    for (reactants, react_stoic, products, prod_stoic, (A, beta, Ea),
+         is_stick) in zip(React_obj, React_stoic, Prod_obj, Prod_stoic,
+                          Arrhenius, is_sticks):
+        rxn_kwargs = {
+            'reactants': reactants,
+            'reactants_stoich': [float(stoic) for stoic in react_stoic],
+            'products': products,
+            'products_stoich': [float(stoic) for stoic in prod_stoic],
+        }
+        if beta is not None:
+            rxn_kwargs['beta'] = float(beta)
+        if is_stick and A is not None:
+            rxn_kwargs['is_adsorption'] = True
+            rxn_kwargs['sticking_coeff'] = float(A)
+        elif A is not None:
+            rxn_kwargs['notes'] = {'A': float(A), 'Ea': float(Ea)}
+        rxns.append(ChemkinReaction(**rxn_kwargs))
+    return Reactions(reactions=rxns)
 
 
 def write_EA(reactions,
@@ -124,7 +158,8 @@ def write_EA(reactions,
              reaction_delimiter='<=>',
              stoich_format='.0f',
              newline='\n',
-             column_delimiter='  '):
+             column_delimiter='  ',
+             n_processes=1):
     """Writes the EAs.inp or EAg.inp file for Chemkin
 
     Parameters
@@ -160,6 +195,10 @@ def write_EA(reactions,
             Newline character to use. Default is the Linux newline character
         column_delimiter : str, optional
             Delimiter for columns. Default is '  '
+        n_processes : int, optional
+            Number of processes to evaluate the conditions. Each process
+            evaluates a share of the conditions. If None, uses the number of
+            processors. Default is 1
     Returns
     -------
         lines_out : str
@@ -210,8 +249,20 @@ def write_EA(reactions,
                                      n_conditions=len(conditions))
     lines.append(column_line)
 
+    # Evaluate the reactions at each condition
+    if n_processes is None:
+        n_processes = os.cpu_count()
+    n_blocks = min(n_processes, len(conditions))
+    jobs = [(valid_reactions, conditions[i::n_blocks], act_method_name,
+             ads_act_method) for i in range(n_blocks)]
+    if n_blocks < 2 or len(valid_reactions) == 0:
+        results = [_get_EA_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_blocks) as executor:
+            results = list(executor.map(_get_EA_job, jobs))
+
     # Add line for each reaction step
-    for reaction in valid_reactions:
+    for i, reaction in enumerate(valid_reactions):
         line = [
             str_field.format(
                 reaction.to_string(species_delimiter=species_delimiter,
@@ -219,13 +270,12 @@ def write_EA(reactions,
                                    stoich_format=stoich_format,
                                    include_TS=False))
         ]
-        for condition in conditions:
-            if reaction.is_adsorption:
-                method = getattr(reaction, ads_act_method)
-            else:
-                method = getattr(reaction, act_method_name)
-            quantity = _force_pass_arguments(method, **condition)
-            line.append(float_field.format(quantity))
+        # Conditions were assigned to blocks in turns
+        quantities = [None] * len(conditions)
+        for j, block_quantities in enumerate(results):
+            quantities[j::n_blocks] = block_quantities[i]
+        line.extend([float_field.format(quantity)
+                     for quantity in quantities])
         lines.append(column_delimiter.join(line))
     lines.append('EOF')
     lines_out = '\n'.join(lines)
@@ -236,6 +286,33 @@ def write_EA(reactions,
         return lines_out
 
 
+def _get_EA_job(job):
+    """Evaluates the activation quantity of reactions at a share of the
+    conditions. Shared species are only evaluated once per condition.
+
+    Parameters
+    ----------
+        job : (list, list of dict, str, str) tuple
+            Reactions, conditions, name of the method for surface reactions
+            and name of the method for adsorption reactions
+    Returns
+    -------
+        quantities : list of list of float
+            Quantities of each reaction at each condition
+    """
+    reactions, conditions, act_method_name, ads_act_method = job
+    quantities = []
+    with _SpeciesCache(conditions=conditions):
+        for reaction in reactions:
+            if reaction.is_adsorption:
+                method = getattr(reaction, ads_act_method)
+            else:
+                method = getattr(reaction, act_method_name)
+            quantities.append([_force_pass_arguments(method, **condition)
+                               for condition in conditions])
+    return quantities
+
+
 def write_gas(nasa_species,
               filename=None,
               T=c.T0('K'),
@@ -279,20 +356,22 @@ def write_gas(nasa_species,
 
     # Get gas-phase reactions
     gas_reactions = [reaction for reaction in reactions if reaction.gas_phase]
-    reaction_lines = _write_reaction_lines(
-        reactions=gas_reactions,
-        species_delimiter=species_delimiter,
-        reaction_delimiter=reaction_delimiter,
-        include_TS=False,
-        stoich_format=stoich_format,
-        act_method_name=act_method_name,
-        ads_act_method=None,
-        act_unit=act_unit,
-        float_format=float_format,
-        column_delimiter=column_delimiter,
-        T=T,
-        sden_operation=None,
-        **kwargs)
+    # Species shared by reactions are only evaluated once
+    with _SpeciesCache():
+        reaction_lines = _write_reaction_lines(
+            reactions=gas_reactions,
+            species_delimiter=species_delimiter,
+            reaction_delimiter=reaction_delimiter,
+            include_TS=False,
+            stoich_format=stoich_format,
+            act_method_name=act_method_name,
+            ads_act_method=None,
+            act_unit=act_unit,
+            float_format=float_format,
+            column_delimiter=column_delimiter,
+            T=T,
+            sden_operation=None,
+            **kwargs)
     # Check length of lines
     if any([(len(reaction_line) > 80) for reaction_line in reaction_lines]):
         warn_msg = ('Reaction lines exceed 80 character limit when writing '
@@ -431,20 +510,22 @@ def write_surf(reactions,
     # Get surface reaction lines
     surf_reactions = \
         [reaction for reaction in reactions if not reaction.gas_phase]
-    reaction_lines = _write_reaction_lines(
-        reactions=surf_reactions,
-        species_delimiter=species_delimiter,
-        reaction_delimiter=reaction_delimiter,
-        include_TS=False,
-        stoich_format=stoich_format,
-        act_method_name=act_method_name,
-        ads_act_method=ads_act_method,
-        act_unit=act_unit,
-        float_format=float_format,
-        column_delimiter=column_delimiter,
-        T=T,
-        sden_operation=sden_operation,
-        **kwargs)
+    # Species shared by reactions are only evaluated once
+    with _SpeciesCache():
+        reaction_lines = _write_reaction_lines(
+            reactions=surf_reactions,
+            species_delimiter=species_delimiter,
+            reaction_delimiter=reaction_delimiter,
+            include_TS=False,
+            stoich_format=stoich_format,
+            act_method_name=act_method_name,
+            ads_act_method=ads_act_method,
+            act_unit=act_unit,
+            float_format=float_format,
+            column_delimiter=column_delimiter,
+            T=T,
+            sden_operation=sden_operation,
+            **kwargs)
 
     # Check length of lines
     if any([(len(reaction_line) > 80) for reaction_line in reaction_lines]):
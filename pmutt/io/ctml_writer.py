@@ -21,6 +21,7 @@
 
 from __future__ import print_function
 
+import contextvars
 import sys
 
 # Python 2/3 compatibility
@@ -38,6 +39,7 @@ class CTI_Error(Exception):
     parsing the input file.
     @ingroup pygroup"""
     def __init__(self, msg):
+        Exception.__init__(self, msg)
         _printerr('\n\n***** Error parsing input file *****\n\n')
         _printerr(msg)
         _printerr()
@@ -141,15 +143,19 @@ class XMLnode(object):
         return self._value
 
     def write(self, filename):
-        """Write out the XML tree to a file."""
-        s = ['<?xml version="1.0"?>\n']
-        self._write(s, 0)
-        s.append('\n')
+        """Write out the XML tree to a file. The file is written as the tree
+        is traversed so the whole document is never held in memory."""
         if isinstance(filename, str):
             with open(filename, 'w') as f:
-                f.write(''.join(s))
+                self._write_file(f)
         else:
-            filename.write(''.join(s))
+            self._write_file(filename)
+
+    def _write_file(self, f):
+        s = ['<?xml version="1.0"?>\n']
+        self._write(s, 0, f)
+        s.append('\n')
+        f.write(''.join(s))
 
     def write_comment(self, s, level):
         s.append('\n'+indent[level]+'<!--')
@@ -181,8 +187,10 @@ class XMLnode(object):
         else:
             s.append(self._value)
 
-    def _write(self, s, level = 0):
-        """Internal method used to write the XML representation of each node."""
+    def _write(self, s, level = 0, f = None):
+        """Internal method used to write the XML representation of each node.
+        If a file, f, is given, the strings accumulated in s are written to
+        it after each child of this node and its children."""
         if not self.name:
             return
 
@@ -206,7 +214,13 @@ class XMLnode(object):
 
             for c in self._children:
                 s.append('\n')
-                c._write(s, level + 2)
+                if f is None or level > 0:
+                    c._write(s, level + 2)
+                else:
+                    c._write(s, level + 2, f)
+                if f is not None:
+                    f.write(''.join(s))
+                    del s[:]
             if self._children:
                 s.extend(('\n', indnt))
             s.extend(('</', self._name, '>'))
@@ -223,57 +237,72 @@ ElectronMass = 9.10938291e-31
 
 import math, copy
 
-# default units
-_ulen = 'm'
-_umol = 'kmol'
-_umass = 'kg'
-_utime = 's'
-_ue = 'J/kmol'
-_uenergy = 'J'
-_upres = 'Pa'
-
 # used to convert reaction pre-exponentials
 _length = {'cm':0.01, 'm':1.0, 'mm':0.001}
 _moles = {'kmol':1.0, 'mol':0.001, 'molec':1.0/6.02214129e26}
 _time = {'s':1.0, 'min':60.0, 'hr':3600.0}
 
-# default std state pressure
-_pref = 1.0e5    # 1 bar
-
-_name = 'noname'
-
-# these lists store top-level entries
-_elements = []
-_species = []
-_speciesnames = []
-_phases = []
-_reactions = []
-_interactions = []
-_beps = []
-_atw = {}
-_enames = {}
-
-_valsp = ''
-_valrxn = ''
-_valexport = ''
-_valfmt = ''
-
-# default for Motz & Wise correction
-_motz_wise = None
+class _State(object):
+    """Units, options and top-level entries of a CTI input. The functions
+    and classes of this module use the state of the current context: the
+    state of the Converter calling them, or the module's default state."""
+    def __init__(self):
+        # default units
+        self.ulen = 'm'
+        self.umol = 'kmol'
+        self.umass = 'kg'
+        self.utime = 's'
+        self.ue = 'J/kmol'
+        self.uenergy = 'J'
+        self.upres = 'Pa'
+
+        # default std state pressure
+        self.pref = 1.0e5    # 1 bar
+
+        self.name = 'noname'
+
+        # these lists store top-level entries
+        self.elements = []
+        self.species = []
+        self.speciesnames = []
+        self.phases = []
+        self.reactions = []
+        self.interactions = []
+        self.beps = []
+        self.atw = {}
+        self.enames = {}
+
+        self.valsp = 'yes'
+        self.valrxn = 'yes'
+        self.valexport = ''
+        self.valfmt = ''
+
+        # default for Motz & Wise correction
+        self.motz_wise = None
+
+class _StateProxy(object):
+    """Forwards attribute access to the state of the current context"""
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(_current_state.get(_default_state), name)
+
+    def __setattr__(self, name, value):
+        setattr(_current_state.get(_default_state), name, value)
+
+_default_state = _State()
+_current_state = contextvars.ContextVar('ctml_writer_state')
+_state = _StateProxy()
 
 def enable_motz_wise():
-    global _motz_wise
-    _motz_wise = True
+    _state.motz_wise = True
 
 def disable_motz_wise():
-    global _motz_wise
-    _motz_wise = False
+    _state.motz_wise = False
 
 def export_species(filename, fmt = 'CSV'):
-    global _valexport
-    global _valfmt
-    _valexport = filename
-    _valfmt = fmt
+    _state.valexport = filename
+    _state.valfmt = fmt
 
 def validate(species = 'yes', reactions = 'yes'):
     """
@@ -286,10 +315,8 @@ def validate(species = 'yes', reactions = 'yes'):
         and validation of rate expressions for some reaction types.
 
     """
-    global _valsp
-    global _valrxn
-    _valsp = species
-    _valrxn = reactions
+    _state.valsp = species
+    _state.valrxn = reactions
 
 def isnum(a):
     """True if a is an integer or floating-point number."""
@@ -300,19 +327,17 @@ def isnum(a):
 
 def is_local_species(name):
     """true if the species named 'name' is defined in this file"""
-    if name in _speciesnames:
+    if name in _state.speciesnames:
         return 1
     return 0
 
 def dataset(nm):
     "Set the dataset name. Invoke this to change the name of the XML file."
-    global _name
-    _name = nm
+    _state.name = nm
 
 def standard_pressure(p0):
     """Set the default standard-state pressure."""
-    global _pref
-    _pref = p0
+    _state.pref = p0
 
 def units(length = '', quantity = '', mass = '', time = '',
           act_energy = '', energy = '', pressure = ''):
@@ -334,14 +359,13 @@ def units(length = '', quantity = '', mass = '', time = '',
     :param pressure:
         The default units for pressure. Default: ``'Pa'``
     """
-    global _ulen, _umol, _ue, _utime, _umass, _uenergy, _upres
-    if length: _ulen = length
-    if quantity: _umol = quantity
-    if act_energy: _ue = act_energy
-    if time: _utime = time
-    if mass: _umass = mass
-    if energy: _uenergy = energy
-    if pressure: _upres = pressure
+    if length: _state.ulen = length
+    if quantity: _state.umol = quantity
+    if act_energy: _state.ue = act_energy
+    if time: _state.utime = time
+    if mass: _state.umass = mass
+    if energy: _state.uenergy = energy
+    if pressure: _state.upres = pressure
 
 def ufmt(base, n):
     """return a string representing a unit to a power n."""
@@ -355,49 +379,49 @@ def write(outName=None):
     """write the CTML file."""
     x = XMLnode("ctml")
     v = x.addChild("validate")
-    v["species"] = _valsp
-    v["reactions"] = _valrxn
+    v["species"] = _state.valsp
+    v["reactions"] = _state.valrxn
 
-    if _elements:
+    if _state.elements:
         ed = x.addChild("elementData")
-        for e in _elements:
+        for e in _state.elements:
             e.build(ed)
 
-    for ph in _phases:
+    for ph in _state.phases:
         ph.build(x)
-    s = species_set(name = _name, species = _species)
+    s = species_set(name = _state.name, species = _state.species)
     s.build(x)
 
     r = x.addChild('reactionData')
     r['id'] = 'reaction_data'
-    if _motz_wise is not None:
-        r['motz_wise'] = str(_motz_wise).lower()
-    for rx in _reactions:
+    if _state.motz_wise is not None:
+        r['motz_wise'] = str(_state.motz_wise).lower()
+    for rx in _state.reactions:
         rx.build(r)
 
     i = x.addChild('interactionData')
     i['id'] = 'interaction_data'
-    for interaction in _interactions:
+    for interaction in _state.interactions:
         interaction.build(i)
 
     b = x.addChild('bepData')
     b['id'] = 'bep_data'
-    for bep in _beps:
+    for bep in _state.beps:
         bep.build(b)
 
     if outName == 'STDOUT':
         x.write(sys.stdout)
     elif outName is not None:
         x.write(outName)
-    elif _name != 'noname':
-        x.write(_name+'.xml')
+    elif _state.name != 'noname':
+        x.write(_state.name+'.xml')
     else:
         print(x)
 
-    if _valexport:
-        f = open(_valexport,'w')
-        for s in _species:
-            s.export(f, _valfmt)
+    if _state.valexport:
+        f = open(_state.valexport,'w')
+        for s in _state.species:
+            s.export(f, _state.valfmt)
         f.close()
 
 def addFloat(x, nm, val, fmt='', defunits=''):
@@ -504,7 +528,7 @@ class element(object):
         self._sym = symbol
         self._atw = atomic_mass
         self._num = atomic_number
-        _elements.append(self)
+        _state.elements.append(self)
 
     def build(self, db):
         e = db.addChild("element")
@@ -597,15 +621,15 @@ class species(object):
                 self._charge = chrg
         self._size = size
 
-        _species.append(self)
-        _speciesnames.append(name)
+        _state.species.append(self)
+        _state.speciesnames.append(name)
         for e in self._atoms.keys():
-            _enames[e] = 1
+            _state.enames[e] = 1
 
     def export(self, f, fmt = 'CSV'):
         if fmt == 'CSV':
             s = self._name+','
-            for e in _enames:
+            for e in _state.enames:
                 if e in self._atoms:
                     s += repr(self._atoms[e])+','
                 else:
@@ -677,10 +701,10 @@ class Mu0_table(thermo):
         n['Tmin'] = repr(self._t[0])
         n['Tmax'] = repr(self._t[1])
         if self._pref <= 0.0:
-            n['P0'] = repr(_pref)
+            n['P0'] = repr(_state.pref)
         else:
             n['P0'] = repr(self._pref)
-        energy_units = _uenergy+'/'+_umol
+        energy_units = _state.uenergy+'/'+_state.umol
         addFloat(n,"H298", self._h298, defunits = energy_units)
         n.addChild("numPoints", len(self._mu0))
 
@@ -743,7 +767,7 @@ class NASA(thermo):
         #n['Tmid'] = repr(self._t[1])
         n['Tmax'] = repr(self._t[1])
         if self._pref <= 0.0:
-            n['P0'] = repr(_pref)
+            n['P0'] = repr(_state.pref)
         else:
             n['P0'] = repr(self._pref)
         s = ''
@@ -795,7 +819,7 @@ class NASA9(thermo):
         n['Tmin'] = repr(self._t[0])
         n['Tmax'] = repr(self._t[1])
         if self._pref <= 0.0:
-            n['P0'] = repr(_pref)
+            n['P0'] = repr(_state.pref)
         else:
             n['P0'] = repr(self._pref)
         s = ''
@@ -831,11 +855,11 @@ class pureFluidParameters(activityCoefficients):
         f['species'] = self._species
         s = '%10.4E, %10.4E \n' % (self._acoeff[0], self._acoeff[1])
         ac = f.addChild("a_coeff",s)
-        ac["units"] = _upres+'-'+_ulen+'6/'+_umol+'2'
+        ac["units"] = _state.upres+'-'+_state.ulen+'6/'+_state.umol+'2'
         ac["model"] = "linear_a"
         s = '%0.2f \n' % self._bcoeff
         bc = f.addChild("b_coeff",s)
-        bc["units"] = _ulen+'3/'+_umol
+        bc["units"] = _state.ulen+'3/'+_state.umol
 
 
 class crossFluidParameters(activityCoefficients):
@@ -850,12 +874,12 @@ class crossFluidParameters(activityCoefficients):
         f["species1"] = self._species1
         s = '%10.4E, %10.4E \n' % (self._acoeff[0], self._acoeff[1])
         ac = f.addChild("a_coeff",s)
-        ac["units"] = _upres+'-'+_ulen+'6/'+_umol+'2'
+        ac["units"] = _state.upres+'-'+_state.ulen+'6/'+_state.umol+'2'
         ac["model"] = "linear_a"
         if self._bcoeff:
             s = '%0.2f \n' % self._bcoeff
             bc = f.addChild("b_coeff",s)
-            bc["units"] = _ulen+'3/'+_umol
+            bc["units"] = _state.ulen+'3/'+_state.umol
 
 
 class Shomate(thermo):
@@ -885,7 +909,7 @@ class Shomate(thermo):
         n['Tmin'] = repr(self._t[0])
         n['Tmax'] = repr(self._t[1])
         if self._pref <= 0.0:
-            n['P0'] = repr(_pref)
+            n['P0'] = repr(_state.pref)
         else:
             n['P0'] = repr(self._pref)
         s = ''
@@ -917,11 +941,11 @@ class Adsorbate(thermo):
         n['Tmin'] = repr(self._t[0])
         n['Tmax'] = repr(self._t[1])
         if self._pref <= 0.0:
-            n['P0'] = repr(_pref)
+            n['P0'] = repr(_state.pref)
         else:
             n['P0'] = repr(self._pref)
 
-        energy_units = _uenergy+'/'+_umol
+        energy_units = _state.uenergy+'/'+_state.umol
         addFloat(n,'binding_energy',self._be, defunits = energy_units)
         s = ""
         nfreq = len(self._freqs)
@@ -958,7 +982,7 @@ class const_cp(thermo):
         c = t.addChild('const_cp')
         if self._t[0] >= 0.0: c['Tmin'] = repr(self._t[0])
         if self._t[1] >= 0.0: c['Tmax'] = repr(self._t[1])
-        energy_units = _uenergy+'/'+_umol
+        energy_units = _state.uenergy+'/'+_state.umol
         addFloat(c,'t0',self._c[0], defunits = 'K')
         addFloat(c,'h0',self._c[1], defunits = energy_units)
         addFloat(c,'s0',self._c[2], defunits = energy_units+'/K')
@@ -1089,7 +1113,7 @@ class Arrhenius(rate_expression):
 
         # If a pure number is entered for the activation energy,
         # add the default units, otherwise use the supplied units.
-        addFloat(a,'E', self._c[2], fmt = '%f', defunits = _ue)
+        addFloat(a,'E', self._c[2], fmt = '%f', defunits = _state.ue)
 
         # for surface reactions, a coverage dependence may be specified.
         if self._cov:
@@ -1098,7 +1122,7 @@ class Arrhenius(rate_expression):
                 c['species'] = cov[0]
                 addFloat(c, 'a', cov[1], fmt = '%f')
                 c.addChild('m', repr(cov[2]))
-                addFloat(c, 'e', cov[3], fmt = '%f', defunits = _ue)
+                addFloat(c, 'e', cov[3], fmt = '%f', defunits = _state.ue)
 
 class stick(Arrhenius):
     def __init__(self, *args, **kwargs):
@@ -1150,7 +1174,7 @@ class reaction(object):
         :param kf:
             The rate coefficient for the forward direction. If a sequence of
             three numbers is given, these will be interpreted as [A, b, E] in
-            the modified Arrhenius function :math:`A T^b exp(-E/\hat{R}T)`.
+            the modified Arrhenius function :math:`A T^b exp(-E/\\hat{R}T)`.
         :param id:
             An optional identification string. If omitted, it defaults to a
             four-digit numeric string beginning with 0001 for the first
@@ -1173,7 +1197,7 @@ class reaction(object):
             self._options = [options]
         else:
             self._options = options
-        self._num = len(_reactions)+1
+        self._num = len(_state.reactions)+1
         r = ''
         p = ''
         for e in ['<=>', '=>', '=']:
@@ -1202,15 +1226,15 @@ class reaction(object):
         self._dims = [0]*4
         self._rxnphase = None
         self._type = ''
-        _reactions.append(self)
+        _state.reactions.append(self)
 
     def unit_factor(self):
         """
         Conversion factor from given rate constant units to the MKS (+kmol)
         used internally by Cantera, taking into account the reaction order.
         """
-        return (math.pow(_length[_ulen], -self.ldim) *
-                math.pow(_moles[_umol], -self.mdim) / _time[_utime])
+        return (math.pow(_length[_state.ulen], -self.ldim) *
+                math.pow(_moles[_state.umol], -self.mdim) / _time[_state.utime])
 
     @property
     def id(self):
@@ -1235,9 +1259,9 @@ class reaction(object):
             nm = -999
             nl = -999
 
-            if _phases:
+            if _state.phases:
                 mindim = 4
-                for ph in _phases:
+                for ph in _state.phases:
                     if ph.has_species(s):
                         nm, nl = ph.conc_dim()
                         if ph.is_ideal_gas():
@@ -1713,7 +1737,7 @@ class lateral_interaction(object):
             is considered picewise linear. The strength parameters define the
             slopes. Could be one or more floats.
             f three numbers is given, these will be interpreted as [A, b, E] in
-            the modified Arrhenius function :math:`A T^b exp(-E/\hat{R}T)`.
+            the modified Arrhenius function :math:`A T^b exp(-E/\\hat{R}T)`.
         :param coverage_thresholds:
             Coverage threshold at which the lateral interaction strength changes.
             Could be None, one or more  floats. The length of coverage_threshold
@@ -1761,9 +1785,9 @@ class lateral_interaction(object):
 
         self._strengths = strengths
         self._coverage_thresholds = coverage_thresholds
-        self._num = len(_interactions)+1
+        self._num = len(_state.interactions)+1
 
-        _interactions.append(self)
+        _state.interactions.append(self)
 
     def build(self, p):
         if self._id:
@@ -1786,7 +1810,7 @@ class lateral_interaction(object):
             str_str += '%17.9E, ' % strength
         str_n = i.addChild("floatArray", str_str)
         str_n["name"] = "strength"
-        strength_units = _uenergy+'/'+_umol
+        strength_units = _state.uenergy+'/'+_state.umol
         str_n["units"] = strength_units
 
         cov_str = ''
@@ -1893,7 +1917,7 @@ class bep(object):
         self._id = id
         self._alpha = slope
         self._beta = intercept
-        self._num = len(_beps) + 1
+        self._num = len(_state.beps) + 1
         if (direction == "cleavage" or direction == "synthesis"):
             self._direction = direction
         else:
@@ -1904,7 +1928,7 @@ class bep(object):
         self._clv_rxns = cleavage_reactions
         self._syn_rxns = synthesis_reactions
 
-        _beps.append(self)
+        _state.beps.append(self)
 
         
     def unit_factor(self):
@@ -1912,8 +1936,8 @@ class bep(object):
         Conversion factor from given rate constant units to the MKS (+kmol)
         used internally by Cantera, taking into account the reaction order.
         """
-        return (math.pow(_length[_ulen], -self.ldim) *
-                math.pow(_moles[_umol], -self.mdim) / _time[_utime])
+        return (math.pow(_length[_state.ulen], -self.ldim) *
+                math.pow(_moles[_state.umol], -self.mdim) / _time[_state.utime])
 
     @property
     def id(self):
@@ -1930,7 +1954,7 @@ class bep(object):
         #b['alpha'] = self._alpha
         #b['beta'] = self._beta
         b.addChild('alpha', repr(self._alpha))
-        addFloat(b, 'beta', self._beta, fmt='%f', defunits=_ue)
+        addFloat(b, 'beta', self._beta, fmt='%f', defunits=_state.ue)
         b.addChild('direction', self._direction)
 
         clv_rx = b.addChild('cleavage_reactions')
@@ -2068,8 +2092,8 @@ class state(object):
     def build(self, ph):
         st = ph.addChild('state')
         if self._t: addFloat(st, 'temperature', self._t, defunits = 'K')
-        if self._p: addFloat(st, 'pressure', self._p, defunits = _upres)
-        if self._rho: addFloat(st, 'density', self._rho, defunits = _umass+'/'+_ulen+'3')
+        if self._p: addFloat(st, 'pressure', self._p, defunits = _state.upres)
+        if self._rho: addFloat(st, 'density', self._rho, defunits = _state.umass+'/'+_state.ulen+'3')
         if self._x: st.addChild('moleFractions', self._x)
         if self._y: st.addChild('massFractions', self._y)
         if self._c: st.addChild('coverages', self._c)
@@ -2160,7 +2184,7 @@ class phase(object):
         self._initial = initial_state
 
         # add this phase to the global phase list
-        _phases.append(self)
+        _state.phases.append(self)
 
 
     def is_ideal_gas(self):
@@ -2235,7 +2259,7 @@ class phase(object):
             for token in sp.split():
                 if ':' in sp:
                     foundColon = True
-                if token not in _speciesnames:
+                if token not in _state.speciesnames:
                     allLocal = False
 
             if foundColon and not allLocal:
@@ -2380,7 +2404,7 @@ class stoichiometric_solid(phase):
         ph = phase.build(self, p)
         e = ph.child('thermo')
         e['model'] = 'StoichSubstance'
-        addFloat(e, 'density', self._dens, defunits = _umass+'/'+_ulen+'3')
+        addFloat(e, 'density', self._dens, defunits = _state.umass+'/'+_state.ulen+'3')
         if self._tr:
             t = ph.addChild('transport')
             t['model'] = self._tr
@@ -2435,7 +2459,7 @@ class metal(phase):
         ph = phase.build(self, p)
         e = ph.child("thermo")
         e['model'] = 'Metal'
-        addFloat(e, 'density', self._dens, defunits = _umass+'/'+_ulen+'3')
+        addFloat(e, 'density', self._dens, defunits = _state.umass+'/'+_state.ulen+'3')
         if self._tr:
             t = ph.addChild('transport')
             t['model'] = self._tr
@@ -2473,9 +2497,9 @@ class semiconductor(phase):
         ph = phase.build(self, p)
         e = ph.child("thermo")
         e['model'] = 'Semiconductor'
-        addFloat(e, 'density', self._dens, defunits = _umass+'/'+_ulen+'3')
-        addFloat(e, 'effectiveMass_e', self._emass, defunits = _umass)
-        addFloat(e, 'effectiveMass_h', self._hmass, defunits = _umass)
+        addFloat(e, 'density', self._dens, defunits = _state.umass+'/'+_state.ulen+'3')
+        addFloat(e, 'effectiveMass_e', self._emass, defunits = _state.umass)
+        addFloat(e, 'effectiveMass_h', self._hmass, defunits = _state.umass)
         addFloat(e, 'bandgap', self._bandgap, defunits = 'eV')
         if self._tr:
             t = ph.addChild('transport')
@@ -2511,7 +2535,7 @@ class incompressible_solid(phase):
         ph = phase.build(self, p)
         e = ph.child("thermo")
         e['model'] = 'Incompressible'
-        addFloat(e, 'density', self._dens, defunits = _umass+'/'+_ulen+'3')
+        addFloat(e, 'density', self._dens, defunits = _state.umass+'/'+_state.ulen+'3')
         if self._tr:
             t = ph.addChild('transport')
             t['model'] = self._tr
@@ -2549,7 +2573,7 @@ class lattice(phase):
         ph = phase.build(self, p)
         e = ph.child('thermo')
         e['model'] = 'Lattice'
-        addFloat(e, 'site_density', self._n, defunits = _umol+'/'+_ulen+'3')
+        addFloat(e, 'site_density', self._n, defunits = _state.umol+'/'+_state.ulen+'3')
         if self._tr:
             t = ph.addChild('transport')
             t['model'] = self._tr
@@ -2737,7 +2761,7 @@ class ideal_interface(phase):
         ph = phase.build(self, p)
         e = ph.child("thermo")
         e['model'] = 'Surface'
-        addFloat(e, 'site_density', self._sitedens, defunits = _umol+'/'+_ulen+'2')
+        addFloat(e, 'site_density', self._sitedens, defunits = _state.umol+'/'+_state.ulen+'2')
         k = ph.addChild("kinetics")
         k['model'] = self._kin
         t = ph.addChild('transport')
@@ -2864,7 +2888,7 @@ class interacting_interface(phase):
             self._build_beps(ph)
         e = ph.child("thermo")
         e['model'] = 'SurfaceCoverage'
-        addFloat(e, 'site_density', self._sitedens, defunits = _umol+'/'+_ulen+'2')
+        addFloat(e, 'site_density', self._sitedens, defunits = _state.umol+'/'+_state.ulen+'2')
         k = ph.addChild("kinetics")
         k['model'] = self._kin
         t = ph.addChild('transport')
@@ -2906,7 +2930,7 @@ class edge(phase):
         ph = phase.build(self, p)
         e = ph.child("thermo")
         e['model'] = 'Edge'
-        addFloat(e, 'site_density', self._sitedens, defunits = _umol+'/'+_ulen)
+        addFloat(e, 'site_density', self._sitedens, defunits = _state.umol+'/'+_state.ulen)
         k = ph.addChild("kinetics")
         k['model'] = self._kin
         t = ph.addChild('transport')
@@ -3109,21 +3133,28 @@ class Lindemann(object):
 
 
 #get_atomic_wts()
-validate()
+
+def clear():
+    """Removes the entries defined so a new file can be processed."""
+    _state.elements = []
+    _state.species = []
+    _state.speciesnames = []
+    _state.phases = []
+    _state.reactions = []
+    _state.interactions = []
+    _state.beps = []
+    _state.atw = {}
+    _state.enames = {}
 
 def convert(filename=None, outName=None, text=None):
+    """Converts a CTI file (or text) to CTML. Each call uses a new
+    Converter so conversions can run at the same time in different threads.
+    Raises CTI_Error if the input cannot be processed."""
+    Converter().convert(filename=filename, outName=outName, text=text)
+
+def _convert(filename=None, outName=None, text=None):
     # Clear variables
-    global _elements, _species, _speciesnames, _phases, _reactions, \
-           _interactions, _beps, _atw, _enames
-    _elements = []
-    _species = []
-    _speciesnames = []
-    _phases = []
-    _reactions = []
-    _interactions = []
-    _beps = []
-    _atw = {}
-    _enames = {}
+    clear()
 
     import os
     if filename is not None:
@@ -3150,17 +3181,16 @@ def convert(filename=None, outName=None, text=None):
             text = open(filename, open_mode).readlines()
         else:
             text = text.split('\n')
-        _printerr('%s in "%s" on line %i:\n' % (err.__class__.__name__,
-                                                err.filename,
-                                                err.lineno))
-        _printerr('|  Line |')
+        msg = ['%s in "%s" on line %i:\n' % (err.__class__.__name__,
+                                              err.filename,
+                                              err.lineno)]
+        msg.append('|  Line |')
         for i in range(max(err.lineno-6, 0),
                        min(err.lineno+3, len(text))):
-            _printerr('| % 5i |' % (i+1), text[i].rstrip())
+            msg.append('| % 5i | %s' % (i+1, text[i].rstrip()))
             if i == err.lineno-1:
-                _printerr(' '* (err.offset+9) + '^')
-        _printerr()
-        sys.exit(3)
+                msg.append(' '* (err.offset+9) + '^')
+        raise CTI_Error('\n'.join(msg)) from err
     except Exception as err:
         import traceback
 
@@ -3173,25 +3203,64 @@ def convert(filename=None, outName=None, text=None):
         lineno = tb[-1][1]
         if tb[-1][0] == filename:
             # Error in input file
-            _printerr('%s on line %i of %s:' % (err.__class__.__name__, lineno, filename))
-            _printerr(err)
-            _printerr('\n| Line |')
+            msg = ['%s on line %i of %s:' % (err.__class__.__name__, lineno,
+                                             filename)]
+            msg.append(str(err))
+            msg.append('\n| Line |')
 
             for i in range(max(lineno-6, 0),
                            min(lineno+3, len(text))):
                 if i == lineno-1:
-                    _printerr('> % 4i >' % (i+1), text[i].rstrip())
+                    msg.append('> % 4i > %s' % (i+1, text[i].rstrip()))
                 else:
-                    _printerr('| % 4i |' % (i+1), text[i].rstrip())
+                    msg.append('| % 4i | %s' % (i+1, text[i].rstrip()))
         else:
             # Error in ctml_writer or elsewhere
-            traceback.print_exc()
-
-        sys.exit(4)
+            msg = [traceback.format_exc()]
+        raise CTI_Error('\n'.join(msg)) from err
 
     write(outName)
 
 
+class Converter(object):
+    """Converts CTI input to CTML using its own state (units, species,
+    phases, reactions, ...). Different converters can be used at the same
+    time, e.g. in threads or an executor.
+
+    The functions and classes of this module used to define entries (e.g.
+    units, ideal_gas, species, surface_reaction) are available as
+    attributes and only add entries to this converter. Call write to
+    generate the CTML file."""
+    def __init__(self):
+        self.state = _State()
+
+    def __getattr__(self, name):
+        # Only called for attributes not found normally
+        try:
+            attr = globals()[name]
+        except KeyError:
+            raise AttributeError(name)
+        if not callable(attr) or isinstance(attr, type) \
+                and issubclass(attr, BaseException):
+            return attr
+        def call_in_state(*args, **kwargs):
+            return self._call(attr, *args, **kwargs)
+        return call_in_state
+
+    def _call(self, fn, *args, **kwargs):
+        """Calls fn using the state of this converter"""
+        token = _current_state.set(self.state)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_state.reset(token)
+
+    def convert(self, filename=None, outName=None, text=None):
+        """Converts a CTI file (or text) to CTML. Raises CTI_Error if the
+        input cannot be processed."""
+        self._call(_convert, filename=filename, outName=outName, text=text)
+
+
 def main():
     if len(sys.argv) not in (2,3):
         raise ValueError('Incorrect number of command line arguments.')
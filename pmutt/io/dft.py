@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+pmutt.io.dft
+
+Builds StatMech species from the outputs of DFT calculations (VASP OUTCAR
+files and Gaussian log files). Directories of outputs can be ingested in
+parallel from Python or from the command line::
+
+    python -m pmutt.io.dft calculations/ -o species.json -n 8
+
+The command exits with status 1 if any file could not be read and 0
+otherwise. The number of failed files is printed in the summary.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ase.io import read
+
+from pmutt import parse_formula
+from pmutt.io import gaussian, vasp
+from pmutt.io.json import pmuttEncoder
+from pmutt.statmech import EmptyMode, StatMech, elec, rot, trans, vib
+
+# Filename patterns used to discover outputs and their format
+file_patterns = {
+    'vasp': ('*OUTCAR*', ),
+    'gaussian': ('*.log', ),
+}
+
+
+def find_dft_outputs(path, file_patterns=file_patterns):
+    """Finds DFT output files in a directory and its subdirectories
+
+    Parameters
+    ----------
+        path : str
+            Directory to search
+        file_patterns : dict, optional
+            Unix shell-style patterns to match filenames using the format as
+            keys. Default is :data:`~pmutt.io.dft.file_patterns`
+    Returns
+    -------
+        dft_outputs : list of (str, str) tuples
+            Filenames and formats of the outputs found, sorted by filename
+    """
+    dft_outputs = []
+    for dir_path, _, filenames in os.walk(path):
+        for filename in filenames:
+            file_format = _get_file_format(filename, file_patterns)
+            if file_format is None:
+                continue
+            dft_outputs.append((os.path.join(dir_path, filename), file_format))
+    dft_outputs.sort()
+    return dft_outputs
+
+
+def read_statmech(filename,
+                  file_format=None,
+                  name=None,
+                  gas_phase=False,
+                  symmetrynumber=None,
+                  spin=0.,
+                  degree_tol=5.,
+                  min_frequency_cutoff=0.,
+                  imaginary_substitute=None):
+    """Creates a StatMech object from a DFT output file. The final
+    structure and energy are read using ASE.
+
+    Parameters
+    ----------
+        filename : str
+            VASP OUTCAR or Gaussian log file
+        file_format : str, optional
+            Format of the file. Supported options are 'vasp' and 'gaussian'.
+            If not specified, it is guessed from the filename
+        name : str, optional
+            Name of the species. If not specified, the name of the directory
+            is used for OUTCAR files and the filename (without extension) for
+            Gaussian files
+        gas_phase : bool, optional
+            If True, translational (:class:`~pmutt.statmech.trans.FreeTrans`)
+            and rotational (:class:`~pmutt.statmech.rot.RigidRotor`) modes
+            are included. Default is False
+        symmetrynumber : float or str, optional
+            Symmetry number for the rigid rotor. If not specified, it is read
+            from Gaussian files or assumed to be 1 for VASP files. Only used if
+            ``gas_phase`` is True
+        spin : float, optional
+            Spin of the ground electronic state. Default is 0
+        degree_tol : float, optional
+            Degree tolerance to estimate the geometry. Default is 5 degrees
+        min_frequency_cutoff : float, optional
+            Only real frequencies greater than this value (in cm-1) are used.
+            Default is 0 cm-1
+        imaginary_substitute : float, optional
+            If this value is set, imaginary frequencies are substituted with
+            this value for calculations. Otherwise, imaginary frequencies are
+            ignored. Default is None
+    Returns
+    -------
+        statmech : :class:`~pmutt.statmech.StatMech` object
+            Species with :class:`~pmutt.statmech.vib.HarmonicVib` and
+            :class:`~pmutt.statmech.elec.GroundStateElec` modes
+    Raises
+    ------
+        ValueError
+            Raised if the file format is not supported
+    """
+    if file_format is None:
+        file_format = _get_file_format(os.path.basename(filename))
+    if name is None:
+        if file_format == 'vasp':
+            name = os.path.basename(os.path.dirname(os.path.abspath(filename)))
+        else:
+            name = os.path.splitext(os.path.basename(filename))[0]
+
+    if file_format == 'vasp':
+        atoms = read(filename, index=-1, format='vasp-out')
+        vib_data = {}
+        vasp.set_vib_wavenumbers_from_outcar(
+            in_file=filename,
+            output_structure=vib_data,
+            min_frequency_cutoff=min_frequency_cutoff,
+            include_imaginary=imaginary_substitute is not None)
+        vib_wavenumbers = vib_data['vib_wavenumbers']
+        if symmetrynumber is None:
+            symmetrynumber = 1
+    elif file_format == 'gaussian':
+        atoms = read(filename, index=-1, format='gaussian-out')
+        properties = gaussian.read_properties(filename)
+        vib_wavenumbers = [
+            vib_wavenumber
+            for vib_wavenumber in properties.get('frequencies', [])
+            if vib_wavenumber > min_frequency_cutoff
+            or (vib_wavenumber < 0. and imaginary_substitute is not None)
+        ]
+        if symmetrynumber is None:
+            symmetrynumber = properties.get('rot_symmetry_num', 1)
+    else:
+        err_msg = ('File format, {}, not supported by '
+                   'pmutt.io.dft.read_statmech. Supported options are: {}'
+                   ''.format(file_format, ', '.join(file_patterns)))
+        raise ValueError(err_msg)
+
+    if gas_phase:
+        trans_model = trans.FreeTrans(n_degrees=3, atoms=atoms)
+        geometry = rot.get_geometry_from_atoms(atoms=atoms,
+                                               degree_tol=degree_tol)
+        rot_model = rot.RigidRotor(
+            symmetrynumber=symmetrynumber,
+            rot_temperatures=rot.get_rot_temperatures_from_atoms(
+                atoms=atoms, geometry=geometry, degree_tol=degree_tol),
+            geometry=geometry)
+    else:
+        trans_model = EmptyMode()
+        rot_model = EmptyMode()
+    return StatMech(name=name,
+                    trans_model=trans_model,
+                    vib_model=vib.HarmonicVib(
+                        vib_wavenumbers=vib_wavenumbers,
+                        imaginary_substitute=imaginary_substitute),
+                    rot_model=rot_model,
+                    elec_model=elec.GroundStateElec(
+                        potentialenergy=atoms.get_potential_energy(),
+                        spin=spin),
+                    elements=parse_formula(
+                        atoms.get_chemical_formula(mode='hill')),
+                    notes={'filename': filename})
+
+
+def read_dft_outputs(path,
+                     n_processes=None,
+                     filename=None,
+                     file_patterns=file_patterns,
+                     **kwargs):
+    """Creates StatMech objects from all the DFT outputs in a directory.
+    Files are parsed concurrently using a process pool. Files that cannot be
+    parsed are reported in the summary instead of raising an error.
+
+    Parameters
+    ----------
+        path : str or list of str
+            Directory to search using :func:`~pmutt.io.dft.find_dft_outputs`
+            or list of output filenames
+        n_processes : int, optional
+            Number of processes to use. If 1, the files are read in the
+            current process. Default is the number of processors
+        filename : str, optional
+            If specified, the species are written to this file in the JSON
+            format. Default is None
+        file_patterns : dict, optional
+            Unix shell-style patterns to match filenames using the format as
+            keys. Default is :data:`~pmutt.io.dft.file_patterns`
+        kwargs : keyword arguments
+            Parameters passed to :func:`~pmutt.io.dft.read_statmech`
+    Returns
+    -------
+        species : dict of :class:`~pmutt.statmech.StatMech` objects
+            Species using the names as keys
+        summary : list of dict
+            Each entry corresponds to an output and has the keys:
+
+            - filename (str)
+            - name (str or None): Name of the species if successful
+            - time (float): Time to parse the file in seconds
+            - error (str or None): Error message if unsuccessful
+    """
+    if isinstance(path, str):
+        dft_outputs = find_dft_outputs(path=path, file_patterns=file_patterns)
+    else:
+        dft_outputs = [(out_filename,
+                        _get_file_format(os.path.basename(out_filename),
+                                         file_patterns))
+                       for out_filename in path]
+    jobs = [(out_filename, file_format, kwargs)
+            for out_filename, file_format in dft_outputs]
+
+    if n_processes == 1 or len(jobs) < 2:
+        results = [_read_statmech_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            results = list(executor.map(_read_statmech_job, jobs))
+
+    species = {}
+    summary = []
+    for out_filename, statmech, elapsed_time, error in results:
+        if statmech is not None and statmech.name in species:
+            error = ('Species name, {}, already read from {}.'
+                     ''.format(statmech.name,
+                               species[statmech.name].notes['filename']))
+            statmech = None
+        if statmech is not None:
+            species[statmech.name] = statmech
+        summary.append({
+            'filename': out_filename,
+            'name': None if statmech is None else statmech.name,
+            'time': elapsed_time,
+            'error': error
+        })
+
+    if filename is not None:
+        with open(filename, 'w') as f_ptr:
+            json.dump(species, f_ptr, cls=pmuttEncoder, indent=True)
+    return (species, summary)
+
+
+def _get_file_format(filename, file_patterns=file_patterns):
+    """Guesses the format of a DFT output using its filename
+
+    Parameters
+    ----------
+        filename : str
+            Name of the file without the directory
+        file_patterns : dict, optional
+            Unix shell-style patterns to match filenames using the format as
+            keys. Default is :data:`~pmutt.io.dft.file_patterns`
+    Returns
+    -------
+        file_format : str or None
+            Format of the file. None if no pattern matches
+    """
+    for file_format, patterns in file_patterns.items():
+        if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+            return file_format
+    return None
+
+
+def _read_statmech_job(job):
+    """Reads one DFT output in a worker process. Exceptions are caught so one
+    bad file does not stop the other files from being read.
+
+    Parameters
+    ----------
+        job : (str, str, dict) tuple
+            Filename, file format and keyword arguments for
+            :func:`~pmutt.io.dft.read_statmech`
+    Returns
+    -------
+        result : (str, StatMech or None, float, str or None) tuple
+            Filename, species (None if unsuccessful), time taken in seconds
+            and error message (None if successful)
+    """
+    filename, file_format, kwargs = job
+    start_time = time.perf_counter()
+    try:
+        statmech = read_statmech(filename=filename,
+                                 file_format=file_format,
+                                 **kwargs)
+    except Exception as e:
+        statmech = None
+        error = '{}: {}'.format(type(e).__name__, e)
+    else:
+        error = None
+    return (filename, statmech, time.perf_counter() - start_time, error)
+
+
+def main(args=None):
+    """Command line interface to ingest a directory of DFT outputs
+
+    Parameters
+    ----------
+        args : list of str, optional
+            Command line arguments. Default is ``sys.argv[1:]``
+    Returns
+    -------
+        exit_status : int
+            1 if any file could not be read. 0 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        description='Creates StatMech species from DFT outputs.')
+    parser.add_argument('path', help='Directory containing DFT outputs')
+    parser.add_argument('-o', '--output', default='species.json',
+                        help='JSON file to write species. Default is '
+                        'species.json')
+    parser.add_argument('-n', '--n_processes', type=int, default=None,
+                        help='Number of processes. Default is the number of '
+                        'processors')
+    parser.add_argument('--gas_phase', action='store_true',
+                        help='Include translational and rotational modes')
+    args = parser.parse_args(args)
+
+    start_time = time.perf_counter()
+    species, summary = read_dft_outputs(path=args.path,
+                                        n_processes=args.n_processes,
+                                        filename=args.output,
+                                        gas_phase=args.gas_phase)
+    for result in summary:
+        status = 'OK' if result['error'] is None else result['error']
+        print('{:8.3f} s  {}  {}'.format(result['time'], result['filename'],
+                                         status))
+    n_errors = sum(result['error'] is not None for result in summary)
+    print('Read {} species from {} files ({} failed) in {:.3f} s. Species '
+          'written to {}'.format(len(species), len(summary), n_errors,
+                                 time.perf_counter() - start_time,
+                                 args.output))
+    return 1 if n_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
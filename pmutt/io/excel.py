@@ -90,102 +90,396 @@ def read_excel(io,
                                skiprows=skiprows,
                                header=header,
                                **kwargs)
-    excel_path = os.path.dirname(io)
-    thermos_out = []
-    for row, row_data in input_data.iterrows():
-        thermo_data = {}
-        vib_set_by_outcar = False
-        for col, cell_data in row_data.items():
-            # Trim whitespaces from cell_data and col
-            if isinstance(cell_data, str):
-                cell_data = cell_data.strip()
-            if isinstance(col, str):
-                col = col.strip()
+    return _read_tabular_data(input_data=input_data,
+                              source=io,
+                              delimiter=delimiter,
+                              min_frequency_cutoff=min_frequency_cutoff,
+                              include_imaginary=include_imaginary)
+
+
+def _read_tabular_data(input_data,
+                       source,
+                       delimiter='.',
+                       min_frequency_cutoff=0.,
+                       include_imaginary=False,
+                       file_cache=None):
+    """Processes a table using the special rules of
+    :func:`~pmutt.io.excel.read_excel`. The rule of each column is resolved
+    once, numeric column groups (elements, vibrational wavenumbers,
+    rotational temperatures and NASA coefficients) are extracted column-wise
+    and external files are only read once.
+
+    Parameters
+    ----------
+        input_data : `pandas.DataFrame`_
+            Table to process. Each row corresponds to one object
+        source : str
+            Filename of the table. Used for error messages and to locate
+            files with relative paths
+        delimiter : str, optional
+            Delimiter to parse column names. Default is '.'
+        min_frequency_cutoff : float, optional
+            Applies for the vib_outcar header. Minimum frequency cutoff (cm-1).
+            Default is 0 cm-1
+        include_imaginary : bool, optional
+            Applies for the vib_outcar header. Whether or not imaginary
+            frequencies should be included. Default is False
+        file_cache : dict, optional
+            Atoms objects and vibrational wavenumbers already read using the
+            path as the key. If None, files are only cached while reading
+            ``input_data``. Default is None
+    Returns
+    -------
+        data : list of dict
+            Can be used to initialize objects with the **kwargs syntax
 
-            '''Special parsing instructions'''
-            if pd.isnull(cell_data):
+    .. _`pandas.DataFrame`: https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.html
+    """
+    if file_cache is None:
+        file_cache = {}
+    source_path = os.path.dirname(source)
+    columns = [col.strip() if isinstance(col, str) else col
+               for col in input_data.columns]
+    values = input_data.to_numpy(dtype=object)
+    null_mask = pd.isnull(input_data).to_numpy()
+
+    # Outputs of column groups processed column-wise. Rows use the index
+    # of the first column in the group.
+    group_values = {}
+    group_first_cols = {}
+    col_rules = []
+    for j, col in enumerate(columns):
+        rule = _get_column_rule(col)
+        if rule in _GROUP_RULES:
+            if rule in group_first_cols:
+                continue
+            group_cols = [k for k, other_col in enumerate(columns)
+                          if _get_column_rule(other_col) == rule]
+            try:
+                group_values[rule] = _get_group_values(
+                    rule=rule,
+                    headers=[columns[k] for k in group_cols],
+                    values=input_data.iloc[:, group_cols].to_numpy(
+                        dtype=float),
+                    delimiter=delimiter)
+            except (ValueError, TypeError):
+                # Non-numeric data is processed cell by cell
+                for k in group_cols:
+                    col_rules.append((k, rule))
+                group_first_cols[rule] = None
+                continue
+            group_first_cols[rule] = j
+        col_rules.append((j, rule))
+    # Wavenumbers read from an OUTCAR take precedence over the columns
+    outcar_cols = [j for j, rule in col_rules if rule == 'vib_outcar']
+    has_outcar = np.any(~null_mask[:, outcar_cols], axis=1)
+
+    data_out = []
+    for i, (row_values, row_nulls) in enumerate(zip(values, null_mask)):
+        data = {}
+        for j, rule in col_rules:
+            if group_first_cols.get(rule) == j:
+                if rule == 'vib_wavenumbers' and has_outcar[i]:
+                    continue
+                _set_group_value(rule=rule,
+                                 value=group_values[rule][i],
+                                 output_structure=data)
+                continue
+            if row_nulls[j]:
                 # Skip empty cells
                 continue
-            elif 'Unnamed' in col:
+            cell_data = row_values[j]
+            # Trim whitespaces from cell_data
+            if isinstance(cell_data, str):
+                cell_data = cell_data.strip()
+            col = columns[j]
+
+            if rule == 'unnamed':
                 warn_msg = ('Found data ({}) with no column header in Excel '
                             'sheet, {}. This property will not be assigned '
                             'correctly.'
-                            ''.format(cell_data, io))
+                            ''.format(cell_data, source))
                 warnings.warn(warn_msg)
-            elif 'element' in col:
+            elif rule == 'elements':
                 set_element(header=col,
                             value=cell_data,
-                            output_structure=thermo_data,
+                            output_structure=data,
                             delimiter=delimiter)
-            elif 'formula' in col:
-                set_formula(formula=cell_data, output_structure=thermo_data)
-            elif 'atoms' in col:
-                set_atoms(path=cell_data,
-                          excel_path=excel_path,
-                          output_structure=thermo_data)
-            elif 'statmech_model' in col:
-                set_statmech_model(model=cell_data,
-                                   output_structure=thermo_data)
-            elif 'trans_model' in col:
-                set_trans_model(model=cell_data, output_structure=thermo_data)
-            elif 'vib_model' in col:
-                set_vib_model(model=cell_data, output_structure=thermo_data)
-            elif 'rot_model' in col:
-                set_rot_model(model=cell_data, output_structure=thermo_data)
-            elif 'elec_model' in col:
-                set_elec_model(model=cell_data, output_structure=thermo_data)
-            elif 'nucl_model' in col:
-                set_nucl_model(model=cell_data, output_structure=thermo_data)
-            elif 'vib_wavenumber' in col:
-                if vib_set_by_outcar:
+            elif rule == 'formula':
+                set_formula(formula=cell_data, output_structure=data)
+            elif rule == 'atoms':
+                _set_atoms_cached(path=cell_data,
+                                  excel_path=source_path,
+                                  output_structure=data,
+                                  file_cache=file_cache)
+            elif rule == 'statmech_model':
+                set_statmech_model(model=cell_data, output_structure=data)
+            elif rule == 'trans_model':
+                set_trans_model(model=cell_data, output_structure=data)
+            elif rule == 'vib_model':
+                set_vib_model(model=cell_data, output_structure=data)
+            elif rule == 'rot_model':
+                set_rot_model(model=cell_data, output_structure=data)
+            elif rule == 'elec_model':
+                set_elec_model(model=cell_data, output_structure=data)
+            elif rule == 'nucl_model':
+                set_nucl_model(model=cell_data, output_structure=data)
+            elif rule == 'vib_wavenumbers':
+                if has_outcar[i]:
                     continue  # vib_wavenumber already set from outcar
-                set_vib_wavenumbers(value=cell_data,
-                                    output_structure=thermo_data)
-            elif 'vib_outcar' in col:
-                set_vib_wavenumbers_from_outcar(
+                set_vib_wavenumbers(value=cell_data, output_structure=data)
+            elif rule == 'vib_outcar':
+                _set_vib_wavenumbers_from_outcar_cached(
                     in_file=cell_data,
-                    output_structure=thermo_data,
+                    output_structure=data,
                     min_frequency_cutoff=min_frequency_cutoff,
-                    include_imaginary=include_imaginary)
-                vib_set_by_outcar = True
-            elif 'rot_temperature' in col:
-                set_rot_temperatures(value=cell_data,
-                                     output_structure=thermo_data)
-            elif 'nasa' in col:
-                if 'a_low' in col:
-                    set_nasa_a_low(header=col,
-                                   value=cell_data,
-                                   output_structure=thermo_data)
-                elif 'a_high' in col:
-                    set_nasa_a_high(header=col,
-                                    value=cell_data,
-                                    output_structure=thermo_data)
-                else:
-                    err_msg = ('Unrecognized argument for nasa column: {}'
-                               ''.format(col))
-                    raise NotImplementedError(err_msg)
-            elif 'list.' in col:
+                    include_imaginary=include_imaginary,
+                    file_cache=file_cache)
+            elif rule == 'rot_temperatures':
+                set_rot_temperatures(value=cell_data, output_structure=data)
+            elif rule == 'a_low':
+                set_nasa_a_low(header=col,
+                               value=cell_data,
+                               output_structure=data)
+            elif rule == 'a_high':
+                set_nasa_a_high(header=col,
+                                value=cell_data,
+                                output_structure=data)
+            elif rule == 'nasa':
+                err_msg = ('Unrecognized argument for nasa column: {}'
+                           ''.format(col))
+                raise NotImplementedError(err_msg)
+            elif rule == 'list':
                 # Process column name
                 header = col.replace('list.', '')
                 # Remove the number if present
                 if '.' in header:
-                    i = header.rfind('.')
-                    header = header[:i]
+                    i_num = header.rfind('.')
+                    header = header[:i_num]
                 set_list_value(header=header,
                                value=cell_data,
-                               output_structure=thermo_data)
-            elif 'dict.' in col:
+                               output_structure=data)
+            elif rule == 'dict':
                 # Process dict_name and key
                 header = col.replace('dict.', '')
                 dict_name, key = header.split('.')
                 set_dict_value(dict_name=dict_name,
                                key=key,
                                value=cell_data,
-                               output_structure=thermo_data)
+                               output_structure=data)
             else:
-                thermo_data[col] = cell_data
-        thermos_out.append(thermo_data)
-    return thermos_out
+                data[col] = cell_data
+        data_out.append(data)
+    return data_out
+
+
+# Rules whose columns are processed together as a numeric array
+_GROUP_RULES = ('elements', 'vib_wavenumbers', 'rot_temperatures', 'a_low',
+                'a_high')
+
+
+def _get_column_rule(col):
+    """Finds the special rule that applies to a column
+
+    Parameters
+    ----------
+        col : str
+            Column header with whitespace trimmed
+    Returns
+    -------
+        rule : str or None
+            Name of the rule. None if the value should be assigned directly
+            using the header as the key
+    """
+    if not isinstance(col, str):
+        return None
+    elif 'Unnamed' in col:
+        return 'unnamed'
+    elif 'element' in col:
+        return 'elements'
+    elif 'formula' in col:
+        return 'formula'
+    elif 'atoms' in col:
+        return 'atoms'
+    elif 'statmech_model' in col:
+        return 'statmech_model'
+    elif 'trans_model' in col:
+        return 'trans_model'
+    elif 'vib_model' in col:
+        return 'vib_model'
+    elif 'rot_model' in col:
+        return 'rot_model'
+    elif 'elec_model' in col:
+        return 'elec_model'
+    elif 'nucl_model' in col:
+        return 'nucl_model'
+    elif 'vib_wavenumber' in col:
+        return 'vib_wavenumbers'
+    elif 'vib_outcar' in col:
+        return 'vib_outcar'
+    elif 'rot_temperature' in col:
+        return 'rot_temperatures'
+    elif 'nasa' in col:
+        if 'a_low' in col:
+            return 'a_low'
+        elif 'a_high' in col:
+            return 'a_high'
+        else:
+            return 'nasa'
+    elif 'list.' in col:
+        return 'list'
+    elif 'dict.' in col:
+        return 'dict'
+    else:
+        return None
+
+
+def _get_group_values(rule, headers, values, delimiter='.'):
+    """Extracts the values of a numeric column group for every row
+
+    Parameters
+    ----------
+        rule : str
+            Rule of the columns. Must be in ``_GROUP_RULES``
+        headers : list of str
+            Column headers
+        values : (N, M) `numpy.ndarray`_
+            Values of the M columns for the N rows. Empty cells are NaN
+        delimiter : str, optional
+            Delimiter to parse element headers. Default is '.'
+    Returns
+    -------
+        group_values : list
+            Value to assign for each row. None if all the cells of the row
+            are empty
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    present = ~np.isnan(values)
+    has_values = present.any(axis=1)
+    if rule == 'elements':
+        names = [header.split(delimiter)[-1] for header in headers]
+        keys = np.array(names, dtype=object)
+    elif rule in ('a_low', 'a_high'):
+        indices = np.array([int(header.split('.')[-1]) for header in headers])
+    group_values = []
+    for row_values, row_present, row_has_values in zip(
+            values, present, has_values):
+        if not row_has_values:
+            group_values.append(None)
+        elif rule == 'elements':
+            # Columns with empty cells are read as floats. Integral counts are
+            # written as int so they are formatted correctly (e.g. thermdats)
+            group_values.append(
+                {key: int(val) if float(val).is_integer() else val
+                 for key, val in zip(keys[row_present],
+                                     row_values[row_present])})
+        elif rule in ('a_low', 'a_high'):
+            a = np.zeros(7, )
+            a[indices[row_present]] = row_values[row_present]
+            group_values.append(a)
+        else:
+            group_values.append(list(row_values[row_present]))
+    return group_values
+
+
+def _set_group_value(rule, value, output_structure):
+    """Assigns the value of a numeric column group to output_structure
+
+    Parameters
+    ----------
+        rule : str
+            Rule of the columns. Must be in ``_GROUP_RULES``
+        value : dict, list, `numpy.ndarray`_ or None
+            Value calculated by ``_get_group_values``. Nothing is assigned if
+            None
+        output_structure : dict
+            Structure to assign value
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    if value is None:
+        return
+    if rule == 'elements':
+        try:
+            output_structure['elements'].update(value)
+        except KeyError:
+            output_structure['elements'] = dict(value)
+    elif rule in ('vib_wavenumbers', 'rot_temperatures'):
+        try:
+            output_structure[rule].extend(value)
+        except KeyError:
+            output_structure[rule] = list(value)
+    else:
+        output_structure[rule] = value.copy()
+
+
+def _set_atoms_cached(path, output_structure, excel_path, file_cache):
+    """Same as :func:`~pmutt.io.excel.set_atoms` but reuses atoms objects that
+    were already read
+
+    Parameters
+    ----------
+        path : str
+            Path to read the atoms object or the string to build the atoms
+            object using `ase.build.molecule`_
+        output_structure : dict
+            Structure to assign value. Will assign to output_structure['atoms']
+        excel_path : str
+            Location where excel path is located
+        file_cache : dict
+            Previously read atoms objects. Keys are tuples starting with
+            'atoms'
+
+    .. _`ase.build.molecule`: https://wiki.fysik.dtu.dk/ase/ase/build/build.html#ase.build.molecule
+    """
+    key = ('atoms', excel_path, path)
+    try:
+        atoms = file_cache[key]
+    except KeyError:
+        set_atoms(path=path,
+                  excel_path=excel_path,
+                  output_structure=output_structure)
+        file_cache[key] = output_structure['atoms'].copy()
+    else:
+        # Copy so species do not share the same atoms object
+        output_structure['atoms'] = atoms.copy()
+
+
+def _set_vib_wavenumbers_from_outcar_cached(in_file, output_structure,
+                                            min_frequency_cutoff,
+                                            include_imaginary, file_cache):
+    """Same as :func:`~pmutt.io.vasp.set_vib_wavenumbers_from_outcar` but
+    reuses wavenumbers of OUTCAR files that were already read
+
+    Parameters
+    ----------
+        in_file : str
+            OUTCAR file of frequency jobs
+        output_structure : dict
+            Structure to assign value. Will assign to
+            output_structure['vib_wavenumbers']
+        min_frequency_cutoff : float
+            Only frequencies greater than min_frequency_cutoff (in cm-1) are
+            read
+        include_imaginary : bool
+            Whether imaginary frequencies should be included
+        file_cache : dict
+            Previously read wavenumbers. Keys are tuples starting with
+            'vib_outcar'
+    """
+    key = ('vib_outcar', in_file, min_frequency_cutoff, include_imaginary)
+    try:
+        vib_wavenumbers = file_cache[key]
+    except KeyError:
+        set_vib_wavenumbers_from_outcar(
+            in_file=in_file,
+            output_structure=output_structure,
+            min_frequency_cutoff=min_frequency_cutoff,
+            include_imaginary=include_imaginary)
+        file_cache[key] = list(output_structure['vib_wavenumbers'])
+    else:
+        output_structure['vib_wavenumbers'] = list(vib_wavenumbers)
 
 
 def set_element(header, value, output_structure, delimiter='.'):
@@ -1,7 +1,23 @@
+import mmap
+import os
 import re
 
 from pmutt import constants as c
 
+# Header of the frequency section. Quantities are read after the last
+# occurrence so only the final frequency calculation is used.
+_FREQ_HEADER = b'Harmonic frequencies'
+# Quantities read by read_properties. Groups are named after the output keys
+_PROPERTY_PATTERN = re.compile(
+    rb'Frequencies -- (?P<frequencies>.*)'
+    rb'|Rotational temperatures \(Kelvin\)(?P<rot_temperatures>.*)'
+    rb'|Zero-point correction=(?P<zpe>.*?)\('
+    rb'|Sum of electronic and zero-point Energies=(?P<electronic_and_zpe>.*)'
+    rb'|Molecular mass:(?P<molecular_mass>.*)'
+    rb'|Rotational symmetry number(?P<rot_symmetry_num>.*)')
+# Quantities that may be split over several lines
+_LIST_PROPERTIES = ('frequencies', 'rot_temperatures')
+
 
 def read_pattern(filename, pattern, group=0, return_immediately=True):
     """Reads the pattern from the Gaussian log file.
@@ -27,17 +43,16 @@ def read_pattern(filename, pattern, group=0, return_immediately=True):
 
             If the pattern is not found, returns an empty list
     """
+    pattern = re.compile(pattern)
     out_values = []
     with open(filename, 'r') as f_ptr:
         for line in f_ptr:
-            if re.search(pattern, line):
-                if return_immediately:
-                    return re.search(pattern, line).groups()[group]
-                else:
-                    data = re.search(pattern, line)
-                    data_split = (data.groups()[0]).split()
-                    for value in data_split:
-                        out_values.append(value)
+            data = pattern.search(line)
+            if data is None:
+                continue
+            if return_immediately:
+                return data.groups()[group]
+            out_values.extend(data.groups()[0].split())
         else:
             return out_values
 
@@ -56,11 +71,11 @@ def read_zpe(filename, units='eV/molecule'):
         zero_point_energy : float
             Zero point energy in ``units``. Default units are 'eV/molecule'
     """
-    return float(read_pattern(filename=filename,
-                              pattern='Zero-point correction=(.*?)\(',
-                              group=0,
-                              return_immediately=True)) \
-           *c.convert_unit(initial='Ha/molecule', final=units)
+    return _get_energy(read_pattern(filename=filename,
+                                    pattern='Zero-point correction=(.*?)\(',
+                                    group=0,
+                                    return_immediately=True),
+                       units=units)
 
 
 def read_electronic_and_zpe(filename, units='eV/molecule'):
@@ -79,12 +94,12 @@ def read_electronic_and_zpe(filename, units='eV/molecule'):
             Electronic and zero point energy in ``units``. Default is
             'eV/molecule'
     """
-    return float(read_pattern(filename=filename,
-                              pattern='Sum of electronic and zero-point '
-                              'Energies=(.*)',
-                              group=0,
-                              return_immediately=True)) \
-           *c.convert_unit(initial='Ha/molecule', final=units)
+    return _get_energy(read_pattern(filename=filename,
+                                    pattern='Sum of electronic and zero-point '
+                                    'Energies=(.*)',
+                                    group=0,
+                                    return_immediately=True),
+                       units=units)
 
 
 def read_frequencies(filename, units='1/cm'):
@@ -101,13 +116,11 @@ def read_frequencies(filename, units='1/cm'):
         frequencies : list of float
             Frequencies in ``units``. Default is '1/cm'
     """
-    final = units.split('/')[-1]
     freq_patterns = read_pattern(filename=filename,
                                  pattern='Frequencies -- (.*)',
                                  group=0,
                                  return_immediately=False)
-    return [float(freq)/c.convert_unit(initial='cm', final=final) \
-            for freq in freq_patterns]
+    return _get_frequencies(freq_patterns, units=units)
 
 
 def read_rotational_temperatures(filename):
@@ -144,16 +157,11 @@ def read_molecular_mass(filename, units='g/mol'):
         molecular_mass : float
             Molecular mass in ``units``. Default is 'g/mol'
     """
-    if units == 'amu':
-        units = 'amu/molecule'
-    mass_unit, amount_unit = units.split('/')
-    molecular_mass = float(read_pattern(filename=filename,
-                                        pattern='Molecular mass:(.*)',
-                                        group=0,
-                                        return_immediately=True).split()[0]) \
-                     *c.convert_unit(initial='amu', final=mass_unit) \
-                     /c.convert_unit(initial='molecule', final=amount_unit)
-    return molecular_mass
+    return _get_molecular_mass(read_pattern(filename=filename,
+                                            pattern='Molecular mass:(.*)',
+                                            group=0,
+                                            return_immediately=True),
+                               units=units)
 
 
 def read_rot_symmetry_num(filename):
@@ -174,3 +182,127 @@ def read_rot_symmetry_num(filename):
                          pattern='Rotational symmetry number(.*)',
                          group=0,
                          return_immediately=True)))
+
+
+def read_properties(filename,
+                    energy_units='eV/molecule',
+                    freq_units='1/cm',
+                    mass_units='g/mol'):
+    """Reads all the quantities supported by this module from the Gaussian
+    log file in one pass. The file is memory-mapped and only the part after
+    the last frequency section is searched, which is faster than calling the
+    individual readers for large log files.
+
+    Parameters
+    ----------
+        filename : str
+            Log file
+        energy_units : str, optional
+            Units to return energies. Default is 'eV/molecule'
+        freq_units : str, optional
+            Units to return frequencies. Default is '1/cm'
+        mass_units : str, optional
+            Units for molecular mass. Default is 'g/mol'
+    Returns
+    -------
+        properties : dict
+            Quantities found in the file. Quantities that are not found are
+            omitted. The keys are:
+
+            - zpe (float): Zero point energy in ``energy_units``
+            - electronic_and_zpe (float): Electronic and zero point energy
+              in ``energy_units``
+            - frequencies (list of float): Frequencies in ``freq_units``
+            - rot_temperatures (list of float): Rotational temperatures in K
+            - molecular_mass (float): Molecular mass in ``mass_units``
+            - rot_symmetry_num (int): Rotational symmetry number
+    """
+    raw_properties = {name: [] for name in _LIST_PROPERTIES}
+    # Empty files cannot be memory-mapped
+    if os.path.getsize(filename) > 0:
+        with open(filename, 'rb') as f_ptr, \
+                mmap.mmap(f_ptr.fileno(), 0, access=mmap.ACCESS_READ) as f_mm:
+            start = max(f_mm.rfind(_FREQ_HEADER), 0)
+            for match in _PROPERTY_PATTERN.finditer(f_mm, start):
+                name = match.lastgroup
+                value = match.group(name).decode()
+                if name in _LIST_PROPERTIES:
+                    raw_properties[name].extend(value.split())
+                elif name not in raw_properties:
+                    # Only use the first instance like the other readers
+                    raw_properties[name] = value
+
+    properties = {}
+    for name, value in raw_properties.items():
+        # Skip quantities not found
+        if len(value) == 0:
+            continue
+        if name in ('zpe', 'electronic_and_zpe'):
+            properties[name] = _get_energy(value, units=energy_units)
+        elif name == 'frequencies':
+            properties[name] = _get_frequencies(value, units=freq_units)
+        elif name == 'rot_temperatures':
+            properties[name] = [float(rot_T) for rot_T in value]
+        elif name == 'molecular_mass':
+            properties[name] = _get_molecular_mass(value, units=mass_units)
+        elif name == 'rot_symmetry_num':
+            properties[name] = int(float(value))
+    return properties
+
+
+def _get_energy(value, units):
+    """Converts an energy read from the Gaussian log file
+
+    Parameters
+    ----------
+        value : str
+            Energy in Ha/molecule
+        units : str
+            Units to return energy
+    Returns
+    -------
+        energy : float
+            Energy in ``units``
+    """
+    return float(value) * c.convert_unit(initial='Ha/molecule', final=units)
+
+
+def _get_frequencies(values, units):
+    """Converts frequencies read from the Gaussian log file
+
+    Parameters
+    ----------
+        values : list of str
+            Frequencies in 1/cm
+        units : str
+            Units to return frequencies
+    Returns
+    -------
+        frequencies : list of float
+            Frequencies in ``units``
+    """
+    final = units.split('/')[-1]
+    conversion = c.convert_unit(initial='cm', final=final)
+    return [float(freq) / conversion for freq in values]
+
+
+def _get_molecular_mass(value, units):
+    """Converts the molecular mass read from the Gaussian log file
+
+    Parameters
+    ----------
+        value : str
+            Text following "Molecular mass:" starting with the mass in amu
+        units : str
+            Units for molecular mass
+    Returns
+    -------
+        molecular_mass : float
+            Molecular mass in ``units``
+    """
+    if units == 'amu':
+        units = 'amu/molecule'
+    mass_unit, amount_unit = units.split('/')
+    return float(value.split()[0]) \
+        * c.convert_unit(initial='amu', final=mass_unit) \
+        / c.convert_unit(initial='molecule', final=amount_unit)
@@ -55,7 +55,8 @@ def type_to_class(class_str):
     # Although it is usually inadvisible to import functions within a function,
     # this was done purposefully. Importing outside the function caused
     # circular import errors. This way the imports are limited to the function.
-    from pmutt.eos import IdealGasEOS, vanDerWaalsEOS
+    from pmutt.eos import (IdealGasEOS, vanDerWaalsEOS, PengRobinsonEOS,
+                           SoaveRedlichKwongEOS, RealGasAdj)
     from pmutt.reaction import Reaction, Reactions
     from pmutt.reaction.bep import BEP
     from pmutt.empirical import EmpiricalBase, GasPressureAdj
@@ -75,6 +76,9 @@ def type_to_class(class_str):
     type_to_class_dict = {
         "<class 'pmutt.eos.IdealGasEOS'>": IdealGasEOS,
         "<class 'pmutt.eos.vanDerWaalsEOS'>": vanDerWaalsEOS,
+        "<class 'pmutt.eos.PengRobinsonEOS'>": PengRobinsonEOS,
+        "<class 'pmutt.eos.SoaveRedlichKwongEOS'>": SoaveRedlichKwongEOS,
+        "<class 'pmutt.eos.RealGasAdj'>": RealGasAdj,
         "<class 'pmutt.reaction.Reaction'>": Reaction,
         "<class 'pmutt.reaction.Reactions'>": Reactions,
         "<class 'pmutt.reaction.bep.BEP'>": BEP,
@@ -1,18 +1,23 @@
+import hashlib
+import io
+import json
 from pathlib import Path
 from collections import defaultdict
 
-import yaml
+import numpy as np
 
-from pmutt import _force_pass_arguments, _is_iterable, pmutt_list_to_dict
+from pmutt import _force_pass_arguments, _is_iterable, _LazyModule
 from pmutt.io import _get_file_timestamp
 from pmutt.io.cantera import obj_to_cti
-from pmutt.io.ctml_writer import convert
+from pmutt.io import ctml_writer
 from pmutt.cantera.phase import IdealGas, StoichSolid
 from pmutt.omkm import _Param, _assign_yaml_val
+from pmutt.omkm.mechanism import Mechanism
 from pmutt.omkm.phase import InteractingInterface
-from pmutt.omkm import phase as omkm_phases
 from pmutt.omkm.units import Units
 
+yaml = _LazyModule('yaml')
+
 
 def write_cti(phases=None,
               species=None,
@@ -25,7 +30,8 @@ def write_cti(phases=None,
               newline='\n',
               use_motz_wise=False,
               ads_act_method='get_H_act',
-              write_xml=True):
+              write_xml=True,
+              manifest=None):
     """Writes the units, phases, species, lateral interactions, reactions and
     additional options in the CTI format for OpenMKM
 
@@ -62,6 +68,13 @@ def write_cti(phases=None,
         write_xml : bool, optional
             If True and ``filename`` is not ``None``, automatically generates
             an XML file with the CTI file.
+        manifest : str, optional
+            Name of a JSON file storing the entries written for each object.
+            If specified, the entries of objects that did not change since
+            the last export are reused instead of being calculated again, and
+            the file is updated. Reactions are always calculated if the XML
+            file is written. See :func:`~pmutt.io.omkm.write_thermo_yaml`
+            for how objects are compared. Default is None
     Returns
     -------
         lines_out : str
@@ -79,6 +92,10 @@ def write_cti(phases=None,
     elif isinstance(units, dict):
         units = Units(**units)
     lines.append(units.to_cti())
+    if manifest is not None:
+        manifest = _ExportManifest(filename=manifest)
+    # Arguments that affect the rendered entries
+    settings = {'format': 'cti', 'units': lines[-1], 'T': T}
     '''Pre-assign IDs for lateral interactions so phases can be written'''
     if lateral_interactions is not None:
         lat_inter_lines = []
@@ -89,12 +106,22 @@ def write_cti(phases=None,
                     lat_interaction.name = '{:04d}'.format(i)
                     i += 1
 
-                lat_inter_CTI = _force_pass_arguments(lat_interaction.to_cti,
-                                                      units=units)
+                lat_inter_CTI = _get_cti_fragment(obj=lat_interaction,
+                                                  kwargs={'units': units},
+                                                  manifest=manifest,
+                                                  settings=settings)
                 lat_inter_lines.append(lat_inter_CTI)
     '''Pre-assign IDs for reactions so phases can be written'''
+    # XML entries for reactions are created with the CTI lines so the
+    # parameters are only calculated once
+    if filename is not None and write_xml:
+        ctml = ctml_writer.Converter()
+    else:
+        ctml = None
     if reactions is not None:
         beps = []
+        # Set of BEPs to check uniqueness without comparing to every BEP
+        unique_beps = set()
         reaction_lines = []
         i = 0
         for reaction in reactions:
@@ -103,8 +130,17 @@ def write_cti(phases=None,
                 reaction.id = '{:04d}'.format(i)
                 i += 1
             # Write reaction
-            reaction_CTI = _force_pass_arguments(reaction.to_cti, units=units,
-                                                 T=T)
+            if ctml is None:
+                reaction_CTI = _get_cti_fragment(obj=reaction,
+                                                 kwargs={'units': units,
+                                                         'T': T},
+                                                 manifest=manifest,
+                                                 settings=settings)
+            else:
+                reaction_CTI = _force_pass_arguments(reaction.to_cti,
+                                                     units=units,
+                                                     T=T,
+                                                     ctml=ctml)
             reaction_lines.append(reaction_CTI)
 
             # Add unique BEP relationship if any
@@ -113,7 +149,8 @@ def write_cti(phases=None,
             except AttributeError:
                 pass
             else:
-                if bep is not None and bep not in beps:
+                if bep is not None and bep not in unique_beps:
+                    unique_beps.add(bep)
                     beps.append(bep)
     '''Write phases'''
     if phases is not None:
@@ -125,8 +162,10 @@ def write_cti(phases=None,
     if species is not None:
         lines.extend(['', '#' + '-' * 79, '# SPECIES', '#' + '-' * 79])
         for ind_species in species:
-            ind_species_CTI = _force_pass_arguments(ind_species.to_cti,
-                                                    units=units)
+            ind_species_CTI = _get_cti_fragment(obj=ind_species,
+                                                kwargs={'units': units},
+                                                manifest=manifest,
+                                                settings=settings)
             lines.append(ind_species_CTI)
     '''Write lateral interactions'''
     if lateral_interactions is not None:
@@ -152,13 +191,18 @@ def write_cti(phases=None,
             # Only write each BEP once
             i = 0
             for bep in beps:
-                bep_CTI = _force_pass_arguments(bep.to_cti, units=units)
+                bep_CTI = _get_cti_fragment(obj=bep,
+                                            kwargs={'units': units},
+                                            manifest=manifest,
+                                            settings=settings)
                 # Increment counter if necessary
                 if bep.name is None:
                     i += 1
                 lines.append(bep_CTI)
     '''Write to file'''
     lines_out = '\n'.join(lines)
+    if manifest is not None:
+        manifest.write()
     if filename is not None:
         filename = Path(filename)
         with open(filename, 'w', newline=newline) as f_ptr:
@@ -166,19 +210,104 @@ def write_cti(phases=None,
         '''Write XML file'''
         if write_xml:
             xml_filename = filename.with_suffix('.xml').as_posix()
-            convert(filename=filename, outName=xml_filename)
+            _write_ctml(ctml=ctml,
+                        filename=xml_filename,
+                        phases=phases,
+                        species=species,
+                        lateral_interactions=lateral_interactions,
+                        beps=beps if reactions is not None else None,
+                        units=units,
+                        use_motz_wise=use_motz_wise)
     else:
         # Or return as string
         return lines_out
 
 
+def _get_cti_fragment(obj, kwargs, manifest=None, settings=None):
+    """Converts an object to CTI format
+
+    Parameters
+    ----------
+        obj : pmutt object
+            Object with a ``to_cti`` method
+        kwargs : dict
+            Arguments to pass to ``to_cti`` if they are accepted
+        manifest : :class:`~pmutt.io.omkm._ExportManifest` object, optional
+            If specified, the entry is reused if the object is unchanged.
+            Default is None
+        settings : dict, optional
+            Arguments that affect the entry. Only used with ``manifest``.
+            Default is None
+    Returns
+    -------
+        cti_str : str
+            Object in CTI format
+    """
+    def render():
+        return _force_pass_arguments(obj.to_cti, **kwargs)
+
+    if manifest is None:
+        return render()
+    return manifest.get_fragment(obj=obj, render=render, settings=settings)
+
+
+def _write_ctml(ctml, filename, phases, species, lateral_interactions, beps,
+                units, use_motz_wise):
+    """Writes the XML file equivalent to the CTI file written by
+    :func:`~pmutt.io.omkm.write_cti`. The entries are created directly from
+    the pmutt objects instead of reading the CTI file.
+
+    Parameters
+    ----------
+        ctml : :class:`~pmutt.io.ctml_writer.Converter` object
+            Converter to add the entries. The reactions should already be
+            added.
+        filename : str
+            Name of the XML file
+        phases : list of :class:`~pmutt.omkm.phase.Phase` objects or None
+            Phases to write.
+        species : list of :class:`~pmutt.empirical.EmpiricalBase` objects or None
+            Species to write.
+        lateral_interactions : list of :class:`~pmutt.mixture.cov.PiecewiseCovEffect` objects or None
+            Lateral interactions to write. Names should already be assigned.
+        beps : list of :class:`~pmutt.omkm.reaction.BEP` objects or None
+            Unique BEP relationships to write. None if there are no reactions.
+        units : :class:`~pmutt.omkm.units.Unit` object
+            Units to write the file.
+        use_motz_wise : bool
+            Whether to use Motz-wise sticking coefficients or not.
+    """
+    ctml.dataset(Path(filename).stem)
+    units.to_ctml(ctml=ctml)
+    if lateral_interactions is not None:
+        for lat_interaction in lateral_interactions:
+            _force_pass_arguments(lat_interaction.to_ctml, ctml=ctml,
+                                  units=units)
+    if phases is not None:
+        for phase in phases:
+            _force_pass_arguments(phase.to_ctml, ctml=ctml, units=units)
+    if species is not None:
+        for ind_species in species:
+            _force_pass_arguments(ind_species.to_ctml, ctml=ctml,
+                                  units=units)
+    if beps is not None:
+        if use_motz_wise:
+            ctml.enable_motz_wise()
+        else:
+            ctml.disable_motz_wise()
+        for bep in beps:
+            _force_pass_arguments(bep.to_ctml, ctml=ctml, units=units)
+    ctml.write(filename)
+
+
 def write_thermo_yaml(phases=None, species=None, reactions=None,
                       lateral_interactions=None, units=None,
                       filename=None, T=300., P=1., newline='\n',
                       ads_act_method='get_H_act',
                       use_motz_wise='False',
                       yaml_options={'default_flow_style': None, 'indent': 2,
-                                    'sort_keys': False, 'width': 79}):
+                                    'sort_keys': False, 'width': 79},
+                      manifest=None):
     """Writes the units, phases, species, lateral interactions, reactions and
     additional options in the CTI format for OpenMKM
 
@@ -209,40 +338,56 @@ def write_thermo_yaml(phases=None, species=None, reactions=None,
             Activation method to use for adsorption reactions. Accepted
             options include 'get_H_act' and 'get_G_act'. Default is
             'get_H_act'.
+        yaml_options : dict, optional
+            Options to pass when converting the parameters to YAML format. See
+            `PyYAML documentation`_ for ``dump`` for available options. The
+            C-accelerated dumper is used if available.
+        manifest : str, optional
+            Name of a JSON file storing the entries written for each object.
+            If specified, the entries of objects that did not change since
+            the last export are reused instead of being calculated again, and
+            the file is updated. Default is None
     Returns
     -------
         lines_out : str
             If ``filename`` is None, CTI file is returned.
+    Notes
+    -----
+        Species, reactions and the other entries are converted and written
+        one at a time so large mechanisms are not held in memory.
+
+        Objects are compared to the manifest using their ``to_dict`` output
+        and public attributes. Modifying an attribute that is not part of
+        these (e.g. an attribute of a nested object that ``to_dict`` does
+        not include) is not detected, so delete the manifest in that case.
+
+    .. _`PyYAML Documentation`: https://pyyaml.org/wiki/PyYAMLDocumentation
     """
-    lines = [
+    header = '\n'.join([
         _get_file_timestamp(comment_char='# '),
         '# See documentation for OpenMKM YAML file here:',
         '# https://vlachosgroup.github.io/openmkm/input',
-    ]
-    yaml_dict = {}
+    ])
 
     '''Organize units units'''
     if units is None:
         units = Units()
     elif isinstance(units, dict):
         units = Units(**units)
-    units_out = units.to_omkm_yaml()
 
     '''Pre-assign IDs for lateral interactions so phases can be written'''
     if lateral_interactions is not None:
-        interactions_out = []
         i = 0
         for lat_interaction in lateral_interactions:
             if lat_interaction.name is None:
                 lat_interaction.name = 'i_{:04d}'.format(i)
                 i += 1
-            interaction_dict = lat_interaction.to_omkm_yaml(units=units)
-            interactions_out.append(interaction_dict)
 
     '''Pre-assign IDs for reactions so phases can be written'''
     beps = []
+    # Set of BEPs to check uniqueness without comparing to every BEP
+    unique_beps = set()
     if reactions is not None:
-        reactions_out = []
         i = 0
         for reaction in reactions:
             # Assign reaction ID if not present
@@ -250,9 +395,6 @@ def write_thermo_yaml(phases=None, species=None, reactions=None,
                 reaction.id = 'r_{:04d}'.format(i)
                 i += 1
             reaction.use_motz_wise = use_motz_wise
-            # Write reaction
-            reaction_dict = reaction.to_omkm_yaml(units=units, T=T)
-            reactions_out.append(reaction_dict)
 
             # Add unique BEP relationship if any
             try:
@@ -260,79 +402,309 @@ def write_thermo_yaml(phases=None, species=None, reactions=None,
             except AttributeError:
                 pass
             else:
-                if bep is not None and bep not in beps:
+                if bep is not None and bep not in unique_beps:
+                    unique_beps.add(bep)
                     beps.append(bep)
 
-    '''Write phases'''
-    if phases is not None:
-        phases_out = []
-        for phase in phases:
-            phase_dict = _force_pass_arguments(phase.to_omkm_yaml, units=units)
-            phases_out.append(phase_dict)
-        # yaml_dict['phases'] = phases_out
+    '''Assign BEP names'''
+    i = 0
+    for bep in beps:
+        if bep.name is None:
+            bep.name = 'b_{:04d}'.format(i)
+            i += 1
 
-    '''Write species'''
+    '''Organize fields'''
+    dump_options = {'Dumper': getattr(yaml, 'CDumper', yaml.Dumper)}
+    dump_options.update(yaml_options)
+    if manifest is not None:
+        manifest = _ExportManifest(filename=manifest)
+    # Arguments that affect the rendered entries
+    settings = {'format': 'yaml',
+                'units': units.to_omkm_yaml(),
+                'T': T,
+                'yaml_options': yaml_options}
+    # Entries are only converted to YAML as they are written
+    sections = [('units', settings['units'])]
+    if phases is not None:
+        sections.append(
+            ('phases', _get_yaml_fragments(objs=phases,
+                                           kwargs={'units': units},
+                                           dump_options=dump_options,
+                                           manifest=manifest,
+                                           settings=settings)))
     if species is not None:
-        species_out = []
-        for ind_species in species:
-            ind_species_dict = _force_pass_arguments(ind_species.to_omkm_yaml,
-                                                     units=units)
-            species_out.append(ind_species_dict)
-        # yaml_dict['species'] = species_out
-
-    '''Organize BEPs'''
+        sections.append(
+            ('species', _get_yaml_fragments(objs=species,
+                                            kwargs={'units': units},
+                                            dump_options=dump_options,
+                                            manifest=manifest,
+                                            settings=settings)))
+    if reactions is not None:
+        sections.append(
+            ('reactions', _get_yaml_fragments(objs=reactions,
+                                              kwargs={'units': units, 'T': T},
+                                              dump_options=dump_options,
+                                              manifest=manifest,
+                                              settings=settings)))
     if len(beps) > 0:
-        beps_out = []
-        i = 0
-        for bep in beps:
-            # Assign name if necessary
-            if bep.name is None:
-                bep.name = 'b_{:04d}'.format(i)
-                i += 1
-            bep_dict = _force_pass_arguments(bep.to_omkm_yaml, units=units)
-            beps_out.append(bep_dict)
-        # yaml_dict['beps'] = beps_out
-
-    '''Organize fields'''
-    fields = ('units', 'phases', 'species', 'reactions',
-              'beps', 'interactions',)
-    for field in fields:
-        try:
-            val = locals()['{}_out'.format(field)]
-        except:
-            pass
-        else:
-            # Create a YAML string
-            yaml_str = yaml.dump(data={field: val},
-                                 stream=None,
-                                 **yaml_options)
-            lines.extend(
-                ['',
-                 '#' + '-' * 79,
-                 '# {}'.format(field.upper()),
-                 '#' + '-' * 79,
-                 yaml_str])
-
-            # yaml_dict[field] = val
-
-    # Convert to YAML format
-    # yaml_str = yaml.dump(data=yaml_dict, stream=None, **yaml_options)
-    # Remove redundant quotes
-    # yaml_str = yaml_str.replace('\'', '')
-    # lines.append(yaml_str)
+        sections.append(
+            ('beps', _get_yaml_fragments(objs=beps,
+                                         kwargs={'units': units},
+                                         dump_options=dump_options,
+                                         manifest=manifest,
+                                         settings=settings)))
+    if lateral_interactions is not None:
+        sections.append(
+            ('interactions',
+             _get_yaml_fragments(objs=lateral_interactions,
+                                 kwargs={'units': units},
+                                 dump_options=dump_options,
+                                 manifest=manifest,
+                                 settings=settings)))
 
-    lines_out = '\n'.join(lines)
-    # Remove redundant strings
-    lines_out = lines_out.replace('\'', '')
-    # Add spacing between list elements
-    lines_out = lines_out.replace('\n-', '\n\n-')
     if filename is not None:
         filename = Path(filename)
         with open(filename, 'w', newline=newline) as f_ptr:
-            f_ptr.write(lines_out)
+            _write_thermo_yaml_sections(f_ptr=f_ptr,
+                                        header=header,
+                                        sections=sections,
+                                        dump_options=dump_options)
+        if manifest is not None:
+            manifest.write()
     else:
         # Or return as string
-        return lines_out
+        f_ptr = io.StringIO()
+        _write_thermo_yaml_sections(f_ptr=f_ptr,
+                                    header=header,
+                                    sections=sections,
+                                    dump_options=dump_options)
+        if manifest is not None:
+            manifest.write()
+        return f_ptr.getvalue()
+
+
+def _get_yaml_fragments(objs, kwargs, dump_options, manifest=None,
+                        settings=None):
+    """Converts objects to YAML list elements one at a time
+
+    Parameters
+    ----------
+        objs : list of pmutt objects
+            Objects with a ``to_omkm_yaml`` method
+        kwargs : dict
+            Arguments to pass to ``to_omkm_yaml`` if they are accepted
+        dump_options : dict
+            Options to pass to ``yaml.dump``
+        manifest : :class:`~pmutt.io.omkm._ExportManifest` object, optional
+            If specified, entries of unchanged objects are reused. Default is
+            None
+        settings : dict, optional
+            Arguments that affect the entries. Only used with ``manifest``.
+            Default is None
+    Yields
+    ------
+        fragment : str
+            YAML list element
+    """
+    for obj in objs:
+        def render(obj=obj):
+            obj_dict = _force_pass_arguments(obj.to_omkm_yaml, **kwargs)
+            return _dump_yaml([obj_dict], dump_options)
+
+        if manifest is None:
+            yield render()
+        else:
+            yield manifest.get_fragment(obj=obj, render=render,
+                                        settings=settings)
+
+
+def _write_thermo_yaml_sections(f_ptr, header, sections, dump_options):
+    """Writes the sections of the thermo YAML file. Lists are written one
+    element at a time so the whole file is never held in memory.
+
+    Parameters
+    ----------
+        f_ptr : file object
+            Stream to write to
+        header : str
+            Comment lines at the top of the file
+        sections : list of (str, dict or iterable) tuples
+            Name of the field and its value. Iterables should produce YAML
+            list elements (see :func:`~pmutt.io.omkm._get_yaml_fragments`)
+        dump_options : dict
+            Options to pass to ``yaml.dump``
+    """
+    f_ptr.write(header)
+    for field, val in sections:
+        f_ptr.write('\n\n#{0}\n# {1}\n#{0}\n'.format('-' * 79,
+                                                       field.upper()))
+        if isinstance(val, dict):
+            f_ptr.write(_dump_yaml({field: val}, dump_options))
+            continue
+        empty = True
+        for fragment in val:
+            if empty:
+                f_ptr.write('{}:\n'.format(field))
+                empty = False
+            # Add spacing between list elements
+            f_ptr.write('\n')
+            f_ptr.write(fragment)
+        if empty:
+            f_ptr.write(_dump_yaml({field: []}, dump_options))
+
+
+def _dump_yaml(data, dump_options):
+    """Converts data to a YAML string without redundant quotes and with
+    spacing between list elements
+
+    Parameters
+    ----------
+        data : dict or list
+            Data to convert
+        dump_options : dict
+            Options to pass to ``yaml.dump``
+    Returns
+    -------
+        yaml_str : str
+            Data in YAML format
+    """
+    yaml_str = yaml.dump(data=data, stream=None, **dump_options)
+    return yaml_str.replace('\'', '').replace('\n-', '\n\n-')
+
+
+class _ExportManifest:
+    """Rendered entries of objects written to OpenMKM input files. Entries
+    are keyed by a digest of the object's contents and the settings used to
+    write it, so unchanged objects do not have to be written again.
+
+    Parameters
+    ----------
+        filename : str
+            Name of the JSON file storing the entries. If it does not exist
+            or was written by a different version, all the objects are
+            written again
+    Attributes
+    ----------
+        n_rendered : int
+            Number of entries that could not be reused
+    """
+    version = 1
+
+    def __init__(self, filename):
+        self.filename = Path(filename)
+        try:
+            with open(self.filename, 'r') as f_ptr:
+                manifest = json.load(f_ptr)
+        except (OSError, ValueError):
+            manifest = {}
+        if manifest.get('version') == self.version:
+            self._prev_fragments = manifest['fragments']
+        else:
+            self._prev_fragments = {}
+        self.fragments = {}
+        self.n_rendered = 0
+
+    def get_fragment(self, obj, render, settings):
+        """Returns the stored entry of the object or renders it
+
+        Parameters
+        ----------
+            obj : pmutt object
+                Object to write
+            render : function
+                Function without arguments that returns the entry as a JSON
+                compatible object (e.g. str)
+            settings : dict
+                Arguments that affect the entry (e.g. units)
+        Returns
+        -------
+            fragment : JSON compatible object
+                Entry of the object
+        """
+        key = _get_manifest_key(obj=obj, settings=settings)
+        if key is None:
+            # Objects that cannot be represented are always written
+            self.n_rendered += 1
+            return render()
+        try:
+            fragment = self.fragments[key]
+        except KeyError:
+            try:
+                fragment = self._prev_fragments[key]
+            except KeyError:
+                fragment = render()
+                self.n_rendered += 1
+            self.fragments[key] = fragment
+        return fragment
+
+    def write(self):
+        """Writes the entries used by the last export. Entries of objects
+        that were not written are discarded."""
+        with open(self.filename, 'w') as f_ptr:
+            json.dump({'version': self.version, 'fragments': self.fragments},
+                      f_ptr)
+
+
+def _get_manifest_key(obj, settings):
+    """Calculates a digest of the object's contents that is stable between
+    Python sessions
+
+    Parameters
+    ----------
+        obj : pmutt object
+            Object to represent. Its ``to_dict`` output and public attributes
+            are used
+        settings : dict
+            Arguments that affect how the object is written
+    Returns
+    -------
+        key : str or None
+            SHA-1 digest. None if the object cannot be represented (e.g. it
+            does not have a ``to_dict`` method)
+    """
+    try:
+        obj_dict = obj.to_dict()
+    except AttributeError:
+        return None
+    # Public attributes that are written but not part of to_dict (e.g. id)
+    attributes = {name: val
+                  for name, val in getattr(obj, '__dict__', {}).items()
+                  if name not in obj_dict and not name.startswith('_')}
+    try:
+        obj_str = json.dumps(
+            [type(obj).__name__, settings, obj_dict, attributes],
+            separators=(',', ':'),
+            default=_get_manifest_val)
+    except (TypeError, ValueError):
+        # e.g. Circular references
+        return None
+    return hashlib.sha1(obj_str.encode('utf-8')).hexdigest()
+
+
+def _get_manifest_val(val):
+    """Converts values that JSON does not support for
+    :func:`~pmutt.io.omkm._get_manifest_key`
+
+    Parameters
+    ----------
+        val : object
+            Value to convert
+    Returns
+    -------
+        manifest_val : JSON compatible object
+            pmutt objects are represented by ``to_dict``, arrays by lists and
+            other objects by their type and ``repr``. Objects whose ``repr``
+            depends on their memory address are never matched between
+            sessions, which only causes them to be written again.
+    """
+    if isinstance(val, np.ndarray):
+        return val.tolist()
+    if isinstance(val, np.generic):
+        return val.item()
+    try:
+        return val.to_dict()
+    except AttributeError:
+        return [type(val).__name__, repr(val)]
 
 def write_yaml(reactor_type=None,
                temperature_mode=None,
@@ -830,6 +1202,9 @@ def get_reactions_phases(reactions):
         return None
 
     reactions_phases = defaultdict(list)
+    # Reactions are hashed by content so duplicates are found without
+    # comparing to every reaction in the phase
+    unique_reactions = defaultdict(set)
     for reaction in reactions:
         reaction_species = reaction.get_species(include_TS=True)
         for ind_species in reaction_species.values():
@@ -839,8 +1214,9 @@ def get_reactions_phases(reactions):
                 # Skip species without a phase
                 continue
             # Skip duplicate reactions
-            if reaction in reactions_phases[phase]:
+            if reaction in unique_reactions[phase]:
                 continue
+            unique_reactions[phase].add(reaction)
             reactions_phases[phase].append(reaction)
     return reactions_phases
 
@@ -895,43 +1271,14 @@ def organize_phases(phases_data, species=None, reactions=None,
     -------
         phases : list of :class:`~pmutt.cantera.phase.Phase` objects
             Phases organized using parameters.
+    Notes
+    -----
+        The objects are indexed using a
+        :class:`~pmutt.omkm.mechanism.Mechanism`. Use it directly to keep
+        the indexes while adding objects to large mechanisms.
     """
-    species_phases = get_species_phases(species)
-    reactions_phases = get_reactions_phases(reactions)
-    interactions_phases = \
-            get_interactions_phases(interactions=interactions,
-                                    species=pmutt_list_to_dict(species))
-    
-    phases = []
-    phase_kwargs = {'species': species_phases,
-                    'reactions': reactions_phases,
-                    'interactions': interactions_phases}
-    for phase_data in phases_data:
-        # Pre-processing relevant data
-        phase_name = phase_data['name']
-        phase_type = phase_data.pop('phase_type')
-
-        # Add relevant data about species, reactions and interactions if present
-        for attr_name, attr_values in phase_kwargs.items():
-            # Skip if no data has been provided for this attribute
-            if attr_values is None:
-                continue
-
-            try:
-                attr_value = attr_values[phase_name]
-            except KeyError:
-                # Skip if the phase is not present
-                continue
-            # Skip if the phase has no values assigned (occurs if attr_value is
-            # a defaultdict(list))
-            if len(attr_value) == 0:
-                continue
-
-            # Assign the kwargs
-            phase_data[attr_name] = attr_value
-
-        phase_class = getattr(omkm_phases, phase_type)
-        phase = phase_class(**phase_data)
-        phases.append(phase)
-    return phases
+    mechanism = Mechanism(species=species,
+                          reactions=reactions,
+                          interactions=interactions)
+    return mechanism.organize_phases(phases_data)
 
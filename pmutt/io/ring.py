@@ -1,4 +1,4 @@
-from pmutt.reaction import Reaction, Reactions
+from pmutt.reaction import Reactions
 
 
 def read_reactions(filename,
@@ -13,9 +13,9 @@ def read_reactions(filename,
     ----------
         filename : str
             Input filename
-        species : dict
+        species : dict or list
             Dictionary using the names as keys. If you have a list of
-            species, use pmutt.pmutt_list_to_dict to make a dict.
+            species it will automatically be converted to a dictionary.
         species_delimiter : str, optional
             Delimiter that separate species. Leading and trailing spaces
             will be trimmed. Default is '.'
@@ -30,21 +30,17 @@ def read_reactions(filename,
             transition state is not located in species. Default is True
     Returns
     -------
-        reactions : list of :class:`~pmutt.reaction.Reaction` objects
+        reactions : :class:`~pmutt.reaction.Reactions` object
             Reactions
     """
-    rxns = []
     with open(filename, 'r') as f_ptr:
-        for line in f_ptr:
-            # Skip lines that do not have a reaction
-            if reaction_delimiter not in line:
-                continue
-            reaction_str = line.replace('\n', '')
-            rxn = Reaction.from_string(reaction_str=reaction_str,
-                                       species=species,
-                                       species_delimiter=species_delimiter,
-                                       reaction_delimiter=reaction_delimiter,
-                                       raise_error=raise_error,
-                                       raise_warning=raise_warning)
-            rxns.append(rxn)
-    return Reactions(reactions=rxns)
+        # Skip lines that do not have a reaction
+        reaction_strs = [
+            line.rstrip('\n') for line in f_ptr if reaction_delimiter in line
+        ]
+    return Reactions.from_strings(reaction_strs=reaction_strs,
+                                  species=species,
+                                  species_delimiter=species_delimiter,
+                                  reaction_delimiter=reaction_delimiter,
+                                  raise_error=raise_error,
+                                  raise_warning=raise_warning)
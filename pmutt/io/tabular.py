@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+pmutt.io.tabular
+
+Streams species from CSV and Parquet files using the same column conventions
+as :func:`~pmutt.io.excel.read_excel`.
+"""
+import pandas as pd
+
+from pmutt.io.excel import _read_tabular_data
+
+
+def read_csv(filename,
+             chunksize=10000,
+             obj_fn=None,
+             delimiter='.',
+             min_frequency_cutoff=0.,
+             include_imaginary=False,
+             **kwargs):
+    """Reads a CSV file in chunks and yields one entry per row. The column
+    headings follow the special rules of :func:`~pmutt.io.excel.read_excel`.
+
+    Parameters
+    ----------
+        filename : str
+            Name of the CSV file
+        chunksize : int, optional
+            Number of rows to read at a time. Default is 10000
+        obj_fn : callable, optional
+            If specified, each row is converted using ``obj_fn(**data)``
+            (e.g. :class:`~pmutt.statmech.StatMech` or
+            :meth:`~pmutt.empirical.nasa.Nasa.from_model`). Otherwise the
+            dictionaries are yielded. Default is None
+        delimiter : str, optional
+            Delimiter to parse column names. Default is '.'
+        min_frequency_cutoff : float, optional
+            Applies for the vib_outcar header. Minimum frequency cutoff (cm-1).
+            Default is 0 cm-1
+        include_imaginary : bool, optional
+            Applies for the vib_outcar header. Whether or not imaginary
+            frequencies should be included. Default is False
+        **kwargs: keyword arguments
+            Parameters used by `pandas.read_csv`_. Some potentially useful
+            parameters include:
+
+            - skiprows (list of int): Rows to skip such as a row of comments
+            - usecols (list of str): Only read these columns
+            - dtype (dict): Expected data type. Will be guessed if
+              not specified
+    Yields
+    ------
+        data : dict or object
+            Dictionary that can be used to initialize objects with the
+            **kwargs syntax, or the output of ``obj_fn`` if specified
+
+    .. _`pandas.read_csv`: https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_csv.html
+    """
+    with pd.read_csv(filename, chunksize=chunksize, **kwargs) as chunks:
+        yield from _read_chunks(chunks=chunks,
+                                source=filename,
+                                obj_fn=obj_fn,
+                                delimiter=delimiter,
+                                min_frequency_cutoff=min_frequency_cutoff,
+                                include_imaginary=include_imaginary)
+
+
+def read_parquet(filename,
+                 chunksize=10000,
+                 obj_fn=None,
+                 columns=None,
+                 delimiter='.',
+                 min_frequency_cutoff=0.,
+                 include_imaginary=False):
+    """Reads a Parquet file in batches and yields one entry per row. The
+    column headings follow the special rules of
+    :func:`~pmutt.io.excel.read_excel`. Requires `pyarrow`_.
+
+    Parameters
+    ----------
+        filename : str
+            Name of the Parquet file
+        chunksize : int, optional
+            Number of rows to read at a time. Default is 10000
+        obj_fn : callable, optional
+            If specified, each row is converted using ``obj_fn(**data)``
+            (e.g. :class:`~pmutt.statmech.StatMech` or
+            :meth:`~pmutt.empirical.nasa.Nasa.from_model`). Otherwise the
+            dictionaries are yielded. Default is None
+        columns : list of str, optional
+            Only read these columns. Default is all the columns
+        delimiter : str, optional
+            Delimiter to parse column names. Default is '.'
+        min_frequency_cutoff : float, optional
+            Applies for the vib_outcar header. Minimum frequency cutoff (cm-1).
+            Default is 0 cm-1
+        include_imaginary : bool, optional
+            Applies for the vib_outcar header. Whether or not imaginary
+            frequencies should be included. Default is False
+    Yields
+    ------
+        data : dict or object
+            Dictionary that can be used to initialize objects with the
+            **kwargs syntax, or the output of ``obj_fn`` if specified
+    Raises
+    ------
+        ImportError
+            Raised if pyarrow is not installed
+
+    .. _`pyarrow`: https://arrow.apache.org/docs/python/
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        err_msg = ('pyarrow is required to read Parquet files using '
+                   'pmutt.io.tabular.read_parquet.')
+        raise ImportError(err_msg)
+
+    parquet_file = pq.ParquetFile(filename)
+    chunks = (batch.to_pandas() for batch in parquet_file.iter_batches(
+        batch_size=chunksize, columns=columns))
+    yield from _read_chunks(chunks=chunks,
+                            source=filename,
+                            obj_fn=obj_fn,
+                            delimiter=delimiter,
+                            min_frequency_cutoff=min_frequency_cutoff,
+                            include_imaginary=include_imaginary)
+
+
+def _read_chunks(chunks, source, obj_fn, delimiter, min_frequency_cutoff,
+                 include_imaginary):
+    """Processes chunks of a table and yields one entry per row
+
+    Parameters
+    ----------
+        chunks : iterable of `pandas.DataFrame`_
+            Chunks of the table
+        source : str
+            Filename of the table
+        obj_fn : callable or None
+            Used to convert each row if specified
+        delimiter : str
+            Delimiter to parse column names
+        min_frequency_cutoff : float
+            Minimum frequency cutoff (cm-1) for the vib_outcar header
+        include_imaginary : bool
+            Whether imaginary frequencies should be included for the
+            vib_outcar header
+    Yields
+    ------
+        data : dict or object
+            Dictionary or the output of ``obj_fn`` if specified
+
+    .. _`pandas.DataFrame`: https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.html
+    """
+    for chunk in chunks:
+        # External files are only cached within a chunk so memory does not
+        # grow with the size of the table
+        chunk_data = _read_tabular_data(
+            input_data=chunk,
+            source=source,
+            delimiter=delimiter,
+            min_frequency_cutoff=min_frequency_cutoff,
+            include_imaginary=include_imaginary)
+        for data in chunk_data:
+            if obj_fn is None:
+                yield data
+            else:
+                yield obj_fn(**data)
@@ -4,9 +4,19 @@ pmutt.io.vasp
 Description: methods to read from vasp outcar files
 """
 
+import mmap
 import os
 import re
 
+# Header of the block listing the vibrational modes. Only the last block is
+# read since earlier blocks belong to previous ionic steps or runs.
+_FREQ_HEADER = b'Eigenvectors and eigenvalues of the dynamical matrix'
+# Written after the frequency block when NWRITE=3. Repeats the frequencies.
+_FREQ_BLOCK_END = b'Eigenvectors after division by SQRT(mass)'
+# Frequency line. The first group is "/i" if the frequency is imaginary.
+_FREQ_LINE_PATTERN = re.compile(
+    rb'^[ \t]*\d+[ \t]+f(/i)?[ ]*=.*?(\d+\.?\d+) cm-1', re.MULTILINE)
+
 
 def get_vib_wavenumber_from_line(in_line):
     """Parses in_line for real frequencies
@@ -61,30 +71,47 @@ def set_vib_wavenumbers_from_outcar(in_file,
         raise FileNotFoundError(err_msg)
 
     vib_wavenumbers = list()
-    real_pattern = re.compile(r'f[ ]*=')  # pattern for real frequencies
-    if include_imaginary:
-        # pattern for imaginary frequencies
-        imag_pattern = re.compile(r'f/i[ ]*=')
-
-    with open(in_file, "r") as out_fp:
-        outcar_contents = out_fp.readlines()
-    for line in outcar_contents:
-        if real_pattern.search(line) is not None:
-            try:
-                vib_wavenumber = get_vib_wavenumber_from_line(line)
-            except TypeError:
-                pass  # if no frequency in line continue
-            else:
-                if vib_wavenumber > min_frequency_cutoff:
-                    vib_wavenumbers.append(vib_wavenumber)
-        elif include_imaginary and imag_pattern.search(line) is not None:
-            try:
-                vib_wavenumber = get_vib_wavenumber_from_line(line)
-            except TypeError:
-                pass  # if no frequency in line continue
-            else:
-                vib_wavenumbers.append(-vib_wavenumber)
+    for is_imaginary, vib_wavenumber in _read_outcar_frequencies(in_file):
+        if not is_imaginary:
+            if vib_wavenumber > min_frequency_cutoff:
+                vib_wavenumbers.append(vib_wavenumber)
+        elif include_imaginary:
+            vib_wavenumbers.append(-vib_wavenumber)
 
     if len(vib_wavenumbers) == 0:
         print('no frequencies found in file')
     output_structure['vib_wavenumbers'] = vib_wavenumbers
+
+
+def _read_outcar_frequencies(in_file):
+    """Reads the frequencies of the final frequency block of an OUTCAR file.
+    The file is memory-mapped and searched backwards for the block header so
+    large OUTCARs (e.g. from MD or NEB runs) are not loaded into memory. If
+    the header is not present, the whole file is searched.
+
+    Parameters
+    ----------
+        in_file: str
+            OUTCAR file of frequency jobs
+    Returns
+    -------
+        frequencies: list of (bool, float) tuples
+            Each tuple contains whether the frequency is imaginary and the
+            magnitude of the wavenumber in cm-1
+    """
+    # Empty files cannot be memory-mapped
+    if os.path.getsize(in_file) == 0:
+        return []
+    with open(in_file, 'rb') as out_fp, \
+            mmap.mmap(out_fp.fileno(), 0, access=mmap.ACCESS_READ) as out_mm:
+        start = out_mm.rfind(_FREQ_HEADER)
+        if start == -1:
+            start = 0
+            end = len(out_mm)
+        else:
+            end = out_mm.find(_FREQ_BLOCK_END, start)
+            if end == -1:
+                end = len(out_mm)
+        return [(is_imaginary == b'/i', float(vib_wavenumber))
+                for is_imaginary, vib_wavenumber in
+                _FREQ_LINE_PATTERN.findall(out_mm, start, end)]
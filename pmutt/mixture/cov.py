@@ -9,6 +9,7 @@ import numpy as np
 
 from pmutt import _ModelBase
 from pmutt import constants as c
+from pmutt.io.cantera import _get_cti_number
 from pmutt.omkm import _Param, _assign_yaml_val
 from pmutt.io.json import remove_class
 
@@ -204,6 +205,42 @@ class PiecewiseCovEffect(_ModelBase):
                                    self.intervals, slopes, self.name))
         return lat_inter_str
 
+    def to_ctml(self, ctml, energy_unit='kcal', quantity_unit='mol',
+                units=None):
+        """Adds the lateral interaction to a CTML converter. Equivalent to
+        reading the output of
+        :meth:`~pmutt.mixture.cov.PiecewiseCovEffect.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the interaction
+            energy_unit : str, optional
+                Energy unit for slopes. Default is 'kcal'
+            quantity_unit : str, optional
+                Quantity unit for slopes. Default is 'mol'
+            units : :class:`~pmutt.cantera.units.Units` object
+                If specified, ``energy_unit`` and ``quantity_unit`` are
+                overwritten. Default is None.
+        Returns
+        -------
+            ctml_lat_inter : ctml_writer.lateral_interaction object
+                Lateral interaction entry
+        """
+        if units is not None:
+            energy_unit = units.energy
+            quantity_unit = units.quantity
+        final = '{}/{}'.format(energy_unit, quantity_unit)
+        slopes = [_get_cti_number(c.convert_unit(slope, initial='kcal/mol',
+                                                 final=final))
+                  for slope in self.slopes]
+        intervals = [_get_cti_number(interval) for interval in self.intervals]
+        return ctml.lateral_interaction('{} {}'.format(self.name_i,
+                                                       self.name_j),
+                                        coverage_thresholds=intervals,
+                                        strengths=slopes,
+                                        id=self.name)
+
     def to_omkm_yaml(self, energy_unit='kcal', quantity_unit='mol', units=None):
         """Writes the object in Cantera's YAML format.
 
@@ -0,0 +1,308 @@
+from pmutt import _UniqueObjects
+from pmutt.omkm import phase as omkm_phases
+
+
+class Mechanism:
+    """Species, reactions and lateral interactions of an OpenMKM mechanism.
+    Objects are indexed by name and by phase as they are added so lookups do
+    not scan the whole mechanism.
+
+    Attributes
+    ----------
+        species : list of :class:`~pmutt.empirical.EmpiricalBase` objects, optional
+            Species in the mechanism. Names should be unique. Default is None
+        reactions : list of :class:`~pmutt.omkm.reaction.SurfaceReaction` objects, optional
+            Reactions in the mechanism. Default is None
+        interactions : list of :class:`~pmutt.mixture.cov.PiecewiseCovEffect` objects, optional
+            Lateral interactions in the mechanism. The species referenced by
+            ``name_i`` should be added first. Default is None
+        phases : list of :class:`~pmutt.cantera.phase.Phase` objects
+            Not supplied during initialization. Phases created by
+            :meth:`~pmutt.omkm.mechanism.Mechanism.organize_phases`
+    """
+    def __init__(self, species=None, reactions=None, interactions=None):
+        self._species = {}
+        self._reactions = {}
+        # Finds duplicate reactions without comparing to every reaction
+        self._unique_reactions = _UniqueObjects()
+        self._interactions = {}
+        self._phase_species = {}
+        self._phase_reactions = {}
+        self._phase_interactions = {}
+        self.phases = []
+        if species is not None:
+            self.add_species(species)
+        if reactions is not None:
+            self.add_reactions(reactions)
+        if interactions is not None:
+            self.add_interactions(interactions)
+
+    @property
+    def species(self):
+        return list(self._species.values())
+
+    @property
+    def reactions(self):
+        return list(self._reactions.values())
+
+    @property
+    def interactions(self):
+        return list(self._interactions.values())
+
+    def add_species(self, species):
+        """Adds species to the mechanism. A species with the same name as an
+        existing species replaces it.
+
+        Parameters
+        ----------
+            species : list of :class:`~pmutt.empirical.EmpiricalBase` objects
+                Species to add
+        """
+        for ind_species in species:
+            if ind_species.name in self._species:
+                self.remove_species(ind_species.name)
+            self._species[ind_species.name] = ind_species
+            phase_name = _get_phase_name(ind_species)
+            if phase_name is not None:
+                phase_species = self._phase_species.setdefault(phase_name, {})
+                phase_species[ind_species.name] = ind_species
+
+    def remove_species(self, name):
+        """Removes a species from the mechanism. Reactions and lateral
+        interactions are not modified.
+
+        Parameters
+        ----------
+            name : str
+                Name of the species
+        Returns
+        -------
+            species : :class:`~pmutt.empirical.EmpiricalBase` object
+                Species removed
+        Raises
+        ------
+            KeyError
+                Raised if the species is not in the mechanism
+        """
+        ind_species = self._species.pop(name)
+        for phase_species in self._phase_species.values():
+            if phase_species.get(name) is ind_species:
+                del phase_species[name]
+                break
+        return ind_species
+
+    def get_species(self, name):
+        """Returns a species by name
+
+        Parameters
+        ----------
+            name : str
+                Name of the species
+        Returns
+        -------
+            species : :class:`~pmutt.empirical.EmpiricalBase` object
+                Species with the name
+        Raises
+        ------
+            KeyError
+                Raised if the species is not in the mechanism
+        """
+        return self._species[name]
+
+    def add_reactions(self, reactions):
+        """Adds reactions to the mechanism. Each reaction is assigned to the
+        phases of its species (including transition states). Reactions equal
+        to one already in the mechanism are ignored.
+
+        Parameters
+        ----------
+            reactions : list of :class:`~pmutt.omkm.reaction.SurfaceReaction` objects
+                Reactions to add
+        """
+        for reaction in reactions:
+            if not self._unique_reactions.add(reaction):
+                continue
+            self._reactions[id(reaction)] = reaction
+            reaction_species = reaction.get_species(include_TS=True)
+            for ind_species in reaction_species.values():
+                try:
+                    phase_name = _get_phase_name(ind_species,
+                                                 raise_error=True)
+                except AttributeError:
+                    # Skip species without a phase
+                    continue
+                phase_reactions = \
+                    self._phase_reactions.setdefault(phase_name, {})
+                phase_reactions[id(reaction)] = reaction
+
+    def add_interactions(self, interactions):
+        """Adds lateral interactions to the mechanism. Each interaction is
+        assigned to the phase of its ``name_i`` species.
+
+        Parameters
+        ----------
+            interactions : list of :class:`~pmutt.mixture.cov.PiecewiseCovEffect` objects
+                Lateral interactions to add
+        Raises
+        ------
+            KeyError
+                Raised if the ``name_i`` species is not in the mechanism
+        """
+        for interaction in interactions:
+            self._interactions[id(interaction)] = interaction
+            phase_name = _get_phase_name(self._species[interaction.name_i])
+            if phase_name is None:
+                continue
+            phase_interactions = \
+                self._phase_interactions.setdefault(phase_name, {})
+            phase_interactions[id(interaction)] = interaction
+
+    def remove_reactions(self, reactions):
+        """Removes reactions from the mechanism and from their phases
+
+        Parameters
+        ----------
+            reactions : list of :class:`~pmutt.omkm.reaction.SurfaceReaction` objects
+                Reactions to remove. A reaction equal to one in the mechanism
+                removes that reaction
+        Returns
+        -------
+            reactions : list of :class:`~pmutt.omkm.reaction.SurfaceReaction` objects
+                Reactions removed
+        Raises
+        ------
+            KeyError
+                Raised if a reaction is not in the mechanism
+        """
+        removed_reactions = []
+        for reaction in reactions:
+            reaction = self._unique_reactions.remove(reaction)
+            del self._reactions[id(reaction)]
+            for phase_reactions in self._phase_reactions.values():
+                phase_reactions.pop(id(reaction), None)
+            removed_reactions.append(reaction)
+        return removed_reactions
+
+    def remove_interactions(self, interactions):
+        """Removes lateral interactions from the mechanism and from their
+        phases
+
+        Parameters
+        ----------
+            interactions : list of :class:`~pmutt.mixture.cov.PiecewiseCovEffect` objects
+                Lateral interactions to remove
+        Raises
+        ------
+            KeyError
+                Raised if an interaction is not in the mechanism
+        """
+        for interaction in interactions:
+            del self._interactions[id(interaction)]
+            for phase_interactions in self._phase_interactions.values():
+                phase_interactions.pop(id(interaction), None)
+
+    def get_phase_species(self, phase):
+        """Returns the species in a phase
+
+        Parameters
+        ----------
+            phase : str or :class:`~pmutt.cantera.phase.Phase` object
+                Phase or its name
+        Returns
+        -------
+            species : list of :class:`~pmutt.empirical.EmpiricalBase` objects
+                Species in the phase in the order they were added
+        """
+        phase_name = getattr(phase, 'name', phase)
+        return list(self._phase_species.get(phase_name, {}).values())
+
+    def get_phase_reactions(self, phase):
+        """Returns the reactions involving species of a phase
+
+        Parameters
+        ----------
+            phase : str or :class:`~pmutt.cantera.phase.Phase` object
+                Phase or its name
+        Returns
+        -------
+            reactions : list of :class:`~pmutt.omkm.reaction.SurfaceReaction` objects
+                Reactions in the order they were added
+        """
+        phase_name = getattr(phase, 'name', phase)
+        return list(self._phase_reactions.get(phase_name, {}).values())
+
+    def get_phase_interactions(self, phase):
+        """Returns the lateral interactions of a phase
+
+        Parameters
+        ----------
+            phase : str or :class:`~pmutt.cantera.phase.Phase` object
+                Phase or its name
+        Returns
+        -------
+            interactions : list of :class:`~pmutt.mixture.cov.PiecewiseCovEffect` objects
+                Lateral interactions in the order they were added
+        """
+        phase_name = getattr(phase, 'name', phase)
+        return list(self._phase_interactions.get(phase_name, {}).values())
+
+    def organize_phases(self, phases_data):
+        """Creates the phases using the species, reactions and lateral
+        interactions of the mechanism. Equivalent to
+        :func:`~pmutt.io.omkm.organize_phases`.
+
+        Parameters
+        ----------
+            phases_data : list of dict
+                Each element of the list corresponds to the data to initialize
+                the phase. Each dictionary are keyword arguments. The
+                ``phase_type`` key is the name of the class in
+                :mod:`pmutt.omkm.phase`.
+        Returns
+        -------
+            phases : list of :class:`~pmutt.cantera.phase.Phase` objects
+                Phases organized using parameters. Also stored in the
+                ``phases`` attribute.
+        """
+        phase_getters = {'species': self.get_phase_species,
+                         'reactions': self.get_phase_reactions,
+                         'interactions': self.get_phase_interactions}
+        phases = []
+        for phase_data in phases_data:
+            phase_data = phase_data.copy()
+            phase_name = phase_data['name']
+            phase_type = phase_data.pop('phase_type')
+            # Add species, reactions and interactions if present
+            for attr_name, get_phase_values in phase_getters.items():
+                attr_value = get_phase_values(phase_name)
+                if len(attr_value) > 0:
+                    phase_data[attr_name] = attr_value
+            phase_class = getattr(omkm_phases, phase_type)
+            phases.append(phase_class(**phase_data))
+        self.phases = phases
+        return phases
+
+
+def _get_phase_name(obj, raise_error=False):
+    """Returns the name of the phase of an object
+
+    Parameters
+    ----------
+        obj : pmutt object
+            Object with a ``phase`` attribute. The phase can be a str or a
+            :class:`~pmutt.cantera.phase.Phase` object
+        raise_error : bool, optional
+            If True, raises an AttributeError if the object does not have a
+            ``phase`` attribute. Otherwise, returns None. Default is False
+    Returns
+    -------
+        phase_name : str or None
+            Name of the phase. None if the object does not have a phase
+    """
+    try:
+        phase = obj.phase
+    except AttributeError:
+        if raise_error:
+            raise
+        return None
+    return getattr(phase, 'name', phase)
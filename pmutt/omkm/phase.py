@@ -1,5 +1,5 @@
 from pmutt import constants as c
-from pmutt.cantera import _get_omkm_range
+from pmutt.cantera import _get_ctml_range, _get_omkm_range
 from pmutt.omkm import _Param, _assign_yaml_val
 import pmutt.cantera.phase as phase_cantera
 
@@ -278,6 +278,88 @@ class InteractingInterface(phase_cantera.Phase):
         cti_str = '{})\n'.format(cti_str[:-2])
         return cti_str
 
+    def to_ctml(self,
+                ctml,
+                max_line_len=80,
+                quantity_unit='molec',
+                length_unit='cm',
+                units=None,
+                delimiter='_'):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.omkm.phase.InteractingInterface.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the phase
+            max_line_len : int, optional
+                Maximum number of characters in the line of the equivalent
+                CTI file. Default is 80.
+            quantity_unit : str, optional
+                Quantity unit to use to calculate A. Default is 'molec'
+            length_unit : str, optional
+                Length unit to use to calculate A. Default is 'cm'
+            units : :class:`~pmutt.omkm.units.Units` object
+                If specified, `quantity_unit` and `length_unit` are overwritten.
+                Default is None.
+            delimiter : str, optional
+                Delimiter used to separate header from footer of reaction and
+                lateral interaction IDs. Default is '_'.
+        Returns
+        -------
+            ctml_phase : ctml_writer.interacting_interface object
+                Phase entry
+        """
+        if units is not None:
+            quantity_unit = units.quantity
+            length_unit = units.length
+
+        species_names = [species.name for species in self.species]
+        area_unit = '{}2'.format(length_unit)
+        site_den = self.site_density\
+                   *c.convert_unit(initial='mol', final=quantity_unit)\
+                   /c.convert_unit(initial='cm2', final=area_unit)
+
+        phases_names = []
+        for phase in self.phases:
+            try:
+                phases_names.append(phase.name)
+            except AttributeError:
+                phases_names.append(phase)
+        kwargs = {
+            'name': phase_cantera.obj_to_ctml(self.name,
+                                              line_len=max_line_len - 27,
+                                              max_line_len=max_line_len - 28),
+            'elements': phase_cantera.obj_to_ctml(self.elements,
+                                                  line_len=max_line_len - 31,
+                                                  max_line_len=max_line_len),
+            'species': phase_cantera.obj_to_ctml(species_names,
+                                                 line_len=max_line_len - 30,
+                                                 max_line_len=max_line_len),
+            'phases': phase_cantera.obj_to_ctml(phases_names,
+                                                line_len=max_line_len - 29,
+                                                max_line_len=max_line_len),
+            'site_density': phase_cantera._get_cti_number(site_den),
+        }
+        for range_field in ('interactions', 'reactions'):
+            val = getattr(self, range_field)
+            # Skip empty fields
+            if val is None:
+                continue
+            kwargs[range_field] = _get_ctml_range(objs=val,
+                                                  parent_obj=self,
+                                                  delimiter=delimiter)
+        for field in ('beps', 'transport', 'options', 'note'):
+            val = getattr(self, field)
+            # Skip empty fields and blank lists
+            if val is None or len(val) == 0:
+                continue
+            kwargs[field] = phase_cantera.obj_to_ctml(
+                val,
+                max_line_len=max_line_len,
+                line_len=max_line_len - len(field) - 23)
+        return ctml.interacting_interface(**kwargs)
+
     def to_omkm_yaml(self,
                      T=300.,
                      P=1.,
@@ -3,8 +3,9 @@ import more_itertools as mit
 
 from pmutt import _apply_numpy_operation
 from pmutt import constants as c
-from pmutt.cantera import _get_omkm_range
+from pmutt.cantera import _get_ctml_range, _get_omkm_range
 from pmutt.cantera.phase import IdealGas
+from pmutt.io.cantera import _get_cti_coeffs, _get_cti_number
 from pmutt.omkm.phase import InteractingInterface, StoichSolid
 from pmutt.omkm.units import Units
 from pmutt.reaction import Reaction
@@ -413,7 +414,8 @@ class SurfaceReaction(Reaction):
                length_unit='cm',
                act_energy_unit='cal/mol',
                ads_act_method='get_H_act',
-               units=None):
+               units=None,
+               ctml=None):
         """Writes the object in Cantera's CTI format.
 
         Parameters
@@ -435,11 +437,163 @@ class SurfaceReaction(Reaction):
             units : :class:`~pmutt.omkm.units.Units` object
                 If specified, `quantity_unit`, `length_unit`, and
                 `act_energy_unit` are overwritten. Default is None.
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object, optional
+                If specified, the reaction is also added to this converter
+                using the same parameters (see
+                :meth:`~pmutt.omkm.reaction.SurfaceReaction.to_ctml`). Default
+                is None.
         Returns
         -------
             cti_str : str
                 Surface reaction string in CTI format
         """
+        reaction_str, id, A, act_val = self._get_cti_params(
+            T=T,
+            P=P,
+            quantity_unit=quantity_unit,
+            length_unit=length_unit,
+            act_energy_unit=act_energy_unit,
+            ads_act_method=ads_act_method,
+            units=units)
+        # Determine the reaction IDs
+        if id is None:
+            id_str = ''
+        else:
+            id_str = ',\n                 id="{}"'.format(id)
+
+        if self.is_adsorption:
+            cti_str = ('surface_reaction("{}",\n'
+                       '                 stick({: .5e}, {}, {: .5e}){})'
+                       ''.format(reaction_str, A, self.beta, act_val, id_str))
+        else:
+            cti_str = ('surface_reaction("{}",\n'
+                       '                 [{: .5e}, {}, {: .5e}]{})'
+                       ''.format(reaction_str, A, self.beta, act_val, id_str))
+        if ctml is not None:
+            self._add_ctml(ctml=ctml,
+                           reaction_str=reaction_str,
+                           id=id,
+                           A=A,
+                           act_val=act_val)
+        return cti_str
+
+    def to_ctml(self,
+                ctml,
+                T=c.T0('K'),
+                P=c.P0('bar'),
+                quantity_unit='molec',
+                length_unit='cm',
+                act_energy_unit='cal/mol',
+                ads_act_method='get_H_act',
+                units=None):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.omkm.reaction.SurfaceReaction.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the reaction
+            T : float, optional
+                Temperature in K. Default is 298.15 K
+            P : float, optional
+                Pressure in bar. Default is 1 bar
+            quantity_unit : str, optional
+                Quantity unit to calculate A. Default is 'molec'
+            length_unit : str, optional
+                Length unit to calculate A. Default is 'cm'
+            act_energy_unit : str, optional
+                Unit to use for activation energy. Default is 'cal/mol'
+            ads_act_method : str, optional
+                Activation method to use for adsorption reactions. Accepted 
+                options include 'get_H_act' and 'get_G_act'. Default is
+                'get_H_act'.
+            units : :class:`~pmutt.omkm.units.Units` object
+                If specified, `quantity_unit`, `length_unit`, and
+                `act_energy_unit` are overwritten. Default is None.
+        Returns
+        -------
+            ctml_reaction : ctml_writer.surface_reaction object
+                Reaction entry
+        """
+        reaction_str, id, A, act_val = self._get_cti_params(
+            T=T,
+            P=P,
+            quantity_unit=quantity_unit,
+            length_unit=length_unit,
+            act_energy_unit=act_energy_unit,
+            ads_act_method=ads_act_method,
+            units=units)
+        return self._add_ctml(ctml=ctml,
+                              reaction_str=reaction_str,
+                              id=id,
+                              A=A,
+                              act_val=act_val)
+
+    def _add_ctml(self, ctml, reaction_str, id, A, act_val):
+        """Adds the reaction to a CTML converter using calculated parameters
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the reaction
+            reaction_str : str
+                Reaction string
+            id : str or None
+                ID of the reaction
+            A : float
+                Pre-exponential factor or sticking coefficient
+            act_val : float
+                Activation energy
+        Returns
+        -------
+            ctml_reaction : ctml_writer.surface_reaction object
+                Reaction entry
+        """
+        # Values are rounded to the precision written in the CTI file
+        A, act_val = _get_cti_coeffs((A, act_val), fmt='{: .5e}')
+        beta = _get_cti_number(self.beta)
+        if self.is_adsorption:
+            kf = ctml.stick(A, beta, act_val)
+        else:
+            kf = [A, beta, act_val]
+        kwargs = {}
+        if id is not None:
+            kwargs['id'] = id
+        return ctml.surface_reaction(reaction_str, kf, **kwargs)
+
+    def _get_cti_params(self, T, P, quantity_unit, length_unit,
+                        act_energy_unit, ads_act_method, units):
+        """Calculates the parameters written to CTI and CTML files
+
+        Parameters
+        ----------
+            T : float
+                Temperature in K
+            P : float
+                Pressure in bar
+            quantity_unit : str
+                Quantity unit to calculate A
+            length_unit : str
+                Length unit to calculate A
+            act_energy_unit : str
+                Unit to use for activation energy
+            ads_act_method : str
+                Activation method to use for adsorption reactions
+            units : :class:`~pmutt.omkm.units.Units` object or None
+                If specified, `quantity_unit`, `length_unit`, and
+                `act_energy_unit` are overwritten.
+        Returns
+        -------
+            reaction_str : str
+                Reaction equation
+            id : str or None
+                ID of the reaction
+            A : float
+                Sticking coefficient if the reaction is an adsorption.
+                Pre-exponential factor otherwise
+            act_val : float
+                Activation energy in ``act_energy_unit``
+        """
         if units is not None:
             quantity_unit = units.quantity
             length_unit = units.length
@@ -453,12 +607,7 @@ class SurfaceReaction(Reaction):
         try:
             id = self.id
         except AttributeError:
-            id_str = ''
-        else:
-            if id is None:
-                id_str = ''
-            else:
-                id_str = ',\n                 id="{}"'.format(self.id)
+            id = None
 
         if self.Ea is None:
             act_val = None
@@ -472,24 +621,13 @@ class SurfaceReaction(Reaction):
             if act_val is None:
                 act_method = getattr(self, ads_act_method)
                 act_val = act_method(units=act_energy_unit, T=T, P=P)
-
-            cti_str = ('surface_reaction("{}",\n'
-                       '                 stick({: .5e}, {}, {: .5e}){})'
-                       ''.format(reaction_str, self.sticking_coeff, self.beta,
-                                 act_val, id_str))
+            A = self.sticking_coeff
         else:
             A_units = '{}/{}2'.format(quantity_unit, length_unit)
             if act_val is None:
                 act_val = self.get_G_act(units=act_energy_unit, T=T, P=P)
-            cti_str = ('surface_reaction("{}",\n'
-                       '                 [{: .5e}, {}, {: .5e}]{})'
-                       ''.format(reaction_str,
-                                 self.get_A(T=T, P=P, include_entropy=False,
-                                            units=A_units),
-                                 self.beta,
-                                 act_val,
-                                 id_str))
-        return cti_str
+            A = self.get_A(T=T, P=P, include_entropy=False, units=A_units)
+        return (reaction_str, id, A, act_val)
 
     def to_omkm_yaml(self,
                      T=c.T0('K'),
@@ -800,6 +938,39 @@ class BEP(BEP_parent):
                              cleavage_reactions, synthesis_reactions))
         return cti_str
 
+    def to_ctml(self, ctml, act_energy_unit=None, units=None, delimiter='_'):
+        """Adds the object to a CTML converter. Equivalent to reading the
+        output of :meth:`~pmutt.omkm.reaction.BEP.to_cti`.
+
+        Parameters
+        ----------
+            ctml : :class:`~pmutt.io.ctml_writer.Converter` object or module
+                Converter to add the BEP
+            act_energy_unit : str, optional
+                Unit to use for energy. Default is 'cal/mol'
+            units : :class:`~pmutt.omkm.units.Units` object
+                If specified, `energy_unit` is overwritten. Default is None.
+        Returns
+        -------
+            ctml_bep : ctml_writer.bep object
+                BEP entry
+        """
+        if units is not None:
+            act_energy_unit = units.act_energy
+        synthesis_reactions = _get_ctml_range(objs=self.synthesis_reactions,
+                                              parent_obj=self,
+                                              delimiter=delimiter)
+        cleavage_reactions = _get_ctml_range(objs=self.cleavage_reactions,
+                                             parent_obj=self,
+                                             delimiter=delimiter)
+        intercept = c.convert_unit(self.intercept, 'kcal/mol', act_energy_unit)
+        return ctml.bep(id=self.name,
+                        slope=_get_cti_number(self.slope),
+                        intercept=_get_cti_number(intercept),
+                        direction=self.direction,
+                        cleavage_reactions=cleavage_reactions,
+                        synthesis_reactions=synthesis_reactions)
+
     def to_omkm_yaml(self, act_energy_unit=None, units=None):
         """Writes the object in Cantera's YAML format.
 
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+pmutt.profiling
+Opt-in collection of call counts and cumulative times of pmutt methods.
+
+Methods are only instrumented while :func:`~pmutt.profiling.collect` is
+active so there is no overhead otherwise.
+"""
+import functools
+import inspect
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# Profiles collecting in the current context. Calls made in other threads
+# are not recorded
+_profiles = ContextVar('pmutt_profiles', default=())
+# (profile, key) of the calls in progress in the current context. Time is
+# only added by the outermost call so recursive calls are not counted twice
+_active_calls = ContextVar('pmutt_active_calls', default=frozenset())
+# Number of collect blocks in progress in all threads. Methods are
+# instrumented while non-zero
+_n_collecting = 0
+_instrument_lock = threading.Lock()
+# (object, attribute name, original value) replaced by the instrumentation
+_patches = []
+
+
+class Profile:
+    """Call counts and cumulative times recorded by
+    :func:`~pmutt.profiling.collect`
+
+    Attributes
+    ----------
+        by_name : bool, optional
+            If True, calls of objects with a ``name`` attribute (e.g. species)
+            are recorded separately for each name. Default is False
+        stats : dict
+            Number of calls and cumulative time in s using
+            (class name, method name) as the keys. If ``by_name`` is True,
+            the class name is followed by the object's name in brackets (e.g.
+            'StatMech[H2O]'). Calls of ``_force_pass_arguments`` and
+            ``_get_mode_quantity`` use the function name as the class name and
+            the method being called as the method name.
+    """
+    def __init__(self, by_name=False):
+        self.by_name = by_name
+        self.stats = {}
+
+    def _start_call(self, class_name, method_name, obj=None):
+        if self.by_name:
+            name = getattr(obj, 'name', None)
+            if isinstance(name, str):
+                class_name = '{}[{}]'.format(class_name, name)
+        key = (class_name, method_name)
+        try:
+            self.stats[key][0] += 1
+        except KeyError:
+            self.stats[key] = [1, 0.]
+        return key
+
+    def get_records(self, sort_by='time'):
+        """Returns the statistics as a list of records
+
+        Parameters
+        ----------
+            sort_by : str, optional
+                Column used to sort the records in descending order. Supported
+                options include:
+
+                - time (Default)
+                - calls
+                - time_per_call
+        Returns
+        -------
+            records : list of dict
+                Each record has the keys 'class', 'method', 'calls', 'time'
+                and 'time_per_call'. Times are in s.
+        """
+        records = [{'class': class_name,
+                    'method': method_name,
+                    'calls': n_calls,
+                    'time': t,
+                    'time_per_call': t / n_calls}
+                   for (class_name, method_name), (n_calls, t)
+                   in self.stats.items()]
+        if sort_by not in ('time', 'calls', 'time_per_call'):
+            err_msg = 'sort_by: {} not supported'.format(sort_by)
+            raise ValueError(err_msg)
+        records.sort(key=lambda record: record[sort_by], reverse=True)
+        return records
+
+    def report(self, sort_by='time', n=None):
+        """Formats the statistics as a table
+
+        Parameters
+        ----------
+            sort_by : str, optional
+                Column used to sort the rows. See
+                :meth:`~pmutt.profiling.Profile.get_records` for supported
+                options. Default is 'time'
+            n : int, optional
+                Maximum number of rows. If None, all the rows are shown.
+                Default is None
+        Returns
+        -------
+            report : str
+                Table with the calls, cumulative time and time per call of
+                each method
+        """
+        records = self.get_records(sort_by=sort_by)[:n]
+        lines = ['{:<40} {:<28} {:>10} {:>12} {:>12}'.format(
+            'class', 'method', 'calls', 'time (s)', 'per call (s)')]
+        for record in records:
+            lines.append('{:<40} {:<28} {:>10d} {:>12.6f} {:>12.3e}'.format(
+                record['class'], record['method'], record['calls'],
+                record['time'], record['time_per_call']))
+        return '\n'.join(lines)
+
+    def to_dataframe(self, sort_by='time'):
+        """Returns the statistics as a table
+
+        Parameters
+        ----------
+            sort_by : str, optional
+                Column used to sort the rows. See
+                :meth:`~pmutt.profiling.Profile.get_records` for supported
+                options. Default is 'time'
+        Returns
+        -------
+            df : `pandas.DataFrame`_
+                Statistics with the columns 'class', 'method', 'calls', 'time'
+                and 'time_per_call'
+
+        .. _`pandas.DataFrame`: https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.html
+        """
+        import pandas as pd
+        return pd.DataFrame(self.get_records(sort_by=sort_by),
+                            columns=['class', 'method', 'calls', 'time',
+                                     'time_per_call'])
+
+    def to_csv(self, filename, sort_by='time'):
+        """Writes the statistics to a CSV file
+
+        Parameters
+        ----------
+            filename : str
+                Output filename
+            sort_by : str, optional
+                Column used to sort the rows. See
+                :meth:`~pmutt.profiling.Profile.get_records` for supported
+                options. Default is 'time'
+        """
+        self.to_dataframe(sort_by=sort_by).to_csv(filename, index=False)
+
+
+@contextmanager
+def collect(by_name=False):
+    """Records the calls of pmutt methods made inside the ``with`` block.
+    The public ``get_*`` methods of models (subclasses of
+    :class:`~pmutt._ModelBase`), reactions and the helper functions
+    ``_force_pass_arguments`` and ``_get_mode_quantity`` are recorded.
+
+    Times are cumulative so they include the time of the calls made by the
+    method. Only classes defined before the block starts are recorded. Calls
+    made in other threads or processes (e.g. ``n_processes`` > 1) are not
+    recorded, even if they run while the block is active.
+
+    Parameters
+    ----------
+        by_name : bool, optional
+            If True, calls of objects with a ``name`` attribute (e.g. species)
+            are recorded separately for each name. Default is False
+    Yields
+    ------
+        profile : :class:`~pmutt.profiling.Profile` object
+            Statistics of the calls. Filled in as the calls are made
+
+    Examples
+    --------
+        >>> from pmutt import profiling
+        >>> with profiling.collect() as profile:
+        ...     species.get_G(T=500., units='eV')
+        >>> print(profile.report(n=10))
+    """
+    global _n_collecting
+    profile = Profile(by_name=by_name)
+    with _instrument_lock:
+        if _n_collecting == 0:
+            _instrument()
+        _n_collecting += 1
+    token = _profiles.set(_profiles.get() + (profile, ))
+    try:
+        yield profile
+    finally:
+        _profiles.reset(token)
+        with _instrument_lock:
+            _n_collecting -= 1
+            if _n_collecting == 0:
+                _uninstrument()
+
+
+def _call(class_name, method_name, obj, fn, args, kwargs):
+    """Calls fn and records the time in the profiles of the current
+    context"""
+    profiles = _profiles.get()
+    if len(profiles) == 0:
+        return fn(*args, **kwargs)
+    active_calls = _active_calls.get()
+    outer_calls = []
+    for profile in profiles:
+        key = profile._start_call(class_name, method_name, obj)
+        if (profile, key) not in active_calls:
+            outer_calls.append((profile, key))
+    token = _active_calls.set(active_calls.union(outer_calls))
+    t0 = perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        dt = perf_counter() - t0
+        _active_calls.reset(token)
+        for profile, key in outer_calls:
+            profile.stats[key][1] += dt
+
+
+def _wrap_method(fn):
+    @functools.wraps(fn)
+    def method_wrapper(self, *args, **kwargs):
+        return _call(type(self).__name__, fn.__name__, self, fn,
+                     (self, ) + args, kwargs)
+    return method_wrapper
+
+
+# All method wrappers share this code object. Used by
+# pmutt._get_expected_arguments to find the arguments of the original method
+_method_wrapper_code = _wrap_method(lambda self: None).__code__
+
+
+def _get_callable_name(fn):
+    """Returns a name for a function, bound method or class"""
+    try:
+        obj = fn.__self__
+    except AttributeError:
+        return getattr(fn, '__qualname__', repr(fn))
+    return '{}.{}'.format(type(obj).__name__, fn.__name__)
+
+
+def _wrap_force_pass_arguments(fn):
+    @functools.wraps(fn)
+    def force_pass_arguments_wrapper(fn_in, **kwargs):
+        return _call(fn.__name__, _get_callable_name(fn_in), fn_in, fn,
+                     (fn_in, ), kwargs)
+    return force_pass_arguments_wrapper
+
+
+def _wrap_get_mode_quantity(fn):
+    @functools.wraps(fn)
+    def get_mode_quantity_wrapper(mode, method_name, *args, **kwargs):
+        return _call(fn.__name__,
+                     '{}.{}'.format(type(mode).__name__, method_name), mode,
+                     fn, (mode, method_name) + args, kwargs)
+    return get_mode_quantity_wrapper
+
+
+def _get_subclasses(cls):
+    """Returns the class and all its loaded subclasses"""
+    subclasses = [cls]
+    for subclass in cls.__subclasses__():
+        subclasses.extend(_get_subclasses(subclass))
+    return subclasses
+
+
+def _instrument():
+    """Replaces the methods and functions with the recording wrappers"""
+    import pmutt
+    from pmutt.reaction import Reaction, Reactions
+
+    classes = []
+    for base_class in (pmutt._ModelBase, Reaction, Reactions):
+        for cls in _get_subclasses(base_class):
+            if cls not in classes:
+                classes.append(cls)
+    for cls in classes:
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith('get_') and inspect.isfunction(attr):
+                _patches.append((cls, attr_name, attr))
+                setattr(cls, attr_name, _wrap_method(attr))
+
+    functions = {
+        '_force_pass_arguments': (pmutt._force_pass_arguments,
+                                  _wrap_force_pass_arguments),
+        '_get_mode_quantity': (pmutt._get_mode_quantity,
+                               _wrap_get_mode_quantity),
+    }
+    for fn_name, (fn, wrap_fn) in functions.items():
+        fn_wrapper = wrap_fn(fn)
+        for module_name, module in list(sys.modules.items()):
+            if module is None or (module_name != 'pmutt'
+                                  and not module_name.startswith('pmutt.')):
+                continue
+            if getattr(module, fn_name, None) is fn:
+                _patches.append((module, fn_name, fn))
+                setattr(module, fn_name, fn_wrapper)
+
+
+def _uninstrument():
+    """Restores the methods and functions replaced by
+    :func:`~pmutt.profiling._instrument`"""
+    while len(_patches) > 0:
+        obj, attr_name, attr = _patches.pop()
+        setattr(obj, attr_name, attr)
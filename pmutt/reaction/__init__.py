@@ -1,22 +1,34 @@
 # -*- coding: utf-8 -*-
+import contextvars
 import inspect
+import numbers
 import re
+import sys
 from collections import Counter
 from copy import deepcopy
+from functools import lru_cache
 from warnings import warn
 
 import numpy as np
-from matplotlib import pyplot as plt
-from scipy import interpolate
 
 from pmutt import (_apply_numpy_operation, _force_pass_arguments,
                    _get_specie_kwargs, _is_iterable, _pass_expected_arguments,
-                   _pmuttBase, _check_iterable_attr)
+                   _pmuttBase, _check_iterable_attr, _LazyModule, plt)
 from pmutt import pmutt_list_to_dict
 from pmutt import constants as c
 from pmutt.io.json import json_to_pmutt, remove_class
 from pmutt.reaction.bep import BEP
 
+interpolate = _LazyModule('scipy.interpolate')
+
+# Separates an optional leading stoichiometric coefficient from a species name
+_SPECIE_PATTERN = re.compile(r'(\d+\.?\d*)?\s*(.*)', re.DOTALL)
+# Number of reaction states kept by the parsing cache
+_PARSE_CACHE_SIZE = 2**16
+# Species quantity cache used by Reaction.get_state_quantity (see
+# _SpeciesCache). Each thread and asyncio task sees its own value
+_species_cache = contextvars.ContextVar('species_cache', default=None)
+
 
 class Reaction(_pmuttBase):
     """Represents a chemical reaction
@@ -1719,20 +1731,28 @@ class Reaction(_pmuttBase):
         else:
             state_quantity = 0.
 
+        species_cache = _species_cache.get()
         for specie, coeff in zip(species, stoich):
             # Process the inputs and methods for each specie
             specie_kwargs = _get_specie_kwargs(specie.name, **kwargs)
             # If the species is a BEP relationship, add reaction specie_kwargs
             if isinstance(specie, BEP):
                 specie_kwargs['reaction'] = self
+                quantity = _force_pass_arguments(getattr(specie, method_name),
+                                                 **specie_kwargs)
+            elif species_cache is None:
+                quantity = _force_pass_arguments(getattr(specie, method_name),
+                                                 **specie_kwargs)
+            else:
+                quantity = species_cache.get_quantity(
+                    specie=specie,
+                    method_name=method_name,
+                    specie_kwargs=specie_kwargs)
 
-            method = getattr(specie, method_name)
             if method_name == 'get_q':
-                state_quantity *= \
-                        _force_pass_arguments(method, **specie_kwargs)**coeff
+                state_quantity *= quantity**coeff
             else:
-                state_quantity += \
-                        _force_pass_arguments(method, **specie_kwargs)*coeff
+                state_quantity += quantity*coeff
         return state_quantity
 
     def get_delta_quantity(self, initial_state, final_state, method_name,
@@ -2436,6 +2456,94 @@ class Reactions(_pmuttBase):
     def __len__(self):
         return len(self.reactions)
 
+    @classmethod
+    def from_strings(cls,
+                     reaction_strs,
+                     species,
+                     species_delimiter='+',
+                     reaction_delimiter='=',
+                     raise_error=True,
+                     raise_warning=True):
+        """Create a Reactions object from many reaction strings. Reaction
+        states are parsed once and shared between reactions, so this is much
+        faster than calling :meth:`~pmutt.reaction.Reaction.from_string`
+        repeatedly for large mechanisms.
+
+        Parameters
+        ----------
+            reaction_strs : iterable of str
+                Reaction strings.
+            species : dict or list
+                Dictionary using the names as keys. If you have a list of
+                species it will automatically be converted to a dictionary.
+            species_delimiter : str, optional
+                Delimiter that separate species. Leading and trailing spaces
+                will be trimmed. Default is '+'
+            reaction_delimiter : str, optional
+                Delimiter that separate states of the reaction. Leading and
+                trailing spaces will be trimmed. Default is '='
+            raise_error : bool, optional
+                If True, raises an error if the transition state is not located
+                in species. Default is True
+            raise_warning : bool, optional
+                Only relevant if raise_error is False. Raises a warning if the
+                transition state is not located in species. Default is True
+        Returns
+        -------
+            Reactions : Reactions object
+        Raises
+        ------
+            KeyError
+                Raised if `species` does not contain an entry for the
+                reactants, products or transition state of a reaction string
+        """
+        # Only convert the species once for all reactions
+        if isinstance(species, list):
+            species = pmutt_list_to_dict(species)
+        # Species objects corresponding to each unique reaction state
+        states = {}
+        reactions = []
+        for reaction_str in reaction_strs:
+            reaction_states = reaction_str.split(reaction_delimiter)
+            try:
+                reactants, reactants_stoich = _get_state_species(
+                    state_str=reaction_states[0],
+                    species=species,
+                    species_delimiter=species_delimiter,
+                    states=states)
+                products, products_stoich = _get_state_species(
+                    state_str=reaction_states[-1],
+                    species=species,
+                    species_delimiter=species_delimiter,
+                    states=states)
+                if len(reaction_states) > 2:
+                    ts, ts_stoich = _get_state_species(
+                        state_str=reaction_states[1],
+                        species=species,
+                        species_delimiter=species_delimiter,
+                        states=states)
+                else:
+                    ts = None
+                    ts_stoich = None
+            except KeyError:
+                # Let the single reaction parser report missing species
+                reaction = Reaction.from_string(
+                    reaction_str=reaction_str,
+                    species=species,
+                    species_delimiter=species_delimiter,
+                    reaction_delimiter=reaction_delimiter,
+                    raise_error=raise_error,
+                    raise_warning=raise_warning)
+            else:
+                reaction = Reaction(reactants=reactants,
+                                    reactants_stoich=reactants_stoich,
+                                    products=products,
+                                    products_stoich=products_stoich,
+                                    transition_state=ts,
+                                    transition_state_stoich=ts_stoich)
+            reactions.append(reaction)
+        return cls(reactions=reactions)
+
     def get_species(self, include_TS=True, key='name'):
         """Returns the unique species included in the reactions.
 
@@ -2746,6 +2854,246 @@ class Reactions(_pmuttBase):
         return cls(**json_obj)
 
 
+class _SpeciesCache:
+    """Stores the quantities calculated by
+    :meth:`~pmutt.reaction.Reaction.get_state_quantity` so species shared
+    between reactions are only evaluated once per condition. The cache is
+    used while it is active as a context manager, e.g.
+
+    >>> with _SpeciesCache(conditions=conditions):
+    ...     EoRT_act = [reaction.get_EoRT_act(**condition)
+    ...                 for condition in conditions]
+
+    Parameters
+    ----------
+        conditions : list of dict, optional
+            Conditions the reactions will be evaluated at. If specified and
+            only numerical values change between conditions (e.g. T), a
+            missing quantity is evaluated for all the conditions at once by
+            passing arrays. Species that do not support arrays are evaluated
+            one condition at a time. Default is None
+    """
+
+    def __init__(self, conditions=None):
+        self.values = {}
+        # Keep the species referenced so their ids are not reused
+        self._species = {}
+        self._unbatchable = set()
+        self._batch_keys, self._batch_index = _get_batch_keys(conditions)
+        if self._batch_keys is not None:
+            self._n_conditions = len(conditions)
+            self._batch_values = {
+                key: np.array([condition[key] for condition in conditions])
+                for key in self._batch_keys
+            }
+
+    def __enter__(self):
+        self._token = _species_cache.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _species_cache.reset(self._token)
+
+    def get_quantity(self, specie, method_name, specie_kwargs):
+        """Calculates the quantity of a species or returns the stored value
+
+        Parameters
+        ----------
+            specie : pmutt specie object
+                Species to evaluate
+            method_name : str
+                Name of the method to calculate the quantity
+            specie_kwargs : dict
+                Arguments for the method
+        Returns
+        -------
+            quantity : float
+                Quantity of the species
+        """
+        try:
+            key = (id(specie), method_name, _get_cache_key(specie_kwargs))
+            return self.values[key]
+        except TypeError:
+            # Arguments cannot be used as a key (e.g. arrays)
+            return _force_pass_arguments(getattr(specie, method_name),
+                                         **specie_kwargs)
+        except KeyError:
+            pass
+        method = getattr(specie, method_name)
+        quantity = _force_pass_arguments(method, **specie_kwargs)
+        self.values[key] = quantity
+        self._species[id(specie)] = specie
+        self._set_batch_quantities(specie=specie,
+                                   method_name=method_name,
+                                   specie_kwargs=specie_kwargs,
+                                   quantity=quantity)
+        return quantity
+
+    def _set_batch_quantities(self, specie, method_name, specie_kwargs,
+                              quantity):
+        """Evaluates the quantity for all the conditions at once and stores
+        the values. Nothing is stored if the species does not support arrays
+        or the values do not match the quantity calculated one condition at a
+        time.
+
+        Parameters
+        ----------
+            specie : pmutt specie object
+                Species to evaluate
+            method_name : str
+                Name of the method to calculate the quantity
+            specie_kwargs : dict
+                Arguments for the method at the current condition
+            quantity : float
+                Quantity at the current condition
+        """
+        if self._batch_keys is None \
+           or (id(specie), method_name) in self._unbatchable:
+            return
+        # Find the condition that corresponds to these arguments
+        try:
+            i = self._batch_index[tuple(specie_kwargs[key]
+                                        for key in self._batch_keys)]
+        except (KeyError, TypeError):
+            return
+
+        batch_kwargs = specie_kwargs.copy()
+        batch_kwargs.update(self._batch_values)
+        method = getattr(specie, method_name)
+        try:
+            batch_quantity = _force_pass_arguments(method, **batch_kwargs)
+            batch_quantity = np.asarray(batch_quantity, dtype=float)
+            is_valid = batch_quantity.shape == (self._n_conditions, ) \
+                and np.isclose(batch_quantity[i], quantity, rtol=1.e-9,
+                               atol=0.)
+        except Exception:
+            is_valid = False
+        if not is_valid:
+            self._unbatchable.add((id(specie), method_name))
+            return
+
+        condition_kwargs = specie_kwargs.copy()
+        for j, quantity_j in enumerate(batch_quantity):
+            for key in self._batch_keys:
+                condition_kwargs[key] = self._batch_values[key][j].item()
+            key = (id(specie), method_name,
+                   _get_cache_key(condition_kwargs))
+            self.values.setdefault(key, quantity_j.item())
+
+
+def _get_cache_key(kwargs):
+    """Converts keyword arguments to a key for
+    :class:`~pmutt.reaction._SpeciesCache`
+
+    Parameters
+    ----------
+        kwargs : dict
+            Arguments to convert
+    Returns
+    -------
+        key : frozenset
+            Hashable representation of the arguments
+    Raises
+    ------
+        TypeError
+            Raised if a value cannot be represented exactly (e.g. arrays)
+    """
+    try:
+        return frozenset(kwargs.items())
+    except TypeError:
+        # Convert nested dictionaries and lists
+        pass
+    key = []
+    for name, val in kwargs.items():
+        if isinstance(val, dict):
+            val = _get_cache_key(val)
+        elif isinstance(val, list):
+            val = tuple(val)
+        hash(val)
+        key.append((name, val))
+    return frozenset(key)
+
+
+def _get_batch_keys(conditions):
+    """Finds the arguments that change between conditions so they can be
+    passed as arrays
+
+    Parameters
+    ----------
+        conditions : list of dict or None
+            Conditions to check
+    Returns
+    -------
+        batch_keys : tuple of str or None
+            Arguments that change between conditions. None if the conditions
+            cannot be evaluated at once
+        batch_index : dict or None
+            Index of each condition using the values of ``batch_keys`` as keys
+    """
+    if conditions is None or len(conditions) < 2:
+        return (None, None)
+    keys = set(conditions[0])
+    if any(set(condition) != keys for condition in conditions[1:]):
+        return (None, None)
+    batch_keys = []
+    for key in sorted(keys):
+        vals = [condition[key] for condition in conditions]
+        try:
+            is_constant = all(val == vals[0] for val in vals[1:])
+        except ValueError:
+            # Arrays are not batched
+            return (None, None)
+        if is_constant:
+            continue
+        if not all(isinstance(val, numbers.Real) and not isinstance(val, bool)
+                   for val in vals):
+            return (None, None)
+        batch_keys.append(key)
+    if len(batch_keys) == 0:
+        return (None, None)
+    batch_index = {}
+    for i, condition in enumerate(conditions):
+        batch_index.setdefault(tuple(condition[key] for key in batch_keys), i)
+    return (tuple(batch_keys), batch_index)
+
+
+def _get_state_species(state_str, species, species_delimiter, states):
+    """Finds the species objects and stoichiometry of a reaction state. Used
+    by :meth:`~pmutt.reaction.Reactions.from_strings` to resolve each unique
+    state once.
+
+    Parameters
+    ----------
+        state_str : str
+            Reactant, product or transition state of a reaction string
+        species : dict
+            Dictionary using the names as keys
+        species_delimiter : str
+            Delimiter that separate species
+        states : dict
+            Previously resolved states using ``state_str`` as keys. Updated
+            with ``state_str`` if it was not present
+    Returns
+    -------
+        species_objs : list of ``pmutt`` species objects
+            Species in the state. A new list is returned for each call
+        stoichiometry : list of float
+            Stoichiometric coefficients. A new list is returned for each call
+    Raises
+    ------
+        KeyError
+            Raised if a species in the state is not in ``species``
+    """
+    try:
+        species_objs, stoichiometry = states[state_str]
+    except KeyError:
+        names, stoichiometry = _parse_reaction_state_cached(
+            reaction_str=state_str, species_delimiter=species_delimiter)
+        species_objs = tuple(species[name] for name in names)
+        states[state_str] = (species_objs, stoichiometry)
+    return (list(species_objs), list(stoichiometry))
+
+
 def _parse_reaction_state(reaction_str, species_delimiter='+'):
     """Takes the reactants/products state of a reaction string and parse it
     into species and stoichiometric amounts
@@ -2765,27 +3113,40 @@ def _parse_reaction_state(reaction_str, species_delimiter='+'):
         stoichiometry : list of int
             Stoichiometric coefficients
     """
-    species_str = reaction_str.split(species_delimiter)
+    species, stoichiometry = _parse_reaction_state_cached(
+        reaction_str=reaction_str, species_delimiter=species_delimiter)
+    # Return copies so callers can modify the lists without affecting cache
+    return (list(species), list(stoichiometry))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_reaction_state_cached(reaction_str, species_delimiter='+'):
+    """Cached implementation of :func:`_parse_reaction_state`. Species names
+    are interned since the same names recur throughout large mechanisms.
+
+    Parameters
+    ----------
+        reaction_str : str
+            Reactant or product state of reaction
+        species_delimiter : str
+            Delimiter that separate species. Leading and trailing spaces will
+            be trimmed. Default is '+'
+
+    Returns
+    -------
+        species : tuple of str
+            Names of the species
+        stoichiometry : tuple of float
+            Stoichiometric coefficients
+    """
     species = []
     stoichiometry = []
-    for specie in species_str:
-        # Strip spaces for easier searching
-        specie = specie.strip()
-        # Search for int and float at the start of a string.
-        # If there is no numbers, returns None.
-        stoich_search = re.search(r'^\d+\.?\d*', specie)
-        if stoich_search is None:
-            # No stoichiometric coefficient so assign 1.
-            specie = specie.strip()
-            specie_stoich = 1.
-            # species.append(specie.strip())
-            # stoichiometry.append(1.)
-        else:
-            # Stoichiometric coefficient present
-            specie_stoich = stoich_search.group()
-            trim_len = len(specie_stoich)
-            specie = specie[trim_len:].strip()
-            specie_stoich = float(specie_stoich)
+    for specie in reaction_str.split(species_delimiter):
+        # Search for int and float at the start of the stripped string. If
+        # there is no number, the stoichiometric coefficient is 1.
+        stoich_str, specie = _SPECIE_PATTERN.match(specie.strip()).groups()
+        specie = sys.intern(specie)
+        specie_stoich = 1. if stoich_str is None else float(stoich_str)
         # If the specie already exists, add its coefficient to existing amount.
         # Otherwise, append the new specie and its stoichiometry
         try:
@@ -2795,7 +3156,7 @@ def _parse_reaction_state(reaction_str, species_delimiter='+'):
             stoichiometry.append(specie_stoich)
         else:
             stoichiometry[i] += specie_stoich
-    return (species, stoichiometry)
+    return (tuple(species), tuple(stoichiometry))
 
 
 def _parse_reaction(reaction_str,
@@ -2858,6 +3219,28 @@ def _parse_reaction(reaction_str,
             transition_state, transition_state_stoich)
 
 
+def _is_close(a, b, rtol=1.e-5, atol=1.e-8):
+    """Scalar version of ``numpy.isclose`` that avoids the overhead of
+    creating arrays
+
+    Parameters
+    ----------
+        a : float
+            Value to compare
+        b : float
+            Reference value
+        rtol : float, optional
+            Relative tolerance. Default is 1e-5
+        atol : float, optional
+            Absolute tolerance. Default is 1e-8
+    Returns
+    -------
+        is_close : bool
+            True if ``a`` is within the tolerance of ``b``
+    """
+    return abs(a - b) <= atol + rtol*abs(b)
+
+
 def _write_reaction_state(species,
                           stoich,
                           species_delimiter='+',
@@ -2894,11 +3277,11 @@ def _write_reaction_state(species,
     for i, (specie, stoich_val) in enumerate(zip(species, stoich)):
         specie_key = getattr(specie, key)
         # If the coefficient is 1, just write the specie name
-        if np.isclose(stoich_val, 1.):
+        if _is_close(stoich_val, 1.):
             specie_str = specie_key
         else:
             # If the value is close to an integer, remove the decimal point
-            if np.isclose(stoich_val, round(stoich_val)):
+            if _is_close(stoich_val, round(stoich_val)):
                 stoich_val = int(stoich_val)
             else:
                 # Otherwise, use the float format specified earlier
@@ -1,16 +1,17 @@
 import heapq
 import itertools as itools
+import numbers
 from copy import copy
 
-import networkx as nx
 import numpy as np
-import pygal
-from matplotlib import pyplot as plt
-from scipy import interpolate
 
-from pmutt import _force_pass_arguments, _get_specie_kwargs, _is_iterable
+from pmutt import (_force_pass_arguments, _get_specie_kwargs, _is_iterable,
+                   _LazyModule, plt, pygal)
+from pmutt import constants as c
 from pmutt.reaction import (Reactions, _parse_reaction_state,
-                            _write_reaction_state)
+                            _write_reaction_state, interpolate)
+
+nx = _LazyModule('networkx')
 
 
 class Network(Reactions):
@@ -35,13 +36,17 @@ class Network(Reactions):
             - species
             - stoich
             - is_transition_state
+            - n_reactions (number of reactions referencing the state)
     """
     def __init__(self, reactions):
         super().__init__(reactions=reactions)
         self.update_network()
 
     def update_network(self, include_TS=True, key='name'):
-        """Updates the reaction network
+        """Rebuilds the reaction network from ``reactions``. Use
+        :meth:`~pmutt.reaction.network.Network.add_reaction` and
+        :meth:`~pmutt.reaction.network.Network.remove_reaction` to modify the
+        network without rebuilding it.
 
         Parameters
         ----------
@@ -52,23 +57,97 @@ class Network(Reactions):
                 Default is name
         """
         self.graph = nx.Graph()
-        for reaction in self.reactions:
-            states = [reaction.reactants, reaction.products]
-            states_stoich = [
-                reaction.reactants_stoich, reaction.products_stoich
-            ]
+        self._reaction_nodes = [
+            self._add_reaction_nodes(reaction) for reaction in self.reactions
+        ]
+        # Finds reactions to remove without searching ``reactions``
+        self._reaction_indices = {
+            id(reaction): i for i, reaction in enumerate(self.reactions)
+        }
+
+    def add_reaction(self, reaction):
+        """Adds a reaction to the network. Only the states and edges of
+        ``reaction`` are added to ``graph`` so the cost does not depend on the
+        size of the network.
+
+        Parameters
+        ----------
+            reaction : :class:`~pmutt.reaction.Reaction` object
+                Reaction to add
+        """
+        self._reaction_indices[id(reaction)] = len(self.reactions)
+        self.reactions.append(reaction)
+        self._reaction_nodes.append(self._add_reaction_nodes(reaction))
+
+    def remove_reaction(self, reaction):
+        """Removes a reaction from the network. Edges and states that are no
+        longer referenced by any reaction are removed from ``graph``. The last
+        reaction in ``reactions`` takes the place of the removed reaction so
+        the cost does not depend on the size of the network.
+
+        Parameters
+        ----------
+            reaction : :class:`~pmutt.reaction.Reaction` object or int
+                Reaction to remove, or its index in ``reactions``
+        Raises
+        ------
+            ValueError
+                Raised if ``reaction`` is not in the network
+            IndexError
+                Raised if the index is out of range
+        """
+        if isinstance(reaction, numbers.Integral):
+            # Also converts negative indices
+            i = range(len(self.reactions))[reaction]
+        else:
+            try:
+                i = self._reaction_indices[id(reaction)]
+            except KeyError:
+                err_msg = 'Reaction {} is not in the network.'.format(
+                    reaction)
+                raise ValueError(err_msg) from None
+        removed_reaction = self.reactions[i]
+        removed_nodes = self._reaction_nodes[i]
+        if self._reaction_indices.get(id(removed_reaction)) == i:
+            del self._reaction_indices[id(removed_reaction)]
+        last_reaction = self.reactions.pop()
+        last_nodes = self._reaction_nodes.pop()
+        if i < len(self.reactions):
+            self.reactions[i] = last_reaction
+            self._reaction_nodes[i] = last_nodes
+            self._reaction_indices[id(last_reaction)] = i
+        self._remove_reaction_nodes(removed_nodes)
 
-            # Add transition state if available
-            if reaction.transition_state is not None:
-                states.append(reaction.transition_state)
-                states_stoich.append(reaction.transition_state_stoich)
+    def _add_reaction_nodes(self, reaction):
+        """Adds the states and edges of a reaction to ``graph``. Nodes and
+        edges keep count of the reactions referencing them.
 
-            # Add nodes
-            state_sets = []
-            for i, (state, stoich) in enumerate(zip(states, states_stoich)):
-                species_set = state_to_set(state, stoich)
-                state_sets.append(species_set)
+        Parameters
+        ----------
+            reaction : :class:`~pmutt.reaction.Reaction` object
+                Reaction to add
+        Returns
+        -------
+            state_sets : tuple of frozenset
+                Nodes corresponding to the reactants, products and transition
+                state (if present)
+        """
+        states = [reaction.reactants, reaction.products]
+        states_stoich = [reaction.reactants_stoich, reaction.products_stoich]
 
+        # Add transition state if available
+        if reaction.transition_state is not None:
+            states.append(reaction.transition_state)
+            states_stoich.append(reaction.transition_state_stoich)
+
+        # Add nodes
+        state_sets = []
+        for i, (state, stoich) in enumerate(zip(states, states_stoich)):
+            species_set = state_to_set(state, stoich)
+            state_sets.append(species_set)
+            try:
+                self.graph.nodes[species_set]['n_reactions'] += 1
+            except KeyError:
                 # Transition states occupy index 2 of states
                 is_transition_state = (i == 2)
                 self.graph.add_node(species_set,
@@ -76,13 +155,61 @@ class Network(Reactions):
                                     stoich=stoich,
                                     is_transition_state=is_transition_state,
                                     name=_write_reaction_state(species=state,
-                                                               stoich=stoich))
-            # Add edges
-            if reaction.transition_state is None:
-                self.graph.add_edge(state_sets[0], state_sets[1])
-            else:
-                self.graph.add_edge(state_sets[0], state_sets[2])
-                self.graph.add_edge(state_sets[1], state_sets[2])
+                                                               stoich=stoich),
+                                    n_reactions=1)
+        state_sets = tuple(state_sets)
+
+        # Add edges
+        for node1, node2 in _get_reaction_edges(state_sets):
+            try:
+                self.graph.edges[node1, node2]['n_reactions'] += 1
+            except KeyError:
+                self.graph.add_edge(node1, node2, n_reactions=1)
+        return state_sets
+
+    def _remove_reaction_nodes(self, state_sets):
+        """Removes the states and edges of a reaction from ``graph`` if they
+        are not referenced by other reactions.
+
+        Parameters
+        ----------
+            state_sets : tuple of frozenset
+                Nodes corresponding to the reactants, products and transition
+                state (if present)
+        """
+        for node1, node2 in _get_reaction_edges(state_sets):
+            edge_data = self.graph.edges[node1, node2]
+            edge_data['n_reactions'] -= 1
+            if edge_data['n_reactions'] == 0:
+                self.graph.remove_edge(node1, node2)
+        for node in state_sets:
+            node_data = self.graph.nodes[node]
+            node_data['n_reactions'] -= 1
+            if node_data['n_reactions'] == 0:
+                self.graph.remove_node(node)
+
+    def get_G_nodes(self, units=None, **kwargs):
+        """Gets the Gibbs energy of every state in the network. The energies
+        are also stored as the ``G`` attribute of the nodes.
+
+        Parameters
+        ----------
+            units : str, optional
+                Units as string. See :func:`~pmutt.constants.R` for accepted
+                units but omit the '/K' (e.g. J/mol). If not specified, the
+                dimensionless Gibbs energy is calculated
+            kwargs : keyword arguments
+                Parameters to evaluate Gibbs energy at each state.
+        Returns
+        -------
+            G : dict
+                Gibbs energy of each state where the keys are the nodes
+        """
+        for node, node_data in self.graph.nodes(data=True):
+            node_data['G'] = _get_G_state(node_data=node_data,
+                                          units=units,
+                                          **kwargs)
+        return nx.get_node_attributes(self.graph, 'G')
 
     def get_min_E_span(self,
                        source,
@@ -90,10 +217,50 @@ class Network(Reactions):
                        units=None,
                        species_delimiter='+',
                        cutoff=None,
+                       return_path=False,
                        **kwargs):
+        """Gets the minimum energy span of the pathways connecting ``source``
+        to ``target``. Node energies are calculated once using
+        :meth:`~pmutt.reaction.network.Network.get_G_nodes` and the pathways
+        are explored using a branch-and-bound search so pathways that cannot
+        improve the energy span are discarded without being enumerated.
+
+        Parameters
+        ----------
+            source : str
+                Initial state as string. All pathways will start here.
+            target : str or list of str
+                Final state as string. All pathways will end here
+            units : str, optional
+                Units as string. See :func:`~pmutt.constants.R` for accepted
+                units but omit the '/K' (e.g. J/mol). If not specified, the
+                dimensionless energy span is calculated
+            species_delimiter : str, optional
+                Delimiter that separate species for target and source.
+                Leading and trailing spaces will be trimmed. Default is '+'
+            cutoff : int, optional
+                Maximum number of edges in the pathway. If not specified,
+                all pathways are considered
+            return_path : bool, optional
+                If True, the pathway with the minimum energy span is also
+                returned. Default is False
+            kwargs : keyword arguments
+                Parameters to evaluate Gibbs energy at each state.
+        Returns
+        -------
+            E_span : float
+                Minimum energy span
+            path : list
+                Nodes of the pathway with the minimum energy span. Only
+                returned if ``return_path`` is True
+        Raises
+        ------
+            ValueError
+                Raised if no pathway connects ``source`` to ``target``
+        """
         # Convert target and source strings to sets
         if source is None:
-            source_set = set()
+            source_set = frozenset()
         else:
             source_names, source_stoich = _parse_reaction_state(
                 reaction_str=source, species_delimiter=species_delimiter)
@@ -102,13 +269,19 @@ class Network(Reactions):
 
         target_sets = _get_target_sets(target=target,
                                        species_delimiter=species_delimiter)
-        E_spans = []
-        for path in nx.all_simple_paths(self.graph,
-                                        source=source_set,
-                                        target=target_sets,
-                                        cutoff=cutoff):
-            E_spans.append(self.get_E_span(path=path, units=units, **kwargs))
-        return np.amin(E_spans)
+        G = self.get_G_nodes(units=units, **kwargs)
+        E_span, path = _get_min_E_span_path(graph=self.graph,
+                                            G=G,
+                                            source=source_set,
+                                            targets=target_sets,
+                                            cutoff=cutoff)
+        if path is None:
+            err_msg = ('No pathway found between {} and {}.'
+                       ''.format(source, target))
+            raise ValueError(err_msg)
+        if return_path:
+            return (E_span, path)
+        return E_span
 
     def get_E_span(self, path, units=None, **kwargs):
         """Gets the energy span of a set of reactions. Equations sourced from
@@ -144,32 +317,134 @@ class Network(Reactions):
                 Energy span of the pathway
         """
         # Get Gibbs energy for each state along path
-        G = []
-        for state in path:
-            species = self.graph.nodes[state]['species']
-            stoich = self.graph.nodes[state]['stoich']
-            if units is None:
-                G.append(
-                    get_state_quantity(species=species,
-                                       stoich=stoich,
-                                       method_name='get_GoRT',
-                                       **kwargs))
-            else:
-                G.append(
-                    get_state_quantity(species=species,
-                                       stoich=stoich,
-                                       method_name='get_G',
-                                       units=units,
-                                       **kwargs))
-        # Get indices for TDI and TDTS
-        min_i = np.argmin(G)
-        max_i = np.argmax(G)
-
-        energy_span = G[max_i] - G[min_i]
-        # If the TDTS is before the TDI, add the Gibbs change of the cycle
-        if max_i < min_i:
-            energy_span += G[-1] - G[0]
-        return energy_span
+        G = [_get_G_state(node_data=self.graph.nodes[state],
+                          units=units,
+                          **kwargs) for state in path]
+        return _get_E_span(G)
+
+    def get_E_span_sweep(self,
+                         T,
+                         source=None,
+                         target=None,
+                         path=None,
+                         P=None,
+                         units=None,
+                         species_delimiter='+',
+                         cutoff=None,
+                         **kwargs):
+        """Calculates the energy span, TOF-determining intermediate (TDI),
+        TOF-determining transition state (TDTS) and energetic span turnover
+        frequency over a range of conditions. Each species is evaluated once
+        over all the conditions instead of once per condition. The energetic
+        span TOF is calculated using:
+
+        :math:`TOF = \\frac{k_bT}{h}\\exp\\bigg(-\\frac{\\delta E}{RT}
+        \\bigg)`
+
+        Parameters
+        ----------
+            T : (N,) np.ndarray
+                Temperatures in K
+            source : str, optional
+                Initial state as string. Required if ``path`` is not specified
+            target : str or list of str, optional
+                Final state as string. Required if ``path`` is not specified
+            path : list, optional
+                Nodes of the pathway to evaluate. If not specified, the pathway
+                with the minimum energy span connecting ``source`` and
+                ``target`` is found at each condition
+            P : float or (N,) np.ndarray, optional
+                Pressures in bar. If not specified, the species' default
+                pressure is used
+            units : str, optional
+                Units as string. See :func:`~pmutt.constants.R` for accepted
+                units but omit the '/K' (e.g. J/mol). If not specified, the
+                dimensionless energy span is calculated
+            species_delimiter : str, optional
+                Delimiter that separate species for target and source.
+                Leading and trailing spaces will be trimmed. Default is '+'
+            cutoff : int, optional
+                Maximum number of edges in the pathway. Only used if ``path``
+                is not specified
+            kwargs : keyword arguments
+                Parameters to evaluate Gibbs energy at each state.
+        Returns
+        -------
+            E_span : (N,) np.ndarray
+                Energy span at each condition
+            TDI : (N,) np.ndarray of str
+                Name of the TOF-determining intermediate at each condition
+            TDTS : (N,) np.ndarray of str
+                Name of the TOF-determining transition state at each condition
+            TOF : (N,) np.ndarray
+                Energetic span turnover frequency in 1/s at each condition
+        Raises
+        ------
+            ValueError
+                Raised if neither ``path`` nor ``source`` and ``target`` are
+                specified, or if no pathway connects ``source`` to ``target``
+        """
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        if P is not None:
+            T, kwargs['P'] = np.broadcast_arrays(T, np.asarray(P, dtype=float))
+        # Only the states along the pathway are needed if it is specified
+        if path is None:
+            nodes = list(self.graph.nodes)
+        else:
+            nodes = list(path)
+        G_nodes = _get_G_nodes_sweep(graph=self.graph,
+                                     nodes=nodes,
+                                     units=units,
+                                     T=T,
+                                     **kwargs)
+
+        if path is not None:
+            paths = [path] * len(T)
+            G_paths = [G_nodes] * len(T)
+        else:
+            if source is None or target is None:
+                err_msg = ('Either path or both source and target must be '
+                           'specified.')
+                raise ValueError(err_msg)
+            source_names, source_stoich = _parse_reaction_state(
+                reaction_str=source, species_delimiter=species_delimiter)
+            source_set = state_str_to_set(species_names=source_names,
+                                          stoich=source_stoich)
+            target_sets = _get_target_sets(target=target,
+                                           species_delimiter=species_delimiter)
+            paths = []
+            G_paths = []
+            for j in range(len(T)):
+                G = dict(zip(nodes, G_nodes[:, j]))
+                _, path_j = _get_min_E_span_path(graph=self.graph,
+                                                 G=G,
+                                                 source=source_set,
+                                                 targets=target_sets,
+                                                 cutoff=cutoff)
+                if path_j is None:
+                    err_msg = ('No pathway found between {} and {}.'
+                               ''.format(source, target))
+                    raise ValueError(err_msg)
+                paths.append(path_j)
+                G_paths.append(np.array([G[node] for node in path_j]))
+
+        E_span = np.zeros_like(T)
+        TDI = []
+        TDTS = []
+        for j, (path_j, G_path) in enumerate(zip(paths, G_paths)):
+            if G_path.ndim == 2:
+                G_path = G_path[:, j]
+            E_span[j] = _get_E_span(G_path)
+            TDI.append(self.graph.nodes[path_j[np.argmin(G_path)]]['name'])
+            TDTS.append(self.graph.nodes[path_j[np.argmax(G_path)]]['name'])
+
+        # Convert energy span to dimensionless form to calculate the TOF
+        if units is None:
+            E_spanoRT = E_span
+        else:
+            E_spanoRT = E_span / (c.R('{}/K'.format(units)) * T)
+        TOF = c.kb('J/K') * T / c.h('J s') * np.exp(-E_spanoRT)
+        return (E_span, np.array(TDI), np.array(TDTS), TOF)
 
     def plot_network(self,
                      layout='kamada_kawai_layout',
@@ -658,7 +933,7 @@ def state_to_set(species, stoich):
 def _get_target_sets(target, species_delimiter='+'):
     target_sets = []
     if target is None:
-        target_sets.append(set())
+        target_sets.append(frozenset())
     else:
         if not _is_iterable(target):
             target = [target]
@@ -693,3 +968,443 @@ def get_state_quantity(species, stoich, method_name, **kwargs):
             state_quantity += \
                     _force_pass_arguments(method, **specie_kwargs)*coeff
     return state_quantity
+
+
+def _get_quantity_sweep(obj, method_name, T, **kwargs):
+    """Evaluates a method over a range of conditions. The method is called
+    once using arrays. If the method does not support arrays, it is called
+    once per condition.
+
+    Parameters
+    ----------
+        obj : pmutt object
+            Object to evaluate
+        method_name : str
+            Name of the method
+        T : (N,) np.ndarray
+            Temperatures in K
+        kwargs : keyword arguments
+            Other parameters passed to the method. If ``P`` is an array, it
+            must have the same shape as ``T``
+    Returns
+    -------
+        quantity : (N,) np.ndarray
+            Quantity at each condition
+    """
+    method = getattr(obj, method_name)
+    try:
+        quantity = np.asarray(_force_pass_arguments(method, T=T, **kwargs),
+                              dtype=float)
+    except (TypeError, ValueError):
+        quantity = None
+    # Models that do not support arrays either raise an error or reduce the
+    # array to a different shape
+    if quantity is None or quantity.shape != T.shape:
+        P = kwargs.get('P', None)
+        quantity = np.zeros_like(T)
+        for i, T_i in enumerate(T):
+            if np.ndim(P) > 0:
+                kwargs['P'] = P[i]
+            quantity[i] = _force_pass_arguments(method, T=T_i, **kwargs)
+    return quantity
+
+
+def _get_G_nodes_sweep(graph, nodes, T, units=None, **kwargs):
+    """Calculates the Gibbs energy of nodes over a range of conditions. Each
+    species is evaluated once and the node energies are assembled from the
+    species energies.
+
+    Parameters
+    ----------
+        graph : networkx.Graph object
+            Reaction network
+        nodes : list of frozenset
+            Nodes to evaluate
+        T : (N,) np.ndarray
+            Temperatures in K
+        units : str, optional
+            Units as string. If not specified, the dimensionless Gibbs energy
+            is calculated
+        kwargs : keyword arguments
+            Parameters to evaluate Gibbs energy at each state.
+    Returns
+    -------
+        G_nodes : (M, N) np.ndarray
+            Gibbs energy of each node at each condition
+    """
+    G_species = {}
+    G_nodes = np.zeros((len(nodes), len(T)))
+    for i, node in enumerate(nodes):
+        node_data = graph.nodes[node]
+        for specie, coeff in zip(node_data['species'], node_data['stoich']):
+            try:
+                G_specie = G_species[id(specie)]
+            except KeyError:
+                specie_kwargs = _get_specie_kwargs(specie.name, **kwargs)
+                if units is None:
+                    G_specie = _get_quantity_sweep(obj=specie,
+                                                   method_name='get_GoRT',
+                                                   T=T,
+                                                   **specie_kwargs)
+                else:
+                    G_specie = _get_quantity_sweep(obj=specie,
+                                                   method_name='get_G',
+                                                   T=T,
+                                                   units=units,
+                                                   **specie_kwargs)
+                G_species[id(specie)] = G_specie
+            G_nodes[i] += G_specie * coeff
+    return G_nodes
+
+
+def _get_reaction_edges(state_sets):
+    """Gets the edges formed by a reaction
+
+    Parameters
+    ----------
+        state_sets : tuple of frozenset
+            Nodes corresponding to the reactants, products and transition
+            state (if present)
+    Returns
+    -------
+        edges : tuple of tuple
+            Pairs of nodes connected by the reaction
+    """
+    if len(state_sets) == 2:
+        return ((state_sets[0], state_sets[1]), )
+    return ((state_sets[0], state_sets[2]), (state_sets[1], state_sets[2]))
+
+
+def _get_G_state(node_data, units=None, **kwargs):
+    """Calculates the Gibbs energy of a state
+
+    Parameters
+    ----------
+        node_data : dict
+            Attributes of the node. Must have the ``species`` and ``stoich``
+            keys
+        units : str, optional
+            Units as string. If not specified, the dimensionless Gibbs energy
+            is calculated
+        kwargs : keyword arguments
+            Parameters to evaluate Gibbs energy at the state.
+    Returns
+    -------
+        G : float
+            Gibbs energy of the state
+    """
+    if units is None:
+        return get_state_quantity(species=node_data['species'],
+                                  stoich=node_data['stoich'],
+                                  method_name='get_GoRT',
+                                  **kwargs)
+    return get_state_quantity(species=node_data['species'],
+                              stoich=node_data['stoich'],
+                              method_name='get_G',
+                              units=units,
+                              **kwargs)
+
+
+def _get_E_span(G):
+    """Calculates the energy span of a pathway
+
+    Parameters
+    ----------
+        G : list of float
+            Gibbs energy of each state along the pathway
+    Returns
+    -------
+        E_span : float
+            Energy span of the pathway
+    """
+    # Get indices for TDI and TDTS
+    min_i = np.argmin(G)
+    max_i = np.argmax(G)
+
+    energy_span = G[max_i] - G[min_i]
+    # If the TDTS is before the TDI, add the Gibbs change of the cycle
+    if max_i < min_i:
+        energy_span += G[-1] - G[0]
+    return energy_span
+
+
+def _get_bottleneck_energies(graph, G, targets, maximize=False):
+    """Calculates the bottleneck energy required to reach any of the targets
+    from every node.
+
+    Parameters
+    ----------
+        graph : networkx.Graph object
+            Reaction network
+        G : dict
+            Gibbs energy of each node
+        targets : set of frozenset
+            Final nodes
+        maximize : bool, optional
+            If False, calculates the lowest possible maximum energy along a
+            pathway to the targets (minimax). If True, calculates the highest
+            possible minimum energy along a pathway to the targets (maximin).
+            Default is False
+    Returns
+    -------
+        G_bottleneck : dict
+            Bottleneck energy of each node that can reach the targets
+        next_nodes : dict
+            Next node along the bottleneck pathway. Targets map onto None
+    """
+    sign = -1. if maximize else 1.
+    G_bottleneck = {}
+    next_nodes = {}
+    queue = []
+    # Breaks ties between equal energies so nodes are never compared
+    counter = itools.count()
+    for target in targets:
+        heapq.heappush(queue, (sign * G[target], next(counter), target, None))
+    while queue:
+        G_node, _, node, next_node = heapq.heappop(queue)
+        if node in G_bottleneck:
+            continue
+        G_bottleneck[node] = sign * G_node
+        next_nodes[node] = next_node
+        for neighbor in graph[node]:
+            if neighbor in G_bottleneck:
+                continue
+            G_neighbor = max(sign * G[neighbor], G_node)
+            heapq.heappush(queue,
+                           (G_neighbor, next(counter), neighbor, node))
+    return (G_bottleneck, next_nodes)
+
+
+def _get_min_width_path(graph, G, source, targets):
+    """Finds the pathway whose highest and lowest energies are closest
+    together. Energy windows are widened until ``source`` is connected to one
+    of the ``targets`` by nodes inside the window.
+
+    Parameters
+    ----------
+        graph : networkx.Graph object
+            Reaction network
+        G : dict
+            Gibbs energy of each node
+        source : frozenset
+            Initial node
+        targets : set of frozenset
+            Final nodes
+    Returns
+    -------
+        width : float
+            Difference between the highest and lowest energy of the pathway.
+            Returns np.inf if no pathway was found
+        path : list
+            Nodes of the pathway. Returns None if no pathway was found
+    """
+    # Work with node indices sorted by energy so nodes inside a window are a
+    # contiguous range of indices
+    nodes = sorted(G, key=G.__getitem__)
+    indices = {node: i for i, node in enumerate(nodes)}
+    G_sorted = [G[node] for node in nodes]
+    adjacency = [[indices[neighbor] for neighbor in graph[node]]
+                 for node in nodes]
+    is_source = [node == source for node in nodes]
+    is_target = [node in targets for node in nodes]
+    G_upper = max(G[source], min(G[target] for target in targets))
+    G_lower = min(G[source], max(G[target] for target in targets))
+
+    # Union-find arrays. Only entries inside the current window are used so
+    # they do not need to be reset between windows
+    parents = list(range(len(nodes)))
+    has_source = [False] * len(nodes)
+    has_target = [False] * len(nodes)
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    best_width = np.inf
+    best_window = None
+    # Lower limits are tried in descending order so the minimum possible
+    # width grows monotonically
+    for i in range(np.searchsorted(G_sorted, G_lower, side='right') - 1, -1,
+                   -1):
+        G_low = G_sorted[i]
+        if G_upper - G_low >= best_width:
+            break
+        for j in range(i, len(nodes)):
+            G_high = G_sorted[j]
+            if G_high - G_low >= best_width:
+                break
+            parents[j] = j
+            has_source[j] = is_source[j]
+            has_target[j] = is_target[j]
+            for k in adjacency[j]:
+                if k < i or k >= j:
+                    continue
+                root_j = find(j)
+                root_k = find(k)
+                if root_j != root_k:
+                    parents[root_k] = root_j
+                    has_source[root_j] |= has_source[root_k]
+                    has_target[root_j] |= has_target[root_k]
+            root_j = find(j)
+            if has_source[root_j] and has_target[root_j]:
+                best_width = G_high - G_low
+                best_window = (G_low, G_high)
+                break
+    if best_window is None:
+        return (np.inf, None)
+
+    # Find a pathway that stays inside the window
+    G_low, G_high = best_window
+    window = graph.subgraph(node for node, G_node in G.items()
+                            if G_low <= G_node <= G_high)
+    paths = nx.single_source_shortest_path(window, source=source)
+    path = min((paths[target] for target in targets if target in paths),
+               key=len)
+    return (best_width, path)
+
+
+def _get_min_E_span_path(graph, G, source, targets, cutoff=None):
+    """Finds the simple pathway with the minimum energy span using a
+    depth-first branch-and-bound search.
+
+    The highest (TDTS) and lowest (TDI) energies of a partial pathway can only
+    become more extreme as the pathway grows. They are also bounded by the
+    minimax and maximin energies needed to reach a target from the last node.
+    Using these bounds, the energy span of any completed pathway is at least:
+
+    :math:`\\min(G_{max} - G_{min}, \\max(G_{max} - G_{source},
+    G_{max} - G_{min} + G_{target, min} - G_{source}))`
+
+    Partial pathways whose bound is not lower than the best energy span found
+    so far are discarded.
+
+    Parameters
+    ----------
+        graph : networkx.Graph object
+            Reaction network
+        G : dict
+            Gibbs energy of each node
+        source : frozenset
+            Initial node
+        targets : list of frozenset
+            Final nodes
+        cutoff : int, optional
+            Maximum number of edges in the pathway. If not specified, no limit
+            is imposed
+    Returns
+    -------
+        E_span : float
+            Minimum energy span. Returns np.inf if no pathway was found
+        path : list
+            Nodes of the pathway with the minimum energy span. Returns None if
+            no pathway was found
+    """
+    targets = set(target for target in targets if target in G)
+    if source not in G or len(targets) == 0:
+        return (np.inf, None)
+    if cutoff is None:
+        cutoff = len(G)
+    G_source = G[source]
+    G_target_min = min(G[target] for target in targets)
+
+    # Lowest maximum and highest minimum energies to reach a target
+    G_max_bound, next_max = _get_bottleneck_energies(graph=graph,
+                                                     G=G,
+                                                     targets=targets)
+    G_min_bound, next_min = _get_bottleneck_energies(graph=graph,
+                                                     G=G,
+                                                     targets=targets,
+                                                     maximize=True)
+    if source not in G_max_bound:
+        return (np.inf, None)
+    # No pathway can have an energy span lower than the narrowest energy
+    # window connecting the source and targets, adjusted by the most
+    # exergonic target
+    min_width, min_width_path = _get_min_width_path(graph=graph,
+                                                    G=G,
+                                                    source=source,
+                                                    targets=targets)
+    global_lower_bound = min_width + min(G_target_min - G_source, 0.)
+
+    def get_lower_bound(G_max, G_min):
+        return min(
+            G_max - G_min,
+            max(G_max - G_source, G_max - G_min + G_target_min - G_source))
+
+    # Use the narrowest, bottleneck and shortest pathways to seed the upper
+    # bound
+    seed_paths = [min_width_path]
+    for next_nodes in (next_max, next_min):
+        path = [source]
+        while next_nodes[path[-1]] is not None:
+            path.append(next_nodes[path[-1]])
+        seed_paths.append(path)
+    shortest_paths = nx.single_source_shortest_path(graph,
+                                                    source=source,
+                                                    cutoff=cutoff)
+    seed_paths.extend(shortest_paths[target] for target in targets
+                      if target in shortest_paths)
+    best_E_span = np.inf
+    best_path = None
+    for path in seed_paths:
+        if len(path) < 2 or len(path) > cutoff + 1:
+            continue
+        E_span = _get_E_span([G[node] for node in path])
+        if E_span < best_E_span:
+            best_E_span = E_span
+            best_path = path
+
+    # Only consider nodes that can reach a target. Explore nodes with low
+    # bottleneck energies first to tighten the upper bound quickly
+    neighbors = {
+        node: sorted((neighbor for neighbor in graph[node]
+                      if neighbor in G_max_bound),
+                     key=G_max_bound.__getitem__)
+        for node in G_max_bound
+    }
+    path = [source]
+    in_path = set(path)
+    # Each element is (G_max, G_min, whether G_max occurs before G_min)
+    extrema = [(G_source, G_source, False)]
+    stack = [iter(neighbors[source])]
+    while stack and best_E_span > global_lower_bound:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            extrema.pop()
+            in_path.discard(path.pop())
+            continue
+        if node in in_path:
+            continue
+
+        G_max, G_min, max_first = extrema[-1]
+        G_node = G[node]
+        if G_node > G_max:
+            G_max = G_node
+            max_first = False
+        elif G_node < G_min:
+            G_min = G_node
+            max_first = True
+        lower_bound = get_lower_bound(
+            G_max=max(G_max, G_max_bound[node]),
+            G_min=min(G_min, G_min_bound[node]))
+        if lower_bound >= best_E_span:
+            continue
+
+        if node in targets:
+            E_span = G_max - G_min
+            if max_first:
+                E_span += G_node - G_source
+            if E_span < best_E_span:
+                best_E_span = E_span
+                best_path = path + [node]
+
+        # Extend the pathway if it is allowed to be longer
+        if len(path) < cutoff:
+            path.append(node)
+            in_path.add(node)
+            extrema.append((G_max, G_min, max_first))
+            stack.append(iter(neighbors[node]))
+    return (best_E_span, best_path)
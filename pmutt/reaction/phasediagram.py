@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
-import matplotlib
 import numpy as np
-from matplotlib import pyplot as plt
 
+from pmutt import _LazyModule, plt
 from pmutt import constants as c
 from pmutt.io.json import json_to_pmutt, remove_class
 from pmutt.reaction import Reactions
 
+matplotlib = _LazyModule('matplotlib')
+
 
 class PhaseDiagram(Reactions):
     """Generate phase diagrams based on reactions specified. Inherits from
@@ -21,7 +21,18 @@ from pmutt.statmech import elec, rot, trans, vib
 
 class EmptyMode(_ModelBase):
     """Placeholder mode that returns 1 for partition function and
-    0 for all functions other thermodynamic properties."""
+    0 for all functions other thermodynamic properties. All instances are
+    the same object."""
+    __slots__ = ()
+
+    def __new__(cls):
+        # Empty modes do not have attributes so a single instance is shared
+        try:
+            return cls.__dict__['_shared_instance']
+        except KeyError:
+            obj = super().__new__(cls)
+            cls._shared_instance = obj
+            return obj
 
     def __init__(self):
         pass
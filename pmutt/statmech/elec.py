@@ -33,6 +33,8 @@ class GroundStateElec(_ModelBase):
 
     .. _`ase.Atoms`: https://wiki.fysik.dtu.dk/ase/ase/atoms.html#ase.Atoms
     """
+    __slots__ = ('potentialenergy', 'D0', '_spin', '_degeneracy')
+
     def __init__(self, potentialenergy=None, spin=0., atoms=None, D0=None):
         # If the potentialenergy was not specified, calculate from atoms object
         if potentialenergy is None:
@@ -5,7 +5,19 @@ from pmutt.io.json import remove_class
 
 class EmptyNucl(_ModelBase):
     """Nuclear modes. Assumes no change in any chemical reaction and hence
-    does not affect thermodynamic quantities."""
+    does not affect thermodynamic quantities. All instances are the same
+    object."""
+    __slots__ = ()
+
+    def __new__(cls):
+        # Empty modes do not have attributes so a single instance is shared
+        try:
+            return cls.__dict__['_shared_instance']
+        except KeyError:
+            obj = super().__new__(cls)
+            cls._shared_instance = obj
+            return obj
+
     def __init__(self):
         pass
 
@@ -58,6 +58,8 @@ class RigidRotor(_ModelBase):
 
     .. _`ase.Atoms`: https://wiki.fysik.dtu.dk/ase/ase/atoms.html#ase.Atoms
     """
+    __slots__ = ('symmetrynumber', 'rot_temperatures', 'geometry')
+
     def __init__(self,
                  symmetrynumber,
                  rot_temperatures=None,
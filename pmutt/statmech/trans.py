@@ -26,6 +26,8 @@ class FreeTrans(_ModelBase):
 
     .. _`ase.Atoms`: https://wiki.fysik.dtu.dk/ase/ase/atoms.html#ase.Atoms
     """
+    __slots__ = ('n_degrees', 'molecular_weight')
+
     def __init__(self, n_degrees=3, molecular_weight=None, atoms=None):
         self.n_degrees = n_degrees
         if molecular_weight is None and atoms is not None:
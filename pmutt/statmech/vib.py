@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.integrate import quad
 
-from pmutt import _ModelBase
+from pmutt import _LazyModule, _ModelBase
 from pmutt import constants as c
 from pmutt.io.json import remove_class
 
+special = _LazyModule('scipy.special')
+
 
 class HarmonicVib(_ModelBase):
     """Vibrational modes using the harmonic approximation. Equations used
@@ -24,6 +27,9 @@ class HarmonicVib(_ModelBase):
             this value for calculations. Otherwise, imaginary frequencies are
             ignored. Default is None
     """
+    __slots__ = ('imaginary_substitute', '_vib_wavenumbers',
+                 '_valid_vib_temperatures')
+
     def __init__(self, vib_wavenumbers=[], imaginary_substitute=None):
         self.imaginary_substitute = imaginary_substitute
         self.vib_wavenumbers = np.array(vib_wavenumbers)
@@ -35,10 +41,11 @@ class HarmonicVib(_ModelBase):
     @vib_wavenumbers.setter
     def vib_wavenumbers(self, val):
         self._vib_wavenumbers = val
-        self._valid_vib_wavenumbers = _get_valid_vib_wavenumbers(
-            wavenumbers=val, substitute=self.imaginary_substitute)
+        # Only the vibrational temperatures are stored to reduce the memory
+        # of each species
         self._valid_vib_temperatures = c.wavenumber_to_temp(
-            self._valid_vib_wavenumbers)
+            _get_valid_vib_wavenumbers(wavenumbers=val,
+                                       substitute=self.imaginary_substitute))
 
     def get_q(self, T, include_ZPE=True):
         """Calculates the partition function
@@ -59,13 +66,12 @@ class HarmonicVib(_ModelBase):
             q_vib : float
                 Vibrational partition function
         """
-        vib_dimless = self._valid_vib_temperatures / T
+        vib_dimless = _get_vib_dimless_T(self._valid_vib_temperatures, T)
         if include_ZPE:
-            qs = np.array(
-                np.exp(-vib_dimless / 2.) / (1. - np.exp(-vib_dimless)))
+            qs = np.exp(-vib_dimless / 2.) / (1. - np.exp(-vib_dimless))
         else:
-            qs = np.array(1. / (1. - np.exp(-vib_dimless)))
-        return np.prod(qs)
+            qs = 1. / (1. - np.exp(-vib_dimless))
+        return np.prod(qs, axis=0)
 
     def get_CvoR(self, T):
         """Calculates the dimensionless heat capacity at constant volume
@@ -82,11 +88,9 @@ class HarmonicVib(_ModelBase):
             CvoR_vib : float
                 Vibrational dimensionless heat capacity at constant volume
         """
-        vib_dimless = self._valid_vib_temperatures / T
-        CvoRs = np.array([
-            (0.5 * vib_dimless)**2 * (1. / np.sinh(vib_dimless / 2.))**2
-        ])
-        return np.sum(CvoRs)
+        vib_dimless = _get_vib_dimless_T(self._valid_vib_temperatures, T)
+        CvoRs = (0.5 * vib_dimless)**2 * (1. / np.sinh(vib_dimless / 2.))**2
+        return np.sum(CvoRs, axis=0)
 
     def get_CpoR(self, T):
         """Calculates the dimensionless heat capacity at constant pressure
@@ -134,12 +138,10 @@ class HarmonicVib(_ModelBase):
             UoRT_vib : float
                 Vibrational dimensionless internal energy
         """
-        vib_dimless = self._valid_vib_temperatures / T
-        UoRT = np.array([
-            vib_dimless / 2. + vib_dimless * np.exp(-vib_dimless) /
-            (1. - np.exp(-vib_dimless))
-        ])
-        return np.sum(UoRT)
+        vib_dimless = _get_vib_dimless_T(self._valid_vib_temperatures, T)
+        exp_term = np.exp(-vib_dimless)
+        UoRT = vib_dimless / 2. + vib_dimless * exp_term / (1. - exp_term)
+        return np.sum(UoRT, axis=0)
 
     def get_HoRT(self, T):
         """Calculates the dimensionless enthalpy
@@ -177,11 +179,10 @@ class HarmonicVib(_ModelBase):
             SoR_vib : float
                 Vibrational dimensionless entropy
         """
-        vib_dimless = self._valid_vib_temperatures / T
-        return np.sum([
-            vib_dimless * np.exp(-vib_dimless) / (1. - np.exp(-vib_dimless)) -
-            np.log(1. - np.exp(-vib_dimless))
-        ])
+        vib_dimless = _get_vib_dimless_T(self._valid_vib_temperatures, T)
+        exp_term = np.exp(-vib_dimless)
+        SoRs = vib_dimless * exp_term / (1. - exp_term) - np.log(1. - exp_term)
+        return np.sum(SoRs, axis=0)
 
     def get_FoRT(self, T):
         """Calculates the dimensionless Helmholtz energy
@@ -248,7 +249,9 @@ class HarmonicVib(_ModelBase):
         calculation. If ``self.imaginary_substitute`` is a float, then
         imaginary frequencies are replaced with that value. Otherwise,
         imaginary frequencies are ignored."""
-        print(self._valid_vib_wavenumbers)
+        print(_get_valid_vib_wavenumbers(
+            wavenumbers=self.vib_wavenumbers,
+            substitute=self.imaginary_substitute))
 
 
 class QRRHOVib(_ModelBase):
@@ -275,6 +278,11 @@ class QRRHOVib(_ModelBase):
             this value for calculations. Otherwise, imaginary frequencies are
             ignored. Default is None
     """
+    __slots__ = ('Bav', 'v0', 'alpha', 'imaginary_substitute',
+                 '_vib_wavenumbers', '_valid_vib_wavenumbers',
+                 '_valid_vib_temperatures', '_valid_scaled_wavenumbers',
+                 '_valid_scaled_inertia')
+
     def __init__(self,
                  vib_wavenumbers,
                  Bav=1.e-44,
@@ -356,14 +364,11 @@ class QRRHOVib(_ModelBase):
             CvoR_vib : float
                 Vibrational dimensionless heat capacity at constant volume
         """
-        CvoR = []
-        vib_dimless = self._valid_vib_temperatures / T
-        for vib_dimless_i, w_i in zip(vib_dimless,
-                                      self._valid_scaled_wavenumbers):
-            CvoR_RRHO = np.exp(-vib_dimless_i) \
-                        * (vib_dimless_i/(1. - np.exp(-vib_dimless_i)))**2
-            CvoR.append(w_i * CvoR_RRHO + 0.5 * (1. - w_i))
-        return np.sum(CvoR)
+        vib_dimless = _get_vib_dimless_T(self._valid_vib_temperatures, T)
+        w = _get_mode_values_T(self._valid_scaled_wavenumbers, T)
+        exp_term = np.exp(-vib_dimless)
+        CvoR_RRHO = exp_term * (vib_dimless / (1. - exp_term))**2
+        return np.sum(w * CvoR_RRHO + 0.5 * (1. - w), axis=0)
 
     def get_CpoR(self, T):
         """Calculates the dimensionless heat capacity at constant pressure
@@ -401,11 +406,11 @@ class QRRHOVib(_ModelBase):
         ----------
             T : float
                 Temperature in K
-            vib_temperature : float
+            vib_temperature : float or np.ndarray
                 Vibrational temperature in K
         Returns
         -------
-            UoRT_RRHO : float
+            UoRT_RRHO : float or np.ndarray
                Dimensionless internal energy of Rigid Rotor Harmonic Oscillator
         """
         vib_dimless = vib_temperature / T
@@ -431,12 +436,10 @@ class QRRHOVib(_ModelBase):
             UoRT_vib : float
                 Vibrational dimensionless internal energy
         """
-        UoRT_QRRHO = []
-        for theta_i, w_i in zip(self._valid_vib_temperatures,
-                                self._valid_scaled_wavenumbers):
-            UoRT_RRHO = self._get_UoRT_RRHO(T=T, vib_temperature=theta_i)
-            UoRT_QRRHO.append(w_i * UoRT_RRHO + (1. - w_i) * 0.5)
-        return np.sum(UoRT_QRRHO)
+        theta = _get_mode_values_T(self._valid_vib_temperatures, T)
+        w = _get_mode_values_T(self._valid_scaled_wavenumbers, T)
+        UoRT_RRHO = self._get_UoRT_RRHO(T=T, vib_temperature=theta)
+        return np.sum(w * UoRT_RRHO + (1. - w) * 0.5, axis=0)
 
     def get_HoRT(self, T):
         """Calculates the dimensionless enthalpy
@@ -462,11 +465,11 @@ class QRRHOVib(_ModelBase):
         ----------
             T : float
                 Temperature in K
-            vib_temperature : float
+            vib_temperature : float or np.ndarray
                 Vibrational temperature in K
         Returns
         -------
-            SoR_RHHO : float
+            SoR_RHHO : float or np.ndarray
                 Dimensionless entropy of Rigid Rotor Harmonic Oscillator
         """
         return vib_temperature/T/(np.exp(vib_temperature/T)-1) \
@@ -479,11 +482,11 @@ class QRRHOVib(_ModelBase):
         ----------
             T : float
                 Temperature in K
-            vib_inertia : float
+            vib_inertia : float or np.ndarray
                 Vibrational inertia in kg m2
         Returns
         -------
-            SoR_RHHO : float
+            SoR_RHHO : float or np.ndarray
                 Dimensionless entropy of Rigid Rotor Harmonic Oscillator
         """
         return 0.5 + np.log(
@@ -512,14 +515,12 @@ class QRRHOVib(_ModelBase):
             SoR_vib : float
                 Vibrational dimensionless entropy
         """
-        SoR_QRRHO = []
-        for theta_i, mu_i, w_i in zip(self._valid_vib_temperatures,
-                                      self._valid_scaled_inertia,
-                                      self._valid_scaled_wavenumbers):
-            SoR_H = self._get_SoR_H(T=T, vib_temperature=theta_i)
-            SoR_RRHO = self._get_SoR_RRHO(T=T, vib_inertia=mu_i)
-            SoR_QRRHO.append(w_i * SoR_H + (1. - w_i) * SoR_RRHO)
-        return np.sum(SoR_QRRHO)
+        theta = _get_mode_values_T(self._valid_vib_temperatures, T)
+        mu = _get_mode_values_T(self._valid_scaled_inertia, T)
+        w = _get_mode_values_T(self._valid_scaled_wavenumbers, T)
+        SoR_H = self._get_SoR_H(T=T, vib_temperature=theta)
+        SoR_RRHO = self._get_SoR_RRHO(T=T, vib_inertia=mu)
+        return np.sum(w * SoR_H + (1. - w) * SoR_RRHO, axis=0)
 
     def get_FoRT(self, T):
         """Calculates the dimensionless Helmholtz energy
@@ -591,9 +592,7 @@ class QRRHOVib(_ModelBase):
         calculation. If ``self.imaginary_substitute`` is a float, then
         imaginary frequencies are replaced with that value. Otherwise,
         imaginary frequencies are ignored."""
-        print(
-            _get_valid_vib_wavenumbers(wavenumbers=self.vib_wavenumbers,
-                                       substitute=self.imaginary_substitute))
+        print(self._valid_vib_wavenumbers)
 
 
 class EinsteinVib(_ModelBase):
@@ -609,6 +608,8 @@ class EinsteinVib(_ModelBase):
         interaction_energy : float, optional
             Interaction energy (:math:`u`) per atom in eV. Default is 0 eV
     """
+    __slots__ = ('einstein_temperature', 'interaction_energy')
+
     def __init__(self, einstein_temperature, interaction_energy=0.):
         self.einstein_temperature = einstein_temperature
         self.interaction_energy = interaction_energy
@@ -802,6 +803,8 @@ class DebyeVib(_ModelBase):
         interaction_energy : float, optional
             Interaction energy (:math:`u`) per atom in eV. Default is 0 eV
     """
+    __slots__ = ('debye_temperature', 'interaction_energy')
+
     def __init__(self, debye_temperature, interaction_energy):
         self.debye_temperature = debye_temperature
         self.interaction_energy = interaction_energy
@@ -825,7 +828,7 @@ class DebyeVib(_ModelBase):
             q : float
                 Partition function
         """
-        G = self._get_intermediate_fn(T=T, fn=self._G_integrand)
+        G = self._get_G(T=T)
         return np.exp(-self.interaction_energy/3./c.kb('eV/K')/T \
                       -3./8.*self.debye_temperature/T - G)
 
@@ -846,7 +849,7 @@ class DebyeVib(_ModelBase):
             CvoR : float
                 Dimensionless heat capacity (constant V)
         """
-        K = self._get_intermediate_fn(T=T, fn=self._K_integrand)
+        K = self._get_K(T=T)
         return 3. * K
 
     def get_CpoR(self, T):
@@ -888,7 +891,7 @@ class DebyeVib(_ModelBase):
                 Dimensionless internal energy
         """
         return self.get_ZPE()/c.kb('eV/K')/T \
-               + 3.*self._get_intermediate_fn(T=T, fn=self._F_integrand)
+               + 3.*self._get_F(T=T)
 
     def get_HoRT(self, T):
         """Calculates dimensionless enthalpy
@@ -935,8 +938,8 @@ class DebyeVib(_ModelBase):
             SoR : float
                 Dimensionless entropy
         """
-        F = self._get_intermediate_fn(T=T, fn=self._F_integrand)
-        G = self._get_intermediate_fn(T=T, fn=self._G_integrand)
+        F = self._get_F(T=T)
+        G = self._get_G(T=T)
         return 3. * (F - G)
 
     def get_FoRT(self, T):
@@ -984,77 +987,148 @@ class DebyeVib(_ModelBase):
         return self.interaction_energy \
                + 9./8.*c.R('eV/K')*self.debye_temperature
 
-    def _G_integrand(self, x):
-        """Integrand when evaluating intermediate function G.
-
-        :math:`f(x) = x^2 \\ln \\bigg(1-e^{-x}\\bigg)`
+    def to_dict(self):
+        """Represents object as dictionary with JSON-accepted datatypes
 
-        Parameters
-        ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
         Returns
         -------
-            f(x) : float
-                Integrand evaluated at x
+            obj_dict : dict
         """
-        return np.log(1. - np.exp(-x)) * (x**2)
+        return {
+            'class': str(self.__class__),
+            'debye_temperature': self.debye_temperature,
+            'interaction_energy': self.interaction_energy
+        }
 
-    def _K_integrand(self, x):
-        """Integrand when evaluating intermediate function K.
+    def _get_F(self, T):
+        """Calculates the intermediate function F
 
-        :math:`f(x) = \\frac {x^4 e^x}{(e^x -1)^2}`
+        :math:`F\\bigg(\\frac{\\Theta_D}{T}\\bigg) = 3\\bigg(\\frac{T}{
+        \\Theta_D}\\bigg)^3 \\int_0^{\\frac{\\Theta_D}{T}} \\frac{x^3 e^x}
+        {e^x-1} dx = \\frac{3}{4}\\frac{\\Theta_D}{T} + 3\\bigg(\\frac{T}{
+        \\Theta_D}\\bigg)^3 J_3\\bigg(\\frac{\\Theta_D}{T}\\bigg)`
 
         Parameters
         ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
+            T : float or (N,) np.ndarray
+                Temperature in K
         Returns
         -------
-            f(x) : float
-                Integrand evaluated at x
+            F : float or (N,) np.ndarray
+                Intermediate function evaluated at T
         """
-        return (x**4) * np.exp(x) / (np.exp(x) - 1.)**2
+        x = self.debye_temperature / np.asarray(T, dtype=float)
+        return 0.75 * x + 3. * _get_debye_integral(x) / x**3
 
-    def _F_integrand(self, x):
-        """Integrand when evaluating intermediate function F.
+    def _get_G(self, T):
+        """Calculates the intermediate function G
 
-        :math:`f(x) = \\frac {x^3 e^x}{e^x -1}`
+        :math:`G\\bigg(\\frac{\\Theta_D}{T}\\bigg) = 3\\bigg(\\frac{T}{
+        \\Theta_D}\\bigg)^3\\int_0^{\\frac{\\Theta_D}{T}}x^2 \\ln
+        \\bigg(1-e^{-x}\\bigg)dx = \\ln\\bigg(1-e^{-\\frac{\\Theta_D}{T}}
+        \\bigg) - \\bigg(\\frac{T}{\\Theta_D}\\bigg)^3 J_3\\bigg(
+        \\frac{\\Theta_D}{T}\\bigg)`
 
         Parameters
         ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
+            T : float or (N,) np.ndarray
+                Temperature in K
         Returns
         -------
-            f(x) : float
-                Integrand evaluated at x
+            G : float or (N,) np.ndarray
+                Intermediate function evaluated at T
         """
-        return (x**3) * np.exp(x) / (np.exp(x) - 1.)
+        x = self.debye_temperature / np.asarray(T, dtype=float)
+        return np.log(-np.expm1(-x)) - _get_debye_integral(x) / x**3
 
-    def _get_intermediate_fn(self, T, fn):
-        """Calculates the intermediate function (i.e. F, G, or K)
+    def _get_K(self, T):
+        """Calculates the intermediate function K
 
-        :math:`F(x) = 3\\bigg(\\frac{T}{\\Theta_D}\\bigg)^3\\int_0^{\\frac
-        {\\Theta_D}{T}} f(x) dx`
+        :math:`K\\bigg(\\frac{\\Theta_D}{T}\\bigg)=3\\bigg(\\frac{T}{
+        \\Theta_D}\\bigg)^3 \\int_0^{\\frac{\\Theta_D}{T}}\\frac{x^4 e^x}
+        {(e^x-1)^2}dx = 12\\bigg(\\frac{T}{\\Theta_D}\\bigg)^3 J_3\\bigg(
+        \\frac{\\Theta_D}{T}\\bigg) - \\frac{3\\Theta_D}{T}\\frac{1}{e^{
+        \\frac{\\Theta_D}{T}}-1}`
 
         Parameters
         ----------
-            T : float
+            T : float or (N,) np.ndarray
                 Temperature in K
-            fn : function
-                Integrand function, f(x)
         Returns
         -------
-            F : float
+            K : float or (N,) np.ndarray
                 Intermediate function evaluated at T
         """
-        vib_dimless = self.debye_temperature / T
-        integral = quad(func=fn, a=0., b=vib_dimless)[0]
-        return 3. * integral / vib_dimless**3
+        x = self.debye_temperature / np.asarray(T, dtype=float)
+        return 12. * _get_debye_integral(x) / x**3 \
+            - 3. * x * np.exp(-x) / -np.expm1(-x)
+
+
+def _get_debye_integral(x):
+    """Calculates the integral used by the Debye intermediate functions
+
+    :math:`J_3(x) = \\int_0^x \\frac{t^3}{e^t-1} dt`
+
+    For :math:`x \\leq 2`, the Bernoulli series is used:
+
+    :math:`J_3(x) = \\sum_{n=0}^\\infty \\frac{B_n x^{n+3}}{n!(n+3)}`
+
+    Otherwise, the exponential series is used:
+
+    :math:`J_3(x) = \\frac{\\pi^4}{15} - \\sum_{k=1}^\\infty e^{-kx}
+    \\bigg(\\frac{x^3}{k} + \\frac{3x^2}{k^2} + \\frac{6x}{k^3} +
+    \\frac{6}{k^4}\\bigg)`
+
+    Both series are truncated once the remaining terms are below machine
+    precision.
+
+    Parameters
+    ----------
+        x : float or (N,) np.ndarray
+            Upper limit of integration. Represents :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        J3 : float or (N,) np.ndarray
+            Integral evaluated at x
+    """
+    x = np.asarray(x, dtype=float)
+    x_flat = np.atleast_1d(x)
+    J3 = np.zeros_like(x_flat)
+
+    small = x_flat <= _DEBYE_SERIES_LIMIT
+    x_small = x_flat[small]
+    J3[small] = x_small**3 * np.polyval(_get_debye_series_coeffs()[::-1],
+                                         x_small)
+
+    x_large = x_flat[~small][:, np.newaxis]
+    k = _DEBYE_EXP_ORDERS
+    terms = np.exp(-k * x_large) \
+        * (x_large**3 / k + 3. * x_large**2 / k**2 + 6. * x_large / k**3
+           + 6. / k**4)
+    J3[~small] = np.pi**4 / 15. - np.sum(terms, axis=1)
+    return J3.reshape(x.shape)[()]
+
+
+@lru_cache(maxsize=None)
+def _get_debye_series_coeffs():
+    """Coefficients of the Bernoulli series of the Debye integral. Calculated
+    on first use so scipy.special is not imported with the module.
+
+    Returns
+    -------
+        coeffs : (40,) np.ndarray
+            Coefficients in increasing order of x
+    """
+    return np.array([
+        special.bernoulli(n)[n] / special.factorial(n) / (n + 3.)
+        for n in range(40)
+    ])
+
+
+_DEBYE_SERIES_LIMIT = 2.
+# Orders of the exponential series of the Debye integral. Terms are
+# negligible after exp(-k*2) < 1e-17
+_DEBYE_EXP_ORDERS = np.arange(1., 21.)
 
 
 def _get_valid_vib_wavenumbers(wavenumbers, substitute=None):
@@ -1073,15 +1147,13 @@ def _get_valid_vib_wavenumbers(wavenumbers, substitute=None):
         wavenumbers_out : (N,) np.ndarray
             Valid wavenumbers
     """
-    wavenumbers_out = []
-    for wavenumber in wavenumbers:
-        if wavenumber > 0.:
-            # Real wavenumbers always added
-            wavenumbers_out.append(wavenumber)
-        elif substitute is not None:
-            # Substitute added if imaginary frequency encountered
-            wavenumbers_out.append(substitute)
-    return np.array(wavenumbers_out)
+    wavenumbers = np.asarray(wavenumbers, dtype=float).flatten()
+    # Real wavenumbers always added
+    real = wavenumbers > 0.
+    if substitute is None:
+        return wavenumbers[real]
+    # Substitute added if imaginary frequency encountered
+    return np.where(real, wavenumbers, substitute)
 
 
 def _get_vib_dimless(wavenumbers, T, substitute=None):
@@ -1092,17 +1164,54 @@ def _get_vib_dimless(wavenumbers, T, substitute=None):
     ----------
         wavenumbers : (N,) np.ndarray
             Wavenumbers in 1/cm
-        T : float
+        T : float or (M,) np.ndarray
             Temperature in K
         substitute : float, optional
             Value to use to replace imaginary frequencies. If not specified,
             imaginary frequencies are ignored. Default is None
     Returns
     -------
-        vib_dimless : (N,) np.ndarray
+        vib_dimless : (N,) or (N, M) np.ndarray
             Vibrational temperatures normalized by T
     """
     valid_wavenumbers = _get_valid_vib_wavenumbers(wavenumbers=wavenumbers,
                                                    substitute=substitute)
-    vib_dimless = c.wavenumber_to_temp(valid_wavenumbers) / T
-    return vib_dimless
+    return _get_vib_dimless_T(
+        vib_temperatures=c.wavenumber_to_temp(valid_wavenumbers), T=T)
+
+
+def _get_mode_values_T(values, T):
+    """Reshapes values of each mode so they broadcast against the
+    temperature. Summing the result over the first axis gives a quantity
+    with the same shape as T.
+
+    Parameters
+    ----------
+        values : (N,) np.ndarray
+            Values corresponding to each mode
+        T : float or (M,) np.ndarray
+            Temperature in K
+    Returns
+    -------
+        values_T : (N,) or (N, 1) np.ndarray
+            Reshaped values
+    """
+    return np.reshape(values, (-1, ) + (1, ) * np.ndim(T))
+
+
+def _get_vib_dimless_T(vib_temperatures, T):
+    """Calculates dimensionless temperatures for precomputed vibrational
+    temperatures
+
+    Parameters
+    ----------
+        vib_temperatures : (N,) np.ndarray
+            Vibrational temperatures in K
+        T : float or (M,) np.ndarray
+            Temperature in K
+    Returns
+    -------
+        vib_dimless : (N,) or (N, M) np.ndarray
+            Vibrational temperatures normalized by T
+    """
+    return _get_mode_values_T(vib_temperatures, T) / np.asarray(T, dtype=float)
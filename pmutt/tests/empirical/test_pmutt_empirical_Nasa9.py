@@ -64,6 +64,29 @@ class TestNasa(unittest.TestCase):
                                                T_high=5000.,
                                                model=H2O_statmech)
 
+    def test_get_CpoR_HoRT_SoR(self):
+        # Includes temperatures on the bounds shared by intervals
+        T = np.array([200., 500., 1000., 3000., 6000., 15000., 20000.])
+        i_nasas = [0, 0, 0, 1, 1, 2, 2]
+        for method_name in ('get_CpoR', 'get_HoRT', 'get_SoR'):
+            method = getattr(self.Nasa9_direct, method_name)
+            exp_quantity = [
+                getattr(self.Nasa9_direct[i], method_name)(T=T_i)[0]
+                for i, T_i in zip(i_nasas, T)
+            ]
+            np.testing.assert_array_almost_equal(method(T=T), exp_quantity)
+            self.assertAlmostEqual(method(T=T[1]), exp_quantity[1])
+
+        # Pressure adjustment of gas species
+        np.testing.assert_array_almost_equal(
+            self.Nasa9_direct.get_SoR(T=T, P=10.),
+            self.Nasa9_direct.get_SoR(T=T) - np.log(10.))
+
+        with self.assertRaises(ValueError):
+            self.Nasa9_direct.get_CpoR(T=np.array([500., 25000.]))
+        with self.assertRaises(ValueError):
+            self.Nasa9_direct.get_HoRT(T=100.)
+
     def test_get_GoRT_Selements(self):
         T = np.array([
             500., 600., 700., 800., 900., 1000., 1100., 1200., 1300., 1400.,
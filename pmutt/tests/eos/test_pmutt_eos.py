@@ -4,8 +4,14 @@ pmutt.test_pmutt_model_statmech
 Tests for pmutt module
 """
 import unittest
+import numpy as np
+from scipy.integrate import quad
+from ase.build import molecule
 from pmutt import constants as c
-from pmutt.eos import IdealGasEOS, vanDerWaalsEOS
+from pmutt.eos import (IdealGasEOS, vanDerWaalsEOS, PengRobinsonEOS,
+                       SoaveRedlichKwongEOS, RealGasAdj)
+from pmutt.io.json import json_to_pmutt
+from pmutt.statmech import StatMech, presets
 
 
 class TestIdealGas(unittest.TestCase):
@@ -63,6 +69,35 @@ class TestvanDerWaalsEOS(unittest.TestCase):
             self.van_der_waals_critical.get_P(V=self.V, T=self.T, n=self.n),
             4.11525126335907)
 
+    def test_get_Vm(self):
+        # Conditions spanning the liquid, vapor-liquid and gas regions
+        T = np.array([400., 500., 550., 650., 800.])
+        P = np.array([400., 100., 50., 50., 200.])
+        exp_Vm_gas = []
+        exp_Vm_liq = []
+        for T_i, P_i in zip(T, P):
+            P_SI = P_i * c.convert_unit(initial='bar', final='Pa')
+            Vm = np.roots([
+                P_SI, -(P_SI * self.van_der_waals.b + c.R('J/mol/K') * T_i),
+                self.van_der_waals.a,
+                -self.van_der_waals.a * self.van_der_waals.b
+            ])
+            real_Vm = np.real(Vm[np.isreal(Vm)])
+            exp_Vm_gas.append(np.max(real_Vm))
+            exp_Vm_liq.append(np.min(real_Vm))
+        np.testing.assert_allclose(self.van_der_waals.get_Vm(T=T, P=P),
+                                   exp_Vm_gas, rtol=1.e-9)
+        np.testing.assert_allclose(
+            self.van_der_waals.get_Vm(T=T, P=P, gas_phase=False), exp_Vm_liq,
+            rtol=1.e-9)
+        self.assertAlmostEqual(
+            self.van_der_waals.get_Vm(T=T[2], P=P[2], gas_phase=False),
+            exp_Vm_liq[2])
+        # Temperature grid at a single pressure
+        np.testing.assert_allclose(
+            self.van_der_waals.get_V(T=T, P=P[2], n=2.),
+            [2. * self.van_der_waals.get_Vm(T=T_i, P=P[2]) for T_i in T])
+
     def test_get_n(self):
         self.assertAlmostEqual(
             self.van_der_waals.get_n(P=self.P, T=self.T, V=self.V),
@@ -72,5 +107,153 @@ class TestvanDerWaalsEOS(unittest.TestCase):
             0.997188563164668)
 
 
+class TestCubicEOS(unittest.TestCase):
+    def setUp(self):
+        # CO2 and CH4
+        self.eos_classes = (PengRobinsonEOS, SoaveRedlichKwongEOS)
+        self.Tc = [304.13, 190.56]
+        self.Pc = [73.77, 45.99]
+        self.omega = [0.225, 0.011]
+        self.kij = [[0., 0.1], [0.1, 0.]]
+        self.T = np.array([250., 310., 400.])
+        self.P = np.array([10., 50., 200.])
+
+    def _get_mix_GoRT_res(self, eos, T, P, y):
+        params = eos._get_mix_params(T=T, P=P, y=y)
+        A = params['A']
+        B = params['B']
+        Z = eos._get_Z(A=A, B=B)
+        I = np.log((Z + eos.sigma * B) / (Z + eos.epsilon * B)) \
+            / (eos.sigma - eos.epsilon)
+        return Z - 1. - np.log(Z - B) - A / B * I
+
+    def test_get_P(self):
+        for eos_class in self.eos_classes:
+            eos = eos_class(Tc=self.Tc[0], Pc=self.Pc[0], omega=self.omega[0])
+            V = eos.get_V(T=self.T, P=self.P, n=2.)
+            np.testing.assert_allclose(eos.get_P(T=self.T, V=V, n=2.),
+                                       self.P)
+            np.testing.assert_allclose(eos.get_n(T=self.T, V=V, P=self.P),
+                                       2.)
+            self.assertAlmostEqual(
+                eos.get_Z(T=self.T[1], P=self.P[1]),
+                eos.get_Vm(T=self.T[1], P=self.P[1]) * self.P[1] /
+                c.R('m3 bar/mol/K') / self.T[1])
+
+    def test_get_ln_phi(self):
+        for eos_class in self.eos_classes:
+            eos = eos_class(Tc=self.Tc[0], Pc=self.Pc[0], omega=self.omega[0])
+            # Pure species compared to integrating (Z-1)/P
+            exp_ln_phi = [
+                quad(lambda P: (eos.get_Z(T=T_i, P=P) - 1.) / P, 0., P_i)[0]
+                for T_i, P_i in zip(self.T, self.P)
+            ]
+            np.testing.assert_allclose(eos.get_ln_phi(T=self.T, P=self.P),
+                                       exp_ln_phi, rtol=1.e-6)
+
+            # Mixture fugacity coefficients are partial molar quantities
+            mix = eos_class(Tc=self.Tc, Pc=self.Pc, omega=self.omega,
+                            kij=self.kij)
+            y = np.array([0.3, 0.7])
+            ln_phi = mix.get_ln_phi(T=self.T, P=self.P, y=y)
+            self.assertEqual(ln_phi.shape, (2, len(self.T)))
+            np.testing.assert_array_almost_equal(
+                np.dot(y, ln_phi),
+                self._get_mix_GoRT_res(eos=mix, T=self.T, P=self.P, y=y))
+            dn = 1.e-6
+            for i in range(2):
+                n_high = y.copy()
+                n_high[i] += dn
+                n_low = y.copy()
+                n_low[i] -= dn
+                nGoRT_high = np.sum(n_high) * self._get_mix_GoRT_res(
+                    eos=mix, T=self.T, P=self.P, y=n_high / np.sum(n_high))
+                nGoRT_low = np.sum(n_low) * self._get_mix_GoRT_res(
+                    eos=mix, T=self.T, P=self.P, y=n_low / np.sum(n_low))
+                np.testing.assert_array_almost_equal(
+                    (nGoRT_high - nGoRT_low) / 2. / dn, ln_phi[i])
+
+            # Composition grid
+            y_grid = np.array([np.linspace(0., 1., 5), np.linspace(1., 0., 5)])
+            phi = mix.get_phi(T=self.T[1], P=self.P[1], y=y_grid)
+            self.assertEqual(phi.shape, (2, 5))
+            self.assertAlmostEqual(phi[0, -1],
+                                   eos.get_phi(T=self.T[1], P=self.P[1]))
+
+            with self.assertRaises(ValueError):
+                mix.get_phi(T=self.T, P=self.P)
+
+    def test_to_dict(self):
+        eos = PengRobinsonEOS(Tc=np.array(self.Tc), Pc=self.Pc,
+                              omega=self.omega)
+        self.assertEqual(json_to_pmutt(eos.to_dict()), eos)
+
+
+class TestRealGasAdj(unittest.TestCase):
+    def setUp(self):
+        self.eos = PengRobinsonEOS(Tc=304.13, Pc=73.77, omega=0.225)
+        self.real_gas_adj = RealGasAdj(eos=self.eos)
+        self.T = 310.
+        self.P = 50.
+
+    def test_get_HoRT(self):
+        eos = self.eos
+        params = eos._get_mix_params(T=self.T, P=self.P, y=None)
+        A = params['A']
+        B = params['B']
+        Z = eos._get_Z(A=A, B=B)
+        I = np.log((Z + eos.sigma * B) / (Z + eos.epsilon * B)) \
+            / (eos.sigma - eos.epsilon)
+        kappa = eos._get_kappa(eos.omega)
+        sqrt_Tr = np.sqrt(self.T / eos.Tc)
+        dln_a_dln_T = -kappa * sqrt_Tr / (1. + kappa * (1. - sqrt_Tr))
+        exp_HoRT = (Z - 1. + (dln_a_dln_T - 1.) * A / B * I).item()
+        self.assertAlmostEqual(
+            self.real_gas_adj.get_HoRT(T=self.T, P=self.P), exp_HoRT)
+        self.assertAlmostEqual(
+            self.real_gas_adj.get_UoRT(T=self.T, P=self.P),
+            exp_HoRT - (Z - 1.).item())
+        self.assertAlmostEqual(
+            self.real_gas_adj.get_SoR(T=self.T, P=self.P),
+            exp_HoRT - eos.get_ln_phi(T=self.T, P=self.P))
+
+    def test_statmech(self):
+        species_kwargs = {
+            'name': 'CO2',
+            'atoms': molecule('CO2'),
+            'symmetrynumber': 2,
+            'spin': 0,
+            'potentialenergy': -22.,
+            'vib_wavenumbers': [2349., 1333., 667., 667.],
+        }
+        ideal_gas = StatMech(**species_kwargs, **presets['idealgas'])
+        real_gas = StatMech(misc_models=[self.real_gas_adj],
+                            **species_kwargs,
+                            **presets['idealgas'])
+        self.assertAlmostEqual(
+            real_gas.get_GoRT(T=self.T, P=self.P) -
+            ideal_gas.get_GoRT(T=self.T, P=self.P),
+            self.eos.get_ln_phi(T=self.T, P=self.P))
+        self.assertAlmostEqual(
+            real_gas.get_HoRT(T=self.T, P=self.P) -
+            ideal_gas.get_HoRT(T=self.T, P=self.P),
+            self.real_gas_adj.get_HoRT(T=self.T, P=self.P))
+
+    def test_mixture(self):
+        mix = PengRobinsonEOS(Tc=[304.13, 190.56], Pc=[73.77, 45.99],
+                              omega=[0.225, 0.011])
+        y = np.array([0.3, 0.7])
+        for i in range(2):
+            real_gas_adj = RealGasAdj(eos=mix, species_index=i)
+            self.assertAlmostEqual(
+                real_gas_adj.get_GoRT(T=self.T, P=self.P, y=y),
+                mix.get_ln_phi(T=self.T, P=self.P, y=y)[i])
+
+    def test_to_dict(self):
+        real_gas_adj = RealGasAdj(eos=self.eos, species_index=1)
+        self.assertEqual(json_to_pmutt(real_gas_adj.to_dict()),
+                         real_gas_adj)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+import os
+import unittest
+
+import numpy as np
+
+from pmutt import pmutt_list_to_dict
+from pmutt.io import chemkin
+from pmutt.empirical import EmpiricalBase
+from pmutt.empirical.nasa import Nasa
+from pmutt.reaction import ChemkinReaction
+
+
+class TestChemkin(unittest.TestCase):
+    def setUp(self):
+        self.test_file = os.path.join(os.path.dirname(__file__),
+                                      'test_surf.inp')
+        self.species = [
+            EmpiricalBase(name='H2', phase='G'),
+            EmpiricalBase(name='H2O', phase='G'),
+            EmpiricalBase(name='PT(S)', phase='S'),
+            EmpiricalBase(name='H(S)', phase='S'),
+            EmpiricalBase(name='O(S)', phase='S'),
+            EmpiricalBase(name='OH(S)', phase='S'),
+        ]
+
+    def test_read_reactions(self):
+        (reaction_strs, reactants, react_stoich, products,
+         prod_stoich) = chemkin.read_reactions(self.test_file)
+        self.assertEqual(reaction_strs, [
+            'H2+2PT(S)=2H(S)', 'H(S)+O(S)<=>OH(S)+PT(S)',
+            '2OH(S)=>H2O+O(S)+PT(S)'
+        ])
+        self.assertEqual(reactants,
+                         [['H2', 'PT(S)'], ['H(S)', 'O(S)'], ['OH(S)']])
+        self.assertEqual(react_stoich, [[1, 2], [1, 1], [2]])
+        self.assertEqual(products,
+                         [['H(S)'], ['OH(S)', 'PT(S)'],
+                          ['H2O', 'O(S)', 'PT(S)']])
+        self.assertEqual(prod_stoich, [[2], [1, 1], [1, 1, 1]])
+
+        out = chemkin.read_reactions(self.test_file, species=self.species)
+        self.assertEqual(len(out), 7)
+        self.assertEqual([specie.name for specie in out[2][1]],
+                         ['H(S)', 'O(S)'])
+
+    def test_read_reactions_objects(self):
+        reactions = chemkin.read_reactions(self.test_file,
+                                           species=self.species,
+                                           return_reactions=True)
+        self.assertEqual(len(reactions), 3)
+        self.assertEqual(reactions[0].to_string(stoich_format='.0f'),
+                         'H2+2PT(S)=2H(S)')
+        self.assertTrue(reactions[0].is_adsorption)
+        self.assertAlmostEqual(reactions[0].sticking_coeff, 0.1)
+        self.assertFalse(reactions[1].is_adsorption)
+        self.assertAlmostEqual(reactions[1].beta, 0.5)
+        self.assertDictEqual(reactions[1].notes, {'A': 3.e13, 'Ea': 10.5})
+        self.assertAlmostEqual(reactions[2].beta, -1.)
+        self.assertEqual(reactions[2].reactants_stoich, [2.])
+        with self.assertRaises(ValueError):
+            chemkin.read_reactions(self.test_file, return_reactions=True)
+
+    def test_write_EA(self):
+        a_low = np.array([3., 1.e-3, -1.e-6, 1.e-10, -1.e-14, -1.e3, 1.])
+        species = [
+            Nasa(name='H2', phase='G', elements={'H': 2}, T_low=300.,
+                 T_mid=1000., T_high=2000., a_low=a_low,
+                 a_high=1.01 * a_low),
+            Nasa(name='PT(S)', phase='S', elements={'Pt': 1}, T_low=300.,
+                 T_mid=1000., T_high=2000., a_low=np.zeros(7),
+                 a_high=np.zeros(7)),
+            Nasa(name='H(S)', phase='S', elements={'H': 1, 'Pt': 1},
+                 T_low=300., T_mid=1000., T_high=2000., a_low=1.5 * a_low,
+                 a_high=1.4 * a_low),
+            Nasa(name='TS(S)', phase='S', elements={'H': 2, 'Pt': 2},
+                 T_low=300., T_mid=1000., T_high=2000., a_low=2.5 * a_low,
+                 a_high=2.6 * a_low),
+        ]
+        species_dict = pmutt_list_to_dict(species)
+        reactions = [
+            ChemkinReaction.from_string('H2+2PT(S)=2H(S)',
+                                        species=species_dict,
+                                        is_adsorption=True),
+            ChemkinReaction.from_string('H2+2PT(S)=TS(S)=2H(S)',
+                                        species=species_dict),
+        ]
+        # Conditions span both NASA polynomial ranges
+        conditions = [{'T': T} for T in (500., 1500., 900., 1200., 500.)]
+        lines = chemkin.write_EA(reactions=reactions, conditions=conditions)
+        expected = [
+            [reactions[0].get_HoRT_act(**condition)
+             for condition in conditions],
+            [reactions[1].get_EoRT_act(**condition)
+             for condition in conditions],
+        ]
+        EA_lines = lines.split('\n')[-3:-1]
+        for EA_line, EA_expected in zip(EA_lines, expected):
+            np.testing.assert_allclose(
+                [float(val) for val in EA_line.split()[1:]], EA_expected,
+                rtol=1.e-2)
+        self.assertEqual(
+            chemkin.write_EA(reactions=reactions, conditions=conditions,
+                             n_processes=2).split('\n')[1:],
+            lines.split('\n')[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pmutt.io import ctml_writer
+
+cti_template = '''
+units(length='cm', quantity='mol', act_energy='kcal/mol')
+
+ideal_gas(name='gas',
+          elements='H Ar',
+          species='H2 Ar')
+
+species(name='H2',
+        atoms='H:2',
+        thermo=NASA([300.0, 1000.0], [{a}, 0.0, 0.0, 0.0, 0.0, -1.0e3, -3.2]))
+
+species(name='Ar',
+        atoms='Ar:1',
+        thermo=NASA([300.0, 1000.0], [2.5, 0.0, 0.0, 0.0, 0.0, -745.0, 4.37]))
+'''
+
+
+class TestCtmlWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _convert(self, i):
+        out_name = os.path.join(self.tmp_dir.name, 'gas{}.xml'.format(i))
+        ctml_writer.Converter().convert(
+            text=cti_template.format(a=3. + i), outName=out_name)
+        with open(out_name) as f_ptr:
+            return f_ptr.read()
+
+    def test_convert_threads(self):
+        n = 16
+        expected = [self._convert(i) for i in range(n)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(self._convert, range(n)))
+        self.assertEqual(outputs, expected)
+        # Each output should only contain the species of its own input
+        for output in outputs:
+            self.assertEqual(output.count('<species '), 2)
+        # Module state is not modified by the converters
+        self.assertEqual(ctml_writer._default_state.species, [])
+
+    def test_converter(self):
+        converter = ctml_writer.Converter()
+        converter.units(length='cm', quantity='mol')
+        converter.enable_motz_wise()
+        self.assertEqual(converter.state.ulen, 'cm')
+        self.assertTrue(converter.state.motz_wise)
+        # Entries of other converters and the module are not modified
+        self.assertEqual(ctml_writer.Converter().state.ulen, 'm')
+        self.assertEqual(ctml_writer._default_state.ulen, 'm')
+        self.assertIsNone(ctml_writer._default_state.motz_wise)
+        self.assertIs(converter.CTI_Error, ctml_writer.CTI_Error)
+        self.assertEqual(converter.OneAtm, ctml_writer.OneAtm)
+
+    def test_convert_error(self):
+        out_name = os.path.join(self.tmp_dir.name, 'bad.xml')
+        bad_text = cti_template.format(a=3.).replace('NASA', 'NASA_typo')
+        with self.assertRaises(ctml_writer.CTI_Error):
+            ctml_writer.convert(text=bad_text, outName=out_name)
+        with self.assertRaises(ctml_writer.CTI_Error):
+            ctml_writer.convert(text='species(', outName=out_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from pmutt.io import dft
+from pmutt.io.json import json_to_pmutt
+from pmutt.statmech import EmptyMode
+from pmutt.statmech.rot import RigidRotor
+
+test_file = os.path.join(os.path.dirname(__file__), 'test_OUTCAR')
+
+
+class TestDFT(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        for name in ('H2O', 'H2O_2'):
+            os.mkdir(os.path.join(self.tmp_dir, name))
+            shutil.copy(test_file, os.path.join(self.tmp_dir, name, 'OUTCAR'))
+        os.mkdir(os.path.join(self.tmp_dir, 'bad'))
+        with open(os.path.join(self.tmp_dir, 'bad', 'OUTCAR'), 'w') as f_ptr:
+            f_ptr.write('Not an OUTCAR file\n')
+        with open(os.path.join(self.tmp_dir, 'notes.txt'), 'w') as f_ptr:
+            f_ptr.write('Ignored\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_find_dft_outputs(self):
+        self.assertEqual(dft.find_dft_outputs(self.tmp_dir), [
+            (os.path.join(self.tmp_dir, 'H2O', 'OUTCAR'), 'vasp'),
+            (os.path.join(self.tmp_dir, 'H2O_2', 'OUTCAR'), 'vasp'),
+            (os.path.join(self.tmp_dir, 'bad', 'OUTCAR'), 'vasp'),
+        ])
+
+    def test_read_statmech(self):
+        H2O = dft.read_statmech(test_file, name='H2O')
+        self.assertEqual(H2O.name, 'H2O')
+        self.assertDictEqual(H2O.elements, {'H': 2, 'O': 1})
+        self.assertAlmostEqual(H2O.elec_model.potentialenergy, -14.82767999)
+        self.assertEqual(list(H2O.vib_model.vib_wavenumbers), [
+            3821.717493, 3703.479948, 1535.727129, 115.153397, 105.380772,
+            64.404843
+        ])
+        self.assertIsInstance(H2O.rot_model, EmptyMode)
+
+        H2O_gas = dft.read_statmech(test_file,
+                                    name='H2O',
+                                    gas_phase=True,
+                                    symmetrynumber=2,
+                                    min_frequency_cutoff=1000.)
+        self.assertIsInstance(H2O_gas.rot_model, RigidRotor)
+        self.assertEqual(H2O_gas.rot_model.geometry, 'nonlinear')
+        self.assertEqual(len(H2O_gas.vib_model.vib_wavenumbers), 3)
+        self.assertEqual(len(H2O_gas.rot_model.rot_temperatures), 3)
+        self.assertEqual(H2O_gas.rot_model.symmetrynumber, 2)
+        with self.assertRaises(ValueError):
+            dft.read_statmech(test_file, file_format='cp2k')
+
+    def test_read_dft_outputs(self):
+        species_file = os.path.join(self.tmp_dir, 'species.json')
+        species, summary = dft.read_dft_outputs(self.tmp_dir,
+                                                n_processes=2,
+                                                filename=species_file)
+        self.assertEqual(sorted(species), ['H2O', 'H2O_2'])
+        self.assertEqual([result['name'] for result in summary],
+                         ['H2O', 'H2O_2', None])
+        self.assertIsNone(summary[0]['error'])
+        self.assertIsNotNone(summary[2]['error'])
+        with open(species_file, 'r') as f_ptr:
+            species_json = json.load(f_ptr, object_hook=json_to_pmutt)
+        self.assertEqual(species_json['H2O'], species['H2O'])
+
+        # Serial reading gives the same species
+        species_serial, _ = dft.read_dft_outputs(self.tmp_dir, n_processes=1)
+        self.assertEqual(species_serial, species)
+
+    def test_main(self):
+        # One good and one bad file
+        shutil.rmtree(os.path.join(self.tmp_dir, 'H2O_2'))
+        species_file = os.path.join(self.tmp_dir, 'species.json')
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_status = dft.main([self.tmp_dir, '-o', species_file,
+                                    '-n', '1'])
+        self.assertEqual(exit_status, 1)
+        with open(species_file, 'r') as f_ptr:
+            species_json = json.load(f_ptr, object_hook=json_to_pmutt)
+        self.assertEqual(list(species_json), ['H2O'])
+        summary_line = stdout.getvalue().strip().split('\n')[-1]
+        self.assertTrue(summary_line.startswith(
+            'Read 1 species from 2 files (1 failed) in '))
+        self.assertTrue(summary_line.endswith(
+            'Species written to {}'.format(species_file)))
+
+        # Success when all the files are read
+        shutil.rmtree(os.path.join(self.tmp_dir, 'bad'))
+        with redirect_stdout(io.StringIO()):
+            exit_status = dft.main([self.tmp_dir, '-o', species_file,
+                                    '-n', '1'])
+        self.assertEqual(exit_status, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from pmutt.empirical.nasa import Nasa
+from pmutt.io import excel
+from pmutt.io.thermdat import write_thermdat
+from pmutt.statmech import StatMech, presets, vib
+
+test_outcar = os.path.join(os.path.dirname(__file__), 'test_OUTCAR')
+
+
+class TestExcel(unittest.TestCase):
+    def setUp(self):
+        self.input_data = pd.DataFrame({
+            'name': ['H2O', 'CO2', 'H2O_2'],
+            'statmech_model': ['IdealGas', 'IdealGas', np.nan],
+            'vib_model': [np.nan, np.nan, 'HarmonicVib'],
+            'atoms': ['H2O', 'CO2', 'H2O'],
+            'element.H': [2, np.nan, 2],
+            'element.O': [1, 2, 1],
+            'formula': [np.nan, 'CO2', np.nan],
+            'vib_wavenumber.0': [3825.434, 2439.1, np.nan],
+            'vib_wavenumber.1': [3710.264, 1353.8, np.nan],
+            'vib_outcar': [np.nan, np.nan, test_outcar],
+            'nasa.a_low.0': [1., np.nan, np.nan],
+            'nasa.a_low.6': [7., np.nan, np.nan],
+            'list.notes.0': [' a ', np.nan, 'c'],
+            'dict.misc.key': [np.nan, 1., np.nan],
+        })
+
+    def test_read_tabular_data(self):
+        data = excel._read_tabular_data(input_data=self.input_data,
+                                        source='species.xlsx')
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data[0]['name'], 'H2O')
+        self.assertIs(data[0]['model'], StatMech)
+        self.assertIs(data[0]['vib_model'], presets['idealgas']['vib_model'])
+        self.assertIs(data[2]['vib_model'], vib.HarmonicVib)
+        self.assertDictEqual(data[0]['elements'], {'H': 2, 'O': 1})
+        self.assertDictEqual(data[1]['elements'], {'C': 1, 'O': 2})
+        # Counts in columns with empty cells are not read as floats
+        self.assertIsInstance(data[0]['elements']['H'], int)
+        self.assertEqual(data[0]['vib_wavenumbers'], [3825.434, 3710.264])
+        # Wavenumbers from the OUTCAR
+        self.assertEqual(data[2]['vib_wavenumbers'], [
+            3821.717493, 3703.479948, 1535.727129, 115.153397, 105.380772,
+            64.404843
+        ])
+        np.testing.assert_array_equal(data[0]['a_low'],
+                                      [1., 0., 0., 0., 0., 0., 7.])
+        self.assertNotIn('a_low', data[1])
+        self.assertEqual(data[0]['notes'], ['a'])
+        self.assertDictEqual(data[1]['misc'], {'key': 1.})
+        # Atoms read from the same source are not shared
+        self.assertEqual(data[0]['atoms'], data[2]['atoms'])
+        self.assertIsNot(data[0]['atoms'], data[2]['atoms'])
+
+    def test_read_excel(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'species.xlsx')
+            comments = pd.DataFrame([['comment'] * 2],
+                                    columns=['name', 'Unnamed'])
+            data = pd.DataFrame({'name': ['H2O'], 'Unnamed': [1.]})
+            pd.concat([comments, data]).to_excel(filename, index=False)
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.simplefilter('always')
+                excel_data = excel.read_excel(io=filename)
+        self.assertEqual(excel_data, [{'name': 'H2O'}])
+        self.assertEqual(len(warns), 1)
+
+    def test_read_excel_write_thermdat(self):
+        a_low = [3.3, 1.e-3, -1.e-6, 1.e-9, -1.e-13, -3.e4, 2.]
+        a_high = [3.0, 2.e-3, -1.e-6, 2.e-10, -1.e-14, -3.e4, 6.]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'nasa.xlsx')
+            input_data = pd.DataFrame({
+                'name': ['H2O', 'O2'],
+                'phase': ['G', 'G'],
+                'element.H': [2, np.nan],
+                'element.O': [1, 2],
+                'T_low': [300., 300.],
+                'T_mid': [1000., 1000.],
+                'T_high': [3000., 3000.],
+            })
+            for i in range(7):
+                input_data['nasa.a_low.{}'.format(i)] = a_low[i]
+                input_data['nasa.a_high.{}'.format(i)] = a_high[i]
+            comments = pd.DataFrame([['comment'] * len(input_data.columns)],
+                                    columns=input_data.columns)
+            pd.concat([comments, input_data]).to_excel(filename, index=False)
+            species = [Nasa(**specie_data)
+                       for specie_data in excel.read_excel(io=filename)]
+        expected_species = [
+            Nasa(name='H2O', phase='G', elements={'H': 2, 'O': 1},
+                 T_low=300., T_mid=1000., T_high=3000., a_low=a_low,
+                 a_high=a_high),
+            Nasa(name='O2', phase='G', elements={'O': 2}, T_low=300.,
+                 T_mid=1000., T_high=3000., a_low=a_low, a_high=a_high)
+        ]
+        # Element counts are aligned in the first line of each entry
+        self.assertEqual(
+            write_thermdat(nasa_species=species, write_date=False),
+            write_thermdat(nasa_species=expected_species, write_date=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import os
+import tempfile
 import numpy as np
 from pmutt.io import gaussian
 
@@ -77,6 +78,50 @@ class TestGaussian(unittest.TestCase):
     def test_rot_symmetry_number(self):
         self.assertEqual(gaussian.read_rot_symmetry_num(test_file), 1)
 
+    def test_read_properties(self):
+        log_lines = [
+            ' Harmonic frequencies (cm**-1), IR intensities (KM/Mole)',
+            ' Frequencies --    100.0000               200.0000',
+            ' Harmonic frequencies (cm**-1), IR intensities (KM/Mole)',
+            ' Frequencies --   1595.1234              3657.0012',
+            ' Frequencies --   3755.9876',
+            ' Molecular mass:    18.01056 amu.',
+            ' Rotational symmetry number  2.',
+            ' Rotational temperatures (Kelvin)     40.11    20.94    13.76',
+            ' Zero-point correction=                           0.021150 '
+            '(Hartree/Particle)',
+            ' Sum of electronic and zero-point Energies=           '
+            '-76.399640',
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, 'water.log')
+            with open(log_file, 'w') as f_ptr:
+                f_ptr.write('\n'.join(log_lines))
+            properties = gaussian.read_properties(log_file,
+                                                  energy_units='Ha/molecule',
+                                                  mass_units='amu')
+            # Only the final frequency section is read
+            np.testing.assert_array_almost_equal(
+                properties['frequencies'], [1595.1234, 3657.0012, 3755.9876])
+            np.testing.assert_array_almost_equal(
+                properties['rot_temperatures'], [40.11, 20.94, 13.76])
+            self.assertAlmostEqual(properties['zpe'], 0.021150)
+            self.assertAlmostEqual(properties['electronic_and_zpe'],
+                                   -76.399640)
+            self.assertAlmostEqual(properties['molecular_mass'], 18.01056)
+            self.assertEqual(properties['rot_symmetry_num'], 2)
+            # Individual readers give the same values
+            self.assertAlmostEqual(
+                gaussian.read_zpe(log_file, units='Ha/molecule'),
+                properties['zpe'])
+            self.assertAlmostEqual(
+                gaussian.read_molecular_mass(log_file, units='amu'),
+                properties['molecular_mass'])
+
+            empty_file = os.path.join(tmp_dir, 'empty.log')
+            open(empty_file, 'w').close()
+            self.assertDictEqual(gaussian.read_properties(empty_file), {})
+
 
 if __name__ == '__main__':
     unittest.main()
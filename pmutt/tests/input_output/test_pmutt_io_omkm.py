@@ -0,0 +1,219 @@
+import filecmp
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import yaml
+
+from pmutt import pmutt_list_to_dict
+from pmutt.cantera.phase import IdealGas, StoichSolid
+from pmutt.empirical.nasa import Nasa
+from pmutt.empirical.shomate import Shomate
+from pmutt.io import ctml_writer
+from pmutt.io.omkm import write_cti, write_thermo_yaml
+from pmutt.mixture.cov import PiecewiseCovEffect
+from pmutt.omkm import phase as omkm_phase
+from pmutt.omkm.phase import InteractingInterface
+from pmutt.omkm.reaction import BEP, SurfaceReaction
+from pmutt.omkm.units import Units
+
+
+class TestOmkm(unittest.TestCase):
+    def setUp(self):
+        a_low = np.array([3.3, -1.2e-3, 2.7e-6, -1.7e-9, 3.6e-13, -1.0e3,
+                          -3.2])
+        a_high = np.array([2.9, 8.2e-4, -1.6e-7, 1.5e-11, -6.5e-16, -8.6e2,
+                           -1.2])
+        gas_species = [
+            Nasa(name='H2', elements={'H': 2}, phase='gas', T_low=300.,
+                 T_mid=1000., T_high=2000., a_low=a_low, a_high=a_high),
+            Shomate(name='Ar', elements={'Ar': 1}, phase='gas', T_low=298.,
+                    T_high=6000.,
+                    a=np.array([20.786, 2.825911e-7, -1.464191e-7,
+                                1.092131e-8, -3.661371e-8, -6.19735,
+                                179.999, 0.]))
+        ]
+        surf_species = [
+            Nasa(name='Pt(S)', elements={'Pt': 1}, phase='terrace',
+                 T_low=300., T_mid=1000., T_high=2000.,
+                 a_low=np.zeros(7), a_high=np.zeros(7)),
+            Nasa(name='H(S)', elements={'H': 1, 'Pt': 1}, phase='terrace',
+                 T_low=300., T_mid=1000., T_high=2000.,
+                 a_low=0.5 * a_low, a_high=0.5 * a_high),
+            Nasa(name='H2(S)', elements={'H': 2, 'Pt': 2}, phase='terrace',
+                 n_sites=2, T_low=300., T_mid=1000., T_high=2000.,
+                 a_low=0.9 * a_low, a_high=0.9 * a_high)
+        ]
+        bulk_species = [
+            Nasa(name='Pt(B)', elements={'Pt': 1}, phase='bulk', T_low=300.,
+                 T_mid=1000., T_high=2000., a_low=np.zeros(7),
+                 a_high=np.zeros(7))
+        ]
+        self.species = gas_species + surf_species + bulk_species
+        bep = BEP(name='H2_BEP', slope=0.5, intercept=10.,
+                  descriptor='delta_H', direction='cleavage')
+        species_dict = pmutt_list_to_dict(self.species + [bep])
+        self.reactions = [
+            SurfaceReaction.from_string('H2+2Pt(S)=2H(S)',
+                                        species=species_dict,
+                                        is_adsorption=True,
+                                        sticking_coeff=0.5),
+            SurfaceReaction.from_string('H2(S)=H2_BEP=2H(S)',
+                                        species=species_dict,
+                                        A=1.e13,
+                                        beta=0.),
+        ]
+        self.interactions = [
+            PiecewiseCovEffect(name_i='H(S)', name_j='H(S)',
+                               intervals=[0., 0.5, 1.], slopes=[-5., -10.])
+        ]
+        gas = IdealGas(name='gas', species=gas_species)
+        bulk = StoichSolid(name='bulk', species=bulk_species, density=21.45)
+        terrace = InteractingInterface(name='terrace',
+                                       species=surf_species,
+                                       site_density=2.49e-9,
+                                       phases=[gas, bulk],
+                                       reactions=self.reactions,
+                                       interactions=self.interactions)
+        self.phases = [gas, bulk, terrace]
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write_cti_xml(self):
+        cti_filename = os.path.join(self.tmp_dir.name, 'thermo.cti')
+        ref_filename = os.path.join(self.tmp_dir.name, 'ref.xml')
+        for use_motz_wise in (True, False):
+            write_cti(phases=self.phases,
+                      species=self.species,
+                      reactions=self.reactions,
+                      lateral_interactions=self.interactions,
+                      units=Units(quantity='mol', energy='kcal',
+                                  act_energy='kcal/mol'),
+                      filename=cti_filename,
+                      T=500.,
+                      use_motz_wise=use_motz_wise)
+            # XML written directly should match converting the CTI file
+            ctml_writer.convert(filename=cti_filename, outName=ref_filename)
+            self.assertTrue(
+                filecmp.cmp(os.path.join(self.tmp_dir.name, 'thermo.xml'),
+                            ref_filename,
+                            shallow=False))
+
+    def test_write_thermo_yaml(self):
+        gas = omkm_phase.IdealGas(name='gas', species=self.species[:2])
+        bulk = omkm_phase.StoichSolid(name='bulk', species=self.species[5:],
+                                      density=21.45)
+        terrace = InteractingInterface(name='terrace',
+                                       species=self.species[2:5],
+                                       site_density=2.49e-9,
+                                       phases=[gas, bulk],
+                                       reactions=self.reactions,
+                                       interactions=self.interactions)
+        yaml_filename = os.path.join(self.tmp_dir.name, 'thermo.yaml')
+        kwargs = {'phases': [gas, bulk, terrace],
+                  'species': self.species,
+                  'reactions': self.reactions,
+                  'lateral_interactions': self.interactions,
+                  'T': 500.}
+        yaml_str = write_thermo_yaml(**kwargs)
+        write_thermo_yaml(filename=yaml_filename, **kwargs)
+        with open(yaml_filename) as f_ptr:
+            # Ignore the timestamp
+            self.assertEqual(f_ptr.read().split('\n')[1:],
+                             yaml_str.split('\n')[1:])
+
+        yaml_dict = yaml.safe_load(yaml_str)
+        self.assertEqual([phase['name'] for phase in yaml_dict['phases']],
+                         ['gas', 'bulk', 'terrace'])
+        self.assertEqual([ind_species['name']
+                          for ind_species in yaml_dict['species']],
+                         [ind_species.name for ind_species in self.species])
+        self.assertEqual([reaction['id']
+                          for reaction in yaml_dict['reactions']],
+                         ['r_0000', 'r_0001'])
+        self.assertEqual(len(yaml_dict['beps']), 1)
+        self.assertEqual(len(yaml_dict['interactions']), 1)
+        # List elements are separated by blank lines and strings are unquoted
+        self.assertIn('species:\n\n- name: H2\n', yaml_str)
+        self.assertNotIn('\'', yaml_str)
+
+        # Empty lists are still written
+        yaml_dict = yaml.safe_load(write_thermo_yaml(species=[]))
+        self.assertEqual(yaml_dict['species'], [])
+
+    def test_write_thermo_yaml_manifest(self):
+        gas = omkm_phase.IdealGas(name='gas', species=self.species[:2])
+        terrace = InteractingInterface(name='terrace',
+                                       species=self.species[2:5],
+                                       site_density=2.49e-9,
+                                       phases=[gas],
+                                       reactions=self.reactions,
+                                       interactions=self.interactions)
+        manifest = os.path.join(self.tmp_dir.name, 'manifest.json')
+        kwargs = {'phases': [gas, terrace],
+                  'species': self.species,
+                  'reactions': self.reactions,
+                  'lateral_interactions': self.interactions,
+                  'T': 500.}
+        write_thermo_yaml(manifest=manifest, **kwargs)
+        # Only the changed species is written again
+        self.species[2].a_low[0] = 1.
+        self.species[2].a_high[0] = 1.
+        written = []
+        nasa_to_omkm_yaml = Nasa.to_omkm_yaml
+
+        def to_omkm_yaml(obj):
+            written.append(obj.name)
+            return nasa_to_omkm_yaml(obj)
+
+        with mock.patch.object(Nasa, 'to_omkm_yaml', to_omkm_yaml):
+            yaml_str = write_thermo_yaml(manifest=manifest, **kwargs)
+        self.assertEqual(written, ['Pt(S)'])
+        # Output is the same as writing all the objects
+        self.assertEqual(yaml_str.split('\n')[1:],
+                         write_thermo_yaml(**kwargs).split('\n')[1:])
+
+        # Reactions depend on their species
+        self.species[5].a_low[5] = 0.
+        written = []
+        reaction_to_omkm_yaml = SurfaceReaction.to_omkm_yaml
+
+        def to_omkm_yaml(obj, units, T):
+            written.append(obj.id)
+            return reaction_to_omkm_yaml(obj, units=units, T=T)
+
+        with mock.patch.object(SurfaceReaction, 'to_omkm_yaml', to_omkm_yaml):
+            yaml_str = write_thermo_yaml(manifest=manifest, **kwargs)
+        self.assertEqual(written, [])
+        self.species[3].a_low[5] = 0.
+        with mock.patch.object(SurfaceReaction, 'to_omkm_yaml', to_omkm_yaml):
+            yaml_str = write_thermo_yaml(manifest=manifest, **kwargs)
+        self.assertEqual(written, ['r_0000', 'r_0001'])
+        self.assertEqual(yaml_str.split('\n')[1:],
+                         write_thermo_yaml(**kwargs).split('\n')[1:])
+
+    def test_write_cti_manifest(self):
+        manifest = os.path.join(self.tmp_dir.name, 'manifest.json')
+        kwargs = {'phases': self.phases,
+                  'species': self.species,
+                  'reactions': self.reactions,
+                  'lateral_interactions': self.interactions,
+                  'units': Units(quantity='mol', energy='kcal',
+                                 act_energy='kcal/mol'),
+                  'T': 500.}
+        cti_str = write_cti(manifest=manifest, **kwargs)
+        self.assertEqual(write_cti(manifest=manifest, **kwargs).split('\n')[1:],
+                         cti_str.split('\n')[1:])
+        # Changing the temperature writes the reactions again
+        kwargs['T'] = 600.
+        self.assertEqual(
+            write_cti(manifest=manifest, **kwargs).split('\n')[1:],
+            write_cti(**kwargs).split('\n')[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import importlib.util
+import os
+import tempfile
+import types
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pmutt.io import tabular
+from pmutt.io.excel import _read_tabular_data
+from pmutt.statmech import StatMech
+
+
+class TestTabular(unittest.TestCase):
+    def setUp(self):
+        self.input_data = pd.DataFrame({
+            'name': ['H2O', 'CO2', 'CH4', 'NH3', 'H2'],
+            'statmech_model': ['IdealGas'] * 5,
+            'atoms': ['H2O', 'CO2', 'CH4', 'NH3', 'H2'],
+            'element.C': [np.nan, 1, 1, np.nan, np.nan],
+            'element.H': [2, np.nan, 4, 3, 2],
+            'vib_wavenumber.0': [3825.434, 2439.1, 3020.3, 3577., 4401.2],
+            'vib_wavenumber.1': [1582.432, np.nan, 1306.1, 1691., np.nan],
+            'potentialenergy': [-14.2209, -22.9517, -24.0512, -19.5406,
+                                -6.7598],
+            'symmetrynumber': [2, 2, 12, 3, 2],
+            'spin': [0] * 5,
+        })
+        self.expected = _read_tabular_data(input_data=self.input_data,
+                                           source='species.csv')
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _assert_data_equal(self, data, expected):
+        self.assertEqual(len(data), len(expected))
+        for row, expected_row in zip(data, expected):
+            self.assertEqual(sorted(row), sorted(expected_row))
+            for key, val in expected_row.items():
+                self.assertEqual(row[key], val)
+
+    def test_read_csv(self):
+        filename = os.path.join(self.tmp_dir.name, 'species.csv')
+        self.input_data.to_csv(filename, index=False)
+        data = tabular.read_csv(filename, chunksize=2)
+        self.assertIsInstance(data, types.GeneratorType)
+        self._assert_data_equal(list(data), self.expected)
+
+        species = list(tabular.read_csv(filename, chunksize=2,
+                                        obj_fn=StatMech))
+        self.assertIsInstance(species[4], StatMech)
+        self.assertEqual(species[4].name, 'H2')
+        self.assertAlmostEqual(species[4].get_H(T=298.15, units='eV'),
+                               StatMech(**self.expected[4]).get_H(
+                                   T=298.15, units='eV'))
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is None,
+                     'pyarrow is not installed')
+    def test_read_parquet(self):
+        filename = os.path.join(self.tmp_dir.name, 'species.parquet')
+        self.input_data.to_parquet(filename, index=False)
+        data = list(tabular.read_parquet(filename, chunksize=2))
+        self._assert_data_equal(data, self.expected)
+
+        species = list(tabular.read_parquet(filename, chunksize=2,
+                                            obj_fn=StatMech))
+        self.assertIsInstance(species[4], StatMech)
+        self.assertEqual(species[4].name, 'H2')
+
+        data = list(tabular.read_parquet(filename, chunksize=2,
+                                         columns=['name', 'element.C']))
+        self.assertEqual(data[1], {'name': 'CO2', 'elements': {'C': 1}})
+        self.assertEqual(data[0], {'name': 'H2O'})
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow') is None,
+                         'pyarrow is installed')
+    def test_read_parquet_no_pyarrow(self):
+        filename = os.path.join(self.tmp_dir.name, 'species.parquet')
+        with self.assertRaises(ImportError):
+            next(tabular.read_parquet(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
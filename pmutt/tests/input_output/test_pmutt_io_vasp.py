@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from pmutt.io import vasp
 
@@ -31,6 +32,31 @@ class TestVasp(unittest.TestCase):
             vasp.set_vib_wavenumbers_from_outcar(incorrect_file, out_dict,
                                                  cutoff)
 
+    def test_set_vib_wavenumbers_from_outcar_last_block(self):
+        outcar_lines = [
+            ' Eigenvectors and eigenvalues of the dynamical matrix',
+            '   1 f  =   30.000000 THz   188.495559 2PiTHz 1000.691000 cm-1'
+            '   124.07 meV',
+            ' Eigenvectors and eigenvalues of the dynamical matrix',
+            '   1 f  =  114.572212 THz   719.878437 2PiTHz 3821.717493 cm-1'
+            '   473.832750 meV',
+            '   2 f/i=    0.318004 THz     1.998076 2PiTHz   10.607462 cm-1'
+            '     1.315158 meV',
+            ' Eigenvectors after division by SQRT(mass)',
+            '   1 f  =  114.572212 THz   719.878437 2PiTHz 3821.717493 cm-1'
+            '   473.832750 meV',
+        ]
+        out_dict = dict()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outcar_file = os.path.join(tmp_dir, 'OUTCAR')
+            with open(outcar_file, 'w') as f_ptr:
+                f_ptr.write('\n'.join(outcar_lines))
+            vasp.set_vib_wavenumbers_from_outcar(outcar_file,
+                                                 out_dict,
+                                                 include_imaginary=True)
+        self.assertDictEqual(out_dict,
+                             {'vib_wavenumbers': [3821.717493, -10.607462]})
+
     def test_get_vib_wavenumber_from_line(self):
         expected_frequency = 3821.717493
         sample_line = '   1 f  =  114.572212 THz   719.878437 2PiTHz ' \
@@ -0,0 +1,151 @@
+import unittest
+
+import numpy as np
+
+from pmutt import pmutt_list_to_dict
+from pmutt.empirical.nasa import Nasa
+from pmutt.io.omkm import organize_phases
+from pmutt.mixture.cov import PiecewiseCovEffect
+from pmutt.omkm.mechanism import Mechanism
+from pmutt.omkm.phase import IdealGas, InteractingInterface
+from pmutt.omkm.reaction import SurfaceReaction
+
+
+class TestMechanism(unittest.TestCase):
+    def setUp(self):
+        def get_nasa(name, phase, elements):
+            return Nasa(name=name, phase=phase, elements=elements, T_low=300.,
+                        T_mid=1000., T_high=2000., a_low=np.zeros(7),
+                        a_high=np.zeros(7))
+
+        self.species = [
+            get_nasa('H2', 'gas', {'H': 2}),
+            get_nasa('Pt(S)', 'terrace', {'Pt': 1}),
+            get_nasa('H(S)', 'terrace', {'H': 1, 'Pt': 1}),
+            get_nasa('H2(S)', 'terrace', {'H': 2, 'Pt': 2}),
+        ]
+        species_dict = pmutt_list_to_dict(self.species)
+        self.reactions = [
+            SurfaceReaction.from_string('H2+2Pt(S)=2H(S)',
+                                        species=species_dict,
+                                        is_adsorption=True,
+                                        sticking_coeff=0.5),
+            SurfaceReaction.from_string('H2(S)=2H(S)',
+                                        species=species_dict,
+                                        A=1.e13,
+                                        beta=0.),
+        ]
+        self.interactions = [
+            PiecewiseCovEffect(name_i='H(S)', name_j='H(S)',
+                               intervals=[0., 1.], slopes=[-5.])
+        ]
+        self.phases_data = [
+            {'name': 'gas', 'phase_type': 'IdealGas'},
+            {'name': 'terrace', 'phase_type': 'InteractingInterface',
+             'site_density': 2.49e-9, 'phases': ['gas']},
+        ]
+
+    def test_get_phase(self):
+        mechanism = Mechanism(species=self.species,
+                              reactions=self.reactions,
+                              interactions=self.interactions)
+        self.assertIs(mechanism.get_species('H(S)'), self.species[2])
+        self.assertEqual(mechanism.get_phase_species('gas'),
+                         self.species[:1])
+        self.assertEqual(mechanism.get_phase_species('terrace'),
+                         self.species[1:])
+        self.assertEqual(mechanism.get_phase_reactions('gas'),
+                         self.reactions[:1])
+        self.assertEqual(mechanism.get_phase_reactions('terrace'),
+                         self.reactions)
+        self.assertEqual(mechanism.get_phase_interactions('terrace'),
+                         self.interactions)
+        self.assertEqual(mechanism.get_phase_interactions('gas'), [])
+
+        # Duplicate reactions are ignored
+        mechanism.add_reactions(self.reactions[:1])
+        self.assertEqual(mechanism.reactions, self.reactions)
+
+        # Removing species updates the phase
+        mechanism.remove_species('H2(S)')
+        self.assertEqual(mechanism.get_phase_species('terrace'),
+                         self.species[1:3])
+        with self.assertRaises(KeyError):
+            mechanism.get_species('H2(S)')
+
+    def test_remove(self):
+        mechanism = Mechanism(species=self.species,
+                              reactions=self.reactions,
+                              interactions=self.interactions)
+        # Equal reactions remove the reaction in the mechanism
+        reaction = SurfaceReaction.from_dict(self.reactions[0].to_dict())
+        self.assertEqual(mechanism.remove_reactions([reaction]),
+                         self.reactions[:1])
+        self.assertEqual(mechanism.reactions, self.reactions[1:])
+        self.assertEqual(mechanism.get_phase_reactions('gas'), [])
+        self.assertEqual(mechanism.get_phase_reactions('terrace'),
+                         self.reactions[1:])
+        with self.assertRaises(KeyError):
+            mechanism.remove_reactions(self.reactions[:1])
+        # Removed reactions can be added again
+        mechanism.add_reactions(self.reactions[:1])
+        self.assertEqual(mechanism.get_phase_reactions('gas'),
+                         self.reactions[:1])
+
+        # Reactions modified after being added are still found
+        self.reactions[1].A = 2.e13
+        mechanism.remove_reactions(self.reactions[1:])
+        self.assertEqual(mechanism.reactions, self.reactions[:1])
+        self.assertEqual(mechanism.get_phase_reactions('terrace'),
+                         self.reactions[:1])
+
+        mechanism.remove_interactions(self.interactions)
+        self.assertEqual(mechanism.interactions, [])
+        self.assertEqual(mechanism.get_phase_interactions('terrace'), [])
+        with self.assertRaises(KeyError):
+            mechanism.remove_interactions(self.interactions)
+
+    def test_organize_phases(self):
+        mechanism = Mechanism(species=self.species,
+                              reactions=self.reactions,
+                              interactions=self.interactions)
+        gas, terrace = mechanism.organize_phases(self.phases_data)
+        self.assertIsInstance(gas, IdealGas)
+        self.assertIsInstance(terrace, InteractingInterface)
+        self.assertEqual(gas.species_names, ['H2'])
+        self.assertEqual(terrace.species_names, ['Pt(S)', 'H(S)', 'H2(S)'])
+        self.assertEqual(terrace.reactions, self.reactions)
+        self.assertEqual(terrace.interactions, self.interactions)
+        self.assertIs(self.species[2].phase, terrace)
+        self.assertEqual(mechanism.phases, [gas, terrace])
+        # Phases can be looked up using phase objects
+        self.assertEqual(mechanism.get_phase_species(terrace),
+                         self.species[1:])
+
+        phases = organize_phases(self.phases_data,
+                                 species=self.species,
+                                 reactions=self.reactions,
+                                 interactions=self.interactions)
+        self.assertEqual([phase.species_names for phase in phases],
+                         [gas.species_names, terrace.species_names])
+
+    def test_index_species(self):
+        phase = IdealGas(name='gas', species=list(self.species))
+        self.assertEqual(phase.index_species('H(S)'), 2)
+        phase.append_species(Nasa(name='O2', phase='gas', T_low=300.,
+                                  T_mid=1000., T_high=2000.,
+                                  a_low=np.zeros(7), a_high=np.zeros(7)))
+        self.assertEqual(phase.index_species('O2'), 4)
+        phase.remove_species('Pt(S)')
+        self.assertEqual(phase.species_names, ['H2', 'H(S)', 'H2(S)', 'O2'])
+        self.assertEqual(phase.index_species('O2'), 3)
+        # Modifying the list directly is still handled
+        phase.species.insert(0, phase.species.pop())
+        self.assertEqual(phase.index_species('O2'), 0)
+        self.assertEqual(phase.index_species('H2'), 1)
+        with self.assertRaises(ValueError):
+            phase.index_species('Pt(S)')
+
+
+if __name__ == '__main__':
+    unittest.main()
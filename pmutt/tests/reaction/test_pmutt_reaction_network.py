@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+pmutt.test_pmutt_reaction_network
+Tests for pmutt module
+"""
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from pmutt import constants as c
+from pmutt.reaction import Reaction
+from pmutt.reaction.network import (Network, _get_bottleneck_energies,
+                                    state_str_to_set)
+from pmutt.statmech import StatMech, presets
+
+
+class TestNetwork(unittest.TestCase):
+    def setUp(self):
+        self.T = c.T0('K')
+        energies = {
+            'A': 0.,
+            'B': -0.5,
+            'C': 0.2,
+            'D': -0.8,
+            'E': -0.3,
+            'F': -1.2,
+            'TS_AB': 0.9,
+            'TS_AC': 0.6,
+            'TS_BC': 0.7,
+            'TS_BD': 0.4,
+            'TS_CE': 0.5,
+            'TS_DF': 0.1,
+            'TS_EF': -0.1,
+            'TS_DE': 0.3,
+        }
+        species = {
+            name: StatMech(name=name,
+                           potentialenergy=energy,
+                           **presets['electronic'])
+            for name, energy in energies.items()
+        }
+        reaction_strs = ('A = TS_AB = B', 'A = TS_AC = C', 'B = TS_BC = C',
+                         'B = TS_BD = D', 'C = TS_CE = E', 'D = TS_DF = F',
+                         'E = TS_EF = F', 'D = TS_DE = E')
+        self.reactions = [
+            Reaction.from_string(reaction_str=reaction_str, species=species)
+            for reaction_str in reaction_strs
+        ]
+        self.network = Network(reactions=self.reactions)
+        self.species = species
+        self.source = state_str_to_set(['A'], [1.])
+        self.target = state_str_to_set(['F'], [1.])
+
+    def _get_brute_min_E_span(self, **kwargs):
+        return np.min([
+            self.network.get_E_span(path=path, **kwargs)
+            for path in nx.all_simple_paths(self.network.graph,
+                                            source=self.source,
+                                            target=self.target)
+        ])
+
+    def test_add_reaction(self):
+        network = Network(reactions=self.reactions[:-1])
+        network.add_reaction(self.reactions[-1])
+        self.assertEqual(len(network), len(self.reactions))
+        self.assertTrue(nx.utils.graphs_equal(network.graph,
+                                              self.network.graph))
+
+        # Energies of new states are evaluated
+        network = Network(reactions=self.reactions[:2])
+        G = network.get_G_nodes(units='eV', T=self.T)
+        network.add_reaction(self.reactions[3])
+        G = network.get_G_nodes(units='eV', T=self.T)
+        self.assertAlmostEqual(G[self.source], 0.)
+        self.assertAlmostEqual(G[state_str_to_set(['D'], [1.])], -0.8)
+
+    def test_remove_reaction(self):
+        network = Network(reactions=self.reactions)
+        network.remove_reaction(self.reactions[-1])
+        self.assertTrue(
+            nx.utils.graphs_equal(network.graph,
+                                  Network(self.reactions[:-1]).graph))
+        # States shared with other reactions are kept
+        D = state_str_to_set(['D'], [1.])
+        self.assertEqual(network.graph.nodes[D]['n_reactions'], 2)
+        self.assertNotIn(state_str_to_set(['TS_DE'], [1.]), network.graph)
+
+        network.remove_reaction(0)
+        self.assertNotIn(state_str_to_set(['TS_AB'], [1.]), network.graph)
+        self.assertEqual(len(network), len(self.reactions) - 2)
+        with self.assertRaises(ValueError):
+            network.remove_reaction(self.reactions[-1])
+
+    def test_remove_reaction_index(self):
+        network = Network(reactions=self.reactions)
+        # Indices may be numpy integers
+        network.remove_reaction(np.int64(0))
+        self.assertNotIn(self.reactions[0], network.reactions)
+        self.assertTrue(
+            nx.utils.graphs_equal(network.graph,
+                                  Network(self.reactions[1:]).graph))
+        # The moved reaction can still be removed by object
+        network.remove_reaction(self.reactions[-1])
+        network.remove_reaction(np.int64(-1))
+        self.assertEqual(len(network), len(self.reactions) - 3)
+        with self.assertRaises(IndexError):
+            network.remove_reaction(np.int64(len(self.reactions)))
+
+    def test_get_G_nodes(self):
+        G = self.network.get_G_nodes(units='eV', T=self.T)
+        self.assertAlmostEqual(G[self.source], 0.)
+        self.assertAlmostEqual(G[self.target], -1.2)
+
+        # Energies reflect changes to the species
+        self.species['F'].elec_model.potentialenergy = -2.
+        G = self.network.get_G_nodes(units='eV', T=self.T)
+        self.assertAlmostEqual(G[self.target], -2.)
+        self.species['TS_AB'].elec_model.potentialenergy = 1.5
+        path = [self.source, state_str_to_set(['TS_AB'], [1.]),
+                state_str_to_set(['B'], [1.])]
+        self.assertAlmostEqual(
+            self.network.get_E_span(path=path, units='eV', T=self.T), 1.5)
+
+        G = self.network.get_G_nodes(units='kcal/mol', T=self.T)
+        self.assertAlmostEqual(
+            G[self.target], self.species['F'].get_G(units='kcal/mol',
+                                                    T=self.T))
+
+    def test_get_min_E_span(self):
+        E_span, path = self.network.get_min_E_span(source='A',
+                                                   target='F',
+                                                   units='eV',
+                                                   T=self.T,
+                                                   return_path=True)
+        self.assertAlmostEqual(E_span,
+                               self._get_brute_min_E_span(units='eV',
+                                                          T=self.T))
+        self.assertAlmostEqual(
+            self.network.get_E_span(path=path, units='eV', T=self.T), E_span)
+        self.assertEqual(path[0], self.source)
+        self.assertEqual(path[-1], self.target)
+
+        # Dimensionless energy span
+        np.testing.assert_almost_equal(
+            self.network.get_min_E_span(source='A', target='F', T=self.T),
+            self._get_brute_min_E_span(T=self.T))
+
+        # Multiple targets and a maximum pathway length
+        targets = [self.target, state_str_to_set(['E'], [1.])]
+        brute_E_span = np.min([
+            self.network.get_E_span(path=path, units='eV', T=self.T)
+            for path in nx.all_simple_paths(self.network.graph,
+                                            source=self.source,
+                                            target=targets,
+                                            cutoff=4)
+        ])
+        self.assertAlmostEqual(
+            self.network.get_min_E_span(source='A',
+                                        target=['F', 'E'],
+                                        units='eV',
+                                        cutoff=4,
+                                        T=self.T), brute_E_span)
+
+        with self.assertRaises(ValueError):
+            self.network.get_min_E_span(source='A',
+                                        target='F',
+                                        units='eV',
+                                        cutoff=1,
+                                        T=self.T)
+
+    def test_get_E_span_sweep(self):
+        T = np.array([300., 500., 800.])
+        E_span, TDI, TDTS, TOF = self.network.get_E_span_sweep(source='A',
+                                                               target='F',
+                                                               T=T)
+        for j, T_j in enumerate(T):
+            E_span_j, path = self.network.get_min_E_span(source='A',
+                                                         target='F',
+                                                         T=T_j,
+                                                         return_path=True)
+            self.assertAlmostEqual(E_span[j], E_span_j)
+        np.testing.assert_array_almost_equal(
+            TOF, c.kb('J/K') * T / c.h('J s') * np.exp(-E_span))
+
+        # Evaluate a specific pathway in dimensional units
+        E_span, TDI, TDTS, TOF = self.network.get_E_span_sweep(path=path,
+                                                               units='eV',
+                                                               T=T)
+        np.testing.assert_array_almost_equal(E_span, [0.6] * 3)
+        np.testing.assert_array_equal(TDI, ['F'] * 3)
+        np.testing.assert_array_equal(TDTS, ['TS_AC'] * 3)
+        np.testing.assert_array_almost_equal(
+            TOF,
+            c.kb('J/K') * T / c.h('J s') *
+            np.exp(-E_span / c.R('eV/K') / T))
+
+        with self.assertRaises(ValueError):
+            self.network.get_E_span_sweep(T=T)
+
+    def test__get_bottleneck_energies(self):
+        # Equal energies with the empty state as a target
+        A = state_str_to_set(['A'], [1.])
+        B = state_str_to_set(['B'], [1.])
+        empty = frozenset()
+        graph = nx.Graph([(A, B), (B, empty)])
+        G_bottleneck, next_nodes = _get_bottleneck_energies(
+            graph=graph, G={A: 0., B: 0., empty: 0.}, targets=[B, empty])
+        self.assertEqual(G_bottleneck, {A: 0., B: 0., empty: 0.})
+        self.assertEqual(next_nodes, {A: B, B: None, empty: None})
+
+
+if __name__ == '__main__':
+    unittest.main()
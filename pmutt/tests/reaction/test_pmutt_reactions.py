@@ -700,6 +700,24 @@ class TestReactions(unittest.TestCase):
         G_span = self.rxn_pathway2.get_E_span(units='eV', T=298.15)
         self.assertAlmostEqual(G_span, 3.5)
 
+    def test_from_strings(self):
+        reaction_strs = ['O+2H=H2O', 'O+H2=H2O', 'OH+H=H2O', 'OH+0.5H2=H2O',
+                         '0.5O+2H=H2O', '0.5O2+H2=H2O']
+        reactions = Reactions.from_strings(reaction_strs=reaction_strs,
+                                           species=self.species_dict)
+        self.assertEqual(reactions, self.reactions)
+        # Reactions sharing a state should not share lists
+        reactions[0].products_stoich[0] = 2.
+        self.assertEqual(reactions[1].products_stoich, [1.])
+        # Species lists are converted to dictionaries
+        reactions = Reactions.from_strings(
+            reaction_strs=reaction_strs,
+            species=list(self.species_dict.values()))
+        self.assertEqual(reactions, self.reactions)
+        with self.assertRaises(KeyError):
+            Reactions.from_strings(reaction_strs=['O+H2=H2O', 'O+N2=N2O'],
+                                   species=self.species_dict)
+
     def test_to_dict(self):
         self.maxDiff = None
         self.assertEqual(self.reactions.to_dict(), self.reactions_dict)
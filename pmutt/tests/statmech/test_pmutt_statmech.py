@@ -3,13 +3,14 @@
 pmutt.test_pmutt_model_statmech
 Tests for pmutt module
 """
+import pickle
 import unittest
 import numpy as np
 from ase.build import molecule
 from ase.thermochemistry import IdealGasThermo
 from pmutt import get_molecular_weight
 from pmutt import constants as c
-from pmutt.statmech import trans, rot, elec, vib, StatMech
+from pmutt.statmech import trans, rot, elec, vib, EmptyMode, StatMech
 
 
 class TestStatMech(unittest.TestCase):
@@ -199,6 +200,25 @@ class TestStatMech(unittest.TestCase):
                                        get_GoRT(T=self.T0, S_elements=True),
                                        GoRT_expected)
 
+    def test_compact_modes(self):
+        # Empty modes are shared between species
+        species = StatMech(trans_model=EmptyMode, vib_model=EmptyMode)
+        self.assertIs(species.trans_model, EmptyMode())
+        self.assertIs(species.vib_model, EmptyMode())
+        # Modes do not have a __dict__
+        for mode in (self.CO2_pmutt.trans_model, self.CO2_pmutt.vib_model,
+                     self.CO2_pmutt.rot_model, self.CO2_pmutt.elec_model,
+                     EmptyMode()):
+            self.assertFalse(hasattr(mode, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.CO2_pmutt.vib_model.vib_temperatures = [1.]
+
+        CO2_copy = pickle.loads(pickle.dumps(self.CO2_pmutt))
+        self.assertEqual(CO2_copy, self.CO2_pmutt)
+        self.assertIs(CO2_copy.nucl_model, EmptyMode())
+        self.assertEqual(CO2_copy.get_GoRT(T=self.T0),
+                         self.CO2_pmutt.get_GoRT(T=self.T0))
+
 
 if __name__ == '__main__':
     unittest.main()
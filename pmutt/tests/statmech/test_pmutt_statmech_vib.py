@@ -5,6 +5,7 @@ Tests for pmutt module
 """
 import unittest
 import numpy as np
+from scipy.integrate import quad
 from pmutt import constants as c
 from pmutt.statmech import vib
 
@@ -69,6 +70,28 @@ class TestHarmonicVib(unittest.TestCase):
         self.assertEqual(vib.HarmonicVib.from_dict(self.vib_H2O_dict),
                          self.vib_H2O)
 
+    def test_get_valid_vib_wavenumbers(self):
+        wavenumbers = [3825.434, -50., 1582.432]
+        np.testing.assert_array_equal(
+            vib._get_valid_vib_wavenumbers(wavenumbers=wavenumbers),
+            [3825.434, 1582.432])
+        np.testing.assert_array_equal(
+            vib._get_valid_vib_wavenumbers(wavenumbers=wavenumbers,
+                                           substitute=12.),
+            [3825.434, 12., 1582.432])
+
+    def test_array_T(self):
+        # Number of temperatures matches the number of modes on purpose
+        T = np.array([300., 500., 800.])
+        vib_H2O = vib.HarmonicVib(
+            vib_wavenumbers=[3825.434, 3710.2642, -1582.432],
+            imaginary_substitute=100.)
+        for method_name in ('get_q', 'get_CvoR', 'get_UoRT', 'get_SoR',
+                            'get_GoRT'):
+            method = getattr(vib_H2O, method_name)
+            np.testing.assert_array_almost_equal(method(T=T),
+                                                 [method(T=T_i) for T_i in T])
+
 
 class TestQRRHOVib(unittest.TestCase):
     def setUp(self):
@@ -166,6 +189,13 @@ class TestQRRHOVib(unittest.TestCase):
         self.assertEqual(vib.QRRHOVib.from_dict(self.vib_H2O_dict),
                          self.vib_H2O)
 
+    def test_array_T(self):
+        T = np.array([300., 500., 800.])
+        for method_name in ('get_CvoR', 'get_UoRT', 'get_SoR', 'get_GoRT'):
+            method = getattr(self.vib_H2O, method_name)
+            np.testing.assert_array_almost_equal(method(T=T),
+                                                 [method(T=T_i) for T_i in T])
+
 
 class TestEinsteinVib(unittest.TestCase):
     def setUp(self):
@@ -288,6 +318,23 @@ class TestDebyeVib(unittest.TestCase):
     def test_from_dict(self):
         self.assertEqual(vib.DebyeVib.from_dict(self.vib_Ag_dict), self.vib_Ag)
 
+    def test_get_debye_integral(self):
+        # Values spanning both series compared to numerical integration
+        x = np.array([1.e-3, 0.5, 1.9, 2., 2.1, 5., 20., 100.])
+        exp_J3 = [
+            quad(lambda t: t**3 / np.expm1(t), 0., x_i)[0] for x_i in x
+        ]
+        np.testing.assert_allclose(vib._get_debye_integral(x), exp_J3,
+                                   rtol=1.e-12)
+        self.assertAlmostEqual(vib._get_debye_integral(1e3), np.pi**4 / 15.)
+
+    def test_array_T(self):
+        T = np.linspace(10., 2000., 20)
+        for method_name in ('get_q', 'get_CvoR', 'get_UoRT', 'get_SoR'):
+            method = getattr(self.vib_Ag, method_name)
+            np.testing.assert_array_almost_equal(method(T=T),
+                                                 [method(T=T_i) for T_i in T])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,10 +5,16 @@ Tests for pmutt module
 Created on Fri Jul 7 12:31:00 2018
 """
 
+import copy
 import os
+import pickle
+import subprocess
+import sys
 import unittest
 import pandas as pd
 import pmutt
+from pmutt.statmech import StatMech
+from pmutt.statmech.vib import HarmonicVib
 
 
 class Testpmutt(unittest.TestCase):
@@ -269,6 +275,30 @@ class Testpmutt(unittest.TestCase):
         self.assertEqual(pmutt._check_obj(self.sum_class, num1=1, num2=2),
                          sum_obj)
 
+    def test_lazy_module(self):
+        lazy_json = pmutt._LazyModule('json')
+        self.assertEqual(lazy_json.dumps([1, 2]), '[1, 2]')
+        # Copies are created without calling __init__
+        for lazy_copy in (copy.copy(lazy_json), copy.deepcopy(lazy_json),
+                          pickle.loads(pickle.dumps(lazy_json))):
+            self.assertEqual(lazy_copy.name, 'json')
+            self.assertEqual(lazy_copy.dumps([1, 2]), '[1, 2]')
+        with self.assertRaises(AttributeError):
+            lazy_json.__missing_attribute__
+        # Heavy optional backends should not be imported with pmutt
+        code = ('import sys, pmutt, pmutt.statmech, pmutt.empirical.nasa, '
+                'pmutt.reaction.network, pmutt.io.omkm; '
+                'print(",".join(name for name in ("matplotlib.pyplot", '
+                '"pygal", "networkx", "yaml", "scipy.optimize") '
+                'if name in sys.modules))')
+        root_path = os.path.dirname(os.path.dirname(pmutt.__file__))
+        output = subprocess.run([sys.executable, '-c', code],
+                                cwd=root_path,
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True,
+                                check=True).stdout
+        self.assertEqual(output.strip(), '')
+
     def test_check_iterable_attr(self):
         self.assertListEqual(pmutt._check_iterable_attr([1]), [1])
         self.assertTupleEqual(pmutt._check_iterable_attr((1, )), (1, ))
@@ -288,6 +318,98 @@ class Test_pmuttBase(unittest.TestCase):
         self.assertTrue(self.pmutt_base == self.pmutt_base)
         self.assertFalse(self.pmutt_base == None)
 
+    def test_hash(self):
+        # _pmuttBase does not have a __dict__ so subclasses can use __slots__
+        class pmuttObj(pmutt._pmuttBase):
+            pass
+
+        pmutt_base1 = pmuttObj()
+        pmutt_base1.elements = {'H': 2}
+        pmutt_base1.vib_wavenumbers = [4000., 1000.]
+        pmutt_base2 = pmuttObj()
+        pmutt_base2.elements = {'H': 2}
+        pmutt_base2.vib_wavenumbers = [4000., 1000.]
+        self.assertEqual(hash(pmutt_base1), hash(pmutt_base2))
+        self.assertEqual(len({pmutt_base1, pmutt_base2}), 1)
+        # Fingerprint is not part of the dictionary representation
+        self.assertNotIn('_fingerprint', pmutt_base1.to_dict())
+
+        # Assigning an attribute clears the cached fingerprint
+        pmutt_base2.elements = {'H': 1}
+        self.assertNotEqual(hash(pmutt_base1), hash(pmutt_base2))
+        self.assertFalse(pmutt_base1 == pmutt_base2)
+
+        # Modifying an attribute in place requires clearing the fingerprint
+        pmutt_base2.elements['H'] = 2
+        pmutt_base2.clear_fingerprint()
+        self.assertEqual(hash(pmutt_base1), hash(pmutt_base2))
+        self.assertTrue(pmutt_base1 == pmutt_base2)
+
+    def test_hash_nested(self):
+        statmech1 = StatMech(vib_model=HarmonicVib,
+                             vib_wavenumbers=[4000., 1000.])
+        statmech2 = StatMech(vib_model=HarmonicVib,
+                             vib_wavenumbers=[4000., 1000.])
+        self.assertEqual(hash(statmech1), hash(statmech2))
+        self.assertTrue(statmech1 == statmech2)
+
+        # Modifying a contained object clears the fingerprint of the
+        # containing object
+        statmech2.vib_model.imaginary_substitute = 100.
+        self.assertNotEqual(hash(statmech1), hash(statmech2))
+        self.assertFalse(statmech1 == statmech2)
+
+    def test_pickle(self):
+        statmech = StatMech(vib_model=HarmonicVib,
+                            vib_wavenumbers=[4000., 1000.])
+        hash(statmech)
+        statmech_copy = pickle.loads(pickle.dumps(statmech))
+        self.assertEqual(statmech, statmech_copy)
+        self.assertEqual(hash(statmech), hash(statmech_copy))
+        self.assertEqual(statmech, copy.deepcopy(statmech))
+
+        # Copies do not share cached fingerprints
+        statmech_copy.vib_model.imaginary_substitute = 100.
+        self.assertNotEqual(statmech, statmech_copy)
+
+    def test_unique_objects(self):
+        class pmuttObj(pmutt._pmuttBase):
+            pass
+
+        pmutt_base1 = pmuttObj()
+        pmutt_base1.elements = {'H': 2}
+        pmutt_base2 = pmuttObj()
+        pmutt_base2.elements = {'H': 2}
+        pmutt_base3 = pmuttObj()
+        pmutt_base3.elements = {'H': 1}
+
+        unique_objs = pmutt._UniqueObjects()
+        self.assertTrue(unique_objs.add(pmutt_base1))
+        self.assertFalse(unique_objs.add(pmutt_base1))
+        self.assertFalse(unique_objs.add(pmutt_base2))
+        self.assertTrue(unique_objs.add(pmutt_base3))
+        self.assertEqual(len(unique_objs), 2)
+        self.assertIn(pmutt_base2, unique_objs)
+
+        # Objects modified after being added are filed again
+        pmutt_base1.elements = {'H': 3}
+        self.assertNotIn(pmutt_base2, unique_objs)
+        self.assertTrue(unique_objs.add(pmutt_base2))
+        pmutt_base4 = pmuttObj()
+        pmutt_base4.elements = {'H': 3}
+        self.assertFalse(unique_objs.add(pmutt_base4))
+        self.assertEqual(len(unique_objs), 3)
+
+        # Removing an equal object removes the added object
+        self.assertIs(unique_objs.remove(pmutt_base4), pmutt_base1)
+        self.assertNotIn(pmutt_base4, unique_objs)
+        self.assertEqual(len(unique_objs), 2)
+        with self.assertRaises(KeyError):
+            unique_objs.remove(pmutt_base4)
+        # Removed objects are no longer watched
+        pmutt_base1.elements = {'H': 1}
+        self.assertTrue(unique_objs.add(pmutt_base4))
+
     def test_to_dict(self):
         out_dict = {'class': "<class 'pmutt._pmuttBase'>"}
         self.assertDictEqual(self.pmutt_base.to_dict(), out_dict)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+pmutt.test_pmutt_profiling
+Tests for pmutt.profiling module
+"""
+import os
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+
+import pmutt
+from pmutt import profiling
+from pmutt import statmech
+from pmutt.reaction import Reaction
+from pmutt.statmech import StatMech, elec, vib
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.species = [
+            StatMech(name=name,
+                     vib_model=vib.HarmonicVib(vib_wavenumbers=wavenumbers),
+                     elec_model=elec.GroundStateElec(potentialenergy=E))
+            for name, wavenumbers, E in (('A', [1000., 500.], -1.),
+                                         ('TS', [800.], 0.),
+                                         ('B', [1200., 300.], -1.5))
+        ]
+        self.reaction = Reaction(reactants=self.species[:1],
+                                 reactants_stoich=[1.],
+                                 products=self.species[2:],
+                                 products_stoich=[1.],
+                                 transition_state=self.species[1:2],
+                                 transition_state_stoich=[1.])
+
+    def test_collect(self):
+        G = self.species[0].get_G(units='eV', T=500.)
+        A = self.reaction.get_A(T=500.)
+        with profiling.collect() as profile:
+            self.assertEqual(self.species[0].get_G(units='eV', T=500.), G)
+            self.assertEqual(self.reaction.get_A(T=500.), A)
+        self.assertEqual(profile.stats[('StatMech', 'get_G')][0], 1)
+        self.assertEqual(profile.stats[('HarmonicVib', 'get_GoRT')][0], 1)
+        self.assertEqual(profile.stats[('Reaction', 'get_A')][0], 1)
+        self.assertEqual(profile.stats[('Reaction', 'get_state_quantity')][0],
+                         2)
+        self.assertIn(('_get_mode_quantity', 'HarmonicVib.get_GoRT'),
+                      profile.stats)
+        self.assertIn(('_force_pass_arguments', 'StatMech.get_q'),
+                      profile.stats)
+        # Cumulative times include the calls made by the method
+        self.assertGreaterEqual(profile.stats[('StatMech', 'get_G')][1],
+                                profile.stats[('StatMech', 'get_GoRT')][1])
+
+        # Original methods and functions are restored
+        self.assertFalse(hasattr(StatMech.get_G, '__wrapped__'))
+        self.assertIs(statmech._get_mode_quantity, pmutt._get_mode_quantity)
+        self.species[0].get_G(units='eV', T=500.)
+        self.assertEqual(profile.stats[('StatMech', 'get_G')][0], 1)
+
+    def test_collect_by_name(self):
+        with profiling.collect(by_name=True) as profile:
+            with profiling.collect() as inner_profile:
+                self.reaction.get_HoRT_act(T=500.)
+            self.reaction.get_HoRT_act(T=500.)
+        self.assertEqual(profile.stats[('StatMech[TS]', 'get_HoRT')][0], 2)
+        self.assertEqual(inner_profile.stats[('StatMech', 'get_HoRT')][0], 2)
+
+    def test_collect_threads(self):
+        # Calls made by other threads while collecting are not recorded
+        started = threading.Event()
+        stop = threading.Event()
+        n_calls = [0]
+
+        def call_get_G():
+            while not stop.is_set():
+                self.species[2].get_G(units='eV', T=500.)
+                n_calls[0] += 1
+                started.set()
+
+        thread = threading.Thread(target=call_get_G)
+        thread.start()
+        try:
+            started.wait()
+            with profiling.collect() as profile:
+                n_calls_start = n_calls[0]
+                self.species[0].get_G(units='eV', T=500.)
+                while n_calls[0] < n_calls_start + 5:
+                    stop.wait(1.e-3)
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual(profile.stats[('StatMech', 'get_G')][0], 1)
+
+    def test_export(self):
+        with profiling.collect() as profile:
+            self.species[0].get_S(units='J/mol/K', T=500.)
+        records = profile.get_records(sort_by='calls')
+        self.assertEqual(len(records), len(profile.stats))
+        self.assertTrue(all(record['calls'] >= next_record['calls']
+                            for record, next_record
+                            in zip(records, records[1:])))
+        self.assertEqual(len(profile.report(n=3).split('\n')), 4)
+        with self.assertRaises(ValueError):
+            profile.get_records(sort_by='name')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'profile.csv')
+            profile.to_csv(filename)
+            df = pd.read_csv(filename)
+        self.assertEqual(list(df.columns),
+                         ['class', 'method', 'calls', 'time',
+                          'time_per_call'])
+        self.assertEqual(len(df), len(profile.stats))
+
+
+if __name__ == '__main__':
+    unittest.main()